@@ -9,9 +9,12 @@ import os
 import sys
 import warnings
 from ast import literal_eval
+from collections.abc import Callable
+from contextlib import AbstractContextManager
 from pathlib import Path
 from textwrap import wrap
-from typing import Any
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any
 
 from napari import Viewer
 from napari.errors import ReaderPluginError
@@ -19,6 +22,9 @@ from napari.utils._startup_script import _run_configured_startup_script
 from napari.utils.misc import maybe_patch_conda_exe
 from napari.utils.translations import trans
 
+if TYPE_CHECKING:
+    from napari.utils.perf._startup import StartupProfiler
+
 
 class InfoAction(argparse.Action):
     def __call__(self, *args, **kwargs):
@@ -55,6 +61,10 @@ class CitationAction(argparse.Action):
         sys.exit()
 
 
+def _no_phase(name: str) -> AbstractContextManager:
+    return contextlib.nullcontext()
+
+
 def validate_unknown_args(unknown: list[str]) -> dict[str, Any]:
     """Convert a list of strings into a dict of valid kwargs for add_* methods.
 
@@ -197,6 +207,14 @@ def parse_sys_argv():
         type=Path,
         help='use specific path to store and load settings.',
     )
+    parser.add_argument(
+        '--profile-startup',
+        metavar='TRACE_FILE',
+        help=(
+            'time each startup phase and write them to TRACE_FILE '
+            '(chrome://tracing JSON format) once the canvas is first drawn.'
+        ),
+    )
 
     args, unknown = parser.parse_known_args()
     # this is a hack to allow using "=" as a key=value separator while also
@@ -209,13 +227,63 @@ def parse_sys_argv():
     return args, kwargs
 
 
+def _profile_startup_phases(profiler: 'StartupProfiler') -> None:
+    """Run the startup steps normally done by ``Viewer()`` one by one.
+
+    Every step is cached or idempotent, so the later ``Viewer()`` call
+    reuses the results, and each step gets its own phase in the profile.
+    """
+    from napari._qt.qt_event_loop import get_qapp
+    from napari._qt.qt_resources import get_stylesheet
+    from napari.plugins import _initialize_plugins
+    from napari.settings import get_settings
+
+    with profiler.phase('load settings'):
+        settings = get_settings()
+    with profiler.phase('plugin discovery'):
+        _initialize_plugins()
+    with profiler.phase('create Qt application'):
+        get_qapp()
+    with profiler.phase('build stylesheet'):
+        get_stylesheet(settings.appearance.theme)
+
+
+def _write_profile_on_first_paint(
+    viewer: Viewer, profiler: 'StartupProfiler', path: str
+) -> None:
+    """Add the 'first paint' phase and write the profile on the first draw."""
+    draw_event = viewer.window._qt_viewer.canvas._scene_canvas.events.draw
+    start_ns = perf_counter_ns()
+
+    def _on_first_draw(event=None):
+        draw_event.disconnect(_on_first_draw)
+        profiler.add_phase('first paint', start_ns, perf_counter_ns())
+        profiler.write(path)
+        print(f'Startup profile written to {path}:')  # noqa: T201
+        print(profiler.summary())  # noqa: T201
+
+    draw_event.connect(_on_first_draw)
+
+
 def _run() -> None:
+    run_start_ns = perf_counter_ns()
+
     from napari import run
     from napari.settings import get_settings
 
     """Main program."""
     args, kwargs = parse_sys_argv()
 
+    profiler = None
+    phase: Callable[[str], AbstractContextManager] = _no_phase
+    if args.profile_startup:
+        from napari.utils.perf._startup import StartupProfiler
+
+        profiler = StartupProfiler()
+        profiler.add_process_start_phase('imports', end_ns=run_start_ns)
+        profiler.add_phase('parse arguments', run_start_ns, perf_counter_ns())
+        phase = profiler.phase
+
     # parse -v flags and set the appropriate logging level
     levels = [logging.WARNING, logging.INFO, logging.DEBUG]
     level = levels[min(2, args.verbose)]  # prevent index error
@@ -247,6 +315,9 @@ def _run() -> None:
         sys.argv.remove('--plugin')
 
     else:
+        if profiler is not None:
+            _profile_startup_phases(profiler)
+
         if args.with_:
             from napari.plugins import (
                 _initialize_plugins,
@@ -279,8 +350,10 @@ def _run() -> None:
         # but in the meantime if the garbage collector runs;
         # it will collect it and hang napari at start time.
         # in a way that is machine, os, time (and likely weather dependant).
-        viewer = Viewer()
-        _run_configured_startup_script()
+        with phase('create viewer'):
+            viewer = Viewer()
+        with phase('startup script'):
+            _run_configured_startup_script()
 
         # For backwards compatibility
         # If the --stack option is provided without additional arguments
@@ -295,13 +368,14 @@ def _run() -> None:
             )
             args.stack = True
         try:
-            viewer._window._qt_viewer._qt_open(
-                args.paths,
-                stack=args.stack,
-                plugin=args.plugin,
-                layer_type=args.layer_type,
-                **kwargs,
-            )
+            with phase('open files'):
+                viewer._window._qt_viewer._qt_open(
+                    args.paths,
+                    stack=args.stack,
+                    plugin=args.plugin,
+                    layer_type=args.layer_type,
+                    **kwargs,
+                )
         except ReaderPluginError:
             logging.getLogger('napari').exception(
                 'Loading %s with %s failed with errors',
@@ -343,6 +417,10 @@ def _run() -> None:
         if running_as_constructor_app():
             install_certifi_opener()
             maybe_patch_conda_exe()
+        if profiler is not None:
+            _write_profile_on_first_paint(
+                viewer, profiler, args.profile_startup
+            )
         run(gui_exceptions=True)
 
 
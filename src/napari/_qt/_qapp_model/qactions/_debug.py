@@ -49,8 +49,9 @@ def _start_trace_dialog(qt_viewer: QtViewer) -> None:
 
 
 def _start_trace(path: str) -> None:
-    """Start recording a trace file."""
-    perf.timers.start_trace_file(path)
+    """Start recording a trace file, with the options of the config file."""
+    options = perf.perf_config.trace_file_options if perf.perf_config else {}
+    perf.timers.start_trace_file(path, **options)
 
 
 def _stop_trace() -> None:
@@ -51,3 +51,30 @@ def test_waiting_on_no_request(monkeypatch, qtbot):
     status_checker.terminate()
 
     qtbot.wait_until(lambda: status_checker.isFinished())
+
+
+def test_trigger_records_snapshot():
+    model = ViewerModel()
+    model.mouse_over_canvas = True
+    status_checker = StatusChecker(model)
+    model.cursor.position = (1, 2)
+    status_checker.trigger_status_update()
+    model.cursor.position = (3, 4)
+    assert status_checker._snapshot.position == (1, 2)
+
+
+@pytest.mark.usefixtures('qapp')
+def test_no_emit_when_cancelled(monkeypatch):
+    """A status computed for an outdated cursor position is not emitted."""
+    model = ViewerModel()
+    model.mouse_over_canvas = True
+    status_checker = StatusChecker(model)
+    monkeypatch.setattr(
+        status_checker,
+        'status_and_tooltip_changed',
+        MagicMock(side_effect=RuntimeError('Should not emit')),
+    )
+    status_checker.trigger_status_update()
+    # the cursor moved again before the status was computed
+    assert status_checker._cancelled()
+    status_checker.calculate_status()
@@ -6,8 +6,15 @@ from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 import numpy as np
+import pytest
+from qtpy.QtCore import QCoreApplication, QEvent
 
-from napari._tests.utils import skip_local_popups, skip_on_win_ci
+from napari._tests.utils import (
+    assert_layer_cycles_do_not_leak,
+    layer_test_data,
+    skip_local_popups,
+    skip_on_win_ci,
+)
 
 if TYPE_CHECKING:
     from pytestqt.qtbot import QtBot
@@ -70,3 +77,37 @@ def test_leaks_labels(
     gc.collect()
     assert lr() is None
     assert dr() is None
+
+
+# the first test data of each layer type
+_one_per_type = [
+    pytest.param(Layer, data, id=Layer.__name__)
+    for Layer, data in {
+        Layer: (Layer, data) for Layer, data, _ in reversed(layer_test_data)
+    }.values()
+]
+
+
+@skip_on_win_ci
+@skip_local_popups
+@pytest.mark.parametrize(('Layer', 'data'), _one_per_type)
+def test_add_remove_layer_cycles_do_not_leak(
+    qtbot: QtBot, make_napari_viewer: MakeNapariViewer, Layer, data
+) -> None:
+    """Adding and removing layers must not pile up vispy nodes or buffers."""
+    viewer = make_napari_viewer(show=True)
+
+    def process_events():
+        qtbot.wait(10)
+        # widgets of removed layers are deleted later
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+    # Qt and pytest-qt keep some bookkeeping objects, such as captured Qt
+    # messages, so only the layer related objects are checked
+    assert_layer_cycles_do_not_leak(
+        viewer,
+        Layer,
+        data,
+        process_events=process_events,
+        check_objects=False,
+    )
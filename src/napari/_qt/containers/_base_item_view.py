@@ -3,7 +3,7 @@ from __future__ import annotations
 from itertools import chain, repeat
 from typing import TYPE_CHECKING, Generic, TypeVar
 
-from qtpy.QtCore import QItemSelection, QModelIndex, Qt
+from qtpy.QtCore import QAbstractProxyModel, QItemSelection, QModelIndex, Qt
 from qtpy.QtWidgets import QAbstractItemView
 
 from napari._qt.containers._base_item_model import ItemRole
@@ -98,7 +98,10 @@ class _BaseEventedItemView(Generic[ItemType]):
             sm.clearCurrentIndex()
         else:
             idx = index_of(self.model(), event.value)
-            sm.setCurrentIndex(idx, sm.SelectionFlag.Current)
+            # the item may not be in the model yet, e.g. while the model
+            # defers the insertion of a batch of items
+            if idx.isValid():
+                sm.setCurrentIndex(idx, sm.SelectionFlag.Current)
 
     def _on_py_selection_change(self, event: Event):
         """The python model selection has changed. Update the Qt view."""
@@ -123,6 +126,10 @@ class _BaseEventedItemView(Generic[ItemType]):
 
 def index_of(model: QAbstractItemModel, obj: ItemType) -> QModelIndex:
     """Find the `QModelIndex` for a given object in the model."""
+    if isinstance(model, QAbstractProxyModel):
+        return model.mapFromSource(index_of(model.sourceModel(), obj))
+    if hasattr(model, 'findIndex'):
+        return model.findIndex(obj)
     fl = Qt.MatchFlag.MatchExactly | Qt.MatchFlag.MatchRecursive
     hits = model.match(
         model.index(0, 0, QModelIndex()),
@@ -84,6 +84,8 @@ class LayerDelegate(QStyledItemDelegate):
         self._load_movie.setScaledSize(QSize(18, 18))
         self._load_movie.frameChanged.connect(self.loading_frame_changed)
         self._layer_visibility_states = WeakKeyDictionary()
+        # thumbnail pixmaps of layers, with the thumbnail version they show
+        self._thumbnail_pixmaps: WeakKeyDictionary = WeakKeyDictionary()
         self._alt_click_layer = lambda: None
 
     def paint(
@@ -157,16 +159,29 @@ class LayerDelegate(QStyledItemDelegate):
             # movie. This is needed since there is only one instance of the
             # delegate and therefore only one instance of the load movie shared
             # between all the layer items.
-            all_loaded = index.model().sourceModel().all_loaded()
-            if all_loaded:
+            if (
+                self._load_movie.state() == QMovie.MovieState.Running
+                and index.model().sourceModel().all_loaded()
+            ):
                 self._load_movie.setPaused(True)
 
             thumb_rect = option.rect.translated(-2, 2)
             h = index.data(Qt.ItemDataRole.SizeHintRole).height() - 4
             thumb_rect.setWidth(h)
             thumb_rect.setHeight(h)
-            image = index.data(ThumbnailRole)
-            painter.drawPixmap(thumb_rect, QPixmap.fromImage(image))
+            painter.drawPixmap(thumb_rect, self._thumbnail_pixmap(index))
+
+    def _thumbnail_pixmap(self, index: QtCore.QModelIndex) -> QPixmap:
+        """Return the thumbnail pixmap of a layer, converting it on change."""
+        layer = index.data(ItemRole)
+        # reading the thumbnail updates it, and thus its version, if needed
+        image = index.data(ThumbnailRole)
+        version = layer._thumbnail_version
+        cached = self._thumbnail_pixmaps.get(layer)
+        if cached is None or cached[0] != version:
+            cached = (version, QPixmap.fromImage(image))
+            self._thumbnail_pixmaps[layer] = cached
+        return cached[1]
 
     def createEditor(
         self,
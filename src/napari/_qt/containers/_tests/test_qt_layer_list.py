@@ -5,7 +5,9 @@ from qtpy.QtCore import QModelIndex, QPoint, Qt
 from qtpy.QtWidgets import QLineEdit, QStyleOptionViewItem
 
 from napari._qt.containers import QtLayerList
+from napari._qt.containers._base_item_model import ItemRole
 from napari._qt.containers._layer_delegate import LayerDelegate
+from napari._qt.containers.qt_layer_model import ThumbnailRole
 from napari._tests.utils import skip_local_focus
 from napari.components import LayerList
 from napari.layers import Image, Shapes
@@ -247,6 +249,98 @@ def test_drag_and_drop_layers(qtbot):
     qtbot.waitUntil(check_drag_and_drop)
 
 
+def test_thumbnail_changes_coalesced(qtbot):
+    view, images = make_qt_layer_list_with_layers(qtbot)
+    view.show()
+    model = view.model()
+    changed = []
+    model.dataChanged.connect(
+        lambda top_left, _, roles: changed.append((top_left.row(), roles))
+    )
+
+    for _ in range(5):
+        for image in images:
+            image.refresh()
+    assert changed == []
+
+    qtbot.waitUntil(lambda: len(changed) == 2)
+    assert sorted(changed) == [(0, [ThumbnailRole]), (1, [ThumbnailRole])]
+
+    # hidden views repaint when they are shown, so are not notified
+    view.hide()
+    images[0].refresh()
+    assert not view.model().sourceModel()._thumbnail_timer.isActive()
+
+
+def test_batched_insert_signals_one_range(qtbot):
+    view, images = make_qt_layer_list_with_layers(qtbot)
+    layers = view._root
+    model = view.model().sourceModel()
+    inserted = []
+    model.rowsInserted.connect(
+        lambda _, first, last: inserted.append((first, last))
+    )
+
+    new_images = [Image(np.zeros((4, 3))) for _ in range(3)]
+    with layers.batched_update():
+        for image in new_images:
+            layers.append(image)
+        layers.selection.active = new_images[-1]
+        # views are only notified at the end of the batch
+        assert model.rowCount() == 2
+        assert inserted == []
+
+    assert inserted == [(2, 4)]
+    assert model.rowCount() == 5
+    assert [model.getItem(model.index(i)) for i in range(5)] == [
+        *images,
+        *new_images,
+    ]
+    selected = view.selectionModel().selectedIndexes()
+    assert [index.data(ItemRole) for index in selected] == [new_images[-1]]
+    assert view.currentIndex().data(ItemRole) is new_images[-1]
+
+
+def test_batched_removal_signals_one_range(qtbot):
+    view, _images = make_qt_layer_list_with_layers(qtbot)
+    layers = view._root
+    layers.extend([Image(np.zeros((4, 3))) for _ in range(2)])
+    model = view.model().sourceModel()
+    removed = []
+    model.rowsRemoved.connect(
+        lambda _, first, last: removed.append((first, last))
+    )
+    reset = []
+    model.modelReset.connect(lambda: reset.append(True))
+
+    layers.selection = set(layers[1:3])
+    layers.remove_selected()
+
+    assert removed == [(1, 2)]
+    assert reset == []
+    assert model.rowCount() == 2
+
+    # removing layers that are not contiguous resets the model
+    layers.insert(1, Image(np.zeros((4, 3))))
+    layers.selection = {layers[0], layers[2]}
+    layers.remove_selected()
+
+    assert reset == [True]
+    assert model.rowCount() == 1
+
+
+def test_thumbnail_pixmap_cached(qtbot):
+    view, image = make_qt_layer_list_with_layer(qtbot)
+    delegate = view.itemDelegate()
+    index = layer_to_model_index(view, 0)
+
+    pixmap = delegate._thumbnail_pixmap(index)
+    assert delegate._thumbnail_pixmap(index) is pixmap
+
+    image.data = np.ones((4, 3))
+    assert delegate._thumbnail_pixmap(index) is not pixmap
+
+
 def drag_and_drop(start_x, start_y, end_x, end_y):
     # simulate a drag and drop action with pyautogui
     import pyautogui
@@ -11,13 +11,17 @@ from napari._qt.containers._base_item_model import (
     SortRole,
     _BaseEventedItemModel,
 )
+from napari._qt.containers._base_item_view import index_of
 from napari._qt.containers._layer_delegate import LayerDelegate
 from napari._qt.containers.qt_list_view import QtListView
 from napari.layers import Layer
 from napari.utils.translations import trans
 
 if TYPE_CHECKING:
-    from qtpy.QtGui import QKeyEvent  # type: ignore[attr-defined]
+    from qtpy.QtGui import (  # type: ignore[attr-defined]
+        QHideEvent,
+        QKeyEvent,
+    )
     from qtpy.QtWidgets import QWidget  # type: ignore[attr-defined]
 
     from napari.components.layerlist import LayerList
@@ -65,6 +69,29 @@ class QtLayerList(QtListView[Layer]):
         # This reverses the order of the items in the view,
         # so items at the end of the list are at the top.
         self.setModel(ReverseProxyModel(self.model()))
+        # All items have the same height, which spares the view from querying
+        # the size of every item to lay out the list.
+        self.setUniformItemSizes(True)
+        # The model only presents the layers inserted in a batched update at
+        # the end of the batch, so the selection is synced after the model.
+        root.events.end_batch.connect(self._on_end_batch, position='last')
+
+    def hideEvent(self, event: QHideEvent | None) -> None:
+        """Flush pending thumbnail changes, which hidden views ignore."""
+        # the model is already gone when the view is hidden while closing
+        if (model := self.model()) is not None:
+            model.sourceModel()._flush_thumbnails()
+        super().hideEvent(event)
+
+    def _on_end_batch(self) -> None:
+        """Sync the Qt selection with the layers selected during a batch."""
+        self._sync_selection_models()
+        current = self._root.selection._current
+        if current is not None:
+            sm = self.selectionModel()
+            sm.setCurrentIndex(
+                index_of(self.model(), current), sm.SelectionFlag.Current
+            )
 
     def keyPressEvent(self, e: QKeyEvent | None) -> None:
         """Override Qt event to pass events to the viewer."""
@@ -1,12 +1,14 @@
 import typing
 
-from qtpy.QtCore import QModelIndex, QSize, Qt
+from qtpy.QtCore import QModelIndex, QObject, QSize, Qt, QTimer
 from qtpy.QtGui import QImage
+from qtpy.QtWidgets import QWidget
 
 from napari import current_viewer
 from napari._qt.containers.qt_list_model import QtListModel
 from napari.layers import Layer
 from napari.settings import get_settings
+from napari.utils.events import SelectableEventedList
 from napari.utils.translations import trans
 
 ThumbnailRole = Qt.UserRole + 2
@@ -14,12 +16,52 @@ LoadedRole = Qt.UserRole + 3
 
 
 class QtLayerListModel(QtListModel[Layer]):
-    def data(self, index: QModelIndex, role: Qt.ItemDataRole):
-        """Return data stored under ``role`` for the item at ``index``."""
-        if not index.isValid():
-            return None
-        layer = self.getItem(index)
-        viewer = current_viewer()
+    """A QItemModel for a :class:`~napari.components.LayerList`.
+
+    Thumbnail changes are coalesced, so that views repaint the thumbnail of
+    a layer at most once every ``THUMBNAIL_INTERVAL`` milliseconds. As
+    layers compute their thumbnails when they are read, a thumbnail is only
+    computed when a view actually paints it, and never while the layer list
+    is hidden.
+
+    Changes made within :meth:`~napari.components.LayerList.batched_update`
+    are signalled to views once, at the end of the batch. Until then, the
+    model keeps presenting the layers as they were at the start of the
+    batch. Layers inserted or removed as a contiguous range are signalled as
+    a single row insertion or removal, and other changes as a model reset.
+    """
+
+    THUMBNAIL_INTERVAL = 100
+
+    def __init__(
+        self,
+        root: SelectableEventedList[Layer],
+        parent: QWidget | None = None,
+    ) -> None:
+        super().__init__(root, parent=parent)
+        self._pending_thumbnails: dict[int, Layer] = {}
+        # the layers presented to views during a batched update
+        self._batch_rows: list[Layer] | None = None
+        self._thumbnail_timer = QTimer(self)
+        self._thumbnail_timer.setSingleShot(True)
+        self._thumbnail_timer.setInterval(self.THUMBNAIL_INTERVAL)
+        self._thumbnail_timer.timeout.connect(self._flush_thumbnails)
+
+    def setRoot(self, root: SelectableEventedList[Layer]):
+        super().setRoot(root)
+        root.events.begin_batch.connect(self._on_begin_batch)
+        root.events.end_batch.connect(self._on_end_batch)
+
+    def getItem(self, index: QModelIndex) -> Layer:
+        """Return python object for a given `QModelIndex`.
+
+        During a batched update, this is the layer at the row that views were
+        last notified of.
+        """
+        rows = self._root if self._batch_rows is None else self._batch_rows
+        return rows[index.row()] if index.isValid() else rows
+
+    def _layer_loaded(self, layer: Layer) -> bool:
         layer_loaded = layer._slicing_state.loaded
         # Playback with async slicing causes flickering between the thumbnail
         # and loading animation in some cases due quick changes in the loaded
@@ -27,6 +69,13 @@ class QtLayerListModel(QtListModel[Layer]):
         if get_settings().experimental.async_ and (viewer := current_viewer()):
             viewer_playing = viewer.window._qt_viewer.dims.is_playing
             layer_loaded = layer.loaded and not viewer_playing
+        return layer_loaded
+
+    def data(self, index: QModelIndex, role: Qt.ItemDataRole):
+        """Return data stored under ``role`` for the item at ``index``."""
+        if not index.isValid():
+            return None
+        layer = self.getItem(index)
         if role == Qt.ItemDataRole.DisplayRole:  # used for item text
             return layer.name
         if role == Qt.ItemDataRole.TextAlignmentRole:  # alignment of the text
@@ -36,7 +85,7 @@ class QtLayerListModel(QtListModel[Layer]):
             return layer.name
         if role == Qt.ItemDataRole.ToolTipRole:  # for tooltip
             layer_source_info = layer.get_source_str()
-            if layer_loaded:
+            if self._layer_loaded(layer):
                 return layer_source_info
             return trans._('{source} (loading)', source=layer_source_info)
         if (
@@ -58,7 +107,7 @@ class QtLayerListModel(QtListModel[Layer]):
                 QImage.Format_RGBA8888,
             )
         if role == LoadedRole:
-            return layer_loaded
+            return self._layer_loaded(layer)
         # normally you'd put the icon in DecorationRole, but we do that in the
         # # LayerDelegate which is aware of the theme.
         # if role == Qt.ItemDataRole.DecorationRole:  # icon to show
@@ -101,12 +150,97 @@ class QtLayerListModel(QtListModel[Layer]):
         # Here we convert native events to the dataChanged signal.
         if not hasattr(event, 'index'):
             return
+        if event.type == 'thumbnail':
+            view = QObject.parent(self)
+            if isinstance(view, QWidget) and not view.isVisible():
+                # hidden views repaint all their items when they are shown
+                return
+            layer = self._root[event.index]
+            self._pending_thumbnails[id(layer)] = layer
+            if not self._thumbnail_timer.isActive():
+                self._thumbnail_timer.start()
+            return
         role = {
-            'thumbnail': ThumbnailRole,
             'visible': Qt.ItemDataRole.CheckStateRole,
             'name': Qt.ItemDataRole.DisplayRole,
             'loaded': LoadedRole,
         }.get(event.type)
-        roles = [role] if role is not None else []
-        row = self.index(event.index)
-        self.dataChanged.emit(row, row, roles)
+        # other layer events, such as those emitted for every slice, do not
+        # change what the views display, so they should not repaint the item
+        if role is None:
+            return
+        row = self.findIndex(self._root[event.index])
+        if row.isValid():
+            self.dataChanged.emit(row, row, [role])
+
+    def _flush_thumbnails(self) -> None:
+        """Notify views of the thumbnails that changed since the last flush."""
+        self._thumbnail_timer.stop()
+        layers = list(self._pending_thumbnails.values())
+        self._pending_thumbnails.clear()
+        for layer in layers:
+            row = self.findIndex(layer)
+            if row.isValid():
+                self.dataChanged.emit(row, row, [ThumbnailRole])
+
+    # During a batched update, the model keeps presenting the layers as they
+    # were at the start of the batch, so row changes are only signalled at
+    # the end of the batch.
+
+    def _on_begin_batch(self) -> None:
+        self._batch_rows = list(self._root)
+
+    def _on_end_batch(self) -> None:
+        old, new = self._batch_rows, list(self._root)
+        if old is None:
+            return
+        # length of the common prefix and suffix of old and new rows
+        n_common = min(len(old), len(new))
+        prefix = 0
+        while prefix < n_common and old[prefix] is new[prefix]:
+            prefix += 1
+        suffix = 0
+        while (
+            suffix < n_common - prefix and old[-1 - suffix] is new[-1 - suffix]
+        ):
+            suffix += 1
+
+        parent = QModelIndex()
+        if prefix + suffix == len(old) == len(new):
+            self._batch_rows = None
+        elif prefix + suffix == len(old):
+            self.beginInsertRows(parent, prefix, len(new) - suffix - 1)
+            self._batch_rows = None
+            self.endInsertRows()
+        elif prefix + suffix == len(new):
+            self.beginRemoveRows(parent, prefix, len(old) - suffix - 1)
+            self._batch_rows = None
+            self.endRemoveRows()
+        else:
+            self.beginResetModel()
+            self._batch_rows = None
+            self.endResetModel()
+
+    def _on_begin_inserting(self, event):
+        if self._batch_rows is None:
+            super()._on_begin_inserting(event)
+
+    def _on_end_insert(self):
+        if self._batch_rows is None:
+            super()._on_end_insert()
+
+    def _on_begin_removing(self, event):
+        if self._batch_rows is None:
+            super()._on_begin_removing(event)
+
+    def _on_end_remove(self):
+        if self._batch_rows is None:
+            super()._on_end_remove()
+
+    def _on_begin_moving(self, event):
+        if self._batch_rows is None:
+            super()._on_begin_moving(event)
+
+    def _on_end_move(self):
+        if self._batch_rows is None:
+            super()._on_end_move()
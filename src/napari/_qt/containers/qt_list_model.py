@@ -30,6 +30,19 @@ class QtListModel(_BaseEventedItemModel[ItemType]):
         """
         return [ListIndexMIMEType, 'text/plain']
 
+    def findIndex(self, item: ItemType) -> QModelIndex:
+        """Return the `QModelIndex` of `item`, or an invalid index if absent.
+
+        As the list is flat, this looks up the row of `item` in the list
+        instead of matching the data of each row, as ``QAbstractItemModel.match``
+        would.
+        """
+        try:
+            row = self.getItem(QModelIndex()).index(item)
+        except ValueError:
+            return QModelIndex()
+        return self.index(row)
+
     def mimeData(self, indices: list[QModelIndex]) -> Optional['QMimeData']:
         """Return an object containing serialized data from `indices`.
 
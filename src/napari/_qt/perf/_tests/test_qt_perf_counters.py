@@ -0,0 +1,51 @@
+import json
+
+from qtpy.QtGui import QGuiApplication
+
+from napari._qt.perf.qt_perf_counters import QtPerfCounters, format_value
+from napari.utils.perf import counters
+
+
+def test_format_value():
+    assert format_value(float('nan'), 'ms') == '-'
+    assert format_value(1.25, 'ms') == '1.2 ms'
+    assert format_value(0.5, 'ratio') == '50%'
+    assert format_value(3 * 1024**2, 'bytes') == '3 MB'
+    assert format_value(12, '') == '12'
+
+
+def test_perf_counters_widget(qtbot):
+    counters.clear()
+    counters.record('test.widget_ms', 2.0, 'ms')
+    widget = QtPerfCounters()
+    qtbot.addWidget(widget)
+
+    assert not widget.timer.isActive()
+    widget.show()
+    assert widget.timer.isActive()
+    assert 'test.widget_ms' in widget.rows
+    sparkline, label = widget.rows['test.widget_ms']
+    assert 'last 2.0 ms' in label.text()
+
+    counters.record('test.widget_ms', 4.0)
+    widget.update_counters()
+    assert sparkline._values.tolist() == [2.0, 4.0]
+    assert 'last 4.0 ms' in label.text()
+
+    widget._copy_snapshot()
+    snapshot = json.loads(QGuiApplication.clipboard().text())
+    assert snapshot['test.widget_ms']['count'] == 2
+
+    widget._reset()
+    assert counters.get('test.widget_ms').count == 0
+
+    widget.hide()
+    assert not widget.timer.isActive()
+
+
+def test_perf_counters_dock(make_napari_viewer):
+    viewer = make_napari_viewer()
+    dock = viewer.window._qt_viewer.dockPerfCounters
+
+    assert not dock.isVisible()
+    assert dock.toggleViewAction() in viewer.window.window_menu.actions()
@@ -0,0 +1,161 @@
+"""QtPerfCounters widget to plot the performance counters live."""
+
+import json
+
+import numpy as np
+from qtpy.QtCore import QPointF, QTimer
+from qtpy.QtGui import QGuiApplication, QPainter, QPen, QPolygonF
+from qtpy.QtWidgets import (
+    QGridLayout,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QVBoxLayout,
+    QWidget,
+)
+
+from napari.utils.perf import counters
+from napari.utils.translations import trans
+
+
+def format_value(value: float, unit: str) -> str:
+    """Return a value of a counter as text, for display."""
+    if np.isnan(value):
+        return '-'
+    if unit == 'ms':
+        return f'{value:.1f} ms'
+    if unit == 'ratio':
+        return f'{value:.0%}'
+    if unit == 'bytes':
+        for prefix in ('', 'K', 'M', 'G'):
+            if abs(value) < 1024:
+                return f'{value:.0f} {prefix}B'
+            value /= 1024
+        return f'{value:.0f} TB'
+    return f'{value:.3g}'
+
+
+class Sparkline(QWidget):
+    """A small line plot of the recent values of a counter."""
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._values = np.empty(0)
+        self.setMinimumSize(160, 24)
+
+    def set_values(self, values: np.ndarray) -> None:
+        """Set the values to plot, and repaint."""
+        self._values = values
+        self.update()
+
+    def paintEvent(self, event) -> None:
+        values = self._values
+        if values.size < 2:
+            return
+        width, height = self.width() - 1, self.height() - 1
+        top = values.max()
+        scaled = values / top if top > 0 else np.zeros_like(values)
+        xs = np.linspace(0, width, values.size)
+        ys = height * (1 - scaled)
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(self.palette().text().color(), 1))
+        painter.drawPolyline(
+            QPolygonF([QPointF(x, y) for x, y in zip(xs, ys, strict=True)])
+        )
+        painter.end()
+
+
+class QtPerfCounters(QWidget):
+    """Dockable widget to plot the performance counters live.
+
+    Each counter of :data:`napari.utils.perf.counters` gets a row with a plot
+    of its recent values, and their last, mean and 95th percentile values.
+    The rows are updated every UPDATE_MS while the widget is visible.
+
+    Attributes
+    ----------
+    rows : dict[str, tuple[Sparkline, QLabel]]
+        The plot and the statistics label of each counter, by name.
+    timer : QTimer
+        To update the rows every UPDATE_MS, while visible.
+    """
+
+    UPDATE_MS = 500
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.rows: dict[str, tuple[Sparkline, QLabel]] = {}
+
+        self._grid = QGridLayout()
+        self._empty_label = QLabel(trans._('No counters recorded yet.'))
+        self._grid.addWidget(self._empty_label, 0, 0, 1, 3)
+
+        copy_button = QPushButton(trans._('Copy snapshot'))
+        copy_button.setToolTip(
+            trans._('Copy the statistics of all counters as JSON')
+        )
+        copy_button.clicked.connect(self._copy_snapshot)
+        reset_button = QPushButton(trans._('Reset'))
+        reset_button.setToolTip(trans._('Forget all recorded values'))
+        reset_button.clicked.connect(self._reset)
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        buttons.addWidget(copy_button)
+        buttons.addWidget(reset_button)
+
+        layout = QVBoxLayout()
+        layout.addLayout(self._grid)
+        layout.addStretch()
+        layout.addLayout(buttons)
+        self.setLayout(layout)
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(self.UPDATE_MS)
+        self.timer.timeout.connect(self.update_counters)
+
+    def showEvent(self, event) -> None:
+        self.update_counters()
+        self.timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event) -> None:
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def update_counters(self) -> None:
+        """Update the rows from the current values of the counters."""
+        for counter in counters:
+            if counter.name not in self.rows:
+                self._add_row(counter.name)
+            sparkline, label = self.rows[counter.name]
+            sparkline.set_values(counter.values())
+            snapshot = counter.snapshot()
+            label.setText(
+                trans._(
+                    'last {last}, mean {mean}, p95 {p95}',
+                    last=format_value(snapshot['last'], counter.unit),
+                    mean=format_value(snapshot['mean'], counter.unit),
+                    p95=format_value(snapshot['p95'], counter.unit),
+                )
+            )
+
+    def _add_row(self, name: str) -> None:
+        self._empty_label.hide()
+        row = len(self.rows) + 1
+        sparkline = Sparkline(self)
+        label = QLabel(self)
+        self._grid.addWidget(QLabel(name, self), row, 0)
+        self._grid.addWidget(sparkline, row, 1)
+        self._grid.addWidget(label, row, 2)
+        self._grid.setColumnStretch(1, 1)
+        self.rows[name] = (sparkline, label)
+
+    def _copy_snapshot(self) -> None:
+        QGuiApplication.clipboard().setText(
+            json.dumps(counters.snapshot(), indent=2)
+        )
+
+    def _reset(self) -> None:
+        counters.clear()
+        self.update_counters()
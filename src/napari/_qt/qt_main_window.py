@@ -750,6 +750,9 @@ class Window:
         self._add_viewer_dock_widget(
             self._qt_viewer.dockLayerList, tabify=False
         )
+        self._add_viewer_dock_widget(
+            self._qt_viewer.dockPerfCounters, menu=self.window_menu
+        )
         if perf.perf_config is not None:
             self._add_viewer_dock_widget(
                 self._qt_viewer.dockPerformance, menu=self.window_menu
@@ -25,6 +25,7 @@ from superqt import ensure_main_thread
 from napari._qt.containers import QtLayerList
 from napari._qt.dialogs.qt_reader_dialog import handle_gui_reading
 from napari._qt.dialogs.screenshot_dialog import ScreenshotDialog
+from napari._qt.perf.qt_perf_counters import QtPerfCounters
 from napari._qt.perf.qt_performance import QtPerformance
 from napari._qt.utils import QImg2array
 from napari._qt.widgets.qt_dims import QtDims
@@ -200,6 +201,7 @@ class QtViewer(QSplitter):
         self._dockLayerControls = None
         self._dockConsole = None
         self._dockPerformance = None
+        self._dockPerfCounters = None
         self._show_welcome_screen = show_welcome_screen
 
         # This dictionary holds the corresponding vispy visual for each layer
@@ -226,6 +228,7 @@ class QtViewer(QSplitter):
         self._on_active_change()
         self.viewer.layers.events.inserted.connect(self._update_camera_depth)
         self.viewer.layers.events.removed.connect(self._update_camera_depth)
+        self.viewer.layers.events.end_batch.connect(self._update_camera_depth)
         self.viewer.dims.events.ndisplay.connect(self._update_camera_depth)
         self.viewer.layers.selection.events.active.connect(
             self._on_active_change
@@ -384,6 +387,20 @@ class QtViewer(QSplitter):
             self._dockPerformance = self._create_performance_dock_widget()
         return self._dockPerformance
 
+    @property
+    def dockPerfCounters(self) -> QtViewerDockWidget:
+        """QWidget wrapped in a QDockWidget plotting the perf counters."""
+        if self._dockPerfCounters is None:
+            self._dockPerfCounters = QtViewerDockWidget(
+                self,
+                QtPerfCounters(),
+                name=trans._('performance counters'),
+                area='right',
+                object_name='performance counters',
+            )
+            self._dockPerfCounters.setVisible(False)
+        return self._dockPerfCounters
+
     @property
     def layer_to_visual(self):
         """Mapping of Napari layer to Vispy layer. Added for backward compatibility"""
@@ -652,8 +669,9 @@ class QtViewer(QSplitter):
 
         See: https://github.com/napari/napari/issues/2138
         """
-        if self.viewer.dims.ndisplay == 2:
-            # don't bother updating 3D camera if we're not using it
+        if self.viewer.dims.ndisplay == 2 or self.viewer.layers._in_batch:
+            # don't bother updating 3D camera if we're not using it, or
+            # before the end of a batch of layer changes
             return
         # otherwise, set depth to diameter of displayed dimensions
         extent = self.viewer.layers.extent
@@ -1301,6 +1319,8 @@ class QtViewer(QSplitter):
         # or Abort trap. (calling stop() when no animation is occurring is also
         # not a problem)
         self.dims.stop()
+        if self._remote_manager is not None:
+            self._remote_manager.close()
         self.canvas.delete()
         if self._console is not None:
             self.console.close()
@@ -3,17 +3,22 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from threading import Event
 from typing import TYPE_CHECKING
 from weakref import ref
 
 from qtpy.QtCore import QObject, QThread, Signal
 
+from napari.components._cursor_status import CursorStatusSnapshot
 from napari.utils.notifications import Notification, notification_manager
 
 if TYPE_CHECKING:
     from napari.components import ViewerModel
 
+#: maximum number of threads computing the status of layers in parallel
+MAX_LAYER_WORKERS = min(4, os.cpu_count() or 1)
+
 
 class StatusChecker(QThread):
     """A dedicated thread for performant updating of the status bar.
@@ -30,12 +35,24 @@ class StatusChecker(QThread):
     naturally throttled since they can only be sent at the rate which updates
     can be computed, but no faster.
 
+    When the cursor moves, the state of the viewer needed to compute the
+    status is recorded on the main thread in a
+    :class:`napari.components._cursor_status.CursorStatusSnapshot`, which
+    the thread computes the status from. A computation is abandoned as soon
+    as the cursor moves again, and the status of several layers is computed
+    in parallel.
+
     Attributes
     ----------
     _need_status_update : threading.Event
         An Event (fancy thread-safe bool-like to synchronize threads)
         for keeping track of when the status needs updating
         (because the cursor has moved).
+    _snapshot : CursorStatusSnapshot or None
+        State of the viewer at the latest cursor position.
+    _executor : concurrent.futures.ThreadPoolExecutor or None
+        Executor computing the status of several layers in parallel,
+        created when first needed and shut down when the thread stops.
     _terminate : bool
         If set to True, the status checker thread needs to be terminated.
         When the QtViewer is being closed, it sets this flag to terminate
@@ -59,6 +76,8 @@ class StatusChecker(QThread):
         self.viewer_ref = ref(viewer)
         self._need_status_update = Event()
         self._need_status_update.clear()
+        self._snapshot: CursorStatusSnapshot | None = None
+        self._executor: ThreadPoolExecutor | None = None
         self._terminate = False
         self._allow_start = True
         self.setObjectName('StatusChecker')
@@ -68,7 +87,12 @@ class StatusChecker(QThread):
 
         When the cursor moves, the viewer will call this to instruct
         the status checker to update the viewer with the present status.
+        This records the state of the viewer, so it must be called from
+        the main thread. A computation in progress is cancelled.
         """
+        viewer = self.viewer_ref()
+        if viewer is not None:
+            self._snapshot = CursorStatusSnapshot.from_viewer(viewer)
         self._need_status_update.set()
 
     def close_terminate(self) -> None:
@@ -101,38 +125,66 @@ class StatusChecker(QThread):
         super().start(priority)
 
     def run(self) -> None:
-        while not self._terminate:
-            if self.viewer_ref() is None:
-                # Stop thread when viewer is closed
-                return
-            if self._need_status_update.is_set():
-                self._need_status_update.clear()
-                self.calculate_status()
-            else:
-                self._need_status_update.wait()
+        try:
+            while not self._terminate:
+                if self.viewer_ref() is None:
+                    # Stop thread when viewer is closed
+                    return
+                if self._need_status_update.is_set():
+                    self._need_status_update.clear()
+                    self.calculate_status()
+                else:
+                    self._need_status_update.wait()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+    def _cancelled(self) -> bool:
+        """Whether the status being computed is no longer needed."""
+        return self._terminate or self._need_status_update.is_set()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=MAX_LAYER_WORKERS,
+                thread_name_prefix='napari-status',
+            )
+        return self._executor
 
     def calculate_status(self) -> None:
         """Calculate the status and emit the signal.
 
-        If the viewer is not available, do nothing. Otherwise,
-        emit the signal that the status has changed.
+        If the viewer is not available, or the computation was cancelled
+        because the cursor moved again, do nothing. Otherwise, emit the
+        signal that the status has changed.
         """
         viewer = self.viewer_ref()
         if viewer is None:
             return
+        snapshot = self._snapshot
+        if snapshot is None:
+            # the state of the viewer is only recorded on the main thread,
+            # by trigger_status_update
+            return
 
         try:
             # Calculate the status change from cursor's movement
-            res = viewer._calc_status_from_cursor()
+            res = viewer._calc_status_from_cursor(
+                snapshot,
+                should_cancel=self._cancelled,
+                executor=self._get_executor() if self.isRunning() else None,
+            )
         except Exception as e:  # pragma: no cover # noqa: BLE001
-            # Our codebase is not threadsafe. It is possible that an
-            # ViewerModel or Layer state is changed while we are trying to
-            # calculate the status, which may cause an exception.
+            # The status is computed by code of each layer type from what
+            # it recorded, which may fail, for instance in a plugin layer.
             # All exceptions are caught and handled to keep updates
             # from crashing the thread. The exception is logged
             # and a notification is sent.
             notification_manager.dispatch(Notification.from_exception(e))
             return
+        if self._cancelled():
+            return
         # Emit the signal with the updated status
         self.status_and_tooltip_changed.emit(res)
 
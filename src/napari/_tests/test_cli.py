@@ -195,3 +195,40 @@ def test_cli_retains_viewer_ref(mock_run, monkeypatch, make_napari_viewer):
                 __main__._run()
             mock_viewer.assert_called_once()
             mock_viewer_open.assert_called_once()
+
+
+def test_cli_profile_startup(
+    mock_run, monkeypatch, make_napari_viewer, tmp_path, capsys
+):
+    """test that --profile-startup writes the startup phases on first draw"""
+    import json
+
+    viewer = make_napari_viewer()
+    trace_path = tmp_path / 'startup.json'
+    monkeypatch.setattr(
+        sys, 'argv', ['napari', '--profile-startup', str(trace_path)]
+    )
+    with mock.patch('napari.__main__.Viewer', return_value=viewer):
+        __main__._run()
+
+    assert not trace_path.exists()
+    # call the first-draw callback directly, drawing needs an OpenGL context
+    draw_event = viewer.window._qt_viewer.canvas._scene_canvas.events.draw
+    (on_first_draw,) = (
+        cb
+        for cb in draw_event.callbacks
+        if getattr(cb, '__name__', '') == '_on_first_draw'
+    )
+    on_first_draw()
+
+    names = {event['name'] for event in json.loads(trace_path.read_text())}
+    assert {
+        'parse arguments',
+        'load settings',
+        'plugin discovery',
+        'create Qt application',
+        'build stylesheet',
+        'create viewer',
+        'first paint',
+    } <= names
+    assert 'first paint' in capsys.readouterr().out
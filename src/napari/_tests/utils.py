@@ -1,6 +1,8 @@
+import gc
 import os
 import sys
 from collections import abc
+from collections.abc import Callable
 from contextlib import suppress
 from threading import RLock
 from typing import Any
@@ -14,6 +16,7 @@ from napari import Viewer
 from napari.layers import (
     Image,
     Labels,
+    Layer,
     Points,
     Shapes,
     Surface,
@@ -338,3 +341,99 @@ def count_warning_events(callbacks) -> int:
     return len(
         list(filter(lambda x: isinstance(x, WarningEmitter), callbacks))
     )
+
+
+def count_live_objects() -> dict[str, int]:
+    """Count the live objects that a layer could leak, after collecting garbage.
+
+    Returns
+    -------
+    dict[str, int]
+        Maps 'objects' to the number of objects tracked by the garbage
+        collector, 'layers' to the number of layers, 'vispy_layers' to the
+        number of vispy layers, 'vispy_nodes' to the number of vispy scene
+        nodes and 'gl_objects' to the number of vispy gloo objects, which
+        own the GPU buffers, textures and programs.
+    """
+    from vispy.gloo import GLObject
+    from vispy.scene import Node
+
+    from napari._vispy.layers.base import VispyBaseLayer
+
+    gc.collect()
+    gc.collect()
+    objects = gc.get_objects()
+    counts = {
+        'objects': len(objects),
+        'layers': 0,
+        'vispy_layers': 0,
+        'vispy_nodes': 0,
+        'gl_objects': 0,
+    }
+    # isinstance checks against abstract classes would fill their caches
+    # with weak references to the type of every object
+    for obj in objects:
+        mro = type(obj).__mro__
+        if Layer in mro:
+            counts['layers'] += 1
+        elif VispyBaseLayer in mro:
+            counts['vispy_layers'] += 1
+        elif Node in mro:
+            counts['vispy_nodes'] += 1
+        elif GLObject in mro:
+            counts['gl_objects'] += 1
+    return counts
+
+
+def assert_layer_cycles_do_not_leak(
+    viewer,
+    layer_type: type[Layer],
+    data: Any,
+    n_cycles: int = 10,
+    process_events: Callable[[], None] | None = None,
+    check_objects: bool = True,
+) -> None:
+    """Add and remove a layer many times, and check that nothing piles up.
+
+    After a few cycles, which fill caches and create lazily initialized
+    objects, the counts of :func:`count_live_objects` are taken as a
+    baseline. After ``n_cycles`` more cycles, the layer related counts must
+    be back to this baseline, and the number of other objects must not have
+    grown by as much as one per cycle.
+
+    Parameters
+    ----------
+    viewer : Viewer or ViewerModel
+        The viewer to add the layers to.
+    layer_type : type of Layer
+        The type of the layers, added with the ``add_*`` method of the viewer.
+    data : Any
+        The data of the layers.
+    n_cycles : int
+        How many times to add and remove the layer after the first cycle.
+    process_events : callable, optional
+        Called after each cycle, e.g. to let Qt delete removed widgets.
+    check_objects : bool
+        If False, only check the layer related counts, and not the number
+        of all objects.
+    """
+    add_layer = getattr(viewer, f'add_{layer_type.__name__.lower()}')
+
+    def cycle():
+        add_layer(data)
+        viewer.layers.clear()
+        if process_events is not None:
+            process_events()
+
+    for _ in range(3):
+        cycle()
+    baseline = count_live_objects()
+    for _ in range(n_cycles):
+        cycle()
+    after = count_live_objects()
+
+    objects_growth = after.pop('objects') - baseline.pop('objects')
+    assert after == baseline, f'{after} != baseline {baseline}'
+    assert not check_objects or objects_growth < n_cycles, (
+        f'{objects_growth} objects were leaked in {n_cycles} cycles'
+    )
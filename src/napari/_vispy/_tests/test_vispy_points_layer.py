@@ -84,6 +84,37 @@ def test_update_property_value_then_refresh_text_updates_node_strings():
     np.testing.assert_array_equal(vispy_layer.node.text.text, ['A', 'D', 'C'])
 
 
+def test_declutter_text():
+    points = np.array([[0, 0], [1, 1], [0, 100], [100, 0], [1000, 1000]])
+    features = {'score': np.array([1, 2, 3, 4, 5])}
+    text = {'string': '{score}', 'priority': 'score'}
+    layer = Points(points, features=features, text=text)
+    vispy_layer = VispyPointsLayer(layer)
+    np.testing.assert_array_equal(
+        vispy_layer.node.text.text, ['1', '2', '3', '4', '5']
+    )
+
+    layer.text.declutter = True
+
+    np.testing.assert_array_equal(
+        vispy_layer.node.text.text, ['2', '3', '4', '5']
+    )
+
+    # only the labels in view are drawn
+    layer._update_draw(
+        scale_factor=1,
+        corner_pixels_displayed=np.array([[-10, -10], [200, 200]]),
+        shape_threshold=(100, 100),
+    )
+
+    np.testing.assert_array_equal(vispy_layer.node.text.text, ['2', '3', '4'])
+
+    # labels overlap when zooming out
+    layer.scale_factor = 100
+
+    np.testing.assert_array_equal(vispy_layer.node.text.text, ['4'])
+
+
 def test_change_canvas_size_limits():
     points = np.random.rand(3, 2)
     layer = Points(points, canvas_size_limits=(0, 10000))
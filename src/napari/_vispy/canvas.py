@@ -34,6 +34,7 @@ from napari.utils.interactions import (
     mouse_release_callbacks,
     mouse_wheel_callbacks,
 )
+from napari.utils.perf._frames import FrameRecorder
 from napari.utils.theme import get_theme
 
 if TYPE_CHECKING:
@@ -239,6 +240,12 @@ class VispyCanvas:
         self._scene_canvas.events.mouse_wheel.connect(self._on_mouse_wheel)
         self._scene_canvas.events.resize.connect(self.on_resize)
         self._scene_canvas.events.draw.connect(self.on_draw, position='last')
+        # time whole frames, from the first to the last callback of a draw
+        self.frame_recorder = FrameRecorder(
+            self._scene_canvas.events.draw,
+            self.on_draw,
+            counter='canvas.frame_ms',
+        )
         self.viewer.cursor.events.style.connect(self._on_cursor)
         self.viewer.cursor.events.size.connect(self._on_cursor)
         # position=first is important to some downstream components such as
@@ -335,6 +342,7 @@ class VispyCanvas:
         disconnect_events(self.viewer.camera.events, self)
         disconnect_events(self.viewer.cursor.events, self)
         disconnect_events(self._scene_canvas.events, self)
+        self.frame_recorder.disconnect()
 
     @property
     def bgcolor(self) -> str:
@@ -720,6 +728,12 @@ class VispyCanvas:
 
         # The canvas corners in full world coordinates (i.e. across all layers).
         viewbox_corners_world = self._viewbox_corners_in_world
+        view_direction = None
+        if (
+            self.viewer.dims.ndisplay == 3
+            and self.viewer.camera.perspective == 0
+        ):
+            view_direction = np.asarray(self.viewer.camera.view_direction)
         for layer in self.viewer.layers:
             # The following condition should mostly be False. One case when it can
             # be True is when a callback connected to self.viewer.dims.events.ndisplay
@@ -737,6 +751,7 @@ class VispyCanvas:
                     :, displayed_axes
                 ],
                 shape_threshold=self._current_viewbox_size[::-1],
+                view_direction=view_direction if nd == 3 else None,
             )
 
     def on_resize(self, event: ResizeEvent) -> None:
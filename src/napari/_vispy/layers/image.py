@@ -18,6 +18,7 @@ from napari.utils.colormaps.colormap_utils import (
     _coerce_contrast_limits,
     _napari_cmap_to_vispy,
 )
+from napari.utils.perf import counters
 from napari.utils.translations import trans
 
 
@@ -153,6 +154,7 @@ class VispyImageLayer(VispyScalarFieldBaseLayer):
         self.layer.events.iso_threshold.connect(self._on_iso_threshold_change)
         self.layer.events.attenuation.connect(self._on_attenuation_change)
         self.layer.events.set_data.connect(self._on_axis_order_change)
+        self.layer.events.region_update.connect(self._on_region_update)
 
         # display_change is special (like data_change) because it requires a
         # self.reset(). This means that we have to call it manually. Also,
@@ -170,6 +172,24 @@ class VispyImageLayer(VispyScalarFieldBaseLayer):
                 self.node.handle_axis_change()
             self._last_order = current_order
 
+    def _on_region_update(self, event) -> None:
+        texture = getattr(self.node, '_texture', None)
+        full = self.layer._slice.texture
+        ndims = len(event.offset)
+        if (
+            isinstance(self.node, TiledImageNode)
+            or texture is None
+            or full is None
+            or texture.shape[:ndims] != full.shape[:ndims]
+        ):
+            # the region cannot be uploaded on its own, upload the slice
+            self._on_data_change()
+            return
+
+        counters.record('texture.upload_bytes', event.data.nbytes, 'bytes')
+        texture.scale_and_set_data(event.data, copy=False, offset=event.offset)
+        self.node.update()
+
     def _on_interpolation_change(self) -> None:
         self.node.interpolation = (
             self.layer.interpolation2d
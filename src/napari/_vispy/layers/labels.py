@@ -20,6 +20,7 @@ from napari.utils.colormaps.colormap import (
     CyclicLabelColormap,
     _texture_dtype,
 )
+from napari.utils.perf import counters
 
 if TYPE_CHECKING:
     from napari.layers import Labels
@@ -310,6 +311,7 @@ class VispyLabelsLayer(VispyScalarFieldBaseLayer):
             self.layer.refresh()
             return
 
+        counters.record('texture.upload_bytes', event.data.nbytes, 'bytes')
         self.node._texture.scale_and_set_data(
             event.data, copy=False, offset=event.offset
         )
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import warnings
 from abc import ABC, abstractmethod
 
 import numpy as np
@@ -9,10 +8,14 @@ from vispy.visuals import ImageVisual
 
 from napari._vispy.layers.base import VispyBaseLayer
 from napari._vispy.layers.tiled_image import TiledImageNode
-from napari._vispy.utils.gl import fix_data_dtype
 from napari._vispy.visuals.labels import LabelNode
 from napari._vispy.visuals.volume import Volume as VolumeNode
+from napari.layers._scalar_field._texture import (
+    downsample_texture as _downsample_texture,
+    fix_data_dtype,
+)
 from napari.layers._scalar_field.scalar_field import ScalarFieldBase
+from napari.utils.perf import counters
 from napari.utils.translations import trans
 
 
@@ -67,6 +70,9 @@ class VispyScalarFieldBaseLayer(VispyBaseLayer[ScalarFieldBase]):
             self._on_custom_interpolation_kernel_2d_change
         )
 
+        # let the slice task prepare the textures for this canvas
+        self.layer._texture_limits = self._texture_limits()
+
         # display_change is special (like data_change) because it requires a
         # self.reset(). This means that we have to call it manually. Also,
         # it must be called before reset in order to set the appropriate node
@@ -75,6 +81,18 @@ class VispyScalarFieldBaseLayer(VispyBaseLayer[ScalarFieldBase]):
         self.reset()
         self._on_data_change()
 
+    def _texture_limits(self) -> tuple[int | None, int | None]:
+        """Maximum 2D and 3D texture sizes above which data is downsampled.
+
+        Large 2D images are tiled instead, so only labels have a 2D limit.
+        """
+        max_2d = (
+            self.MAX_TEXTURE_SIZE_2D
+            if isinstance(self._layer_node.get_node(2), LabelNode)
+            else None
+        )
+        return max_2d, self.MAX_TEXTURE_SIZE_3D
+
     def _on_display_change(self, data=None) -> None:
         parent = self.node.parent
         children = list(self.node.children)
@@ -107,28 +125,19 @@ class VispyScalarFieldBaseLayer(VispyBaseLayer[ScalarFieldBase]):
 
     def _on_data_change(self) -> None:
         self._data = self.layer._data_view
-
-        data = fix_data_dtype(self.layer._data_view)
         ndisplay = self.layer._slice_input.ndisplay
 
+        # the slice task usually prepares the texture already
+        data = self.layer._slice.texture
+        if data is None:
+            data = self._prepare_texture(self.layer._data_view)
+        counters.record('texture.upload_bytes', data.nbytes, 'bytes')
+
         node = self._layer_node.get_node(
             ndisplay,
             getattr(data, 'dtype', None),
             getattr(data, 'shape', None),
         )
-        if ndisplay > self.layer.ndim:
-            data = data.reshape(
-                (1,) * (ndisplay - self.layer.ndim) + data.shape
-            )
-
-        if (
-            self.MAX_TEXTURE_SIZE_2D is not None
-            and ndisplay == 2
-            and isinstance(node, LabelNode)
-        ):
-            data = self.downsample_texture(data, self.MAX_TEXTURE_SIZE_2D)
-        if self.MAX_TEXTURE_SIZE_3D is not None and ndisplay == 3:
-            data = self.downsample_texture(data, self.MAX_TEXTURE_SIZE_3D)
 
         # Check if ndisplay has changed current node type needs updating
         if (ndisplay == 3 and not isinstance(node, VolumeNode)) or (
@@ -147,6 +156,24 @@ class VispyScalarFieldBaseLayer(VispyBaseLayer[ScalarFieldBase]):
         self._on_matrix_change()
         node.update()
 
+    def _prepare_texture(self, data: np.ndarray) -> np.ndarray:
+        """Prepare sliced data for upload to the GPU on the main thread.
+
+        This is only needed if the slice task did not prepare the texture,
+        see `_ScalarFieldSliceResponse.to_texture`.
+        """
+        data = fix_data_dtype(data)
+        ndisplay = self.layer._slice_input.ndisplay
+        if ndisplay > self.layer.ndim:
+            data = data.reshape(
+                (1,) * (ndisplay - self.layer.ndim) + data.shape
+            )
+        max_2d, max_3d = self._texture_limits()
+        max_texture_size = max_3d if ndisplay == 3 else max_2d
+        if max_texture_size is not None:
+            data = self.downsample_texture(data, max_texture_size)
+        return data
+
     def _on_custom_interpolation_kernel_2d_change(self) -> None:
         if self.layer._slice_input.ndisplay == 2:
             self.node.custom_kernel = self.layer.custom_interpolation_kernel_2d
@@ -177,6 +204,11 @@ class VispyScalarFieldBaseLayer(VispyBaseLayer[ScalarFieldBase]):
     def _on_colormap_change(self, event=None) -> None:
         raise NotImplementedError
 
+    def close(self):
+        """Vispy visual is closing."""
+        self.layer._texture_limits = None
+        super().close()
+
     def reset(self, event=None) -> None:
         super().reset()
         self._on_rendering_change()
@@ -203,33 +235,24 @@ class VispyScalarFieldBaseLayer(VispyBaseLayer[ScalarFieldBase]):
         data : array
             Data that now fits inside texture.
         """
-        if np.any(np.greater(data.shape, MAX_TEXTURE_SIZE)):
-            if self.layer.multiscale:
-                raise ValueError(
-                    trans._(
-                        'Shape of individual tiles in multiscale {shape} cannot '
-                        'exceed GL_MAX_TEXTURE_SIZE {texture_size}. Rendering is '
-                        'currently in {ndisplay}D mode.',
-                        deferred=True,
-                        shape=data.shape,
-                        texture_size=MAX_TEXTURE_SIZE,
-                        ndisplay=self.layer._slice_input.ndisplay,
-                    )
-                )
-            warnings.warn(
+        if self.layer.multiscale and np.any(
+            np.greater(data.shape, MAX_TEXTURE_SIZE)
+        ):
+            raise ValueError(
                 trans._(
-                    'data shape {shape} exceeds GL_MAX_TEXTURE_SIZE {texture_size}'
-                    ' in at least one axis and will be downsampled.'
-                    ' Rendering is currently in {ndisplay}D mode.',
+                    'Shape of individual tiles in multiscale {shape} cannot '
+                    'exceed GL_MAX_TEXTURE_SIZE {texture_size}. Rendering is '
+                    'currently in {ndisplay}D mode.',
                     deferred=True,
                     shape=data.shape,
                     texture_size=MAX_TEXTURE_SIZE,
                     ndisplay=self.layer._slice_input.ndisplay,
                 )
             )
-            downsample = np.ceil(
-                np.divide(data.shape, MAX_TEXTURE_SIZE)
-            ).astype(int)
+        data, downsample = _downsample_texture(
+            data, MAX_TEXTURE_SIZE, self.layer._slice_input.ndisplay
+        )
+        if downsample is not None:
             scale = np.ones(self.layer.ndim)
             for i, d in enumerate(self.layer._slice_input.displayed):
                 scale[d] = downsample[i]
@@ -239,8 +262,6 @@ class VispyScalarFieldBaseLayer(VispyBaseLayer[ScalarFieldBase]):
             self.layer._transforms['tile2data'].scale = scale
 
             self._on_matrix_change()
-            slices = tuple(slice(None, None, ds) for ds in downsample)
-            data = data[slices]
         return data
 
 
@@ -3,21 +3,15 @@
 from collections.abc import Generator
 from contextlib import contextmanager
 from functools import lru_cache
-from typing import Any, cast
 
-import numpy as np
-import numpy.typing as npt
 from vispy.app import Canvas
 from vispy.gloo import gl
 from vispy.gloo.context import get_current_canvas
 
-from napari.utils.translations import trans
-
-texture_dtypes = [
-    np.dtype(np.uint8),
-    np.dtype(np.uint16),
-    np.dtype(np.float32),
-]
+from napari.layers._scalar_field._texture import (  # noqa: F401
+    fix_data_dtype,
+    texture_dtypes,
+)
 
 
 @contextmanager
@@ -77,50 +71,6 @@ def get_max_texture_sizes() -> tuple[int, int]:
     return max_size_2d, max_size_3d
 
 
-def fix_data_dtype(data: npt.NDArray) -> npt.NDArray:
-    """Makes sure the dtype of the data is accetpable to vispy.
-
-    Acceptable types are int8, uint8, int16, uint16, float32.
-
-    Parameters
-    ----------
-    data : np.ndarray
-        Data that will need to be of right type.
-
-    Returns
-    -------
-    np.ndarray
-        Data that is of right type and will be passed to vispy.
-    """
-
-    dtype = np.dtype(data.dtype)
-    if dtype in texture_dtypes:
-        return data
-
-    try:
-        dtype_ = cast(
-            'type[np.unsignedinteger[Any] | np.floating[Any]]',
-            {
-                'i': np.float32,
-                'f': np.float32,
-                'u': np.uint16,
-                'b': np.uint8,
-            }[dtype.kind],
-        )
-        if dtype_ == np.uint16 and dtype.itemsize > 2:
-            dtype_ = np.float32
-    except KeyError as e:  # not an int or float
-        raise TypeError(
-            trans._(
-                'type {dtype} not allowed for texture; must be one of {textures}',
-                deferred=True,
-                dtype=dtype,
-                textures=set(texture_dtypes),
-            )
-        ) from e
-    return data.astype(dtype_)
-
-
 # blend_func parameters are multiplying:
 # - source color
 # - destination color
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 from functools import lru_cache
 from importlib import resources
 from typing import TYPE_CHECKING
@@ -8,7 +9,9 @@ import numpy as np
 from PIL.ImageFont import FreeTypeFont
 
 from napari.layers import Points, Shapes
+from napari.layers.utils._text_utils import declutter_text
 from napari.layers.utils.string_encoding import ConstantStringEncoding
+from napari.settings import get_settings
 
 if TYPE_CHECKING:
     from napari._vispy.visuals.text import Text
@@ -17,6 +20,13 @@ if TYPE_CHECKING:
 FONT_DIR = resources.files('napari') / 'resources' / 'fonts' / 'AlataPlus'
 FONT_FILE = FONT_DIR / 'AlataPlus-Regular.ttf'
 
+# Approximate size of a character relative to the font size, used to
+# estimate the box of text labels when decluttering them.
+CHAR_WIDTH = 0.6
+LINE_HEIGHT = 1.2
+# Number of strings whose length is used to estimate the box of labels.
+N_SAMPLED_STRINGS = 64
+
 
 def update_text(
     *,
@@ -38,11 +48,20 @@ def update_text(
     # Vispy always needs non-empty values and coordinates, so if a layer
     # effectively has no visible text then return single dummy data.
     # This also acts as a minor optimization.
+    text_values = np.array([])
     if _has_visible_text(layer):
-        text_values = layer._view_text
-        colors = layer._view_text_color
         coords, anchor_x, anchor_y = layer._view_text_coords
-    else:
+        if ndisplay == 2 and layer.text.declutter:
+            selection = _declutter(layer, coords)
+            coords = coords[selection]
+            text_values, colors = _view_text_values(
+                layer, layer._indices_view[selection]
+            )
+        else:
+            text_values = layer._view_text
+            colors = layer._view_text_color
+
+    if len(text_values) == 0:
         text_values = np.array([''])
         colors = np.zeros((4,), np.float32)
         coords = np.zeros((1, ndisplay))
@@ -74,6 +93,101 @@ def update_text(
     node.font_size = text_manager._get_scaled_size(layer.scale_factor)
 
 
+def _view_text_values(
+    layer: Points | Shapes, indices: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Get the strings and colors of the text elements at the given indices."""
+    text = layer.text
+    # Only the strings of the given elements are derived, as for the
+    # layer's _view_text and _view_text_color.
+    text.string._apply(layer.features)
+    text.color._apply(layer.features)
+    return text.view_text(indices), text._view_color(indices)
+
+
+def _declutter(layer: Points | Shapes, coords: np.ndarray) -> np.ndarray:
+    """Select the text elements in view of a 2D layer that are drawn.
+
+    Elements outside of the canvas are culled, and the others are
+    decluttered in screen space so that their labels do not overlap, up to
+    the experimental ``max_text_labels`` setting.
+
+    Parameters
+    ----------
+    layer : Union[Points, Shapes]
+        A layer with text.
+    coords : (N, 2) np.ndarray
+        Data coordinates of the text elements in view.
+
+    Returns
+    -------
+    selection : np.ndarray
+        Positions of the drawn elements in ``layer._indices_view``.
+    """
+    text = layer.text
+    displayed = layer._slice_input.displayed
+    # The layer's scale factor goes from canvas to world coordinates.
+    data_to_screen = layer._transforms[1:].simplified._sliced(displayed)
+    positions = data_to_screen(coords) / layer.scale_factor
+    in_view = np.arange(len(coords))
+    box_size = _label_box_size(layer, in_view)
+
+    # The corner pixels are the bounding box of the canvas in data
+    # coordinates, and stay at zero until the layer is first drawn.
+    corners = layer.corner_pixels[:, displayed]
+    if np.any(corners[1] != corners[0]):
+        screen_corners = (
+            data_to_screen(list(itertools.product(*corners.T)))
+            / layer.scale_factor
+        )
+        # Keep a margin so that labels whose anchor is just outside of the
+        # canvas still show.
+        low = np.min(screen_corners, axis=0) - box_size
+        high = np.max(screen_corners, axis=0) + box_size
+        in_view = np.flatnonzero(
+            np.all((positions >= low) & (positions <= high), axis=1)
+        )
+    if len(in_view) == 0:
+        return in_view
+
+    priority = None
+    if text.priority is not None and text.priority in layer.features:
+        values = layer.features[text.priority].to_numpy()
+        if np.issubdtype(values.dtype, np.number):
+            priority = values[layer._indices_view[in_view]]
+
+    selected = declutter_text(
+        positions[in_view],
+        box_size,
+        priority=priority,
+        max_labels=get_settings().experimental.max_text_labels,
+    )
+    return in_view[selected]
+
+
+def _label_box_size(
+    layer: Points | Shapes, in_view: np.ndarray
+) -> tuple[float, float]:
+    """Estimate the size of text labels in screen pixels along each axis.
+
+    The size is estimated from the font size, and the number of lines and
+    characters of a sample of the strings of the given elements in view.
+    """
+    sampled = in_view[
+        np.linspace(0, len(in_view) - 1, N_SAMPLED_STRINGS).astype(int)
+    ]
+    strings, _ = _view_text_values(layer, layer._indices_view[sampled])
+    lines = [str(string).split('\n') for string in strings]
+    n_chars = np.mean([max(len(line) for line in ls) for ls in lines])
+    n_lines = np.mean([len(ls) for ls in lines])
+    font_size = layer.text._get_scaled_size(layer.scale_factor)
+    # Positions are (row, column), so the width of labels is along axis 1.
+    return (
+        max(n_lines, 1) * LINE_HEIGHT * font_size,
+        max(n_chars, 1) * CHAR_WIDTH * font_size,
+    )
+
+
 def _has_visible_text(layer: Points | Shapes) -> bool:
     text = layer.text
     if not text.visible:
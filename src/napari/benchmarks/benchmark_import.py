@@ -2,10 +2,20 @@ import subprocess
 import sys
 
 
+def _time_import(module: str) -> None:
+    cmd = [sys.executable, '-c', f'import {module}']
+    subprocess.run(cmd, stderr=subprocess.PIPE)
+
+
 class ImportTimeSuite:
     def time_import(self):
-        cmd = [sys.executable, '-c', 'import napari']
-        subprocess.run(cmd, stderr=subprocess.PIPE)
+        _time_import('napari')
+
+    def time_import_layers(self):
+        _time_import('napari.layers')
+
+    def time_import_viewer(self):
+        _time_import('napari.viewer')
 
 
 if __name__ == '__main__':
@@ -0,0 +1,399 @@
+# See "Writing benchmarks" in the asv docs for more information.
+# https://asv.readthedocs.io/en/latest/writing_benchmarks.html
+# or the napari documentation on benchmarking
+# https://github.com/napari/napari/blob/main/docs/BENCHMARKS.md
+"""Benchmarks of lazy and multiscale data read from slow storage.
+
+The data of these benchmarks are zarr arrays in a :class:`LatencyStore`,
+an in-memory store that waits for a configurable latency and bandwidth on
+every chunk it reads, to simulate data on a network file system or in an
+object store.
+
+Drawing is simulated on a ``ViewerModel`` with :func:`draw`, which updates
+the layers from the camera the way the vispy canvas does before each frame,
+so that the multiscale level and the tiles in view are selected and loaded
+without requiring an OpenGL context.
+
+Besides the ``time_*`` benchmarks, the ``track_*`` benchmarks report two
+latencies as seen by a user:
+
+* time to first pixel, the time from adding a layer until something can be
+  drawn, usually the lowest resolution level;
+* time to full resolution, the time from adding a layer until the level
+  matching the camera zoom is loaded.
+"""
+
+import asyncio
+import time
+
+import numpy as np
+import zarr
+
+from napari.components import ViewerModel
+from napari.settings import get_settings
+
+from .utils import Skip
+
+ZARR_V3 = int(zarr.__version__.split('.')[0]) >= 3
+
+#: latency of reading one chunk, in seconds
+LATENCIES = [0, 0.005, 0.02]
+#: bandwidth of the store, in MB/s, or None for unlimited
+BANDWIDTHS = [None, 100]
+
+
+def _skip_slow(latency, bandwidth, *_):
+    return latency > 0 or bandwidth is not None
+
+
+class _LatencyMixin:
+    """Delays of a store reading chunks from slow storage.
+
+    Attributes
+    ----------
+    latency : float
+        Time to wait before every read, in seconds.
+    bandwidth : float or None
+        Bandwidth of reads, in MB/s. None for unlimited bandwidth.
+    """
+
+    latency: float = 0
+    bandwidth: float | None = None
+
+    def _read_delay(self, nbytes: int) -> float:
+        delay = self.latency
+        if self.bandwidth is not None:
+            delay += nbytes / (self.bandwidth * 1e6)
+        return delay
+
+
+if ZARR_V3:
+
+    class LatencyStore(_LatencyMixin, zarr.storage.MemoryStore):
+        """In-memory zarr store with a delay on every read."""
+
+        async def get(self, key, prototype=None, byte_range=None):
+            value = await super().get(key, prototype, byte_range)
+            nbytes = 0 if value is None else len(value)
+            await asyncio.sleep(self._read_delay(nbytes))
+            return value
+
+else:
+
+    class LatencyStore(_LatencyMixin, zarr.storage.MemoryStore):
+        """In-memory zarr store with a delay on every read."""
+
+        def __getitem__(self, item: str):
+            value = super().__getitem__(item)
+            time.sleep(self._read_delay(len(value)))
+            return value
+
+
+def latency_store(latency: float, bandwidth: float | None) -> LatencyStore:
+    """Create an empty store with the given read latency and bandwidth."""
+    store = LatencyStore()
+    store.latency = latency
+    store.bandwidth = bandwidth
+    return store
+
+
+def zarr_pyramid(
+    store: LatencyStore,
+    shape: tuple[int, ...],
+    chunks: tuple[int, ...],
+    n_levels: int,
+    dtype='uint8',
+    downsampled_axes: tuple[int, ...] | None = None,
+) -> list:
+    """Write a multiscale pyramid of random data to a store.
+
+    Every level halves the size of the previous one along the downsampled
+    axes, by default all of them. The store only applies its delays once
+    the data are written.
+
+    Returns
+    -------
+    list of zarr.Array
+        The levels of the pyramid, from the highest resolution.
+    """
+    latency, bandwidth = store.latency, store.bandwidth
+    store.latency, store.bandwidth = 0, None
+    rng = np.random.default_rng(0)
+    pyramid = []
+    for level in range(n_levels):
+        level_shape = tuple(
+            max(s // 2**level, 1)
+            if downsampled_axes is None or axis in downsampled_axes
+            else s
+            for axis, s in enumerate(shape)
+        )
+        array = zarr.open_array(
+            store=store,
+            path=f'{level}',
+            mode='w',
+            shape=level_shape,
+            chunks=tuple(
+                min(c, s) for c, s in zip(chunks, level_shape, strict=False)
+            ),
+            dtype=dtype,
+        )
+        array[...] = rng.integers(0, 255, level_shape, dtype=dtype)
+        pyramid.append(array)
+    store.latency, store.bandwidth = latency, bandwidth
+    return pyramid
+
+
+def draw(viewer: ViewerModel) -> None:
+    """Update the layers of a viewer as drawing a canvas would.
+
+    The canvas of the viewer is ``viewer._canvas_size`` pixels, and looks
+    at the world through ``viewer.camera``.
+    """
+    ndisplay = viewer.dims.ndisplay
+    canvas_size = np.array(viewer._canvas_size, dtype=float)
+    if ndisplay == 3:
+        canvas_size = np.full(3, canvas_size.max())
+    zoom = viewer.camera.zoom
+    center = np.array(viewer.camera.center)[-ndisplay:]
+    half_size = canvas_size / 2 / zoom
+    corners = np.stack([center - half_size, center + half_size])
+    view_direction = None
+    if ndisplay == 3 and viewer.camera.perspective == 0:
+        view_direction = np.array(viewer.camera.view_direction)
+    for layer in viewer.layers:
+        displayed = list(layer._slice_input.displayed)
+        layer._update_draw(
+            scale_factor=1 / zoom,
+            corner_pixels_displayed=corners[:, -len(displayed) :],
+            shape_threshold=tuple(viewer._canvas_size),
+            view_direction=view_direction,
+        )
+
+
+class MultiscalePanZoom2DSuite:
+    """Benchmarks for viewing a 2D multiscale image."""
+
+    params = (LATENCIES, BANDWIDTHS)
+    param_names = ['latency', 'bandwidth']
+    skip_params = Skip(if_in_pr=_skip_slow)
+    timeout = 300
+
+    def setup(self, latency, bandwidth):
+        store = latency_store(latency, bandwidth)
+        self.data = zarr_pyramid(
+            store, shape=(4096, 4096), chunks=(256, 256), n_levels=4
+        )
+        self.viewer = ViewerModel()
+        self.viewer._canvas_size = (512, 512)
+
+    def teardown(self, *_):
+        self.viewer.layers.clear()
+
+    def _add_and_zoom(self):
+        start = time.perf_counter()
+        layer = self.viewer.add_image(self.data, multiscale=True)
+        first_pixel = time.perf_counter() - start
+        self.viewer.camera.zoom = 1
+        self.viewer.camera.center = (2048, 2048)
+        draw(self.viewer)
+        full_resolution = time.perf_counter() - start
+        assert layer.data_level == 0
+        return first_pixel, full_resolution
+
+    def time_pan(self, *_):
+        """Time to pan across the full resolution level."""
+        self.viewer.add_image(self.data, multiscale=True)
+        self.viewer.camera.zoom = 1
+        for y in range(256, 4096, 512):
+            self.viewer.camera.center = (y, y)
+            draw(self.viewer)
+
+    def time_zoom(self, *_):
+        """Time to zoom from the lowest to the highest resolution level."""
+        self.viewer.add_image(self.data, multiscale=True)
+        self.viewer.camera.center = (2048, 2048)
+        for zoom in (0.125, 0.25, 0.5, 1):
+            self.viewer.camera.zoom = zoom
+            draw(self.viewer)
+
+    def track_time_to_first_pixel(self, *_):
+        """Time from adding the image until its lowest level is loaded."""
+        return self._add_and_zoom()[0]
+
+    track_time_to_first_pixel.unit = 'seconds'
+
+    def track_time_to_full_resolution(self, *_):
+        """Time from adding the image until the zoomed-in tile is loaded."""
+        return self._add_and_zoom()[1]
+
+    track_time_to_full_resolution.unit = 'seconds'
+
+
+class MultiscaleVolume3DSuite:
+    """Benchmarks for loading a multiscale volume in 3D."""
+
+    params = (LATENCIES, BANDWIDTHS, [False, True])
+    param_names = ['latency', 'bandwidth', 'multiscale_3d']
+    skip_params = Skip(if_in_pr=_skip_slow)
+    timeout = 300
+
+    def setup(self, latency, bandwidth, multiscale_3d):
+        self.prev_multiscale_3d = get_settings().experimental.multiscale_3d
+        get_settings().experimental.multiscale_3d = multiscale_3d
+        store = latency_store(latency, bandwidth)
+        self.data = zarr_pyramid(
+            store, shape=(256, 256, 256), chunks=(64, 64, 64), n_levels=3
+        )
+        self.viewer = ViewerModel(ndisplay=3)
+        self.viewer._canvas_size = (512, 512)
+
+    def teardown(self, *_):
+        self.viewer.layers.clear()
+        get_settings().experimental.multiscale_3d = self.prev_multiscale_3d
+
+    def _add_and_zoom(self):
+        start = time.perf_counter()
+        self.viewer.add_image(self.data, multiscale=True)
+        first_pixel = time.perf_counter() - start
+        self.viewer.camera.zoom = 2
+        draw(self.viewer)
+        full_resolution = time.perf_counter() - start
+        return first_pixel, full_resolution
+
+    def time_load_volume(self, *_):
+        """Time to add a volume and load the level in view."""
+        self._add_and_zoom()
+
+    def time_rotate(self, *_):
+        """Time to rotate the camera around a zoomed-in volume."""
+        self._add_and_zoom()
+        for azimuth in range(0, 360, 45):
+            self.viewer.camera.angles = (0, 30, azimuth)
+            draw(self.viewer)
+
+    def track_time_to_first_pixel(self, *_):
+        """Time from adding the volume until its lowest level is loaded."""
+        return self._add_and_zoom()[0]
+
+    track_time_to_first_pixel.unit = 'seconds'
+
+    def track_time_to_full_resolution(self, *_):
+        """Time from adding the volume until the level in view is loaded.
+
+        Without ``multiscale_3d``, this is the lowest level.
+        """
+        return self._add_and_zoom()[1]
+
+    track_time_to_full_resolution.unit = 'seconds'
+
+
+class ThickSliceProjectionSuite:
+    """Benchmarks for projecting thick slices of a lazy 3D image."""
+
+    params = (LATENCIES, BANDWIDTHS, ['none', 'max', 'mean'])
+    param_names = ['latency', 'bandwidth', 'projection_mode']
+    skip_params = Skip(if_in_pr=_skip_slow)
+    timeout = 300
+
+    def setup(self, latency, bandwidth, projection_mode):
+        store = latency_store(latency, bandwidth)
+        (self.data,) = zarr_pyramid(
+            store, shape=(128, 1024, 1024), chunks=(16, 256, 256), n_levels=1
+        )
+        self.viewer = ViewerModel()
+        self.layer = self.viewer.add_image(
+            self.data, projection_mode=projection_mode
+        )
+        self.viewer.dims.thickness = (16, 0, 0)
+
+    def teardown(self, *_):
+        self.viewer.layers.clear()
+
+    def time_project(self, *_):
+        """Time to project the thick slice at the current point."""
+        self.layer.refresh()
+
+    def time_scroll(self, *_):
+        """Time to scroll a thick slice through the image."""
+        for z in range(8, 128, 16):
+            self.viewer.dims.set_point(0, z)
+
+
+class LabelsPaintZarrSuite:
+    """Benchmarks for painting labels backed by a zarr array."""
+
+    params = (LATENCIES, BANDWIDTHS)
+    param_names = ['latency', 'bandwidth']
+    skip_params = Skip(if_in_pr=_skip_slow)
+    timeout = 300
+
+    def setup(self, latency, bandwidth):
+        store = latency_store(latency, bandwidth)
+        (self.data,) = zarr_pyramid(
+            store,
+            shape=(64, 1024, 1024),
+            chunks=(1, 256, 256),
+            n_levels=1,
+            dtype='uint32',
+        )
+        self.viewer = ViewerModel()
+        self.layer = self.viewer.add_labels(self.data)
+        self.layer.brush_size = 20
+        self.layer.mode = 'paint'
+
+    def teardown(self, *_):
+        self.viewer.layers.clear()
+
+    def time_paint_stroke(self, *_):
+        """Time to paint a stroke across the current slice."""
+        z = self.viewer.dims.point[0]
+        for x in range(16, 1024, 32):
+            self.layer.paint((z, x, x), 1, refresh=False)
+        self.layer.refresh()
+
+    def time_paint_slices(self, *_):
+        """Time to paint a dot on successive slices while scrolling."""
+        for z in range(0, 64, 8):
+            self.viewer.dims.set_point(0, z)
+            self.layer.paint((z, 512, 512), 1)
+
+
+class DimsPlaybackSuite:
+    """Benchmarks for playing through a lazy 3D image."""
+
+    params = (LATENCIES, BANDWIDTHS, [False, True])
+    param_names = ['latency', 'bandwidth', 'multiscale']
+    skip_params = Skip(if_in_pr=_skip_slow)
+    timeout = 300
+
+    def setup(self, latency, bandwidth, multiscale):
+        store = latency_store(latency, bandwidth)
+        pyramid = zarr_pyramid(
+            store,
+            shape=(32, 2048, 2048),
+            chunks=(1, 256, 256),
+            n_levels=3 if multiscale else 1,
+            downsampled_axes=(1, 2),
+        )
+        self.viewer = ViewerModel()
+        self.viewer._canvas_size = (512, 512)
+        self.viewer.add_image(
+            pyramid if multiscale else pyramid[0], multiscale=multiscale
+        )
+        self.viewer.dims.set_point(0, 0)
+        draw(self.viewer)
+
+    def teardown(self, *_):
+        self.viewer.layers.clear()
+
+    def time_play(self, *_):
+        """Time to play through all frames, drawing each of them."""
+        for _ in range(31):
+            self.viewer.dims._increment_dims_right(axis=0)
+            draw(self.viewer)
+
+
+if __name__ == '__main__':
+    from utils import run_benchmark
+
+    run_benchmark()
@@ -0,0 +1,148 @@
+# See "Writing benchmarks" in the asv docs for more information.
+# https://asv.readthedocs.io/en/latest/writing_benchmarks.html
+# or the napari documentation on benchmarking
+# https://github.com/napari/napari/blob/main/docs/BENCHMARKS.md
+"""Benchmarks of the peak memory used by slicing and layer lifecycles.
+
+``peakmem_*`` benchmarks report the peak resident memory of the process,
+including what was allocated in ``setup``, so each suite allocates its data
+in ``setup`` and the benchmarks compare across versions, not across suites.
+
+Leaks of layers and of their vispy nodes and GPU buffers are checked by
+``assert_layer_cycles_do_not_leak`` in the test suite.
+"""
+
+import numpy as np
+
+from napari.components import ViewerModel
+
+from .utils import Skip, labeled_particles
+
+
+class SlicingMemorySuite:
+    """Peak memory of slicing through 3D images and labels."""
+
+    params = [256, 1024, 4096]
+    param_names = ['size']
+    skip_params = Skip(if_in_pr=lambda size: size > 256)
+    timeout = 300
+
+    def setup(self, size):
+        rng = np.random.default_rng(0)
+        self.image = rng.random((16, size, size), dtype=np.float32)
+        self.labels = labeled_particles(
+            (16, size, size), dtype=np.uint32, n=64, seed=1
+        )
+        self.viewer = ViewerModel()
+
+    def teardown(self, *_):
+        self.viewer.layers.clear()
+
+    def peakmem_slice_image(self, size):
+        """Peak memory of scrolling through an image."""
+        self.viewer.add_image(self.image)
+        for z in range(16):
+            self.viewer.dims.set_point(0, z)
+
+    def peakmem_slice_labels(self, size):
+        """Peak memory of scrolling through labels."""
+        self.viewer.add_labels(self.labels)
+        for z in range(16):
+            self.viewer.dims.set_point(0, z)
+
+
+class ProjectionMemorySuite:
+    """Peak memory of projecting thick slices of a 3D image."""
+
+    params = (['max', 'mean', 'sum'], [512, 2048])
+    param_names = ['projection_mode', 'size']
+    skip_params = Skip(if_in_pr=lambda mode, size: size > 512)
+    timeout = 300
+
+    def setup(self, projection_mode, size):
+        rng = np.random.default_rng(0)
+        self.data = rng.integers(0, 2**12, (64, size, size), dtype=np.uint16)
+        self.viewer = ViewerModel()
+
+    def teardown(self, *_):
+        self.viewer.layers.clear()
+
+    def peakmem_project(self, projection_mode, size):
+        """Peak memory of projecting the whole image onto a plane."""
+        self.viewer.add_image(self.data, projection_mode=projection_mode)
+        self.viewer.dims.thickness = (64, 0, 0)
+
+
+class LabelsHistoryMemorySuite:
+    """Peak memory of the undo history of painted labels."""
+
+    params = [10, 100]
+    param_names = ['n_strokes']
+    timeout = 300
+
+    def setup(self, n_strokes):
+        self.viewer = ViewerModel()
+        self.layer = self.viewer.add_labels(
+            np.zeros((16, 1024, 1024), dtype=np.uint32)
+        )
+        self.layer.brush_size = 50
+        self.layer.mode = 'paint'
+
+    def teardown(self, *_):
+        self.viewer.layers.clear()
+
+    def _paint_strokes(self, n_strokes):
+        for stroke in range(n_strokes):
+            y = 10 * (stroke % 100)
+            with self.layer.block_history():
+                last = np.array([0, y, 0])
+                for x in range(0, 1024, 32):
+                    coord = np.array([0, y, x])
+                    self.layer._draw(stroke + 1, last, coord)
+                    last = coord
+
+    def peakmem_paint_strokes(self, n_strokes):
+        """Peak memory of painting strokes, each added to the history."""
+        self._paint_strokes(n_strokes)
+
+    def peakmem_undo_redo(self, n_strokes):
+        """Peak memory of undoing and redoing all painted strokes."""
+        self._paint_strokes(n_strokes)
+        for _ in range(n_strokes):
+            self.layer.undo()
+        for _ in range(n_strokes):
+            self.layer.redo()
+
+
+class LayerLifecycleMemorySuite:
+    """Peak memory of adding and removing layers many times."""
+
+    params = (['image', 'labels', 'points', 'shapes'], [100])
+    param_names = ['layer_type', 'n_cycles']
+    timeout = 300
+
+    def setup(self, layer_type, n_cycles):
+        rng = np.random.default_rng(0)
+        self.data = {
+            'image': rng.random((512, 512), dtype=np.float32),
+            'labels': labeled_particles((512, 512), n=64, seed=1),
+            'points': 512 * rng.random((1000, 2)),
+            'shapes': 512 * rng.random((100, 4, 2)),
+        }[layer_type]
+        self.viewer = ViewerModel()
+        self.add_layer = getattr(self.viewer, f'add_{layer_type}')
+
+    def teardown(self, *_):
+        self.viewer.layers.clear()
+
+    def peakmem_add_remove(self, layer_type, n_cycles):
+        """Peak memory of adding and removing a layer n_cycles times."""
+        for _ in range(n_cycles):
+            self.add_layer(self.data)
+            self.viewer.layers.clear()
+
+
+if __name__ == '__main__':
+    from utils import run_benchmark
+
+    run_benchmark()
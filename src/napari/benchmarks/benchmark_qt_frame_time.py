@@ -0,0 +1,161 @@
+# See "Writing benchmarks" in the asv docs for more information.
+# https://asv.readthedocs.io/en/latest/writing_benchmarks.html
+# or the napari documentation on benchmarking
+# https://github.com/napari/napari/blob/main/docs/BENCHMARKS.md
+"""Benchmarks of the frame times of a viewer during scripted interactions.
+
+Each scenario scripts an interaction in a viewer, such as panning or
+painting, and processes the Qt events after each step so that the canvas
+draws the resulting frame. The duration of every frame is recorded by the
+frame recorder of the canvas, see
+:class:`napari.utils.perf._frames.FrameRecorder`, and the ``track_*``
+benchmarks report percentiles of the frame times.
+
+The benchmarks run headless with ``QT_QPA_PLATFORM=offscreen``, as long as
+an OpenGL implementation is available, e.g. Mesa's software rasterizer with
+``LIBGL_ALWAYS_SOFTWARE=1``.
+
+Running this module as a script prints a table of the percentiles of all
+scenarios, followed by the slowest event callbacks of each of them::
+
+    python -m napari.benchmarks.benchmark_qt_frame_time
+"""
+
+import numpy as np
+from qtpy.QtWidgets import QApplication
+
+import napari
+from napari.utils.perf._frames import frame_table
+
+from .utils import Skip
+
+SCENARIOS = ['pan', 'zoom', 'play', 'paint']
+#: side of the displayed image, in pixels
+SIZES = [512, 2048]
+#: number of frames drawn by each scenario
+N_FRAMES = 60
+
+
+class QtFrameTimeSuite:
+    """Frame times of a viewer while interacting with a 3D image."""
+
+    params = (SCENARIOS, SIZES)
+    param_names = ['scenario', 'size']
+    skip_params = Skip(if_in_pr=lambda scenario, size: size > 512)
+    timeout = 300
+
+    def setup(self, scenario, size):
+        _ = QApplication.instance() or QApplication([])
+        rng = np.random.default_rng(0)
+        self.viewer = napari.Viewer()
+        self.viewer.add_image(
+            rng.integers(0, 255, (N_FRAMES + 1, size, size), dtype=np.uint8)
+        )
+        if scenario == 'paint':
+            self.labels = self.viewer.add_labels(
+                np.zeros((N_FRAMES + 1, size, size), dtype=np.uint8)
+            )
+            self.labels.brush_size = max(size // 64, 1)
+            self.labels.mode = 'paint'
+        self.size = size
+        self.recorder = self.viewer.window._qt_viewer.canvas.frame_recorder
+        # draw the first frame, which includes the upload of all textures
+        QApplication.processEvents()
+
+    def teardown(self, *_):
+        self.viewer.close()
+
+    def _steps(self, scenario):
+        """Yield after each step of the interaction of a scenario."""
+        viewer = self.viewer
+        if scenario == 'pan':
+            viewer.camera.zoom *= 4
+            cz, cy, cx = viewer.camera.center
+            radius = self.size / 8
+            for angle in np.linspace(0, 2 * np.pi, N_FRAMES):
+                viewer.camera.center = (
+                    cz,
+                    cy + radius * np.sin(angle),
+                    cx + radius * np.cos(angle),
+                )
+                yield
+        elif scenario == 'zoom':
+            zoom = viewer.camera.zoom
+            for factor in np.geomspace(1, 16, N_FRAMES // 2):
+                viewer.camera.zoom = zoom * factor
+                yield
+            for factor in np.geomspace(16, 1, N_FRAMES // 2):
+                viewer.camera.zoom = zoom * factor
+                yield
+        elif scenario == 'play':
+            for _ in range(N_FRAMES):
+                viewer.dims._increment_dims_right(axis=0)
+                yield
+        elif scenario == 'paint':
+            z = viewer.dims.current_step[0]
+            last = np.array([z, 0, 0])
+            with self.labels.block_history():
+                for x in np.linspace(0, self.size - 1, N_FRAMES):
+                    coord = np.array([z, x, x])
+                    self.labels._draw(1, last, coord)
+                    last = coord
+                    yield
+
+    def run(self, scenario):
+        """Run a scenario, drawing a frame after each step."""
+        with self.recorder.record(scenario) as stats:
+            for _ in self._steps(scenario):
+                QApplication.processEvents()
+        return stats
+
+    def time_scenario(self, scenario, size):
+        """Time to run the scenario, including all of its frames."""
+        self.run(scenario)
+
+    def track_frame_time_p50(self, scenario, size):
+        """Median frame time of the scenario."""
+        return self.run(scenario).percentile(50)
+
+    track_frame_time_p50.unit = 'ms'
+
+    def track_frame_time_p95(self, scenario, size):
+        """95th percentile of the frame times of the scenario."""
+        return self.run(scenario).percentile(95)
+
+    track_frame_time_p95.unit = 'ms'
+
+    def track_frame_time_p99(self, scenario, size):
+        """99th percentile of the frame times of the scenario."""
+        return self.run(scenario).percentile(99)
+
+    track_frame_time_p99.unit = 'ms'
+
+
+def report(size: int = 512) -> str:
+    """Run all scenarios, and return their frame times as text tables."""
+    all_stats = []
+    for scenario in SCENARIOS:
+        suite = QtFrameTimeSuite()
+        suite.setup(scenario, size)
+        try:
+            all_stats.append(suite.run(scenario))
+        finally:
+            suite.teardown()
+    sections = [frame_table(all_stats)]
+    sections.extend(
+        f'\n{stats.name}:\n{stats.callbacks.table(limit=10)}'
+        for stats in all_stats
+        if stats.callbacks is not None
+    )
+    return '\n'.join(sections)
+
+
+if __name__ == '__main__':
+    import sys
+
+    if len(sys.argv) > 1:
+        from .utils import run_benchmark
+
+        run_benchmark()
+    else:
+        print(report())  # noqa: T201
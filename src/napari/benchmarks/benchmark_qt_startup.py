@@ -0,0 +1,64 @@
+# See "Writing benchmarks" in the asv docs for more information.
+# https://asv.readthedocs.io/en/latest/writing_benchmarks.html
+# or the napari documentation on benchmarking
+# https://github.com/napari/napari/blob/main/docs/BENCHMARKS.md
+"""Benchmarks for the Qt phases of ``napari --profile-startup``."""
+
+import subprocess
+import sys
+from time import perf_counter
+
+from qtpy.QtWidgets import QApplication
+
+import napari
+
+
+class QtStartupPhasesSuite:
+    """Benchmarks for the startup phases that need Qt."""
+
+    def time_import_qt(self):
+        """Time to import napari.qt in a new process."""
+        cmd = [sys.executable, '-c', 'import napari.qt']
+        subprocess.run(cmd, stderr=subprocess.PIPE)
+
+    def time_create_qapp(self):
+        """Time to import Qt and create the QApplication in a new process."""
+        code = 'from napari._qt.qt_event_loop import get_qapp; get_qapp()'
+        subprocess.run([sys.executable, '-c', code], stderr=subprocess.PIPE)
+
+    def time_build_stylesheet(self):
+        """Time to build the themed stylesheet."""
+        from napari._qt.qt_resources import get_stylesheet
+
+        get_stylesheet('dark')
+
+
+class QtFirstPaintSuite:
+    """Benchmark the time from creating a viewer to its first draw."""
+
+    timeout = 60
+
+    def setup(self):
+        self.viewer = None
+
+    def teardown(self):
+        if self.viewer is not None:
+            self.viewer.close()
+
+    def time_first_paint(self):
+        """Time to create a viewer and draw its canvas once."""
+        self.viewer = napari.Viewer()
+        draw_event = (
+            self.viewer.window._qt_viewer.canvas._scene_canvas.events.draw
+        )
+        drawn = []
+        draw_event.connect(lambda event: drawn.append(True))
+        start = perf_counter()
+        while not drawn and perf_counter() - start < 30:
+            QApplication.processEvents()
+
+
+if __name__ == '__main__':
+    from utils import run_benchmark
+
+    run_benchmark()
@@ -0,0 +1,59 @@
+# See "Writing benchmarks" in the asv docs for more information.
+# https://asv.readthedocs.io/en/latest/writing_benchmarks.html
+# or the napari documentation on benchmarking
+# https://github.com/napari/napari/blob/main/docs/BENCHMARKS.md
+"""Benchmarks for the phases of ``napari --profile-startup``."""
+
+import tempfile
+from pathlib import Path
+
+from npe2 import PluginManager
+
+from napari.plugins._discovery_cache import (
+    _environment_fingerprint,
+    load_cached_manifests,
+    write_manifest_cache,
+)
+from napari.settings import NapariSettings
+
+
+class StartupPhasesSuite:
+    """Benchmarks for the startup phases that do not need Qt."""
+
+    def setup(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.settings_path = Path(self._tmpdir.name) / 'settings.yaml'
+        NapariSettings(config_path=self.settings_path).save()
+
+        self.cache_path = Path(self._tmpdir.name) / 'plugin_manifests.json'
+        pm = PluginManager()
+        pm.discover(include_npe1=True)
+        write_manifest_cache(
+            _environment_fingerprint(), pm.iter_manifests(), self.cache_path
+        )
+
+    def teardown(self):
+        self._tmpdir.cleanup()
+
+    def time_load_settings(self):
+        """Time to load the settings from a file."""
+        NapariSettings(config_path=self.settings_path)
+
+    def time_plugin_discovery(self):
+        """Time to discover installed plugins without the manifest cache."""
+        PluginManager().discover(include_npe1=True)
+
+    def time_plugin_discovery_cached(self):
+        """Time to register installed plugins from the manifest cache."""
+        pm = PluginManager()
+        manifests = load_cached_manifests(
+            _environment_fingerprint(), self.cache_path
+        )
+        for mf in manifests:
+            pm.register(mf, warn_disabled=False)
+
+
+if __name__ == '__main__':
+    from utils import run_benchmark
+
+    run_benchmark()
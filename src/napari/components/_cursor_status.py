@@ -0,0 +1,106 @@
+"""Immutable inputs of the cursor status computation.
+
+The status bar and tooltip are computed from the cursor position in a
+separate thread (see :class:`napari._qt.threads.status_checker.StatusChecker`)
+while the main thread keeps changing the viewer. A
+:class:`CursorStatusSnapshot` records the viewer state the computation
+depends on when the cursor moves, so that it does not read values that the
+main thread changes in the middle of it.
+
+This includes what the status of each layer is computed from, recorded by
+``Layer._get_status_inputs``, so that the layers themselves are not read
+by the computation.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from napari.components.viewer_model import ViewerModel
+    from napari.layers import Layer
+    from napari.layers.base._status import _LayerStatusInputs
+
+
+@dataclass(frozen=True)
+class CursorStatusSnapshot:
+    """State of the viewer needed to compute the cursor status.
+
+    Attributes
+    ----------
+    mouse_over_canvas : bool
+        Whether the mouse was over the canvas.
+    position : tuple of float
+        Position of the cursor in world coordinates.
+    tooltip_visible : bool
+        Whether the tooltip is shown.
+    grid_enabled : bool
+        Whether the viewer is in grid mode.
+    n_selected : int
+        Number of selected layers.
+    active : _LayerStatusInputs or None
+        What the status of the active layer is computed from, or None if
+        there is no active layer, its slice was not loaded, or the mouse was
+        not over the canvas.
+    layers : tuple of (_LayerStatusInputs, bool)
+        What the status of the layers shown with several layers selected
+        or in grid mode is computed from, from top to bottom, and whether
+        each one is the active layer. Empty if the mouse was not over the
+        canvas.
+    """
+
+    mouse_over_canvas: bool
+    position: tuple[float, ...]
+    tooltip_visible: bool
+    grid_enabled: bool
+    n_selected: int
+    active: _LayerStatusInputs | None
+    layers: tuple[tuple[_LayerStatusInputs, bool], ...]
+
+    @classmethod
+    def from_viewer(cls, viewer: ViewerModel) -> CursorStatusSnapshot:
+        """Record the state of a viewer, from the main thread."""
+        position = tuple(viewer.cursor.position)
+        view_direction = viewer.cursor._view_direction
+        dims_displayed = list(viewer.dims.displayed)
+
+        def status_inputs(layer: Layer) -> _LayerStatusInputs:
+            return layer._get_status_inputs(
+                position,
+                view_direction=view_direction,
+                dims_displayed=dims_displayed,
+                world=True,
+            )
+
+        selection = viewer.layers.selection
+        active = selection.active
+        if not viewer.mouse_over_canvas or (
+            active is not None and not active._slicing_state._loaded
+        ):
+            active = None
+        # layers whose status is shown with several layers selected or
+        # in grid mode, from top to bottom
+        layers = tuple(
+            (status_inputs(layer), layer is active)
+            for layer in reversed(viewer.layers)
+            if viewer.mouse_over_canvas
+            and layer.visible
+            and layer.opacity != 0
+            and layer._slicing_state._loaded
+            and (layer in selection or viewer.grid.enabled)
+        )
+        active_inputs = next(
+            (inputs for inputs, is_active in layers if is_active), None
+        )
+        if active is not None and active_inputs is None:
+            active_inputs = status_inputs(active)
+        return cls(
+            mouse_over_canvas=viewer.mouse_over_canvas,
+            position=position,
+            tooltip_visible=viewer.tooltip.visible,
+            grid_enabled=viewer.grid.enabled,
+            n_selected=len(selection),
+            active=active_inputs,
+            layers=layers,
+        )
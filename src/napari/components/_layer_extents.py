@@ -0,0 +1,181 @@
+"""Incrementally maintained extent of a list of layers.
+
+The extent of a LayerList is the minimum and maximum of the world extents
+of its layers, and its step size the minimum of their steps, for each axis.
+Layers of lower dimensionality correspond to the last axes of the world, so
+values are aligned on their last axis.
+
+Recomputing these over all layers whenever a layer is added makes adding
+many layers quadratic. Instead, :class:`LayerExtents` keeps one heap of
+values per axis, and only pushes the values of layers that were added or
+changed, so that updating the extent after a layer change takes
+O(D log N) time for N layers of D dimensions.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    import numpy.typing as npt
+
+    from napari.layers import Layer
+
+
+class _AlignedMinimum:
+    """Minimum of vectors aligned on their last value, for each axis.
+
+    Each axis has a heap of (value, version, key) entries. Setting the
+    vector of a key gives it a new version, so that entries pushed for
+    previous versions, or for removed keys, are stale. Stale entries are
+    discarded when they reach the top of a heap, and heaps are compacted
+    when stale entries outnumber live ones.
+    """
+
+    def __init__(self) -> None:
+        # heaps[k] holds the values of axis k counted from the last axis
+        self._heaps: list[list[tuple[float, int, Hashable]]] = []
+        self._versions: dict[Hashable, int] = {}
+        self._counter = itertools.count()
+
+    def set(self, key: Hashable, values: npt.ArrayLike) -> None:
+        """Set the vector of key, replacing its previous vector."""
+        version = next(self._counter)
+        self._versions[key] = version
+        values = np.asarray(values, dtype=float)
+        while len(self._heaps) < len(values):
+            self._heaps.append([])
+        for heap, value in zip(self._heaps, values[::-1], strict=False):
+            # nan values are ignored, like np.fmin does
+            if not np.isnan(value):
+                heapq.heappush(heap, (float(value), version, key))
+            if len(heap) > 2 * len(self._versions) + 16:
+                self._compact(heap)
+
+    def remove(self, key: Hashable) -> None:
+        """Remove the vector of key, if any."""
+        self._versions.pop(key, None)
+        for heap in self._heaps:
+            if len(heap) > 2 * len(self._versions) + 16:
+                self._compact(heap)
+
+    def _is_live(self, entry: tuple[float, int, Hashable]) -> bool:
+        return self._versions.get(entry[2]) == entry[1]
+
+    def _compact(self, heap: list[tuple[float, int, Hashable]]) -> None:
+        heap[:] = [entry for entry in heap if self._is_live(entry)]
+        heapq.heapify(heap)
+
+    def minimum(self, ndim: int) -> np.ndarray:
+        """Minimum of the last ndim axes, nan where there are no values."""
+        result = np.full(ndim, np.nan)
+        for k, heap in enumerate(self._heaps[:ndim]):
+            while heap and not self._is_live(heap[0]):
+                heapq.heappop(heap)
+            if heap:
+                result[ndim - 1 - k] = heap[0][0]
+        return result
+
+
+class _AlignedMaximum(_AlignedMinimum):
+    """Maximum of vectors aligned on their last value, for each axis."""
+
+    def set(self, key: Hashable, values: npt.ArrayLike) -> None:
+        super().set(key, -np.asarray(values, dtype=float))
+
+    def maximum(self, ndim: int) -> np.ndarray:
+        """Maximum of the last ndim axes, nan where there are no values."""
+        return -self.minimum(ndim)
+
+
+class LayerExtents:
+    """Extent and step size of a collection of layers.
+
+    Layers that are added or whose extent changed are only marked, and
+    their extents are read the next time the combined extent is needed, as
+    layer extents are computed lazily.
+    """
+
+    def __init__(self) -> None:
+        self._min = _AlignedMinimum()
+        self._max = _AlignedMaximum()
+        self._min_augmented = _AlignedMinimum()
+        self._max_augmented = _AlignedMaximum()
+        self._step = _AlignedMinimum()
+        self._pending: dict[int, Layer] = {}
+
+    def _trackers(self) -> tuple[_AlignedMinimum, ...]:
+        return (
+            self._min,
+            self._max,
+            self._min_augmented,
+            self._max_augmented,
+            self._step,
+        )
+
+    def update(self, layer: Layer) -> None:
+        """Mark a layer as added, or its extent as changed."""
+        self._pending[id(layer)] = layer
+
+    def remove(self, layer: Layer) -> None:
+        """Forget the extent of a layer."""
+        self._pending.pop(id(layer), None)
+        for tracker in self._trackers():
+            tracker.remove(id(layer))
+
+    def _flush(self) -> None:
+        for key, layer in self._pending.items():
+            extent = layer.extent
+            augmented = layer._extent_augmented
+            self._min.set(key, extent.world[0])
+            self._max.set(key, extent.world[1])
+            self._min_augmented.set(key, augmented.world[0])
+            self._max_augmented.set(key, augmented.world[1])
+            self._step.set(key, extent.step)
+        self._pending.clear()
+
+    def world(self, ndim: int, augmented: bool = False) -> np.ndarray:
+        """Minimum and maximum world coordinates of the layers.
+
+        Parameters
+        ----------
+        ndim : int
+            Number of dimensions of the world.
+        augmented : bool
+            If True, use the augmented extents of the layers.
+
+        Returns
+        -------
+        extent_world : array, shape (2, ndim)
+            nan for axes without any finite extent.
+        """
+        self._flush()
+        if augmented:
+            return np.stack(
+                [
+                    self._min_augmented.minimum(ndim),
+                    self._max_augmented.maximum(ndim),
+                ]
+            )
+        return np.stack([self._min.minimum(ndim), self._max.maximum(ndim)])
+
+    def step(self, ndim: int) -> np.ndarray:
+        """Minimum step size of the layers along each axis.
+
+        Parameters
+        ----------
+        ndim : int
+            Number of dimensions of the world.
+
+        Returns
+        -------
+        step : array, shape (ndim,)
+        """
+        self._flush()
+        return self._step.minimum(ndim)
@@ -11,6 +11,7 @@ from collections.abc import Iterable
 from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait
 from contextlib import contextmanager
 from threading import RLock
+from time import perf_counter_ns
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -21,6 +22,7 @@ from typing import (
 from napari.layers import Layer
 from napari.settings import get_settings
 from napari.utils.events.event import EmitterGroup, Event
+from napari.utils.perf import counters
 
 if TYPE_CHECKING:
     from napari.components import Dims
@@ -233,19 +235,23 @@ class _LayerSlicer:
         task = None
         if len(requests) > 0:
             logger.debug('Submitting task %s', id(task))
-            task = self._executor.submit(self._slice_layers, requests)
+            task = self._executor.submit(
+                self._slice_layers, requests, perf_counter_ns()
+            )
             # Store task before adding done callback to ensure there is always
             # a task to remove in the done callback.
             with self._lock_layers_to_task:
                 self._layers_to_task[tuple(requests)] = task
+                counters.record('slice.queue_depth', len(self._layers_to_task))
             task.add_done_callback(self._on_slice_done)
 
         # Then execute sync slicing tasks to run concurrent with async ones.
         for layer in sync_layers:
-            layer._slice_dims(
-                dims=dims,
-                force=force,
-            )
+            with counters.timer('slice.sync_ms'):
+                layer._slice_dims(
+                    dims=dims,
+                    force=force,
+                )
 
         return task
 
@@ -261,7 +267,9 @@ class _LayerSlicer:
         self.events.disconnect()
         self.events.ready.disconnect()
 
-    def _slice_layers(self, requests: dict) -> dict:
+    def _slice_layers(
+        self, requests: dict, submitted_ns: int | None = None
+    ) -> dict:
         """
         Iterates through a dictionary of request objects and call the slice
         on each individual layer. Can be called from the main or slicing thread.
@@ -270,6 +278,9 @@ class _LayerSlicer:
         ----------
         requests: dict[Layer, SliceRequest]
             Dictionary of request objects to be used for constructing the slice
+        submitted_ns: int or None
+            Time at which the task was submitted, from `time.perf_counter_ns`,
+            to record the latency of the slice.
 
         Returns
         -------
@@ -277,6 +288,12 @@ class _LayerSlicer:
         """
         logger.debug('_LayerSlicer._slice_layers: %s', requests)
         result = {layer: request() for layer, request in requests.items()}
+        if submitted_ns is not None:
+            counters.record(
+                'slice.async_ms',
+                (perf_counter_ns() - submitted_ns) / 1e6,
+                'ms',
+            )
         self.events.ready(value=result)
         return result
 
@@ -305,6 +322,9 @@ class _LayerSlicer:
             for k_layers, v_task in self._layers_to_task.items():
                 if v_task == task:
                     del self._layers_to_task[k_layers]
+                    counters.record(
+                        'slice.queue_depth', len(self._layers_to_task)
+                    )
                     return True
         return False
 
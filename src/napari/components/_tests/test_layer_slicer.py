@@ -12,6 +12,7 @@ from napari._tests.utils import DEFAULT_TIMEOUT_SECS, LockableData
 from napari.components import Dims
 from napari.components._layer_slicer import _LayerSlicer
 from napari.layers import Image, Labels, Points
+from napari.utils.perf import counters
 
 # The following fakes are used to control execution of slicing across
 # multiple threads, while also allowing us to mimic real classes
@@ -119,6 +120,20 @@ def test_submit_emits_ready_event_when_done(layer_slicer):
     assert actual_result is event_result
 
 
+def test_submit_records_counters(layer_slicer):
+    counters.clear()
+    async_layer = FakeAsyncLayer()
+    sync_layer = FakeSyncLayer()
+
+    future = layer_slicer.submit(layers=[async_layer, sync_layer], dims=Dims())
+    _wait_for_result(future)
+    layer_slicer.wait_until_idle(DEFAULT_TIMEOUT_SECS)
+
+    assert counters.get('slice.async_ms').count == 1
+    assert counters.get('slice.sync_ms').count == 1
+    assert counters.get('slice.queue_depth').count >= 1
+
+
 def test_submit_with_one_sync_layer(layer_slicer):
     layer = FakeSyncLayer()
     assert layer.slice_count == 0
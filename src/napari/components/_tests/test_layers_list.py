@@ -514,6 +514,109 @@ def test_world_extent_mixed_flipped():
     np.testing.assert_allclose(layers.extent.step, (1, 1))
 
 
+def test_batched_world_to_data():
+    """Test converting coordinates for all layers at once."""
+    layers = LayerList()
+    layers.append(
+        Image(np.zeros((6, 10, 15)), scale=(3, 1, 2), translate=(10, 20, 5))
+    )
+    layers.append(
+        Image(np.zeros((10, 10)), affine=[[0, 2, 1], [1, 0, 3], [0, 0, 1]])
+    )
+    layers.append(Image(np.zeros((8, 6, 15)), rotate=30, shear=[0.5, 0, 0]))
+
+    positions = np.random.default_rng(0).random((5, 3)) * 10
+    data = layers.world_to_data(positions)
+    assert data.shape == (3, 5, 3)
+    for layer, layer_data in zip(layers, data, strict=True):
+        for position, coords in zip(positions, layer_data, strict=True):
+            np.testing.assert_allclose(
+                coords[-layer.ndim :], layer.world_to_data(position)
+            )
+
+    np.testing.assert_allclose(layers.world_to_data(positions[0]), data[:, 0])
+    np.testing.assert_allclose(
+        layers.data_to_world(data), positions[None].repeat(3, 0)
+    )
+    np.testing.assert_allclose(
+        layers.data_to_world(data[:, 0]), positions[None, 0].repeat(3, 0)
+    )
+
+
+def test_batched_world_to_data_cache_cleared():
+    """Test that stacked transforms follow transforms and layer order."""
+    layers = LayerList()
+    layer_a = Image(np.zeros((10, 10)), scale=(2, 2))
+    layer_b = Image(np.zeros((10, 10)))
+    layers.extend([layer_a, layer_b])
+    np.testing.assert_allclose(layers.world_to_data((4, 4)), [[2, 2], [4, 4]])
+
+    layer_a.translate = (2, 2)
+    np.testing.assert_allclose(layers.world_to_data((4, 4)), [[1, 1], [4, 4]])
+
+    layers.move(1, 0)
+    np.testing.assert_allclose(layers.world_to_data((4, 4)), [[4, 4], [1, 1]])
+
+    layers.append(Image(np.zeros((5, 10, 10)), scale=(2, 1, 1)))
+    np.testing.assert_allclose(
+        layers.world_to_data((6, 4, 4)), [[6, 4, 4], [6, 1, 1], [3, 4, 4]]
+    )
+
+
+def test_world_extent_updated_incrementally():
+    """Test extent after removing, changing and replacing layers."""
+    layers = LayerList()
+    layer_a = Image(np.zeros((5, 10, 10)), scale=(2, 1, 1))
+    layer_b = Image(np.zeros((10, 10)), translate=(20, 20))
+    layer_c = Image(np.zeros((10, 10)), scale=(0.5, 0.5), translate=(-5, 0))
+    layers.extend([layer_a, layer_b, layer_c])
+    np.testing.assert_allclose(layers.extent.world, [[0, -5, 0], [8, 29, 29]])
+    np.testing.assert_allclose(layers.extent.step, (2, 0.5, 0.5))
+
+    layers.remove(layer_b)
+    np.testing.assert_allclose(layers.extent.world, [[0, -5, 0], [8, 9, 9]])
+
+    layer_c.translate = (0, 0)
+    np.testing.assert_allclose(layers.extent.world, [[0, 0, 0], [8, 9, 9]])
+    np.testing.assert_allclose(
+        layers._extent_world_augmented, [[-1, -0.5, -0.5], [9, 9.5, 9.5]]
+    )
+
+    layers[1] = layer_b
+    np.testing.assert_allclose(layers.extent.world, [[0, 0, 0], [8, 29, 29]])
+    np.testing.assert_allclose(layers.extent.step, (2, 1, 1))
+
+    layers.remove(layer_a)
+    assert layers.ndim == 2
+    np.testing.assert_allclose(layers.extent.world, [[20, 20], [29, 29]])
+    np.testing.assert_allclose(layers.extent.step, (1, 1))
+
+    layers.clear()
+    np.testing.assert_allclose(layers.extent.world, [[0, 0], [511, 511]])
+
+
+def test_world_extent_many_layers():
+    """Test that extents of many layers match a full recomputation."""
+    rng = np.random.default_rng(0)
+    layers = LayerList()
+    for _ in range(100):
+        layers.append(
+            Image(
+                np.zeros((4, 4)),
+                scale=rng.uniform(0.5, 2, 2),
+                translate=rng.uniform(-100, 100, 2),
+            )
+        )
+    for layer in list(layers)[::3]:
+        layers.remove(layer)
+    for layer in list(layers)[::4]:
+        layer.translate = rng.uniform(-100, 100, 2)
+
+    expected = layers.get_extent(list(layers))
+    np.testing.assert_allclose(layers.extent.world, expected.world)
+    np.testing.assert_allclose(layers.extent.step, expected.step)
+
+
 def test_ndim():
     """Test world extent after adding layers."""
     layers = LayerList()
@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+from napari.components import LayerList
+from napari.components.experimental.monitor import SharedFrame
+from napari.components.experimental.remote import RemoteManager
+from napari.components.experimental.remote._frames import RemoteFrames
+from napari.layers import Image, Labels, Points
+
+
+@pytest.fixture
+def shared_frame(monkeypatch):
+    # attaching in the process that created the frame must not unregister
+    # it from the resource tracker, which only happens in tests
+    monkeypatch.setattr(
+        'multiprocessing.resource_tracker.unregister', lambda *args: None
+    )
+    frame = SharedFrame.create((4, 6), np.uint16)
+    yield frame
+    frame.close()
+
+
+def test_shared_frame_attach(shared_frame):
+    shared_frame.write(np.arange(24).reshape(4, 6))
+    assert shared_frame.counter == 2
+
+    attached = SharedFrame.attach(shared_frame.name)
+    assert attached.array.shape == (4, 6)
+    assert attached.array.dtype == np.uint16
+    assert attached.counter == 2
+    np.testing.assert_array_equal(attached.array, shared_frame.array)
+
+    # both map the same memory
+    attached.array[0, 0] = 100
+    assert shared_frame.array[0, 0] == 100
+    attached.close()
+
+
+def test_shared_frame_too_many_dimensions():
+    with pytest.raises(ValueError, match='dimensions'):
+        SharedFrame.create((1,) * 9, np.uint8)
+
+
+def test_remote_frames_attach(shared_frame):
+    layers = LayerList()
+    frames = RemoteFrames(layers)
+    layer = frames.attach(shared_frame.name, labels=True)
+    assert isinstance(layer, Labels)
+    assert layer in layers
+    assert layer.data is frames._inputs[shared_frame.name].frame.array
+
+    shared_frame.write(np.full((4, 6), 3))
+    frames.on_poll()
+    np.testing.assert_array_equal(layer._slice.image.raw, 3)
+
+    layers.remove(layer)
+    assert frames._inputs == {}
+    frames.close()
+
+
+@pytest.mark.usefixtures('shared_frame')
+def test_remote_frames_export_slice():
+    layers = LayerList()
+    layer = Image(np.arange(60, dtype=np.float32).reshape(3, 4, 5))
+    layers.append(layer)
+    frames = RemoteFrames(layers)
+    frames.export(layer.name)
+    frames.on_poll()
+
+    frame = frames._exports[id(layer)].frame
+    attached = SharedFrame.attach(frame.name)
+    np.testing.assert_array_equal(attached.array, layer._slice.image.raw)
+    counter = attached.counter
+
+    # nothing changed, nothing is written
+    frames.on_poll()
+    assert attached.counter == counter
+
+    layer.data = layer.data + 1
+    frames.on_poll()
+    assert attached.counter == counter + 2
+    np.testing.assert_array_equal(attached.array, layer._slice.image.raw)
+
+    layers.append(Points())
+    with pytest.raises(TypeError, match='Image or Labels'):
+        frames.export('Points')
+
+    attached.close()
+    frames.close()
+
+
+@pytest.mark.usefixtures('shared_frame')
+def test_remote_manager_close_unlinks_exports():
+    layers = LayerList()
+    layer = Image(np.zeros((4, 5), dtype=np.float32))
+    layers.append(layer)
+    manager = RemoteManager(layers)
+    manager._frames.export(layer.name)
+    manager.on_poll(None)
+    name = manager._frames._exports[id(layer)].frame.name
+
+    manager.close()
+    with pytest.raises(FileNotFoundError):
+        SharedFrame.attach(name)
@@ -1,15 +1,18 @@
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pytest
 from npe2 import DynamicPlugin
 
 from napari._tests.utils import (
+    assert_layer_cycles_do_not_leak,
     count_warning_events,
     good_layer_data,
     layer_test_data,
 )
 from napari.components import ViewerModel
+from napari.components._cursor_status import CursorStatusSnapshot
 from napari.errors import MultipleReaderError, ReaderPluginError
 from napari.errors.reader_errors import NoAvailableReaderError
 from napari.layers import Image
@@ -469,6 +472,45 @@ def test_add_remove_layer_dims_change():
     assert viewer.dims.ndim == 2
 
 
+def test_add_layers_updates_viewer_once():
+    """Test that adding layers in bulk updates the viewer at the end."""
+    viewer = ViewerModel()
+    range_events = []
+    viewer.dims.events.range.connect(range_events.append)
+    layers = [
+        Image(np.zeros((5, 10, 10)), translate=(0, 10 * i, 0))
+        for i in range(10)
+    ]
+
+    assert viewer.add_layers(layers) == layers
+    assert len(viewer.layers) == 10
+    assert viewer.layers.selection.active is layers[-1]
+    assert viewer.dims.ndim == 3
+    assert viewer.dims.range[1] == (0, 99, 1)
+    assert viewer.dims.point[0] == 2
+    # once for the new ndim, and once for the extent of all layers
+    assert len(range_events) == 2
+    assert all(layer._slicing_state._loaded for layer in layers)
+
+
+def test_batched_update_nested_and_removal():
+    """Test that nested batches defer removals and the active layer."""
+    viewer = ViewerModel()
+    layer_a = viewer.add_image(np.zeros((10, 10)))
+    with viewer.layers.batched_update():
+        with viewer.layers.batched_update():
+            layer_b = viewer.add_image(np.zeros((5, 20, 20)))
+        assert viewer.dims.ndim == 2
+        viewer.layers.remove(layer_a)
+        assert viewer.dims.ndim == 2
+    assert viewer.dims.ndim == 3
+    assert viewer.dims.range[2] == (0, 19, 1)
+    assert layer_b._highlight_visible
+
+    viewer.layers.clear()
+    assert viewer.dims.ndim == 2
+
+
 @pytest.mark.parametrize('data', good_layer_data)
 def test_add_layer_from_data(data):
     # make sure adding valid layer data calls the proper corresponding add_*
@@ -761,6 +803,13 @@ def test_add_remove_layer_no_callbacks(Layer, data, ndim):
         assert len(em.callbacks) == count_warning_events(em.callbacks)
 
 
+@pytest.mark.parametrize(('Layer', 'data', 'ndim'), layer_test_data)
+def test_add_remove_layer_does_not_leak(Layer, data, ndim):
+    """Test that removed layers and their objects are freed."""
+    viewer = ViewerModel()
+    assert_layer_cycles_do_not_leak(viewer, Layer, data)
+
+
 @pytest.mark.parametrize(('Layer', 'data', 'ndim'), layer_test_data)
 def test_add_remove_layer_external_callbacks(Layer, data, ndim):
     """Test external callbacks for layer emmitters preserved."""
@@ -1062,6 +1111,77 @@ def test_get_status_text():
     assert viewer.tooltip.text == '0\na: 1'
 
 
+def test_get_status_text_from_snapshot():
+    viewer = ViewerModel(ndisplay=2)
+    viewer.mouse_over_canvas = True
+    viewer.tooltip.visible = False
+    data = np.zeros((10, 10), dtype='uint8')
+    data[1, 2] = 3
+    viewer.add_labels(data)
+    viewer.add_labels(data * 2)
+    viewer.layers.select_all()
+    viewer.cursor.position = (1, 2)
+    snapshot = CursorStatusSnapshot.from_viewer(viewer)
+
+    viewer.cursor.position = (5, 5)
+    status, _ = viewer._calc_status_from_cursor(snapshot)
+    assert status == ' [1 2] » Labels [1]: 6    Labels: 3'
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        parallel = viewer._calc_status_from_cursor(snapshot, executor=executor)
+    assert parallel == (status, '')
+
+    assert (
+        viewer._calc_status_from_cursor(snapshot, should_cancel=lambda: True)
+        is None
+    )
+
+
+def test_status_from_snapshot_uses_recorded_transforms_and_slice():
+    viewer = ViewerModel(ndisplay=2)
+    viewer.mouse_over_canvas = True
+    viewer.tooltip.visible = False
+    data = np.zeros((10, 10), dtype='uint8')
+    data[1, 2] = 3
+    layer = viewer.add_image(data)
+    viewer.cursor.position = (1, 2)
+    snapshot = CursorStatusSnapshot.from_viewer(viewer)
+
+    # the main thread changes the layer before the status is computed
+    layer.scale = (2, 2)
+    layer.data = np.ones((10, 10), dtype='uint8')
+    status, _ = viewer._calc_status_from_cursor(snapshot)
+    assert status['value'] == '3'
+    assert layer._transforms['data2physical'].scale.tolist() == [2, 2]
+
+    # the current state maps the cursor to [0 1] in the new data
+    status, _ = viewer._calc_status_from_cursor()
+    assert status['value'] == '1'
+
+
+def test_status_from_snapshot_uses_recorded_points():
+    viewer = ViewerModel(ndisplay=2)
+    viewer.mouse_over_canvas = True
+    viewer.tooltip.visible = True
+    layer = viewer.add_points(
+        [[1, 2], [5, 5]], size=2, features={'a': ['first', 'second']}
+    )
+    viewer.cursor.position = (1, 2)
+    snapshot = CursorStatusSnapshot.from_viewer(viewer)
+
+    # the main thread moves the points before the status is computed
+    layer.data = [[5, 5], [1, 2]]
+    status, tooltip = viewer._calc_status_from_cursor(snapshot)
+    assert status['value'] == '0; a: first'
+    assert tooltip == 'a: first'
+    # in pan_zoom mode, the point is found in the computation, which does
+    # not change the layer
+    assert layer._value is None
+
+    status, tooltip = viewer._calc_status_from_cursor()
+    assert status['value'] == '1; a: second'
+
+
 def test_reset_view():
     """Test camera angle behavior after a viewer reset."""
     viewer = ViewerModel(ndisplay=3)
@@ -4,7 +4,6 @@ from typing import TYPE_CHECKING, Literal, cast
 
 import numpy as np
 from pydantic import field_validator
-from scipy.spatial.transform import Rotation as R
 
 from napari.utils.camera_orientations import (
     DEFAULT_ORIENTATION_TYPED,
@@ -77,6 +76,8 @@ class Camera(EventedModel):
         """
         # once we're in scene-land, we pretend to be in xyz space (axes names don't
         # mean anything after all...) which simplifies the logic a lot.
+        from scipy.spatial.transform import Rotation as R
+
         rotation = R.from_euler('xyz', self.angles, degrees=True)
         # view direction is given by the z component, but flipping the sign.
         # This is because the default view direction at angles (0, 0, 0) is (-1, 0, 0)
@@ -92,6 +93,8 @@ class Camera(EventedModel):
         """
         # once we're in scene-land, we pretend to be in xyz space (axes names don't
         # mean anything after all...) which simplifies the logic a lot.
+        from scipy.spatial.transform import Rotation as R
+
         rotation = R.from_euler('xyz', self.angles, degrees=True)
         # up direction is given by the y component, but flipping the sign.
         # This is because the default up direction at angles (0, 0, 0) is (0, -1, 0)
@@ -141,6 +144,8 @@ class Camera(EventedModel):
         matrix = -np.array(
             (view_direction_arr, up_direction_arr, right_direction)
         )
+        from scipy.spatial.transform import Rotation as R
+
         self.angles = R.from_matrix(matrix).as_euler('xyz', degrees=True)
 
     def calculate_nd_view_direction(
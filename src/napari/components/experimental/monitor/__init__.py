@@ -1,6 +1,7 @@
 """Monitor service."""
 
 from napari.components.experimental.monitor._monitor import monitor
+from napari.components.experimental.monitor._shared_frame import SharedFrame
 from napari.components.experimental.monitor._utils import numpy_dumps
 
-__all__ = ['monitor', 'numpy_dumps']
+__all__ = ['SharedFrame', 'monitor', 'numpy_dumps']
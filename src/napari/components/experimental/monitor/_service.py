@@ -87,10 +87,13 @@ The client can access data['tiled_image_layer']. Clients should be
 resilient to missing data. Nn case the napari version is different than
 expected, or is just not producing that data for some reason.
 
-Future Work
------------
-We plan to investigate the use of numpy shared memory buffers for bulk
-binary data. Possibly using recarray to organized things.
+Passing Arrays
+--------------
+Arrays are not sent through the queues, which would pickle them. Instead
+the client and napari map the same SharedFrame shared memory blocks. The
+client creates a frame and sends an "attach_shared_frame" command with its
+name to show it in a layer, or sends an "export_slice" command to receive
+the current slice of a layer. See RemoteFrames.
 """
 
 import copy
@@ -0,0 +1,201 @@
+"""SharedFrame class.
+
+An ndarray in a multiprocessing.shared_memory block, that napari and
+monitor clients both map without copying it.
+
+The block starts with a fixed size header describing the array, followed by
+the array data:
+
+    magic    8 bytes    b'NAPFRAME'
+    counter  uint64     incremented by the writer around each write
+    ndim     uint32     number of dimensions of the array
+    dtype    16 bytes   numpy dtype string, such as b'<u2'
+    shape    8 int64    shape of the array, only the first ndim are used
+
+The counter is odd while a frame is being written and even once it is
+complete. Readers compare it to the last counter they saw to know that
+there is a new frame, without any message being sent.
+
+A client streaming frames into napari does:
+
+    frame = SharedFrame.create((512, 512), np.uint16)
+    commands.put({'attach_shared_frame': {'name': frame.name}})
+    while acquiring:
+        frame.write(camera.read())
+
+This module only depends on numpy and the standard library, so that
+clients can use it without importing the rest of napari.
+"""
+
+from __future__ import annotations
+
+import contextlib
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+import numpy.typing as npt
+
+MAGIC = b'NAPFRAME'
+
+#: maximum number of dimensions of a shared frame
+MAX_NDIM = 8
+
+HEADER_DTYPE = np.dtype(
+    [
+        ('magic', 'S8'),
+        ('counter', '<u8'),
+        ('ndim', '<u4'),
+        ('dtype', 'S16'),
+        ('shape', '<i8', (MAX_NDIM,)),
+    ]
+)
+
+# Align the data so that any dtype can be viewed in place.
+HEADER_SIZE = 128
+assert HEADER_DTYPE.itemsize <= HEADER_SIZE
+
+
+def _open_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing block without taking ownership of it.
+
+    Before Python 3.13, attaching registers the block with the resource
+    tracker of this process, which unlinks it when this process exits,
+    even though the process that created it still uses it.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, 'shared_memory')  # type: ignore[attr-defined]
+        return shm
+
+
+class SharedFrame:
+    """An ndarray in a shared memory block, with a header describing it.
+
+    Use :meth:`create` to allocate a new block, or :meth:`attach` to map a
+    block created by another process.
+
+    Parameters
+    ----------
+    shm : multiprocessing.shared_memory.SharedMemory
+        The block holding the header and the array.
+    owner : bool
+        Whether this process created the block, and should unlink it.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool) -> None:
+        self._shm = shm
+        self._owner = owner
+        self._header = np.ndarray((), dtype=HEADER_DTYPE, buffer=shm.buf)
+        if self._header['magic'].item() != MAGIC:
+            raise ValueError(f'Shared memory {shm.name} is not a SharedFrame')
+        ndim = int(self._header['ndim'])
+        shape = tuple(int(n) for n in self._header['shape'][:ndim])
+        dtype = np.dtype(self._header['dtype'].item().decode('ascii'))
+        self._array: np.ndarray = np.ndarray(
+            shape, dtype=dtype, buffer=shm.buf, offset=HEADER_SIZE
+        )
+
+    @classmethod
+    def create(
+        cls,
+        shape: tuple[int, ...],
+        dtype: npt.DTypeLike,
+        name: str | None = None,
+    ) -> SharedFrame:
+        """Allocate a new shared frame, filled with zeros.
+
+        Parameters
+        ----------
+        shape : tuple of int
+            Shape of the array.
+        dtype : dtype
+            Data type of the array.
+        name : str, optional
+            Name of the block. By default, a unique name is generated.
+
+        Returns
+        -------
+        SharedFrame
+            The frame, which this process owns.
+        """
+        dtype = np.dtype(dtype)
+        if len(shape) > MAX_NDIM:
+            raise ValueError(
+                f'SharedFrame supports up to {MAX_NDIM} dimensions, '
+                f'got shape {shape}'
+            )
+        if dtype.hasobject or dtype.fields is not None:
+            raise ValueError(f'SharedFrame does not support dtype {dtype}')
+        nbytes = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+        shm = shared_memory.SharedMemory(
+            name=name, create=True, size=HEADER_SIZE + max(nbytes, 1)
+        )
+        header = np.ndarray((), dtype=HEADER_DTYPE, buffer=shm.buf)
+        header['magic'] = MAGIC
+        header['counter'] = 0
+        header['ndim'] = len(shape)
+        header['dtype'] = dtype.str.encode('ascii')
+        header['shape'][: len(shape)] = shape
+        del header
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> SharedFrame:
+        """Map a shared frame created by another process.
+
+        Parameters
+        ----------
+        name : str
+            Name of the block.
+
+        Returns
+        -------
+        SharedFrame
+            The frame, which this process does not own.
+        """
+        return cls(_open_shared_memory(name), owner=False)
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block."""
+        return self._shm.name
+
+    @property
+    def array(self) -> np.ndarray:
+        """The array, a view of the shared memory."""
+        return self._array
+
+    @property
+    def counter(self) -> int:
+        """Counter incremented by the writer, odd during a write."""
+        return int(self._header['counter'])
+
+    def write(self, frame: npt.ArrayLike) -> None:
+        """Copy a frame into the array.
+
+        Parameters
+        ----------
+        frame : array-like
+            Frame with the shape of the array, cast to its dtype.
+        """
+        self._header['counter'] += 1
+        try:
+            self._array[...] = frame
+        finally:
+            self._header['counter'] += 1
+
+    def close(self) -> None:
+        """Unmap the block, and unlink it if this process created it.
+
+        The array, and any array viewing it, must not be used afterwards.
+        """
+        self._array = np.empty(self._array.shape, self._array.dtype)
+        self._header = np.zeros((), dtype=HEADER_DTYPE)
+        # if arrays still view the block, it is unmapped once they are
+        # garbage collected
+        with contextlib.suppress(BufferError):
+            self._shm.close()
+        if self._owner:
+            self._shm.unlink()
@@ -3,6 +3,7 @@
 import json
 import logging
 
+from napari.components.experimental.remote._frames import RemoteFrames
 from napari.components.layerlist import LayerList
 
 LOGGER = logging.getLogger('napari.monitor')
@@ -26,6 +27,8 @@ class RemoteCommands:
     ----------
     layers : LayerList
         The viewer's layers, so we can call into them.
+    frames : RemoteFrames
+        The layer data shared with clients.
 
     Notes
     -----
@@ -35,8 +38,9 @@ class RemoteCommands:
     commands, command implementations should be spread out all over the system.
     """
 
-    def __init__(self, layers: LayerList) -> None:
+    def __init__(self, layers: LayerList, frames: RemoteFrames) -> None:
         self.layers = layers
+        self.frames = frames
 
     def process_command(self, event) -> None:
         """Process this one command from the remote client.
@@ -63,3 +67,38 @@ class RemoteCommands:
                 method(args)
             except AttributeError:
                 LOGGER.exception('RemoteCommands.%s does not exist.', name)
+
+    def attach_shared_frame(self, args: dict) -> None:
+        """Add a layer showing a SharedFrame written by the client.
+
+            {"attach_shared_frame": {"name": "psm_1234", "labels": false}}
+
+        Parameters
+        ----------
+        args : dict
+            The ``name`` of the SharedFrame block, and optionally the
+            ``layer_name`` and whether the layer is ``labels``.
+        """
+        try:
+            self.frames.attach(
+                args['name'],
+                layer_name=args.get('layer_name'),
+                labels=args.get('labels', False),
+            )
+        except (KeyError, OSError, ValueError):
+            LOGGER.exception('Cannot attach shared frame %s', args)
+
+    def export_slice(self, args: dict) -> None:
+        """Share the current slice of a layer with the client.
+
+            {"export_slice": {"layer": "Image"}}
+
+        Parameters
+        ----------
+        args : dict
+            The name of the ``layer`` to export.
+        """
+        try:
+            self.frames.export(args['layer'])
+        except (KeyError, TypeError):
+            LOGGER.exception('Cannot export slice %s', args)
@@ -0,0 +1,182 @@
+"""RemoteFrames class.
+
+Shares layer data with remote clients through SharedFrame blocks.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+
+from napari.components.experimental.monitor import monitor
+from napari.components.experimental.monitor._shared_frame import SharedFrame
+from napari.components.layerlist import LayerList
+from napari.layers import Image, Labels, Layer
+from napari.layers._scalar_field.scalar_field import ScalarFieldBase
+from napari.utils.events import Event
+
+LOGGER = logging.getLogger('napari.monitor')
+
+# Layer events after which the slice of a layer may have changed in place.
+_SLICE_UPDATE_EVENTS = ('set_data', 'labels_update', 'region_update')
+
+
+@dataclass
+class _Input:
+    """A frame written by a client, shown as the data of a layer."""
+
+    frame: SharedFrame
+    layer: Layer
+    counter: int
+
+
+@dataclass
+class _Export:
+    """A frame napari writes the current slice of a layer into."""
+
+    layer: ScalarFieldBase
+    frame: SharedFrame | None = None
+    slice: object = None
+    dirty: bool = True
+    callbacks: list = field(default_factory=list)
+
+
+class RemoteFrames:
+    """Layer data shared with remote clients without copying it.
+
+    A client streams frames into napari by creating a SharedFrame and
+    sending its name in an ``attach_shared_frame`` command. The frame array
+    becomes the data of a new layer, which is refreshed whenever the client
+    writes a new frame.
+
+    A client receives the current slice of a layer by sending an
+    ``export_slice`` command. napari then writes the slice into a
+    SharedFrame it owns every time the slice changes, and sends the name of
+    the frame in a ``shared_frame_exported`` message.
+
+    Parameters
+    ----------
+    layers : LayerList
+        The viewer's layers.
+    """
+
+    def __init__(self, layers: LayerList) -> None:
+        self.layers = layers
+        self._inputs: dict[str, _Input] = {}
+        self._exports: dict[int, _Export] = {}
+        layers.events.removed.connect(self._on_layer_removed)
+
+    def attach(
+        self, name: str, layer_name: str | None = None, labels: bool = False
+    ) -> Layer:
+        """Add a layer whose data is a frame shared by a client.
+
+        Parameters
+        ----------
+        name : str
+            Name of the SharedFrame block.
+        layer_name : str, optional
+            Name of the layer. By default, the name of the block.
+        labels : bool
+            If True, add a Labels layer instead of an Image layer.
+
+        Returns
+        -------
+        Layer
+            The new layer.
+        """
+        frame = SharedFrame.attach(name)
+        layer_type = Labels if labels else Image
+        layer = layer_type(frame.array, name=layer_name or name)
+        self._inputs[name] = _Input(frame, layer, frame.counter)
+        self.layers.append(layer)
+        return layer
+
+    def export(self, layer_name: str) -> None:
+        """Share the current slice of a layer with clients.
+
+        Parameters
+        ----------
+        layer_name : str
+            Name of an Image or Labels layer.
+        """
+        layer = self.layers[layer_name]
+        if not isinstance(layer, ScalarFieldBase):
+            raise TypeError(
+                f'Can only export the slice of Image or Labels layers, '
+                f'not {type(layer).__name__}'
+            )
+        if id(layer) in self._exports:
+            return
+        export = _Export(layer)
+
+        def _mark_dirty(event: Event | None = None) -> None:
+            export.dirty = True
+
+        for event_name in _SLICE_UPDATE_EVENTS:
+            if hasattr(layer.events, event_name):
+                getattr(layer.events, event_name).connect(_mark_dirty)
+                export.callbacks.append((event_name, _mark_dirty))
+        self._exports[id(layer)] = export
+
+    def on_poll(self) -> None:
+        """Refresh layers with new frames, and export changed slices."""
+        for inp in self._inputs.values():
+            counter = inp.frame.counter
+            # an odd counter means the client is writing the frame
+            if counter != inp.counter and counter % 2 == 0:
+                inp.counter = counter
+                inp.layer.refresh()
+
+        for export in self._exports.values():
+            if export.dirty or export.layer._slice is not export.slice:
+                self._export_slice(export)
+
+    def _export_slice(self, export: _Export) -> None:
+        layer = export.layer
+        data = layer._slice.image.raw
+        frame = export.frame
+        if (
+            frame is None
+            or frame.array.shape != data.shape
+            or frame.array.dtype != data.dtype
+        ):
+            if frame is not None:
+                frame.close()
+            frame = export.frame = SharedFrame.create(data.shape, data.dtype)
+            monitor.send_message(
+                {
+                    'shared_frame_exported': {
+                        'layer': layer.name,
+                        'name': frame.name,
+                    }
+                }
+            )
+        frame.write(data)
+        export.slice = layer._slice
+        export.dirty = False
+
+    def _on_layer_removed(self, event: Event) -> None:
+        layer = event.value
+        for name, inp in list(self._inputs.items()):
+            if inp.layer is layer:
+                # the layer may still be in use, so the block is unmapped
+                # when its data is garbage collected
+                del self._inputs[name]
+        export = self._exports.pop(id(layer), None)
+        if export is not None:
+            self._close_export(export)
+
+    def _close_export(self, export: _Export) -> None:
+        for event_name, callback in export.callbacks:
+            getattr(export.layer.events, event_name).disconnect(callback)
+        if export.frame is not None:
+            export.frame.close()
+
+    def close(self) -> None:
+        """Stop sharing data, and unlink the frames napari created."""
+        self.layers.events.removed.disconnect(self._on_layer_removed)
+        self._inputs.clear()
+        for export in self._exports.values():
+            self._close_export(export)
+        self._exports.clear()
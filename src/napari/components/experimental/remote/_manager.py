@@ -3,6 +3,7 @@
 import logging
 
 from napari.components.experimental.remote._commands import RemoteCommands
+from napari.components.experimental.remote._frames import RemoteFrames
 from napari.components.experimental.remote._messages import RemoteMessages
 from napari.components.layerlist import LayerList
 from napari.utils.events import Event
@@ -16,10 +17,12 @@ class RemoteManager:
     The monitor system itself purposely does not depend on anything else in
     napari except for utils.events.
 
-    However RemoteManager and its children RemoteCommands and
-    RemoteMessages do very much depend on napari. RemoteCommands executes
-    commands sent to napari by clients. RemoteMessages sends messages to
-    remote clients, such as the current state of the layers.
+    However RemoteManager and its children RemoteCommands,
+    RemoteMessages and RemoteFrames do very much depend on napari.
+    RemoteCommands executes commands sent to napari by clients.
+    RemoteMessages sends messages to remote clients, such as the current
+    state of the layers. RemoteFrames shares layer data with clients in
+    shared memory.
 
     Parameters
     ----------
@@ -28,7 +31,8 @@ class RemoteManager:
     """
 
     def __init__(self, layers: LayerList) -> None:
-        self._commands = RemoteCommands(layers)
+        self._frames = RemoteFrames(layers)
+        self._commands = RemoteCommands(layers, self._frames)
         self._messages = RemoteMessages(layers)
 
     def process_command(self, event: Event) -> None:
@@ -42,5 +46,10 @@ class RemoteManager:
         return self._commands.process_command(event)
 
     def on_poll(self, _event: Event) -> None:
-        """Send out messages when polled."""
+        """Update shared frames and send out messages when polled."""
+        self._frames.on_poll()
         self._messages.on_poll()
+
+    def close(self) -> None:
+        """Stop sharing data, and unlink the frames napari created."""
+        self._frames.close()
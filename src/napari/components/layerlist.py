@@ -9,13 +9,16 @@ from functools import cached_property
 from typing import TYPE_CHECKING
 
 import numpy as np
+import numpy.typing as npt
 
+from napari.components._layer_extents import LayerExtents
 from napari.components.dims import RangeTuple
 from napari.layers import Layer
 from napari.layers.utils.layer_utils import Extent
 from napari.utils.events import Event
 from napari.utils.events.containers import SelectableEventedList
 from napari.utils.naming import inc_name_count
+from napari.utils.transforms.transform_utils import embed_in_identity_matrix
 from napari.utils.translations import trans
 
 if TYPE_CHECKING:
@@ -115,6 +118,8 @@ class LayerList(SelectableEventedList[Layer]):
     """
 
     def __init__(self, data=()) -> None:
+        self._extents = LayerExtents()
+        self._batch_depth = 0
         super().__init__(
             data=data,
             basetype=Layer,
@@ -123,6 +128,9 @@ class LayerList(SelectableEventedList[Layer]):
         self.events.add(begin_batch=Event, end_batch=Event, renamed=Event)
         self.events.inserted.connect(self._on_layer_inserted)
         self.events.removed.connect(self._on_layer_removed)
+        # the stacked transforms follow the order of the layers
+        self.events.moved.connect(self._clean_transforms_cache)
+        self.events.reordered.connect(self._clean_transforms_cache)
         self._create_contexts()
 
     def _on_layer_inserted(self, event: Event):
@@ -173,8 +181,24 @@ class LayerList(SelectableEventedList[Layer]):
 
     def _process_delete_item(self, item: Layer):
         super()._process_delete_item(item)
-        item.events.extent.disconnect(self._clean_cache)
-        item.events._extent_augmented.disconnect(self._clean_cache)
+        self._untrack_extent(item)
+
+    def _track_extent(self, layer: Layer):
+        self._extents.update(layer)
+        layer.events.extent.connect(self._on_layer_extent_changed)
+        layer.events._extent_augmented.connect(self._on_layer_extent_changed)
+        self._clean_cache()
+
+    def _untrack_extent(self, layer: Layer):
+        layer.events.extent.disconnect(self._on_layer_extent_changed)
+        layer.events._extent_augmented.disconnect(
+            self._on_layer_extent_changed
+        )
+        self._extents.remove(layer)
+        self._clean_cache()
+
+    def _on_layer_extent_changed(self, event: Event):
+        self._extents.update(event.source)
         self._clean_cache()
 
     def _clean_cache(self):
@@ -185,6 +209,11 @@ class LayerList(SelectableEventedList[Layer]):
             '_step_size',
         )
         [self.__dict__.pop(p, None) for p in cached_properties]
+        self._clean_transforms_cache()
+
+    def _clean_transforms_cache(self, event: Event | None = None):
+        self.__dict__.pop('_data_to_world_matrices', None)
+        self.__dict__.pop('_world_to_data_matrices', None)
 
     def __newlike__(self, data):
         return LayerList(data)
@@ -204,10 +233,19 @@ class LayerList(SelectableEventedList[Layer]):
         new_name : str
             Coerced, unique name.
         """
-        existing_layers = {x.name for x in self if x is not layer}
-        for _ in range(len(self)):
-            if name in existing_layers:
-                name = inc_name_count(name)
+        existing_layers = {x.name for x in self._list if x is not layer}
+        if name not in existing_layers:
+            return name
+        name = inc_name_count(name)
+        # the name now ends with a count in square brackets, which is
+        # incremented directly rather than by matching the name each time
+        prefix = name[: name.rindex('[') + 1]
+        count = int(name[len(prefix) : -1])
+        for _ in range(len(self) - 1):
+            if name not in existing_layers:
+                break
+            count += 1
+            name = f'{prefix}{count}]'
         return name
 
     def _update_name(self, event):
@@ -238,6 +276,30 @@ class LayerList(SelectableEventedList[Layer]):
     def __getitem__(self, item):
         return super().__getitem__(item)
 
+    def __contains__(self, key) -> bool:
+        if isinstance(key, Layer):
+            return key in self._list
+        return super().__contains__(key)
+
+    def index(self, value, start: int = 0, stop: int | None = None) -> int:
+        if isinstance(value, Layer):
+            # layers compare by identity, so lookups can be done by the
+            # underlying list instead of comparing items one by one, which
+            # matters when inserting many layers
+            try:
+                return self._list.index(
+                    value, start, len(self) if stop is None else stop
+                )
+            except ValueError:
+                raise ValueError(
+                    trans._(
+                        '{value!r} is not in list',
+                        deferred=True,
+                        value=value,
+                    )
+                ) from None
+        return super().index(value, start, stop)
+
     def __setitem__(self, key, value):
         old = self._list[key]
         if isinstance(key, slice):
@@ -245,15 +307,17 @@ class LayerList(SelectableEventedList[Layer]):
         elif isinstance(key, int):
             (value,) = self._ensure_unique((value,), (old,))
         super().__setitem__(key, value)
+        # replacing a single item does not go through insert and delete
+        if isinstance(key, int) and value is not old:
+            self._untrack_extent(old)
+            self._track_extent(value)
 
     def insert(self, index: int, value: Layer):
         """Insert ``value`` before index."""
         (value,) = self._ensure_unique((value,))
         new_layer = self._type_check(value)
         new_layer.name = self._coerce_name(new_layer.name)
-        self._clean_cache()
-        new_layer.events.extent.connect(self._clean_cache)
-        new_layer.events._extent_augmented.connect(self._clean_cache)
+        self._track_extent(new_layer)
         super().insert(index, new_layer)
 
     def remove_selected(self):
@@ -280,7 +344,7 @@ class LayerList(SelectableEventedList[Layer]):
         -------
         extent_world : array, shape (2, D)
         """
-        return self._get_extent_world([layer.extent for layer in self])
+        return self._get_tracked_extent_world(augmented=False)
 
     @cached_property
     def _extent_world_augmented(self) -> np.ndarray:
@@ -293,44 +357,43 @@ class LayerList(SelectableEventedList[Layer]):
         -------
         extent_world : array, shape (2, D)
         """
-        return self._get_extent_world(
-            [layer._extent_augmented for layer in self],
-            augmented=True,
-        )
+        return self._get_tracked_extent_world(augmented=True)
+
+    def _get_tracked_extent_world(self, augmented: bool) -> np.ndarray:
+        """Extent of all layers, updated only for layers that changed."""
+        if len(self) == 0:
+            return self._get_extent_world([], augmented=augmented)
+        extent_world = self._extents.world(self.ndim, augmented=augmented)
+        # 512 element default extent as documented in `_get_extent_world`
+        extent_world[0] = np.nan_to_num(extent_world[0], nan=-0.5)
+        extent_world[1] = np.nan_to_num(extent_world[1], nan=511.5)
+        return extent_world
+
+    @staticmethod
+    def _stack_aligned(arrays, ndim):
+        """Stack 1D arrays of up to ndim values aligned on their last axes.
+
+        Missing leading values are NaN, since layers of lower dimensionality
+        correspond to the last dimensions of the world.
+        """
+        stacked = np.full((len(arrays), ndim), np.nan)
+        for row, array in zip(stacked, arrays, strict=False):
+            if len(array):
+                row[-len(array) :] = array
+        return stacked
 
     def _get_min_and_max(self, mins_list, maxes_list):
-        # Reverse dimensions since it is the last dimensions that are
-        # displayed.
-        mins_list = [mins[::-1] for mins in mins_list]
-        maxes_list = [maxes[::-1] for maxes in maxes_list]
-
-        with warnings.catch_warnings():
-            # Taking the nanmin and nanmax of an axis of all nan
-            # raises a warning and returns nan for that axis
-            # as we have do an explicit nan_to_num below this
-            # behaviour is acceptable and we can filter the
-            # warning
-            warnings.filterwarnings(
-                'ignore',
-                message=str(
-                    trans._('All-NaN axis encountered', deferred=True)
-                ),
-            )
-            min_v = np.nanmin(
-                list(itertools.zip_longest(*mins_list, fillvalue=np.nan)),
-                axis=1,
-            )
-            max_v = np.nanmax(
-                list(itertools.zip_longest(*maxes_list, fillvalue=np.nan)),
-                axis=1,
-            )
+        ndim = max(map(len, itertools.chain(mins_list, maxes_list)), default=0)
+        # fmin and fmax ignore nan, and give nan for axes that are all nan,
+        # which are replaced by the default extent below
+        min_v = np.fmin.reduce(self._stack_aligned(mins_list, ndim), axis=0)
+        max_v = np.fmax.reduce(self._stack_aligned(maxes_list, ndim), axis=0)
 
         # 512 element default extent as documented in `_get_extent_world`
         min_v = np.nan_to_num(min_v, nan=-0.5)
         max_v = np.nan_to_num(max_v, nan=511.5)
 
-        # switch back to original order
-        return min_v[::-1], max_v[::-1]
+        return min_v, max_v
 
     def _get_extent_world(self, layer_extent_list, augmented=False):
         """Extent of layers in world coordinates.
@@ -369,16 +432,13 @@ class LayerList(SelectableEventedList[Layer]):
         -------
         step_size : array, shape (D,)
         """
-        return self._get_step_size([layer.extent for layer in self])
+        if len(self) == 0:
+            return np.ones(self.ndim)
+        return self._extents.step(self.ndim)
 
     def _step_size_from_scales(self, scales):
-        # Reverse order so last axes of scale with different ndim are aligned
-        scales = [scale[::-1] for scale in scales]
-        full_scales = list(
-            np.array(list(itertools.zip_longest(*scales, fillvalue=np.nan)))
-        )
-        # restore original order
-        return np.nanmin(full_scales, axis=1)[::-1]
+        ndim = max(map(len, scales), default=0)
+        return np.nanmin(self._stack_aligned(scales, ndim), axis=0)
 
     def _get_step_size(self, layer_extent_list):
         if len(self) == 0:
@@ -420,7 +480,99 @@ class LayerList(SelectableEventedList[Layer]):
         Extent bounds are inclusive. See Layer.extent for a detailed explanation
         of how extents are calculated.
         """
-        return self.get_extent(list(self))
+        return Extent(
+            data=None, world=self._extent_world, step=self._step_size
+        )
+
+    @cached_property
+    def _data_to_world_matrices(self) -> np.ndarray:
+        """Homogeneous data to world matrices of the layers.
+
+        The matrix of each layer is embedded bottom right of an identity
+        matrix with the dimensionality of the list, as layers correspond to
+        the last dimensions of the world.
+
+        Returns
+        -------
+        matrices : array, shape (N, D + 1, D + 1)
+        """
+        ndim = self.ndim
+        matrices = np.empty((len(self), ndim + 1, ndim + 1))
+        for matrix, layer in zip(matrices, self, strict=False):
+            matrix[...] = embed_in_identity_matrix(
+                layer._data_to_world.affine_matrix, ndim + 1
+            )
+        return matrices
+
+    @cached_property
+    def _world_to_data_matrices(self) -> np.ndarray:
+        """Homogeneous world to data matrices of the layers.
+
+        Returns
+        -------
+        matrices : array, shape (N, D + 1, D + 1)
+        """
+        return np.linalg.inv(self._data_to_world_matrices)
+
+    def _pad_coords(self, coords: npt.ArrayLike) -> np.ndarray:
+        """Keep or pad the last axis of coordinates to ndim values."""
+        coords = np.asarray(coords, dtype=float)
+        ndim = self.ndim
+        if coords.shape[-1] >= ndim:
+            return coords[..., coords.shape[-1] - ndim :]
+        padding = [(0, 0)] * (coords.ndim - 1) + [(ndim - coords.shape[-1], 0)]
+        return np.pad(coords, padding)
+
+    def world_to_data(self, position: npt.ArrayLike) -> np.ndarray:
+        """Convert world coordinates to the data coordinates of every layer.
+
+        This gives the same result as ``Layer.world_to_data`` for each
+        layer, with a single matrix product for all layers and positions.
+
+        Parameters
+        ----------
+        position : array, shape (D,) or (M, D)
+            Positions in world coordinates. If they have more than
+            ``self.ndim`` dimensions, the later dimensions are used.
+
+        Returns
+        -------
+        array, shape (N, D) or (N, M, D)
+            Positions in the data coordinates of each of the N layers, with
+            D equal to ``self.ndim``. The coordinates in a layer are the
+            last ``layer.ndim`` values.
+        """
+        coords = self._pad_coords(position)
+        if coords.ndim == 1:
+            return _apply_homogeneous(
+                self._world_to_data_matrices, coords[np.newaxis]
+            )[:, 0]
+        return _apply_homogeneous(self._world_to_data_matrices, coords)
+
+    def data_to_world(self, position: npt.ArrayLike) -> np.ndarray:
+        """Convert data coordinates of every layer to world coordinates.
+
+        This gives the same result as ``Layer.data_to_world`` for each
+        layer, with a single matrix product for all layers and positions.
+
+        Parameters
+        ----------
+        position : array, shape (N, D) or (N, M, D)
+            Positions in the data coordinates of each of the N layers. If
+            they have fewer than ``self.ndim`` dimensions, they are padded
+            with leading zeros.
+
+        Returns
+        -------
+        array, shape (N, D) or (N, M, D)
+            Positions in world coordinates.
+        """
+        coords = self._pad_coords(position)
+        if coords.ndim == 2:
+            return _apply_homogeneous(
+                self._data_to_world_matrices, coords[:, np.newaxis]
+            )[:, 0]
+        return _apply_homogeneous(self._data_to_world_matrices, coords)
 
     @property
     def _ranges(self) -> tuple[RangeTuple, ...]:
@@ -546,10 +698,53 @@ class LayerList(SelectableEventedList[Layer]):
         with self.batched_update():
             super().clear()
 
+    @property
+    def _in_batch(self) -> bool:
+        """Whether changes are made within ``batched_update``."""
+        return self._batch_depth > 0
+
     @contextlib.contextmanager
     def batched_update(self):
+        """Defer updates that depend on all layers until the end.
+
+        Listeners of the ``begin_batch`` and ``end_batch`` events, such as the
+        viewer and the canvas, update once at the end of the block instead of
+        after each inserted or removed layer. Nested blocks only emit these
+        events for the outermost block.
+
+        Examples
+        --------
+        >>> with viewer.layers.batched_update():
+        ...     for tile in tiles:
+        ...         viewer.add_image(tile.data, translate=tile.offset)
+        """
+        self._batch_depth += 1
         try:
-            self.events.begin_batch()
+            if self._batch_depth == 1:
+                self.events.begin_batch()
             yield
         finally:
-            self.events.end_batch()
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.events.end_batch()
+
+
+def _apply_homogeneous(matrices: np.ndarray, coords: np.ndarray) -> np.ndarray:
+    """Apply stacked homogeneous matrices to coordinates.
+
+    Parameters
+    ----------
+    matrices : array, shape (N, D + 1, D + 1)
+        Homogeneous matrices.
+    coords : array, shape (M, D) or (N, M, D)
+        Coordinates, shared by all matrices or one set per matrix.
+
+    Returns
+    -------
+    array, shape (N, M, D)
+        Transformed coordinates.
+    """
+    ndim = matrices.shape[-1] - 1
+    linear = matrices[:, :ndim, :ndim]
+    translate = matrices[:, np.newaxis, :ndim, ndim]
+    return coords @ linear.transpose(0, 2, 1) + translate
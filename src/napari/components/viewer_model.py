@@ -5,6 +5,8 @@ import itertools
 import os
 import warnings
 from collections.abc import (
+    Callable,
+    Iterable,
     Iterator,
     Mapping,
     MutableMapping,
@@ -27,6 +29,7 @@ from app_model.expressions import Context
 from pydantic import Field, PrivateAttr, field_validator
 
 from napari import layers
+from napari.components._cursor_status import CursorStatusSnapshot
 from napari.components._layer_slicer import _LayerSlicer
 from napari.components._viewer_mouse_bindings import (
     dims_scroll,
@@ -102,8 +105,12 @@ from napari.utils.theme import available_themes, is_theme_available
 from napari.utils.translations import trans
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     from npe2.types import SampleDataCreator
 
+    from napari.layers.base._status import _LayerStatusInputs
+
 
 DEFAULT_THEME = 'dark'
 EXCLUDE_DICT = {
@@ -217,6 +224,12 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
     # Need to use default factory because slicer is not copyable which
     # is required for default values.
     _layer_slicer: _LayerSlicer = PrivateAttr(default_factory=_LayerSlicer)
+    # layers added during LayerList.batched_update, and whether the layers
+    # or the active layer changed, to update the viewer once at the end
+    _batch_added: list[Layer] = PrivateAttr(default_factory=list)
+    _batch_layers_changed: bool = PrivateAttr(False)
+    _batch_active_changed: bool = PrivateAttr(False)
+    _batch_was_empty: bool = PrivateAttr(False)
 
     def __init__(
         self, title='napari', ndisplay=2, order=(), axis_labels=()
@@ -296,6 +309,8 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
         self.layers.events.removed.connect(self._on_remove_layer)
         self.layers.events.reordered.connect(self._on_layers_change)
         self.layers.selection.events.active.connect(self._on_active_layer)
+        self.layers.events.begin_batch.connect(self._on_begin_batch)
+        self.layers.events.end_batch.connect(self._on_end_batch)
 
         # Add mouse callback
         self.mouse_wheel_callbacks.append(dims_scroll)
@@ -664,7 +679,12 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
 
     def _on_active_layer(self, event):
         """Update viewer state for a new active layer."""
-        active_layer = event.value
+        if self.layers._in_batch:
+            self._batch_active_changed = True
+            return
+        self._update_active_layer(event.value)
+
+    def _update_active_layer(self, active_layer: Layer | None) -> None:
         if active_layer is None:
             for layer in self.layers:
                 layer.update_transform_box_visibility(False)
@@ -693,9 +713,12 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
             self.dims.reset()
         else:
             ranges = self.layers._ranges
-            # TODO: can be optimized with dims.update(), but events need fixing
-            self.dims.ndim = len(ranges)
-            self.dims.range = ranges
+            # adding a layer within the current extent, such as a tile of
+            # a mosaic, leaves the ranges unchanged
+            if ranges != self.dims.range:
+                # TODO: can be optimized with dims.update(), but events need fixing
+                self.dims.ndim = len(ranges)
+                self.dims.range = ranges
 
         new_dim = self.dims.ndim
         dim_diff = new_dim - len(self.cursor.position)
@@ -730,72 +753,87 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
 
     def _calc_status_from_cursor(
         self,
+        snapshot: CursorStatusSnapshot | None = None,
+        *,
+        should_cancel: Callable[[], bool] | None = None,
+        executor: Executor | None = None,
     ) -> tuple[str | Dict, str] | None:
-        if not self.mouse_over_canvas:
+        """Compute the status and the tooltip text at the cursor position.
+
+        Parameters
+        ----------
+        snapshot : CursorStatusSnapshot, optional
+            State of the viewer to compute the status from. By default, the
+            current state of the viewer.
+        should_cancel : callable, optional
+            Checked before the status of each layer is computed. As soon as
+            it returns True, the computation stops and returns None.
+        executor : concurrent.futures.Executor, optional
+            Executor computing the status of several layers in parallel.
+            By default, they are computed in turn.
+
+        Returns
+        -------
+        tuple of status and tooltip text, or None
+            None if the mouse is not over the canvas or if the computation
+            was cancelled.
+        """
+        if snapshot is None:
+            snapshot = CursorStatusSnapshot.from_viewer(self)
+        if not snapshot.mouse_over_canvas:
             return None
+
+        def cancelled() -> bool:
+            return should_cancel is not None and should_cancel()
+
         coord2val: dict[str, list[str]] = {}
         coord_str = ''
         status_str = ''
         tooltip_text = ''
-        selection = self.layers.selection
-        active = selection.active
+        active = snapshot.active
         # TODO: this doesn't work well yet with grid mode (and is broken by wide borders too)
 
         # Compute the tooltip first since it is always needed.
-        if (
-            self.tooltip.visible
-            and active is not None
-            and active._slicing_state._loaded
-        ):
-            tooltip_text = active._get_tooltip_text(
-                np.asarray(self.cursor.position),
-                view_direction=self.cursor._view_direction,
-                dims_displayed=list(self.dims.displayed),
-                world=True,
-            )
+        if snapshot.tooltip_visible and active is not None:
+            tooltip_text = active.get_tooltip_text()
 
         # If there is an active layer and a single selection, calculate status using "the classic way".
         # Then return the status and the tooltip.
-        if (
-            active is not None
-            and active._slicing_state._loaded
-            and len(selection) < 2
-        ):
-            status = active.get_status(
-                self.cursor.position,
-                view_direction=self.cursor._view_direction,
-                dims_displayed=list(self.dims.displayed),
-                world=True,
-            )
-            return status, tooltip_text
+        if active is not None and snapshot.n_selected < 2:
+            if cancelled():
+                return None
+            return active.get_status(), tooltip_text
 
         # Otherwise, return the layer status of multiple selected layers
         # or gridded layers as well as the tooltip.
-        for layer in self.layers[::-1]:
-            if (
-                not layer.visible
-                or layer.opacity == 0
-                or not layer._slicing_state._loaded
-                or (layer not in selection and not self.grid.enabled)
-            ):
-                continue
-            status = layer.get_status(
-                self.cursor.position,
-                view_direction=self.cursor._view_direction,
-                dims_displayed=list(self.dims.displayed),
-                world=True,
-            )
-            separator = '    '
-            emphasis = separator if layer is active else ''
+        def layer_status(
+            inputs: _LayerStatusInputs,
+        ) -> dict[str, str] | None:
+            if cancelled():
+                return None
+            return inputs.get_status()
+
+        layers = snapshot.layers
+        records = [inputs for inputs, _ in layers]
+        statuses: Iterable[dict[str, str] | None]
+        if executor is not None and len(layers) > 1:
+            statuses = executor.map(layer_status, records)
+        else:
+            statuses = map(layer_status, records)
+        separator = '    '
+        for (_, is_active), status in zip(layers, statuses, strict=True):
+            if status is None:
+                return None
+            emphasis = separator if is_active else ''
             coord_str = f'{status["coords"]} » '
             if status['value'] != '':
                 if coord_str not in coord2val:
                     coord2val[coord_str] = []
                 coord2val[coord_str].append(
-                    f'{layer.name}: {status["value"]}{emphasis}'
+                    f'{status["layer_name"]}: {status["value"]}{emphasis}'
                 )
         if coord2val:
-            if not self.grid.enabled:
+            if not snapshot.grid_enabled:
                 # use a single coordinate system
                 values = list(itertools.chain(*coord2val.values()))
                 key = next(iter(coord2val))  # choose arbitrary coordinate
@@ -805,9 +843,9 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
                 for key, values in coord2val.items()
             ]
             status_str = separator.join(status_strs)
-        elif coord_str and not self.grid.enabled:
+        elif coord_str and not snapshot.grid_enabled:
             status_str = coord_str + '[empty]'
-        elif self.grid.enabled:
+        elif snapshot.grid_enabled:
             status_str = '[empty]'
         else:
             status_str = 'Ready'
@@ -863,6 +901,11 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
             layer.events.mode.connect(self._on_layer_mode_change)
         self._layer_help_from_mode(layer)
 
+        if self.layers._in_batch:
+            self._batch_added.append(layer)
+            self._batch_layers_changed = True
+            return
+
         # Update dims
         self._on_layers_change()
         # Slice current layer based on dims
@@ -932,8 +975,36 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
         disconnect_events(layer.events, self)
         disconnect_events(layer.events, self.layers)
 
+        if self.layers._in_batch:
+            self._batch_layers_changed = True
+            return
         self._on_layers_change()
 
+    def _on_begin_batch(self) -> None:
+        """Start deferring updates that depend on all layers."""
+        self._batch_added = []
+        self._batch_layers_changed = False
+        self._batch_active_changed = False
+        self._batch_was_empty = len(self.layers) == 0
+
+    def _on_end_batch(self) -> None:
+        """Update the viewer once for all layers added or removed in a batch."""
+        remaining = set(self.layers)
+        added = [layer for layer in self._batch_added if layer in remaining]
+        self._batch_added = []
+        if self._batch_layers_changed:
+            self._batch_layers_changed = False
+            self._on_layers_change()
+            if added:
+                self._update_layers(layers=added)
+            if self._batch_was_empty and self.layers:
+                # set dims slider to the middle of all dimensions
+                self.reset_view()
+                self.dims._go_to_center_step()
+        if self._batch_active_changed:
+            self._batch_active_changed = False
+            self._update_active_layer(self.layers.selection.active)
+
     def add_layer(self, layer: Layer) -> Layer:
         """Add a layer to the viewer.
 
@@ -954,6 +1025,29 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
         self.layers.append(layer)
         return layer
 
+    def add_layers(self, layers: Iterable[Layer]) -> list[Layer]:
+        """Add several layers to the viewer at once.
+
+        The viewer is updated once after all layers are inserted, instead
+        of after each layer, which is much faster for many layers such as
+        the tiles of a mosaic. To add layers with other methods, such as
+        ``add_image``, use ``viewer.layers.batched_update()`` instead.
+
+        Parameters
+        ----------
+        layers : iterable of :class:`napari.layers.Layer`
+            Layers to add.
+
+        Returns
+        -------
+        layers : list of :class:`napari.layers.Layer`
+            The layers that were added (same as input).
+        """
+        layers = list(layers)
+        with self.layers.batched_update():
+            self.layers.extend(layers)
+        return layers
+
     def add_image(
         self,
         data=None,
@@ -998,7 +1092,8 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
             list and arrays are decreasing in shape then the data is treated as
             a multiscale image. Please note multiscale rendering is only
             supported in 2D. In 3D, only the lowest resolution scale is
-            displayed.
+            displayed, unless the experimental ``multiscale_3d`` setting
+            is enabled.
         channel_axis : int, optional
             Axis to expand image along. If provided, each channel in the data
             will be added as an individual image layer. In channel_axis mode,
@@ -1070,7 +1165,8 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
             then it will be taken to be multiscale. The first image in the list
             should be the largest. Please note multiscale rendering is only
             supported in 2D. In 3D, only the lowest resolution scale is
-            displayed.
+            displayed, unless the experimental ``multiscale_3d`` setting
+            is enabled.
         name : str or list of str
             Name of the layer.
         opacity : float or list
@@ -1237,7 +1333,7 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
             If `plugin` does not provide a sample named `sample`.
         """
         plugin_spec_reader = None
-        data: None | SampleDataCreator | SampleData
+        data: SampleDataCreator | SampleData | None
         # try with npe2
         data, available = _npe2.get_sample_data(plugin, sample)
 
@@ -324,6 +324,7 @@ def qt_viewer_(
     original_dock_layer_controls = viewer.__class__.dockLayerControls.fget  # type: ignore[attr-defined]
     original_dock_console = viewer.__class__.dockConsole.fget  # type: ignore[attr-defined]
     original_dock_performance = viewer.__class__.dockPerformance.fget  # type: ignore[attr-defined]
+    original_dock_perf_counters = viewer.__class__.dockPerfCounters.fget  # type: ignore[attr-defined]
 
     def hide_widget(widget):
         widget.hide()
@@ -384,6 +385,14 @@ def qt_viewer_(
             )
         return self._dockPerformance
 
+    def patched_dock_perf_counters(self):
+        if self._dockPerfCounters is None:
+            self._dockPerfCounters = original_dock_perf_counters(self)
+            qtbot.addWidget(
+                self._dockPerfCounters, before_close_func=hide_widget
+            )
+        return self._dockPerfCounters
+
     monkeypatch.setattr(
         viewer.__class__, 'controls', property(patched_controls)
     )
@@ -408,6 +417,11 @@ def qt_viewer_(
     monkeypatch.setattr(
         viewer.__class__, 'dockPerformance', property(patched_dock_performance)
     )
+    monkeypatch.setattr(
+        viewer.__class__,
+        'dockPerfCounters',
+        property(patched_dock_perf_counters),
+    )
 
     qtbot.addWidget(viewer, before_close_func=hide_and_clear_qt_viewer)
     return viewer
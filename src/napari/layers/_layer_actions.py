@@ -58,13 +58,13 @@ def _split_rgb(ll: LayerList) -> None:
 def _convert(ll: LayerList, type_: str) -> None:
     from napari.layers import Shapes
 
+    ll_shape = ll._extent_world_augmented[1] - ll._extent_world_augmented[0]
+    # the shape in the data coordinates of every layer, in one product
+    ll_shapes = dict(zip(ll, ll.world_to_data(ll_shape), strict=True))
     for lay in list(ll.selection):
         idx = ll.index(lay)
         if isinstance(lay, Shapes) and type_ == 'labels':
-            ll_shape = (
-                ll._extent_world_augmented[1] - ll._extent_world_augmented[0]
-            )
-            data = lay.to_labels(labels_shape=lay.world_to_data(ll_shape))
+            data = lay.to_labels(labels_shape=ll_shapes[lay][-lay.ndim :])
             idx += 1
         elif (
             not np.issubdtype(lay.data.dtype, np.integer) and type_ == 'labels'
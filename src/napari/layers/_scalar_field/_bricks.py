@@ -0,0 +1,220 @@
+"""Bricked loading of multiscale volumes for view-dependent 3D rendering.
+
+In 3D, a multiscale layer normally renders its lowest resolution level as a
+whole. With the experimental ``multiscale_3d`` setting, the level is instead
+chosen from the camera zoom, and only the part of the volume that is in view
+is loaded. That region is split into cubic bricks aligned to a fixed grid of
+the level, so that moving the camera only reads the bricks that were not
+loaded before. Loaded bricks are kept in a :class:`BrickCache`.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+import numpy as np
+import numpy.typing as npt
+
+from napari.utils.perf import counters
+
+#: size of the side of a brick, in data pixels of its level
+BRICK_SIZE = 64
+#: largest volume that will be composed from bricks, in voxels
+MAX_VOLUME_VOXELS = 2**26
+#: largest side of a composed volume, in voxels (GL_MAX_3D_TEXTURE_SIZE is
+#: at least 2048 on all hardware supporting napari)
+MAX_VOLUME_SIDE = 2048
+
+
+class BrickCache:
+    """A thread-safe, least-recently-used cache of loaded bricks.
+
+    Parameters
+    ----------
+    max_bytes : int
+        The maximum total size of the cached bricks, in bytes.
+    """
+
+    def __init__(self, max_bytes: int = 512 * 1024**2) -> None:
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._bricks: OrderedDict[Hashable, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._bricks)
+
+    def get(self, key: Hashable, load: Callable[[], np.ndarray]) -> np.ndarray:
+        """Return the brick stored at ``key``, calling ``load`` if missing."""
+        with self._lock:
+            brick = self._bricks.get(key)
+            if brick is not None:
+                self._bricks.move_to_end(key)
+                counters.record('brick_cache.hit', 1, 'ratio')
+                return brick
+        counters.record('brick_cache.hit', 0, 'ratio')
+        # load outside of the lock, it may be slow
+        brick = load()
+        with self._lock:
+            if key not in self._bricks:
+                self._bricks[key] = brick
+                self.nbytes += brick.nbytes
+                while self.nbytes > self.max_bytes and len(self._bricks) > 1:
+                    _, old = self._bricks.popitem(last=False)
+                    self.nbytes -= old.nbytes
+        return brick
+
+    def clear(self) -> None:
+        """Remove all cached bricks."""
+        with self._lock:
+            self._bricks.clear()
+            self.nbytes = 0
+
+
+def brick_aligned_corners(
+    bbox: npt.NDArray, shape: npt.ArrayLike, brick_size: int = BRICK_SIZE
+) -> npt.NDArray:
+    """Grow a bounding box to the bricks that intersect it.
+
+    Parameters
+    ----------
+    bbox : array (2, D)
+        Inclusive min and max pixel coordinates of the region.
+    shape : array-like (D,)
+        Shape of the data, used to clip the bricks at the border.
+    brick_size : int
+        Size of the side of a brick.
+
+    Returns
+    -------
+    corners : array (2, D)
+        Inclusive min and max pixel coordinates of the bricks.
+    """
+    shape = np.asarray(shape, dtype=int)
+    bbox = np.clip(np.asarray(bbox), 0, shape - 1)
+    start = (np.floor(bbox[0]).astype(int) // brick_size) * brick_size
+    stop = (np.floor(bbox[1]).astype(int) // brick_size + 1) * brick_size
+    return np.stack([start, np.minimum(stop, shape) - 1])
+
+
+def iter_bricks(
+    corners: npt.NDArray, shape: npt.ArrayLike, brick_size: int = BRICK_SIZE
+) -> list[tuple[tuple[int, ...], tuple[slice, ...]]]:
+    """List the bricks intersecting ``corners``.
+
+    Parameters
+    ----------
+    corners : array (2, D)
+        Inclusive min and max pixel coordinates of the region.
+    shape : array-like (D,)
+        Shape of the data, used to clip the bricks at the border.
+    brick_size : int
+        Size of the side of a brick.
+
+    Returns
+    -------
+    list of (index, slices)
+        The grid index of each brick and the slices of the data it covers.
+    """
+    first = corners[0] // brick_size
+    last = corners[1] // brick_size
+    bricks = []
+    for offset in np.ndindex(*(last - first + 1)):
+        index = tuple(int(i) for i in np.add(offset, first))
+        slices = tuple(
+            slice(i * brick_size, min((i + 1) * brick_size, size))
+            for i, size in zip(index, shape, strict=True)
+        )
+        bricks.append((index, slices))
+    return bricks
+
+
+def visible_bounding_box(
+    canvas_corners: npt.NDArray,
+    view_direction: npt.ArrayLike,
+    extent: npt.NDArray,
+) -> npt.NDArray:
+    """Bounding box of the region seen through the canvas in 3D.
+
+    With an orthographic camera, the visible region is the prism spanned
+    by the canvas rectangle along the view direction. It is bounded here by
+    the cylinder around the canvas diagonal, which only needs the two
+    opposite canvas corners.
+
+    Parameters
+    ----------
+    canvas_corners : array (2, 3)
+        World coordinates of the top-left and bottom-right canvas corners.
+    view_direction : array-like (3,)
+        View direction of the camera, in world coordinates.
+    extent : array (2, 3)
+        World extent of the layer, used to bound the depth of the region.
+
+    Returns
+    -------
+    array (2, 3)
+        Min and max world coordinates of the visible region.
+    """
+    canvas_corners = np.asarray(canvas_corners, dtype=float)
+    direction = np.asarray(view_direction, dtype=float)
+    direction = direction / np.linalg.norm(direction)
+    center = canvas_corners.mean(axis=0)
+    radius = np.linalg.norm(canvas_corners[1] - canvas_corners[0]) / 2
+    half_length = np.linalg.norm(extent[1] - extent[0]) / 2 + np.linalg.norm(
+        center - extent.mean(axis=0)
+    )
+    half_size = half_length * np.abs(direction) + radius * np.sqrt(
+        np.clip(1 - direction**2, 0, None)
+    )
+    return np.stack([center - half_size, center + half_size])
+
+
+def plane_bounding_box(
+    bbox: npt.NDArray,
+    position: npt.ArrayLike,
+    normal: npt.ArrayLike,
+    thickness: float,
+) -> npt.NDArray:
+    """Shrink a bounding box to the part that a slab can intersect.
+
+    Parameters
+    ----------
+    bbox : array (2, D)
+        Min and max coordinates of the box.
+    position, normal : array-like (D,)
+        A point on the plane, and its normal, in the coordinates of the box.
+    thickness : float
+        Thickness of the slab centered on the plane.
+
+    Returns
+    -------
+    array (2, D)
+        Min and max coordinates of the intersection of the box and the slab,
+        or the input box if the slab does not restrict an axis.
+    """
+    bbox = np.asarray(bbox, dtype=float)
+    normal = np.asarray(normal, dtype=float)
+    normal = normal / np.linalg.norm(normal)
+    offset = np.dot(normal, position)
+    half = max(thickness, 1) / 2
+    # range of normal . x over the box, per axis
+    low = np.minimum(normal * bbox[0], normal * bbox[1])
+    high = np.maximum(normal * bbox[0], normal * bbox[1])
+    out = bbox.copy()
+    for axis, n in enumerate(normal):
+        if abs(n) < 1e-6:
+            continue
+        rest_low = low.sum() - low[axis]
+        rest_high = high.sum() - high[axis]
+        # n * x_axis must lie in [offset - half - rest_high,
+        #                        offset + half - rest_low]
+        bounds = (
+            np.array([offset - half - rest_high, offset + half - rest_low]) / n
+        )
+        out[0, axis] = max(out[0, axis], bounds.min())
+        out[1, axis] = min(out[1, axis], bounds.max())
+    # an empty intersection keeps a single pixel, the plane is not drawn
+    out[1] = np.maximum(out[0], out[1])
+    return out
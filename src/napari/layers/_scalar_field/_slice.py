@@ -1,10 +1,15 @@
 from collections.abc import Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import numpy.typing as npt
 
+from napari.layers._scalar_field._bricks import BrickCache, iter_bricks
+from napari.layers._scalar_field._texture import (
+    downsample_texture,
+    fix_data_dtype,
+)
 from napari.layers.base._slice import _next_request_id
 from napari.layers.utils._slice_input import _SliceInput, _ThickNDSlice
 from napari.types import ArrayLike
@@ -76,6 +81,13 @@ class _ScalarFieldSliceResponse:
         Describes the slicing plane or bounding box in the layer's dimensions.
     request_id : int
         The identifier of the request from which this was generated.
+    converted : bool
+        True if the viewable images were already converted from the raw ones
+        with `to_displayed`.
+    texture : array, optional
+        The viewable image, prepared for upload to the GPU by `to_texture`.
+        None if it was not prepared, in which case the vispy layer prepares
+        it on the main thread.
     """
 
     image: _ScalarFieldView = field(repr=False)
@@ -84,6 +96,8 @@ class _ScalarFieldSliceResponse:
     slice_input: _SliceInput
     request_id: int
     empty: bool = False
+    converted: bool = False
+    texture: np.ndarray | None = field(default=None, repr=False)
 
     @classmethod
     def make_empty(
@@ -137,6 +151,38 @@ class _ScalarFieldSliceResponse:
             empty=True,
         )
 
+    def to_thumbnail(
+        self, thumbnail_shape: tuple[int, int], rgb: bool
+    ) -> '_ScalarFieldSliceResponse':
+        """
+        Returns a slice with its thumbnail reduced to about the given shape.
+
+        Volumes are max projected along their first displayed axis, and the
+        result is strided so that it is at least as large as
+        ``thumbnail_shape`` but no more than twice as large, leaving only a
+        small image for the layer to colormap on the main thread.
+
+        Parameters
+        ----------
+        thumbnail_shape : tuple of int
+            The shape of the layer thumbnail, without the color channel.
+        rgb : bool
+            True if the last dimension of the image is a color channel.
+
+        Returns
+        -------
+        _ScalarFieldSliceResponse
+            Contains the reduced thumbnail.
+        """
+        raw = self.thumbnail.raw
+        if raw.ndim - rgb > 2:
+            raw = np.max(raw, axis=0)
+        steps = np.maximum(np.floor_divide(raw.shape[:2], thumbnail_shape), 1)
+        if np.all(steps == 1) and raw is self.thumbnail.raw:
+            return self
+        raw = raw[:: steps[0], :: steps[1]]
+        return replace(self, thumbnail=_ScalarFieldView.from_view(raw))
+
     def to_displayed(
         self, converter: Callable[[np.ndarray], np.ndarray]
     ) -> '_ScalarFieldSliceResponse':
@@ -169,6 +215,58 @@ class _ScalarFieldSliceResponse:
             slice_input=self.slice_input,
             request_id=self.request_id,
             empty=self.empty,
+            converted=True,
+        )
+
+    def to_texture(
+        self, max_texture_size: int | None, multiscale: bool
+    ) -> '_ScalarFieldSliceResponse':
+        """
+        Returns a slice with its viewable image prepared for the GPU.
+
+        The image is converted to a dtype supported by vispy, padded to the
+        number of displayed dimensions, downsampled to fit in a texture if
+        needed and made contiguous, so that it can be uploaded as is.
+
+        Parameters
+        ----------
+        max_texture_size : int | None
+            The maximum texture size of the canvas in the number of displayed
+            dimensions, or None if there is no limit.
+        multiscale : bool
+            True if the image is a tile of a multiscale layer. Tiles are not
+            downsampled; if one does not fit, the slice is returned as is and
+            the vispy layer raises an error.
+
+        Returns
+        -------
+        _ScalarFieldSliceResponse
+            Contains the prepared texture.
+        """
+        ndim = self.slice_input.ndim
+        ndisplay = self.slice_input.ndisplay
+        texture = fix_data_dtype(self.image.view)
+        if ndisplay > ndim:
+            texture = texture.reshape((1,) * (ndisplay - ndim) + texture.shape)
+
+        tile_to_data = self.tile_to_data
+        if max_texture_size is not None and multiscale:
+            if np.any(np.greater(texture.shape, max_texture_size)):
+                return self
+        elif max_texture_size is not None:
+            texture, downsample = downsample_texture(
+                texture, max_texture_size, ndisplay
+            )
+            if downsample is not None:
+                scale = np.ones(ndim)
+                for i, d in enumerate(self.slice_input.displayed):
+                    scale[d] = downsample[i]
+                tile_to_data = Affine(name='tile2data', scale=scale, ndim=ndim)
+
+        return replace(
+            self,
+            tile_to_data=tile_to_data,
+            texture=np.ascontiguousarray(texture),
         )
 
 
@@ -191,6 +289,24 @@ class _ScalarFieldSliceRequest:
         The layer's data field, which is the main input to slicing.
     data_slice : _ThickNDSlice
         The slicing coordinates and margins in data space.
+    multiscale_3d : bool
+        If True, a multiscale volume is sliced at ``data_level`` and
+        restricted to ``corner_pixels`` like in 2D, instead of loading the
+        whole lowest resolution level.
+    brick_cache : BrickCache, optional
+        If given, the volume of a ``multiscale_3d`` request is composed
+        from bricks that are cached across requests.
+    converter : Callable[[np.ndarray], np.ndarray], optional
+        If given, converts the raw sliced images into viewable ones, see
+        `_ScalarFieldSliceResponse.to_displayed`.
+    texture_limits : tuple of (int or None), optional
+        The maximum 2D and 3D texture sizes of the canvas displaying the
+        layer. If given, the viewable image is also prepared for upload to
+        the GPU, see `_ScalarFieldSliceResponse.to_texture`.
+    thumbnail_shape : tuple of int, optional
+        The shape of the layer thumbnail. If given, the thumbnail image is
+        reduced to about that shape, see
+        `_ScalarFieldSliceResponse.to_thumbnail`.
     others
         See the corresponding attributes in `Layer` and `Image`.
     id : int
@@ -209,22 +325,44 @@ class _ScalarFieldSliceRequest:
     thumbnail_level: int = field(repr=False)
     level_shapes: np.ndarray = field(repr=False)
     downsample_factors: np.ndarray = field(repr=False)
+    multiscale_3d: bool = field(default=False, repr=False)
+    brick_cache: BrickCache | None = field(default=None, repr=False)
+    converter: Callable[[np.ndarray], np.ndarray] | None = field(
+        default=None, repr=False
+    )
+    texture_limits: tuple[int | None, int | None] | None = field(
+        default=None, repr=False
+    )
+    thumbnail_shape: tuple[int, int] | None = field(default=None, repr=False)
     id: int = field(default_factory=_next_request_id)
 
     def __call__(self) -> _ScalarFieldSliceResponse:
         if self._slice_out_of_bounds():
-            return _ScalarFieldSliceResponse.make_empty(
+            response = _ScalarFieldSliceResponse.make_empty(
                 slice_input=self.slice_input,
                 rgb=self.rgb,
                 request_id=self.id,
                 dtype=self.data.dtype,
             )
-        with self.dask_indexer():
-            return (
-                self._call_multi_scale()
-                if self.multiscale
-                else self._call_single_scale()
-            )
+        else:
+            with self.dask_indexer():
+                response = (
+                    self._call_multi_scale()
+                    if self.multiscale
+                    else self._call_single_scale()
+                )
+        # prepare the data for display here rather than on the main thread
+        if self.thumbnail_shape is not None and not response.empty:
+            response = response.to_thumbnail(self.thumbnail_shape, self.rgb)
+        if self.converter is not None:
+            response = response.to_displayed(self.converter)
+            if self.texture_limits is not None:
+                max_2d, max_3d = self.texture_limits
+                response = response.to_texture(
+                    max_3d if self.slice_input.ndisplay == 3 else max_2d,
+                    self.multiscale,
+                )
+        return response
 
     def _call_single_scale(self) -> _ScalarFieldSliceResponse:
         order = self._get_order()
@@ -246,10 +384,8 @@ class _ScalarFieldSliceRequest:
         )
 
     def _call_multi_scale(self) -> _ScalarFieldSliceResponse:
-        if self.slice_input.ndisplay == 3:
-            level = len(self.data) - 1
-        else:
-            level = self.data_level
+        tiled = self.slice_input.ndisplay == 2 or self.multiscale_3d
+        level = self.data_level if tiled else len(self.data) - 1
 
         # Calculate the tile-to-data transform.
         scale = np.ones(self.slice_input.ndim)
@@ -260,7 +396,7 @@ class _ScalarFieldSliceRequest:
 
         translate = np.zeros(self.slice_input.ndim)
         disp_slice = [slice(None) for _ in data.shape]
-        if self.slice_input.ndisplay == 2:
+        if tiled:
             for d in self.slice_input.displayed:
                 disp_slice[d] = slice(
                     self.corner_pixels[0, d],
@@ -278,12 +414,19 @@ class _ScalarFieldSliceRequest:
             ndim=self.slice_input.ndim,
         )
 
-        # slice displayed dimensions to get the right tile data
-        data = data[tuple(disp_slice)]
-
         # project the thick slice
         data_slice = self._thick_slice_at_level(level)
-        data = self._project_thick_slice(data, data_slice)
+        if (
+            self.slice_input.ndisplay == 3
+            and self.multiscale_3d
+            and self.brick_cache is not None
+        ):
+            data = self._load_bricks(level, data_slice)
+        else:
+            # slice displayed dimensions to get the right tile data
+            data = self._project_thick_slice(
+                data[tuple(disp_slice)], data_slice
+            )
 
         order = self._get_order()
         data = np.transpose(data, order)
@@ -304,6 +447,69 @@ class _ScalarFieldSliceRequest:
             request_id=self.id,
         )
 
+    def _load_bricks(
+        self, level: int, data_slice: _ThickNDSlice
+    ) -> np.ndarray:
+        """Compose the tile within ``corner_pixels`` from cached bricks.
+
+        The result is the same as slicing the tile out of the level at once,
+        but only the bricks that are not in the cache are read.
+        """
+        assert self.brick_cache is not None
+        data = self.data[level]
+        # sliced data keeps the displayed axes in increasing order
+        displayed = sorted(self.slice_input.displayed)
+        corners = self.corner_pixels[:, displayed]
+        if self.projection_mode == 'none':
+            point_slices = self._point_to_slices(data_slice.point)
+        else:
+            point_slices = self._data_slice_to_slices(data_slice, displayed)
+        # slices are only hashable since python 3.12
+        slice_key = tuple(
+            (s.start, s.stop) if isinstance(s, slice) else s
+            for s in point_slices
+        )
+
+        tile: np.ndarray | None = None
+        shape = np.take(data.shape, displayed)
+        for index, brick_slices in iter_bricks(corners, shape):
+            slices = [slice(None)] * data.ndim
+            for d, s in zip(displayed, brick_slices, strict=True):
+                slices[d] = s
+            key = (id(data), level, slice_key, self.projection_mode, index)
+            brick = self.brick_cache.get(
+                key,
+                lambda slices=tuple(slices): self._project_thick_slice(
+                    data[slices], data_slice
+                ),
+            )
+            if tile is None:
+                tile_shape = (
+                    tuple(corners[1] - corners[0] + 1)
+                    + brick.shape[len(displayed) :]
+                )
+                tile = np.empty(tile_shape, dtype=brick.dtype)
+            # copy the part of the brick that is within the corners
+            starts = np.maximum([s.start for s in brick_slices], corners[0])
+            stops = np.minimum([s.stop for s in brick_slices], corners[1] + 1)
+            tile[
+                tuple(
+                    slice(start - c, stop - c)
+                    for start, stop, c in zip(
+                        starts, stops, corners[0], strict=True
+                    )
+                )
+            ] = brick[
+                tuple(
+                    slice(start - s.start, stop - s.start)
+                    for start, stop, s in zip(
+                        starts, stops, brick_slices, strict=True
+                    )
+                )
+            ]
+        assert tile is not None
+        return tile
+
     def _thick_slice_at_level(self, level: int) -> _ThickNDSlice:
         """
         Get the data_slice rescaled for a specific level.
@@ -314,6 +520,26 @@ class _ScalarFieldSliceRequest:
         slice_arr[0] = np.clip(slice_arr[0], 0, self.level_shapes[level] - 1)
         return _ThickNDSlice.from_array(slice_arr)
 
+    def _intersects(self, region: tuple[slice, ...]) -> bool:
+        """Whether a region of the data intersects the slice.
+
+        Only the non-displayed dimensions of the region are checked.
+        """
+        if self.projection_mode == 'none':
+            slices = self._point_to_slices(self.data_slice.point)
+        else:
+            slices = self._data_slice_to_slices(
+                self.data_slice, self.slice_input.displayed
+            )
+        for d in self.slice_input.not_displayed:
+            s = slices[d]
+            start, stop = (
+                (s, s + 1) if isinstance(s, int) else (s.start, s.stop)
+            )
+            if start >= region[d].stop or stop <= region[d].start:
+                return False
+        return True
+
     def _project_thick_slice(
         self, data: ArrayLike, data_slice: _ThickNDSlice
     ) -> np.ndarray:
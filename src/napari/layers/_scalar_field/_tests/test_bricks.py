@@ -0,0 +1,72 @@
+import numpy as np
+
+from napari.layers._scalar_field._bricks import (
+    BrickCache,
+    brick_aligned_corners,
+    iter_bricks,
+    plane_bounding_box,
+    visible_bounding_box,
+)
+
+
+def test_brick_aligned_corners():
+    corners = brick_aligned_corners(
+        np.array([[10, 70, -5], [20, 130, 300]]), (100, 200, 100), 64
+    )
+    np.testing.assert_array_equal(corners, [[0, 64, 0], [63, 191, 99]])
+
+
+def test_iter_bricks():
+    bricks = iter_bricks(np.array([[10, 60], [70, 70]]), (100, 100), 64)
+    assert [index for index, _ in bricks] == [(0, 0), (0, 1), (1, 0), (1, 1)]
+    # bricks are not cropped to the corners, only to the data
+    assert bricks[-1][1] == (slice(64, 100), slice(64, 100))
+
+
+def test_brick_cache_evicts_least_recently_used():
+    cache = BrickCache(max_bytes=2 * 8)
+    loads = []
+
+    def loader(value):
+        def load():
+            loads.append(value)
+            return np.array([value], dtype=np.float64)
+
+        return load
+
+    cache.get('a', loader(0))
+    cache.get('b', loader(1))
+    cache.get('a', loader(0))
+    cache.get('c', loader(2))
+    assert loads == [0, 1, 2]
+    assert len(cache) == 2
+    # 'b' was the least recently used one
+    cache.get('b', loader(1))
+    assert loads == [0, 1, 2, 1]
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def test_visible_bounding_box():
+    extent = np.array([[0, 0, 0], [99, 99, 99]])
+    bbox = visible_bounding_box(
+        np.array([[50, 0, 0], [50, 20, 20]]), (1, 0, 0), extent
+    )
+    # the whole depth of the layer is in view
+    assert bbox[0, 0] < 0
+    assert bbox[1, 0] > 99
+    # the canvas only covers part of the other axes
+    assert np.all(bbox[:, 1:] > -5)
+    assert np.all(bbox[:, 1:] < 25)
+
+
+def test_plane_bounding_box():
+    bbox = np.array([[0, 0, 0], [99, 99, 99]])
+    out = plane_bounding_box(bbox, (50, 50, 50), (1, 0, 0), 4)
+    np.testing.assert_allclose(out, [[48, 0, 0], [52, 99, 99]])
+
+    # an oblique plane does not restrict any axis of a cube
+    out = plane_bounding_box(bbox, (50, 50, 50), (1, 1, 1), 1)
+    np.testing.assert_allclose(out, bbox)
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from napari.components import Dims
+from napari.layers import Image, Labels
+from napari.layers._scalar_field._texture import fix_data_dtype
+
+
+@pytest.mark.parametrize(
+    ('dtype', 'expected'),
+    [
+        (np.float64, np.float32),
+        (np.int32, np.float32),
+        (np.uint32, np.float32),
+        (np.int8, np.float32),
+        (np.uint8, np.uint8),
+        (np.bool_, np.uint8),
+    ],
+)
+def test_fix_data_dtype(dtype, expected):
+    assert fix_data_dtype(np.zeros(3, dtype=dtype)).dtype == expected
+
+
+def test_texture_prepared_in_slice():
+    layer = Image(np.random.random((4, 10, 12)))
+    assert layer._slice.texture is None
+
+    layer._texture_limits = (None, None)
+    layer.refresh()
+    texture = layer._slice.texture
+    assert texture.dtype == np.float32
+    assert texture.flags.c_contiguous
+    np.testing.assert_allclose(texture, layer._data_view)
+
+    # transposed data is made contiguous
+    layer._slice_dims(Dims(ndim=3, order=(0, 2, 1)))
+    assert layer._slice.texture.shape == (12, 10)
+    assert layer._slice.texture.flags.c_contiguous
+
+
+def test_texture_padded_to_ndisplay():
+    layer = Image(np.zeros((10, 12), dtype=np.uint8))
+    layer._texture_limits = (None, None)
+    layer._slice_dims(Dims(ndim=2, ndisplay=3))
+    assert layer._slice.texture.shape == (1, 10, 12)
+
+
+def test_texture_downsampled_in_slice():
+    layer = Image(np.zeros((5, 10, 12), dtype=np.uint8))
+    layer._texture_limits = (None, 4)
+    with pytest.warns(UserWarning, match='GL_MAX_TEXTURE_SIZE'):
+        layer._slice_dims(Dims(ndim=3, ndisplay=3))
+    assert layer._slice.texture.shape == (3, 4, 4)
+    np.testing.assert_array_equal(
+        layer._transforms['tile2data'].scale, (2, 3, 3)
+    )
+
+
+def test_multiscale_tile_too_big_not_prepared():
+    data = [np.zeros((40, 40)), np.zeros((20, 20))]
+    layer = Image(data, multiscale=True)
+    layer._texture_limits = (8, None)
+    layer.refresh()
+    # the vispy layer raises an error for it on the main thread
+    assert layer._slice.texture is None
+
+
+def test_labels_texture_prepared_in_slice():
+    layer = Labels(np.arange(200).reshape(20, 10))
+    layer._texture_limits = (8, None)
+    with pytest.warns(UserWarning, match='GL_MAX_TEXTURE_SIZE'):
+        layer.refresh()
+    texture = layer._slice.texture
+    assert texture.dtype == layer._slice.image.view.dtype
+    assert texture.shape == (7, 5)
+    np.testing.assert_array_equal(texture, layer._slice.image.view[::3, ::2])
@@ -0,0 +1,104 @@
+"""Preparation of sliced scalar field data for upload to the GPU.
+
+These functions do not depend on vispy or on an OpenGL context, so that
+they can run in the slice task, off the main thread. The texture size
+limits of the canvas are passed in by the vispy layer.
+"""
+
+import warnings
+from typing import Any, cast
+
+import numpy as np
+import numpy.typing as npt
+
+from napari.utils.translations import trans
+
+texture_dtypes = [
+    np.dtype(np.uint8),
+    np.dtype(np.uint16),
+    np.dtype(np.float32),
+]
+
+
+def fix_data_dtype(data: npt.NDArray) -> npt.NDArray:
+    """Makes sure the dtype of the data is accetpable to vispy.
+
+    Acceptable types are int8, uint8, int16, uint16, float32.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        Data that will need to be of right type.
+
+    Returns
+    -------
+    np.ndarray
+        Data that is of right type and will be passed to vispy.
+    """
+
+    dtype = np.dtype(data.dtype)
+    if dtype in texture_dtypes:
+        return data
+
+    try:
+        dtype_ = cast(
+            'type[np.unsignedinteger[Any] | np.floating[Any]]',
+            {
+                'i': np.float32,
+                'f': np.float32,
+                'u': np.uint16,
+                'b': np.uint8,
+            }[dtype.kind],
+        )
+        if dtype_ == np.uint16 and dtype.itemsize > 2:
+            dtype_ = np.float32
+    except KeyError as e:  # not an int or float
+        raise TypeError(
+            trans._(
+                'type {dtype} not allowed for texture; must be one of {textures}',
+                deferred=True,
+                dtype=dtype,
+                textures=set(texture_dtypes),
+            )
+        ) from e
+    return data.astype(dtype_)
+
+
+def downsample_texture(
+    data: npt.NDArray, max_texture_size: int, ndisplay: int
+) -> tuple[npt.NDArray, npt.NDArray | None]:
+    """Downsample data based on maximum allowed texture size.
+
+    Parameters
+    ----------
+    data : array
+        Data to be downsampled if needed.
+    max_texture_size : int
+        Maximum allowed texture size.
+    ndisplay : int
+        Number of displayed dimensions, used in the warning.
+
+    Returns
+    -------
+    data : array
+        Data that now fits inside texture.
+    downsample : array or None
+        Downsampling factor of each axis of the data, or None if the data
+        was not downsampled.
+    """
+    if not np.any(np.greater(data.shape, max_texture_size)):
+        return data, None
+    warnings.warn(
+        trans._(
+            'data shape {shape} exceeds GL_MAX_TEXTURE_SIZE {texture_size}'
+            ' in at least one axis and will be downsampled.'
+            ' Rendering is currently in {ndisplay}D mode.',
+            deferred=True,
+            shape=data.shape,
+            texture_size=max_texture_size,
+            ndisplay=ndisplay,
+        )
+    )
+    downsample = np.ceil(np.divide(data.shape, max_texture_size)).astype(int)
+    slices = tuple(slice(None, None, ds) for ds in downsample)
+    return data[slices], downsample
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 import types
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
@@ -11,6 +12,14 @@ from numpy import typing as npt
 
 from napari.layers._data_protocols import LayerDataProtocol
 from napari.layers._multiscale_data import MultiScaleData
+from napari.layers._scalar_field._bricks import (
+    MAX_VOLUME_SIDE,
+    MAX_VOLUME_VOXELS,
+    BrickCache,
+    brick_aligned_corners,
+    plane_bounding_box,
+    visible_bounding_box,
+)
 from napari.layers._scalar_field._slice import (
     _ScalarFieldSliceRequest,
     _ScalarFieldSliceResponse,
@@ -23,7 +32,9 @@ from napari.layers.image._image_mouse_bindings import (
 )
 from napari.layers.image._image_utils import guess_multiscale
 from napari.layers.utils._slice_input import _SliceInput, _ThickNDSlice
+from napari.layers.utils.layer_utils import compute_multiscale_level_3d
 from napari.layers.utils.plane import SlicingPlane
+from napari.settings import get_settings
 from napari.types import LayerDataType
 from napari.utils._dask_utils import DaskIndexer
 from napari.utils._dtype import normalize_dtype
@@ -42,6 +53,9 @@ if TYPE_CHECKING:
 
 __all__ = ('ScalarFieldBase',)
 
+# number of samples of a ray read at once when picking a value in 3D
+_RAY_CHUNK_SIZE = 256
+
 
 # It is important to contain at least one abstractmethod to properly exclude this class
 # in creating NAMES set inside of napari.layers.__init__
@@ -57,7 +71,8 @@ class ScalarFieldBase(Layer, ABC):
         list and arrays are decreasing in shape then the data is treated as
         a multiscale image. Please note multiscale rendering is only
         supported in 2D. In 3D, only the lowest resolution scale is
-        displayed.
+        displayed, unless the experimental ``multiscale_3d`` setting
+        is enabled.
     affine : n-D array or napari.utils.transforms.Affine
         (N+1, N+1) affine transformation matrix in homogeneous coordinates.
         The first (N, N) entries correspond to a linear transform and
@@ -92,7 +107,8 @@ class ScalarFieldBase(Layer, ABC):
         then it will be taken to be multiscale. The first image in the list
         should be the largest. Please note multiscale rendering is only
         supported in 2D. In 3D, only the lowest resolution scale is
-        displayed.
+        displayed, unless the experimental ``multiscale_3d`` setting
+        is enabled.
     name : str
         Name of the layer. If not provided then will be guessed using heuristics.
     ndim : int
@@ -137,7 +153,8 @@ class ScalarFieldBase(Layer, ABC):
         and arrays are decreasing in shape then the data is treated as a
         multiscale image. Please note multiscale rendering is only
         supported in 2D. In 3D, only the lowest resolution scale is
-        displayed.
+        displayed, unless the experimental ``multiscale_3d`` setting
+        is enabled.
     axis_labels : tuple of str
         Dimension names of the layer data.
     custom_interpolation_kernel_2d : np.ndarray
@@ -158,7 +175,8 @@ class ScalarFieldBase(Layer, ABC):
         represented by a list of array like image data. The first image in the
         list should be the largest. Please note multiscale rendering is only
         supported in 2D. In 3D, only the lowest resolution scale is
-        displayed.
+        displayed, unless the experimental ``multiscale_3d`` setting
+        is enabled.
     plane : SlicingPlane or dict
         Properties defining plane rendering in 3D. Valid dictionary keys are
         {'position', 'normal', 'thickness'}.
@@ -228,6 +246,9 @@ class ScalarFieldBase(Layer, ABC):
         if ndim is None:
             ndim = len(data.shape)
         self._data = data
+        # maximum 2D and 3D texture sizes of the canvas, set by the vispy
+        # layer so that slicing can prepare the textures
+        self._texture_limits: tuple[int | None, int | None] | None = None
 
         super().__init__(
             data,
@@ -386,7 +407,127 @@ class ScalarFieldBase(Layer, ABC):
         if self._data_level == level:
             return
         self._data_level = level
-        self.refresh(extent=False)
+        # a change of the view only, keep the loaded bricks
+        super().refresh(extent=False)
+
+    def refresh(
+        self,
+        event: Event | None = None,
+        *,
+        thumbnail: bool = True,
+        data_displayed: bool = True,
+        highlight: bool = True,
+        extent: bool = True,
+        force: bool = False,
+    ) -> None:
+        """Refresh all layer data based on current view slice."""
+        if data_displayed:
+            # the data may have been modified in place
+            self._slicing_state._brick_cache.clear()
+        super().refresh(
+            event,
+            thumbnail=thumbnail,
+            data_displayed=data_displayed,
+            highlight=highlight,
+            extent=extent,
+            force=force,
+        )
+
+    def _update_draw(
+        self,
+        scale_factor,
+        corner_pixels_displayed,
+        shape_threshold,
+        view_direction=None,
+    ):
+        if not (
+            self.multiscale
+            and self._slice_input.ndisplay == 3
+            and get_settings().experimental.multiscale_3d
+        ):
+            super()._update_draw(
+                scale_factor,
+                corner_pixels_displayed,
+                shape_threshold,
+                view_direction=view_direction,
+            )
+            return
+
+        self.scale_factor = scale_factor
+        displayed_axes = self._slice_input.displayed
+        data_to_world = self._transforms[1:].simplified._sliced(
+            displayed_axes
+        )
+
+        # the region in view, in full resolution data pixels
+        shape = self.level_shapes[0][displayed_axes]
+        data_bbox = np.stack([np.zeros(len(shape)), shape - 1])
+        if view_direction is not None:
+            world_bbox = visible_bounding_box(
+                corner_pixels_displayed,
+                view_direction,
+                self.extent.world[:, displayed_axes],
+            )
+            data_corners = data_to_world.inverse(
+                list(itertools.product(*world_bbox.T))
+            )
+            data_bbox = np.clip(
+                np.stack(
+                    [
+                        np.min(data_corners, axis=0),
+                        np.max(data_corners, axis=0),
+                    ]
+                ),
+                data_bbox[0],
+                data_bbox[1],
+            )
+        if self.depiction == VolumeDepiction.PLANE:
+            data_bbox = plane_bounding_box(
+                data_bbox,
+                self.plane.position,
+                self.plane.normal,
+                self.plane.thickness,
+            )
+
+        # one voxel per screen pixel, but the bricks in view must fit in a
+        # single volume texture
+        voxel_size = np.linalg.norm(data_to_world.linear_matrix, axis=0)
+        downsample_factors = self.downsample_factors[:, displayed_axes]
+        level = compute_multiscale_level_3d(
+            scale_factor / voxel_size, downsample_factors
+        )
+        while True:
+            level_corners = brick_aligned_corners(
+                data_bbox / downsample_factors[level],
+                self.level_shapes[level][displayed_axes],
+            )
+            size = level_corners[1] - level_corners[0] + 1
+            if level == len(downsample_factors) - 1 or (
+                np.prod(size) <= MAX_VOLUME_VOXELS
+                and np.all(size <= MAX_VOLUME_SIDE)
+            ):
+                break
+            level += 1
+
+        corners = np.zeros((2, self.ndim), dtype=int)
+        corners[:, displayed_axes] = level_corners
+        # only update when level changes or when the bricks in view are
+        # outside of the loaded ones
+        if (
+            self.data_level != level
+            or np.any(
+                corners[0, displayed_axes]
+                < self.corner_pixels[0, displayed_axes]
+            )
+            or np.any(
+                corners[1, displayed_axes]
+                > self.corner_pixels[1, displayed_axes]
+            )
+        ):
+            self._data_level = level
+            self.corner_pixels = corners
+            # a change of the view only, keep the loaded bricks
+            super().refresh(extent=False, thumbnail=False)
 
     def _get_level_shapes(self) -> Sequence[tuple[int, ...]]:
         data = self.data
@@ -598,8 +739,17 @@ class ScalarFieldBase(Layer, ABC):
                 sample_points,
                 bounding_box,
             ).astype(int)
-            values = im_slice[tuple(clamped.T)]
-            return self._calculate_value_from_ray(values)
+            # sample the ray in chunks to stop as soon as the value is known
+            chunks = []
+            for start in range(0, max(len(clamped), 1), _RAY_CHUNK_SIZE):
+                chunk = clamped[start : start + _RAY_CHUNK_SIZE]
+                values = im_slice[tuple(chunk.T)]
+                hit = self._ray_hit(values)
+                if hit is not None:
+                    chunks.append(values[: hit + 1])
+                    break
+                chunks.append(values)
+            return self._calculate_value_from_ray(np.concatenate(chunks))
 
         return None
 
@@ -607,12 +757,32 @@ class ScalarFieldBase(Layer, ABC):
     def _calculate_value_from_ray(self, values):
         raise NotImplementedError
 
+    def _ray_hit(self, values: np.ndarray) -> int | None:
+        """Index of the sample of a ray after which the value is known.
+
+        Samples of a ray are read from the start point in chunks, and the
+        remaining ones are skipped once this returns an index. By default
+        the whole ray is needed.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Values of the next samples along the ray.
+
+        Returns
+        -------
+        index : int or None
+            Index of the last sample needed to compute the value of the
+            ray, or None if the next samples are needed too.
+        """
+        return None
+
     def _get_value_3d(
         self,
         start_point: np.ndarray | None,
         end_point: np.ndarray | None,
         dims_displayed: list[int],
-    ) -> int | None | tuple[int, int | None]:
+    ) -> int | tuple[int, int | None] | None:
         """Get the first non-background value encountered along a ray.
 
         Parameters
@@ -683,6 +853,7 @@ class ScalarFieldSlicingState(_LayerSlicingState):
         self, layer: ScalarFieldBase, data: LayerDataType, cache: bool
     ):
         super().__init__(layer, data, cache)
+        self._brick_cache = BrickCache()
         self.transforms = Affine(
             np.ones(self.ndim), np.zeros(self.ndim), name='tile2data'
         )
@@ -743,6 +914,11 @@ class ScalarFieldSlicingState(_LayerSlicingState):
             thumbnail_level=self.layer._thumbnail_level,
             level_shapes=self.layer.level_shapes,
             downsample_factors=self.layer.downsample_factors,
+            multiscale_3d=get_settings().experimental.multiscale_3d,
+            brick_cache=self._brick_cache,
+            converter=self.layer._raw_to_displayed,
+            texture_limits=self.layer._texture_limits,
+            thumbnail_shape=self.layer._thumbnail_shape[:2],
         )
 
     def _update_slice_response(
@@ -751,10 +927,12 @@ class ScalarFieldSlicingState(_LayerSlicingState):
         """Update the slice output state currently on the layer. Currently used
         for both sync and async slicing.
         """
-        response = response.to_displayed(self.layer._raw_to_displayed)
-        # We call to_displayed here to ensure that if the contrast limits
+        if not response.converted:
+            response = response.to_displayed(self.layer._raw_to_displayed)
+        # We call to_displayed to ensure that if the contrast limits
         # are outside the range of supported by vispy, then data view is
-        # rescaled to fit within the range.
+        # rescaled to fit within the range. Requests made by the layer
+        # already do it in the slice task.
         self._slice_input = response.slice_input
         # this is the temporary patch
         self.layer._transforms[0] = response.tile_to_data
@@ -0,0 +1,52 @@
+"""Make sure that heavy dependencies are only imported when needed."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+# modules that must not be imported by ``import napari.layers``, nor by
+# creating an Image layer from a numpy array.
+DEFERRED_MODULES = [
+    'dask',
+    'pandas',
+    'pint',
+    'scipy.ndimage',
+    'scipy.sparse',
+    'scipy.spatial',
+    'xarray',
+]
+
+SCRIPT = """
+import json
+import sys
+
+import numpy as np
+
+import napari.layers
+
+imported = {{'import': [m for m in {modules!r} if m in sys.modules]}}
+napari.layers.Image(np.zeros((10, 10)))
+imported['image'] = [m for m in {modules!r} if m in sys.modules]
+print(json.dumps(imported))
+"""
+
+
+def _imported_modules(modules: list[str]) -> dict[str, list[str]]:
+    result = subprocess.run(
+        [sys.executable, '-c', SCRIPT.format(modules=modules)],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.slow
+def test_layers_import_graph():
+    imported = _imported_modules(DEFERRED_MODULES)
+    assert imported['import'] == []
+    # scipy.ndimage is used to compute the thumbnail, which is only done
+    # when it is read
+    assert imported['image'] == []
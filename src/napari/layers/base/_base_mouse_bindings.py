@@ -28,7 +28,7 @@ def highlight_box_handles(layer: 'Layer', event: Event) -> None:
     # we work in data space so we're axis aligned which simplifies calculation
     # same as Layer.world_to_data
     world_to_data = (
-        layer._transforms[1:].set_slice(layer._slice_input.displayed).inverse
+        layer._transforms[1:]._sliced(layer._slice_input.displayed).inverse
     )
     pos = np.array(world_to_data(event.position))[event.dims_displayed]
     handle_coords = generate_transform_box_from_layer(
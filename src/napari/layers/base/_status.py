@@ -0,0 +1,88 @@
+"""Records of what the status of a layer is computed from.
+
+The status bar and the tooltip are computed from the cursor position in a
+separate thread, while the main thread keeps changing the layers. On the
+main thread, ``Layer._get_status_inputs`` records what the status of a
+layer at the cursor is computed from, and the status is then computed from
+that record alone, in any thread.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from napari.utils.status_messages import generate_layer_status_strings
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _format_properties(features: pd.DataFrame, row: int) -> list[str]:
+    """Return the features of a row as 'name: value' strings.
+
+    Missing values, and the 'index' column, are left out.
+    """
+    return [
+        f'{k}: {v[row]}'
+        for k, v in features.items()
+        if k != 'index'
+        and len(v) > row
+        and v[row] is not None
+        and not (isinstance(v[row], float) and np.isnan(v[row]))
+    ]
+
+
+@dataclass(frozen=True)
+class _LayerStatusInputs:
+    """What the status of a layer at a position is computed from.
+
+    By default, the value of the layer at the position is computed when the
+    record is made. Layer types whose value is costly to compute record what
+    it is computed from instead, in a subclass overriding `get_value`.
+
+    Attributes
+    ----------
+    source_info : dict of str to str
+        The source of the layer, see ``Layer._get_source_info``.
+    position : tuple of float or None
+        The position, in the dimensions of the layer, or None.
+    value : Any
+        The value of the layer at the position.
+    """
+
+    source_info: dict[str, str]
+    position: tuple[float, ...] | None
+    value: Any = None
+
+    def get_value(self) -> Any:
+        """Value of the layer at the position."""
+        return self.value
+
+    def get_properties(self, value: Any) -> list[str]:
+        """Properties of the layer at a value, as 'name: value' strings."""
+        return []
+
+    def get_status(self) -> dict[str, str]:
+        """Status message information, see ``Layer.get_status``."""
+        status = dict(self.source_info)
+        if self.position is not None:
+            value = self.get_value()
+            coords_str, value_str = generate_layer_status_strings(
+                self.position, value
+            )
+            if properties := self.get_properties(value):
+                value_str += '; ' + ', '.join(properties)
+        else:
+            coords_str, value_str = '', ''
+
+        status['coordinates'] = ': '.join((coords_str, value_str))
+        status['coords'] = coords_str
+        status['value'] = value_str
+        return status
+
+    def get_tooltip_text(self) -> str:
+        """Tooltip message, see ``Layer._get_tooltip_text``."""
+        return ''
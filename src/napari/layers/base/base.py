@@ -16,7 +16,6 @@ from typing import TYPE_CHECKING, Any, ClassVar
 
 import magicgui as mgui
 import numpy as np
-import pint
 from npe2 import plugin_manager as pm
 
 from napari.layers.base._base_constants import (
@@ -28,6 +27,7 @@ from napari.layers.base._base_mouse_bindings import (
     highlight_box_handles,
     transform_with_box,
 )
+from napari.layers.base._status import _LayerStatusInputs
 from napari.layers.utils._slice_input import _SliceInput, _ThickNDSlice
 from napari.layers.utils.interactivity_utils import (
     drag_data_to_projected_distance,
@@ -59,14 +59,12 @@ from napari.utils.migrations import _DeprecatingDict
 from napari.utils.misc import StringEnum
 from napari.utils.mouse_bindings import MousemapProvider
 from napari.utils.naming import magic_name
-from napari.utils.status_messages import (
-    generate_layer_status_strings,
-)
 from napari.utils.transforms import Affine, CompositeAffine, TransformChain
 from napari.utils.translations import trans
 
 if TYPE_CHECKING:
     import numpy.typing as npt
+    import pint
 
     from napari.components.dims import Dims
     from napari.components.overlays import BoundingBoxOverlay, Overlay
@@ -624,6 +622,10 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
 
         self._thumbnail_shape = (32, 32, 4)
         self._thumbnail = np.zeros(self._thumbnail_shape, dtype=np.uint8)
+        self._thumbnail_stale = False
+        # incremented whenever the thumbnail array is replaced, so that views
+        # can cache what they derive from it
+        self._thumbnail_version = 0
         self._update_properties = True
         self._name = ''
         self.experimental_clipping_planes = experimental_clipping_planes
@@ -898,7 +900,7 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
             )
 
         self._opacity = float(opacity)
-        self._update_thumbnail()
+        self._invalidate_thumbnail()
         self.events.opacity()
 
     @property
@@ -1281,6 +1283,11 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
     @property
     def thumbnail(self) -> npt.NDArray[np.uint8]:
         """array: Integer array of thumbnail for the layer"""
+        if self._thumbnail_stale:
+            self._thumbnail_stale = False
+            # listeners were already notified when it became stale
+            with self.events.thumbnail.blocker():
+                self._update_thumbnail()
         return self._thumbnail
 
     @thumbnail.setter
@@ -1303,6 +1310,18 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
         thumbnail = thumbnail * f_dest + background * f_source
 
         self._thumbnail = thumbnail.astype(np.uint8)
+        self._thumbnail_version += 1
+        self._thumbnail_stale = False
+        self.events.thumbnail()
+
+    def _invalidate_thumbnail(self) -> None:
+        """Mark the thumbnail as outdated.
+
+        The thumbnail is only updated when it is next read, so that it is
+        not computed for every slice during playback, nor at all when it
+        is not displayed.
+        """
+        self._thumbnail_stale = True
         self.events.thumbnail()
 
     @property
@@ -1505,42 +1524,22 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
         value : tuple, None
             Value of the data. If the layer is not visible return None.
         """
-        position = np.asarray(position)
         if self.visible:
-            if world:
-                ndim_world = len(position)
-
-                if dims_displayed is not None:
-                    # convert the dims_displayed to the layer dims.This accounts
-                    # for differences in the number of dimensions in the world
-                    # dims versus the layer and for transpose and rolls.
-                    dims_displayed = dims_displayed_world_to_layer(
-                        dims_displayed,
-                        ndim_world=ndim_world,
-                        ndim_layer=self.ndim,
-                    )
-                position = self.world_to_data(position)
-
-            if (dims_displayed is not None) and (view_direction is not None):
-                if len(dims_displayed) == 2 or self.ndim == 2:
-                    value = self._get_value(position=tuple(position))
-
-                else:  # if len(dims_displayed) == 3:
-                    view_direction = self._world_to_data_ray(view_direction)
-                    start_point, end_point = self.get_ray_intersections(
-                        position=position,
-                        view_direction=view_direction,
-                        dims_displayed=dims_displayed,
-                        world=False,
-                    )
-                    value = self._get_value_3d(
-                        start_point=start_point,
-                        end_point=end_point,
-                        dims_displayed=dims_displayed,
-                    )
-            else:
+            position, ray = self._get_value_query(
+                position,
+                view_direction=view_direction,
+                dims_displayed=dims_displayed,
+                world=world,
+            )
+            if ray is None:
                 value = self._get_value(position)
-
+            else:
+                start_point, end_point, dims_displayed = ray
+                value = self._get_value_3d(
+                    start_point=start_point,
+                    end_point=end_point,
+                    dims_displayed=dims_displayed,
+                )
         else:
             value = None
         # This should be removed as soon as possible, it is still
@@ -1549,6 +1548,59 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
             self._value = value
         return value
 
+    def _get_value_query(
+        self,
+        position: npt.ArrayLike,
+        *,
+        view_direction: npt.ArrayLike | None = None,
+        dims_displayed: list[int] | None = None,
+        world: bool = False,
+    ) -> tuple[
+        npt.ArrayLike,
+        tuple[np.ndarray | None, np.ndarray | None, list[int]] | None,
+    ]:
+        """Where to look for the value of the data, see `get_value`.
+
+        Returns
+        -------
+        position : tuple or np.ndarray
+            Position in data coordinates.
+        ray : tuple or None
+            If the value is looked for along a ray in 3D, the start and end
+            points of the ray in data coordinates, or None if it does not
+            intersect the data, and the displayed dimensions of the layer.
+            None if the value is looked for at the position.
+        """
+        position = np.asarray(position)
+        if world:
+            ndim_world = len(position)
+
+            if dims_displayed is not None:
+                # convert the dims_displayed to the layer dims.This accounts
+                # for differences in the number of dimensions in the world
+                # dims versus the layer and for transpose and rolls.
+                dims_displayed = dims_displayed_world_to_layer(
+                    dims_displayed,
+                    ndim_world=ndim_world,
+                    ndim_layer=self.ndim,
+                )
+            position = self.world_to_data(position)
+
+        if (dims_displayed is None) or (view_direction is None):
+            return position, None
+        if len(dims_displayed) == 2 or self.ndim == 2:
+            return tuple(position), None
+
+        # if len(dims_displayed) == 3:
+        view_direction = self._world_to_data_ray(view_direction)
+        start_point, end_point = self.get_ray_intersections(
+            position=position,
+            view_direction=view_direction,
+            dims_displayed=dims_displayed,
+            world=False,
+        )
+        return position, (start_point, end_point, dims_displayed)
+
     def _get_value_3d(
         self,
         start_point: np.ndarray | None,
@@ -1697,7 +1749,7 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
         if data_displayed:
             self.events.set_data()
         if thumbnail:
-            self._update_thumbnail()
+            self._invalidate_thumbnail()
         if highlight:
             self._set_highlight(force=True)
 
@@ -2066,7 +2118,11 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
         return start_point, end_point
 
     def _update_draw(
-        self, scale_factor, corner_pixels_displayed, shape_threshold
+        self,
+        scale_factor,
+        corner_pixels_displayed,
+        shape_threshold,
+        view_direction=None,
     ):
         """Update canvas scale and corner values on draw.
 
@@ -2082,6 +2138,9 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
             world coordinates.
         shape_threshold : tuple
             Requested shape of field of view in data coordinates.
+        view_direction : array, shape (3,), optional
+            View direction of an orthographic camera in 3D, in world
+            coordinates. None in 2D, or if the camera has a perspective.
         """
         self.scale_factor = scale_factor
 
@@ -2094,7 +2153,7 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
         # Note that we ignore the first transform which is tile2data
         data_corners = (
             self._transforms[1:]
-            .simplified.set_slice(displayed_axes)
+            .simplified._sliced(displayed_axes)
             .inverse(all_corners)
         )
 
@@ -2246,28 +2305,59 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
         status_dict : dict
             Dictionary containing a information that can be used as a status update.
         """
-        status_dict = self._get_source_info().copy()
+        return self._get_status_inputs(
+            position,
+            view_direction=view_direction,
+            dims_displayed=dims_displayed,
+            world=world,
+        ).get_status()
+
+    def _get_status_inputs(
+        self,
+        position: npt.ArrayLike | None,
+        *,
+        view_direction: npt.ArrayLike | None = None,
+        dims_displayed: list[int] | None = None,
+        world: bool = False,
+    ) -> _LayerStatusInputs:
+        """Record what the status at a position is computed from.
+
+        This reads the layer, so it must be called from the main thread,
+        but the returned record computes the status and the tooltip without
+        reading the layer, so it may do it in another thread.
 
-        if position is not None:
-            position = np.asarray(position)
-            value = self.get_value(
+        Parameters
+        ----------
+        position : tuple of float or None
+            Position in either data or world coordinates.
+        view_direction : Optional[np.ndarray]
+            A unit vector giving the direction of the ray in nD world coordinates.
+            The default value is None.
+        dims_displayed : Optional[List[int]]
+            A list of the dimensions currently being displayed in the viewer.
+            The default value is None.
+        world : bool
+            If True the position is taken to be in world coordinates
+            and converted into data coordinates. False by default.
+
+        Returns
+        -------
+        _LayerStatusInputs
+            What the status at the position is computed from.
+        """
+        if position is None:
+            return _LayerStatusInputs(self._get_source_info(), None)
+        position = np.asarray(position)
+        return _LayerStatusInputs(
+            self._get_source_info(),
+            tuple(position[-self.ndim :]),
+            self.get_value(
                 position,
                 view_direction=view_direction,
                 dims_displayed=dims_displayed,
                 world=world,
-            )
-            coords_str, value_str = generate_layer_status_strings(
-                position[-self.ndim :],
-                value,
-            )
-        else:
-            coords_str, value_str = '', ''
-
-        status_dict['coordinates'] = ': '.join((coords_str, value_str))
-        status_dict['coords'] = coords_str
-        status_dict['value'] = value_str
-
-        return status_dict
+            ),
+        )
 
     def _get_tooltip_text(
         self,
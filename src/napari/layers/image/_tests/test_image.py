@@ -645,6 +645,40 @@ def test_narrow_thumbnail():
     assert np.mean(thumbnail[middle_row - 1 : middle_row + 1]) > 0
 
 
+def test_thumbnail_updated_when_read():
+    layer = Image(np.random.random((2, 30, 30)))
+    calls = []
+    update_thumbnail = layer._update_thumbnail
+    layer._update_thumbnail = lambda: calls.append(update_thumbnail())
+    thumbnail_events = []
+    layer.events.thumbnail.connect(thumbnail_events.append)
+
+    layer._slice_dims(Dims(ndim=3, point=(1, 0, 0)))
+    layer.refresh()
+    assert len(thumbnail_events) == 2
+    assert calls == []
+
+    thumbnail = layer.thumbnail
+    assert len(calls) == 1
+    assert thumbnail.shape == layer._thumbnail_shape
+    assert layer.thumbnail is thumbnail
+    assert len(calls) == 1
+    assert len(thumbnail_events) == 2
+
+
+def test_thumbnail_reduced_by_slice_request():
+    data = np.random.random((4, 300, 200))
+    layer = Image(data)
+    thumbnail = layer._slice.thumbnail.raw
+    assert thumbnail.shape == (34, 34)
+    np.testing.assert_array_equal(thumbnail, data[0, ::9, ::6])
+
+    layer._slice_dims(Dims(ndim=3, ndisplay=3))
+    thumbnail = layer._slice.thumbnail.raw
+    np.testing.assert_array_equal(thumbnail, data.max(axis=0)[::9, ::6])
+    assert layer.thumbnail.shape == layer._thumbnail_shape
+
+
 @pytest.mark.parametrize('dtype', [np.float32, np.float64])
 def test_out_of_range_image(dtype):
     data = -1.7 - 0.001 * np.random.random((10, 15)).astype(dtype)
@@ -1059,6 +1093,41 @@ def test_contrast_outside_range():
     Image(data, contrast_limits=(0, 1000))
 
 
+def test_refresh_region():
+    data = np.zeros((3, 20, 30))
+    layer = Image(data, contrast_limits=(0, 10))
+    layer._slice_dims(Dims(ndim=3, point=(1, 0, 0)))
+    # the sliced data is a copy of the data in the texture dtype
+    layer._texture_limits = (None, None)
+    layer.refresh()
+    updates = []
+    layer.events.region_update.connect(updates.append)
+
+    # regions refreshed before the draw are merged
+    data[1, 2:4, 5:10] = 7
+    layer.refresh_region((slice(1, 2), slice(2, 4), slice(5, 10)))
+    data[1, 8, 12] = 3
+    layer.refresh_region((1, 8, slice(12, 13)))
+    assert updates == []
+    layer._refresh_dirty_region()
+    assert len(updates) == 1
+    assert updates[0].offset == [2, 5]
+    npt.assert_array_equal(updates[0].data, data[1, 2:9, 5:13])
+    assert updates[0].data.dtype == np.float32
+    npt.assert_array_equal(layer._slice.texture, data[1])
+
+    # regions outside of the current slice are not updated
+    data[2] = 1
+    layer.refresh_region((slice(2, 3),))
+    layer._refresh_dirty_region()
+    assert len(updates) == 1
+
+    # without a canvas, regions are updated immediately
+    layer._texture_limits = None
+    layer.refresh_region((1, slice(0, 2)))
+    assert len(updates) == 2
+
+
 def test_docstring():
     validate_all_params_in_docstring(Image)
     validate_kwargs_sorted(Image)
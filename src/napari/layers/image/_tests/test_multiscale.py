@@ -1,6 +1,7 @@
 import numpy as np
 import pytest
 import skimage
+import zarr
 from skimage.transform import pyramid_gaussian
 
 from napari._tests.utils import check_layer_world_data_extent
@@ -498,3 +499,95 @@ def test_update_draw_variable_canvas_size_fixed_fov(
 
     assert layer.data_level == exp_level
     np.testing.assert_equal(layer.corner_pixels, exp_corner_pixels_data)
+
+
+def _update_draw_3d(layer, scale_factor):
+    # canvas looking down axis 0 at the first 64x64 pixels of axes 1 and 2
+    layer._update_draw(
+        scale_factor=scale_factor,
+        corner_pixels_displayed=np.array([[128, 0, 0], [128, 63, 63]]),
+        shape_threshold=(64, 64),
+        view_direction=np.array([1, 0, 0]),
+    )
+
+
+def test_update_draw_3d_multiscale():
+    from napari.components import Dims
+    from napari.settings import get_settings
+
+    get_settings().experimental.multiscale_3d = True
+    base = np.random.default_rng(0).random((256, 256, 256), dtype=np.float32)
+    data = [base, base[::2, ::2, ::2], base[::4, ::4, ::4]]
+    layer = Image(data, multiscale=True)
+    layer._slice_dims(Dims(ndim=3, ndisplay=3))
+    cache = layer._slicing_state._brick_cache
+
+    # zoomed in: full resolution, restricted to the bricks in view
+    _update_draw_3d(layer, scale_factor=1)
+    assert layer.data_level == 0
+    np.testing.assert_array_equal(
+        layer.corner_pixels, [[0, 0, 0], [255, 127, 127]]
+    )
+    np.testing.assert_array_equal(layer._data_view, base[:, :128, :128])
+
+    # zoomed out: coarsest level, which fits in view entirely
+    _update_draw_3d(layer, scale_factor=4)
+    assert layer.data_level == 2
+    np.testing.assert_array_equal(layer._data_view, data[2])
+    n_bricks = len(cache)
+
+    # going back reuses the bricks loaded before
+    _update_draw_3d(layer, scale_factor=1)
+    assert layer.data_level == 0
+    assert len(cache) == n_bricks
+
+    # bricks of the old data are dropped when the data is replaced
+    new_data = [d + 1 for d in data]
+    layer.data = new_data
+    level = layer.data_level
+    start, stop = layer.corner_pixels
+    np.testing.assert_array_equal(
+        layer._data_view,
+        new_data[level][tuple(map(slice, start, stop + 1))],
+    )
+
+
+def test_update_draw_3d_multiscale_data_edited_in_place():
+    from napari.components import Dims
+    from napari.settings import get_settings
+
+    get_settings().experimental.multiscale_3d = True
+    # reading a zarr array returns a copy, unlike a view of a numpy array
+    data = [
+        zarr.zeros((256 // 2**i,) * 3, chunks=64, dtype=np.float32)
+        for i in range(3)
+    ]
+    layer = Image(data, multiscale=True, contrast_limits=(0, 1))
+    layer._slice_dims(Dims(ndim=3, ndisplay=3))
+    _update_draw_3d(layer, scale_factor=1)
+    assert layer.data_level == 0
+    assert len(layer._slicing_state._brick_cache) > 0
+
+    data[0][:, :64, :64] = 1
+    layer.refresh()
+    np.testing.assert_array_equal(layer._data_view, data[0][:, :128, :128])
+
+
+def test_update_draw_3d_multiscale_plane():
+    from napari.components import Dims
+    from napari.settings import get_settings
+
+    get_settings().experimental.multiscale_3d = True
+    data = [np.zeros((256, 256, 256)), np.zeros((128, 128, 128))]
+    layer = Image(
+        data,
+        multiscale=True,
+        depiction='plane',
+        plane={'position': (100, 128, 128), 'normal': (1, 0, 0)},
+    )
+    layer._slice_dims(Dims(ndim=3, ndisplay=3))
+    _update_draw_3d(layer, scale_factor=1)
+    # only the bricks intersecting the plane are loaded
+    np.testing.assert_array_equal(
+        layer.corner_pixels, [[64, 0, 0], [127, 127, 127]]
+    )
@@ -5,10 +5,11 @@ from __future__ import annotations
 import typing
 import warnings
 from collections.abc import Sequence
+from contextlib import nullcontext
+from dataclasses import replace
 from typing import Any, Literal, cast
 
 import numpy as np
-from scipy import ndimage as ndi
 
 from napari.layers._data_protocols import LayerDataProtocol
 from napari.layers._multiscale_data import MultiScaleData
@@ -31,6 +32,7 @@ from napari.types import LayerDataType
 from napari.utils._dtype import get_dtype_limits, normalize_dtype
 from napari.utils.colormaps import ensure_colormap
 from napari.utils.colormaps.colormap_utils import _coerce_contrast_limits
+from napari.utils.events import Event
 from napari.utils.translations import trans
 
 if typing.TYPE_CHECKING:
@@ -54,7 +56,8 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
         list and arrays are decreasing in shape then the data is treated as
         a multiscale image. Please note multiscale rendering is only
         supported in 2D. In 3D, only the lowest resolution scale is
-        displayed.
+        displayed, unless the experimental ``multiscale_3d`` setting
+        is enabled.
     affine : n-D array or napari.utils.transforms.Affine
         (N+1, N+1) affine transformation matrix in homogeneous coordinates.
         The first (N, N) entries correspond to a linear transform and
@@ -117,7 +120,8 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
         then it will be taken to be multiscale. The first image in the list
         should be the largest. Please note multiscale rendering is only
         supported in 2D. In 3D, only the lowest resolution scale is
-        displayed.
+        displayed, unless the experimental ``multiscale_3d`` setting
+        is enabled.
     name : str
         Name of the layer.
     opacity : float
@@ -164,7 +168,8 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
         and arrays are decreasing in shape then the data is treated as a
         multiscale image. Please note multiscale rendering is only
         supported in 2D. In 3D, only the lowest resolution scale is
-        displayed.
+        displayed, unless the experimental ``multiscale_3d`` setting
+        is enabled.
     axis_labels : tuple of str
         Dimension names of the layer data.
     metadata : dict
@@ -179,7 +184,8 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
         represented by a list of array like image data. The first image in the
         list should be the largest. Please note multiscale rendering is only
         supported in 2D. In 3D, only the lowest resolution scale is
-        displayed.
+        displayed, unless the experimental ``multiscale_3d`` setting
+        is enabled.
     mode : str
         Interactive mode. The normal, default mode is PAN_ZOOM, which
         allows for normal interactivity with the canvas.
@@ -306,6 +312,9 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
         )
 
         self.rgb = rgb
+        self.events.add(region_update=Event)
+        # bounding box of the regions to refresh at the next draw
+        self._dirty_region: tuple[slice, ...] | None = None
         self._colormap = ensure_colormap(colormap)
         self._gamma = gamma
         self._interpolation2d = Interpolation.NEAREST
@@ -423,6 +432,7 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
         self._data_raw = data
         # note, we don't support changing multiscale in an Image instance
         self._data = MultiScaleData(data) if self.multiscale else data  # type: ignore
+        self._slicing_state._brick_cache.clear()
         self._update_dims()
         if self._keep_auto_contrast:
             self.reset_contrast_limits()
@@ -484,6 +494,111 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
         self._update_thumbnail()
         self.events.iso_threshold()
 
+    def refresh_region(self, region: Sequence[slice | int]) -> None:
+        """Refresh the display of a region of the data modified in place.
+
+        This is a faster alternative to :meth:`refresh` when only part of
+        the data changed, for example when the frames of a live acquisition
+        are written into a preallocated array. Only the part of the region
+        within the current slice is sliced again and sent to the GPU. The
+        thumbnail is not updated.
+
+        Regions refreshed before the canvas is drawn are merged into their
+        bounding box, and updated once at the draw. If the layer is not
+        displayed in a canvas, the region is updated immediately.
+
+        Parameters
+        ----------
+        region : sequence of slice or int
+            The modified region of the data, with one slice or index per
+            layer dimension. Missing trailing dimensions are taken in full.
+        """
+        shape = self.data.shape[: self.ndim]
+        region = tuple(region) + (slice(None),) * (self.ndim - len(region))
+        bounds = []
+        for s, size in zip(region, shape, strict=True):
+            if not isinstance(s, slice):
+                s = slice(s, s + 1 if s != -1 else None)
+            indices = range(*s.indices(size))
+            if len(indices) == 0:
+                return
+            start, stop = sorted((indices[0], indices[-1]))
+            bounds.append(slice(start, stop + 1))
+        if self._dirty_region is not None:
+            bounds = [
+                slice(min(a.start, b.start), max(a.stop, b.stop))
+                for a, b in zip(bounds, self._dirty_region, strict=True)
+            ]
+        self._dirty_region = tuple(bounds)
+
+        if self._texture_limits is None:
+            self._refresh_dirty_region()
+        else:
+            # schedule a draw of the canvas, which updates the region
+            self.events.refresh()
+
+    def _refresh_dirty_region(self) -> None:
+        """Slice and display the region accumulated by `refresh_region`."""
+        region, self._dirty_region = self._dirty_region, None
+        if (
+            region is None
+            or not self.visible
+            or not self.loaded
+            or self._slice.empty
+        ):
+            return
+        if (
+            self.multiscale
+            or self._keep_auto_contrast
+            or not np.all(self._transforms['tile2data'].scale == 1)
+        ):
+            # the levels, contrast limits or downsampling of the texture
+            # may depend on the new data
+            self.refresh(extent=False, highlight=False)
+            return
+
+        response = self._slicing_state._slice_region(region)
+        if response is None:
+            return
+
+        # keep the current slice up to date, unless it is a read-only view
+        # of the data, which then is already updated
+        index = tuple(region[d] for d in self._slice_input.displayed)
+        updated = response.image.view
+        offset = [s.start for s in index]
+        parts = [
+            (self._slice.image.raw, index, response.image.raw),
+            (self._slice.image.view, index, response.image.view),
+        ]
+        if response.texture is not None:
+            pad = response.texture.ndim - response.image.view.ndim
+            updated = response.texture
+            offset = [0] * pad + offset
+            parts.append(
+                (self._slice.texture, (slice(None),) * pad + index, updated)
+            )
+        for array, array_index, value in parts:
+            if array is not None and array.flags.writeable:
+                array[array_index] = value
+
+        self.events.region_update(data=updated, offset=offset)
+
+    def _update_draw(
+        self,
+        scale_factor,
+        corner_pixels_displayed,
+        shape_threshold,
+        view_direction=None,
+    ):
+        # update the regions refreshed since the last draw at once
+        self._refresh_dirty_region()
+        super()._update_draw(
+            scale_factor,
+            corner_pixels_displayed,
+            shape_threshold,
+            view_direction=view_direction,
+        )
+
     def _get_level_shapes(self) -> Sequence[tuple[int, ...]]:
         shapes = super()._get_level_shapes()
         if self.rgb:
@@ -497,9 +612,9 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
             self.thumbnail = np.zeros(self._thumbnail_shape, self.dtype)
             return
 
+        # the slice request usually projects volumes already
         image = self._slice.thumbnail.raw
-
-        if self._slice_input.ndisplay == 3 and self.ndim > 2:
+        if image.ndim - self.rgb > 2:
             image = np.max(image, axis=0)
 
         # float16 not supported by ndi.zoom
@@ -516,6 +631,9 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
             self._thumbnail_shape[:2],
         )
         zoom_factor = tuple(new_shape / image.shape[:2])
+
+        from scipy import ndimage as ndi
+
         if self.rgb:
             downsampled = ndi.zoom(
                 image, zoom_factor + (1,), prefilter=False, order=0
@@ -619,7 +737,13 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
             finally:
                 self._keep_auto_contrast = prev
 
-    def _calculate_value_from_ray(self, values: npt.NDArray) -> None | float:
+    def _ray_hit(self, values: npt.NDArray) -> int | None:
+        # the value does not depend on the samples past the first one
+        if self.rendering in (ImageRendering.TRANSLUCENT, ImageRendering.ISO):
+            return 0
+        return None
+
+    def _calculate_value_from_ray(self, values: npt.NDArray) -> float | None:
         # translucent is special: just return the first value, no matter what
         if self.rendering == ImageRendering.TRANSLUCENT:
             return np.ravel(values)[0]
@@ -678,6 +802,27 @@ class _ImageSlicingState(ScalarFieldSlicingState):
     layer: Image
     _slice_request_class = _ImageSliceRequest
 
+    def _slice_region(
+        self, region: tuple[slice, ...]
+    ) -> _ScalarFieldSliceResponse | None:
+        """Slice a region of the data within the current slice.
+
+        Returns None if the region does not intersect the current slice.
+        """
+        request = self._make_slice_request_internal(
+            slice_input=self._slice_input,
+            data_slice=self.data_slice,
+            dask_indexer=nullcontext,
+        )
+        if not request._intersects(region):
+            return None
+        displayed = self._slice_input.displayed
+        data_region = tuple(
+            region[d] if d in displayed else slice(None)
+            for d in range(self.ndim)
+        )
+        return replace(request, data=self.layer.data[data_region])()
+
     def _update_slice_response(
         self, response: _ScalarFieldSliceResponse
     ) -> None:
@@ -694,6 +839,14 @@ class _ImageSlicingState(ScalarFieldSlicingState):
                 rgb=self.layer.rgb,
                 dtype=self.layer.dtype,
             )
+            if not np.allclose(
+                _coerce_contrast_limits(
+                    self.layer.contrast_limits
+                ).contrast_limits,
+                self.layer.contrast_limits,
+            ):
+                # the slice was converted with the previous contrast limits
+                response = response.to_displayed(self.layer._raw_to_displayed)
         super()._update_slice_response(response)
         if self.layer._should_calc_clims:
             self.layer.reset_contrast_limits_range()
@@ -1379,6 +1379,31 @@ def test_get_value_ray_3d():
     assert value is None
 
 
+def test_get_value_ray_3d_stops_at_first_label(monkeypatch):
+    """Test that _get_value_ray does not read the ray past the first label"""
+    data = np.zeros((400, 4, 4), dtype=int)
+    data[300:, 1, 1] = 2
+    data[10, 1, 1] = 1
+    labels = Labels(data)
+    labels._slice_dims(Dims(ndim=3, ndisplay=3))
+
+    n_chunks = []
+    ray_hit = labels._ray_hit
+
+    def _ray_hit(values):
+        n_chunks.append(len(values))
+        return ray_hit(values)
+
+    monkeypatch.setattr(labels, '_ray_hit', _ray_hit)
+    value = labels._get_value_ray(
+        start_point=np.array([0, 1, 1]),
+        end_point=np.array([399, 1, 1]),
+        dims_displayed=[0, 1, 2],
+    )
+    assert value == 1
+    assert len(n_chunks) == 1
+
+
 def test_get_value_ray_3d_rolled():
     """Test using _get_value_ray to interrogate labels in 3D
     with the dimensions rolled.
@@ -1936,3 +1961,42 @@ def test_view_dtype(visible, dtype):
 def test_view_dtype_int16(visible, dtype):
     layer = Labels(np.arange(25, dtype=dtype).reshape(5, 5), visible=visible)
     assert layer._slice.image.view.dtype == np.uint16
+
+
+def test_batched_labels_update_keeps_every_paint():
+    layer = Labels(np.zeros((10, 10), dtype=np.uint8))
+    layer.brush_size = 1
+    updates = []
+    layer.events.labels_update.connect(
+        lambda event: updates.append(tuple(event.offset))
+    )
+
+    with layer.events.batched():
+        layer.paint((1, 1), 1)
+        layer.paint((8, 8), 2)
+        assert updates == []
+
+    assert updates == [(1, 1), (8, 8)]
+
+
+def test_paint_clears_brick_cache():
+    layer = Labels(np.zeros((10, 10), dtype=np.uint8))
+    cache = layer._slicing_state._brick_cache
+    cache.get((0, 0, 0), lambda: np.zeros((4, 4), dtype=np.uint8))
+    assert len(cache) == 1
+
+    layer.paint((1, 1), 1)
+    assert len(cache) == 0
+
+
+def test_paint_drops_prepared_texture():
+    layer = Labels(np.zeros((10, 10), dtype=np.uint8))
+    # as if displayed in a canvas, which makes the slice prepare a texture
+    layer._texture_limits = (2048, 2048)
+    layer.refresh()
+    assert layer._slice.texture is not None
+
+    layer.brush_size = 1
+    layer.paint((1, 1), 1)
+    assert layer._slice.texture is None
+    assert layer._slice.image.view[1, 1] != layer._slice.image.view[0, 0]
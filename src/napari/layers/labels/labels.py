@@ -5,16 +5,16 @@ import warnings
 from collections import deque
 from collections.abc import Callable, Generator, Sequence
 from contextlib import contextmanager
+from dataclasses import dataclass, replace
 from typing import (
+    TYPE_CHECKING,
     Any,
     ClassVar,
 )
 
 import numpy as np
 import numpy.typing as npt
-import pandas as pd
 from PIL import Image, ImageDraw
-from scipy import ndimage as ndi
 
 from napari.layers._data_protocols import LayerDataProtocol
 from napari.layers._multiscale_data import MultiScaleData
@@ -27,6 +27,7 @@ from napari.layers.base._base_mouse_bindings import (
     highlight_box_handles,
     transform_with_box,
 )
+from napari.layers.base._status import _format_properties, _LayerStatusInputs
 from napari.layers.image._image_utils import guess_multiscale
 from napari.layers.labels._labels_constants import (
     IsoCategoricalGradientMode,
@@ -72,9 +73,59 @@ from napari.utils.misc import StringEnum, _is_array_type
 from napari.utils.naming import magic_name
 from napari.utils.translations import trans
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 __all__ = ('Labels',)
 
 
+@dataclass(frozen=True, kw_only=True)
+class _LabelsStatusInputs(_LayerStatusInputs):
+    """What the status of a labels layer at a position is computed from.
+
+    Attributes
+    ----------
+    features : pd.DataFrame
+        The features of the labels.
+    label_index : dict of int to int
+        The row of the features of each label.
+    multiscale : bool
+        Whether the value includes the data level, see ``Labels.get_value``.
+    """
+
+    features: pd.DataFrame
+    label_index: dict[int, int]
+    multiscale: bool
+
+    def get_properties(self, value: Any) -> list[str]:
+        # if the cursor is not outside the image or on the background
+        if (
+            len(self.label_index) == 0
+            or self.features.shape[1] == 0
+            or value is None
+        ):
+            return []
+
+        label_value: int = typing.cast(
+            int, value[1] if self.multiscale else value
+        )
+        if label_value not in self.label_index:
+            return [trans._('[No Properties]')]
+
+        return _format_properties(self.features, self.label_index[label_value])
+
+    def get_tooltip_text(self) -> str:
+        value = self.get_value()
+        if value is None:
+            return ''
+
+        properties = self.get_properties(value)
+        if not properties:
+            return f'{value}'
+
+        return f'{value}\n' + '\n'.join(properties)
+
+
 class Labels(ScalarFieldBase):
     """Labels (or segmentation) layer.
 
@@ -131,7 +182,8 @@ class Labels(ScalarFieldBase):
         then it will be taken to be multiscale. The first image in the list
         should be the largest. Please note multiscale rendering is only
         supported in 2D. In 3D, only the lowest resolution scale is
-        displayed.
+        displayed, unless the experimental ``multiscale_3d`` setting
+        is enabled.
     name : str
         Name of the layer.
     opacity : float
@@ -186,7 +238,8 @@ class Labels(ScalarFieldBase):
         represented by a list of array like image data. The first image in the
         list should be the largest. Please note multiscale rendering is only
         supported in 2D. In 3D, only the lowest resolution scale is
-        displayed.
+        displayed, unless the experimental ``multiscale_3d`` setting
+        is enabled.
     metadata : dict
         Labels metadata.
     num_colors : int
@@ -592,6 +645,7 @@ class Labels(ScalarFieldBase):
         data = self._ensure_int_labels(data)
         self._data = data
         self._ndim = len(self._data.shape)
+        self._slicing_state._brick_cache.clear()
         self._update_dims()
         self.events.data(value=self.data)
         self._reset_editable()
@@ -978,7 +1032,8 @@ class Labels(ScalarFieldBase):
             return
 
         image = self._slice.thumbnail.raw
-        if self._slice_input.ndisplay == 3 and self.ndim > 2:
+        if image.ndim > 2:
+            # the slice request usually projects volumes already, otherwise
             # we are only using the current slice so `image` will never be
             # bigger than 3. If we are in this clause, it is exactly 3, so we
             # use max projection. For labels, ideally we would use "first
@@ -993,6 +1048,8 @@ class Labels(ScalarFieldBase):
         )
         zoom_factor = tuple(new_shape / imshape)
 
+        from scipy import ndimage as ndi
+
         downsampled = ndi.zoom(image, zoom_factor, prefilter=False, order=0)
         color_array = self.colormap.map(downsampled)
         color_array[..., 3] *= self.opacity
@@ -1169,6 +1226,8 @@ class Labels(ScalarFieldBase):
         matches = labels == old_label
         if self.contiguous:
             # if contiguous replace only selected connected component
+            from scipy import ndimage as ndi
+
             labeled_matches, num_features = ndi.label(matches)
             if num_features != 1:
                 match_label = labeled_matches[slice_coord]
@@ -1454,6 +1513,11 @@ class Labels(ScalarFieldBase):
 
         # update the labels image
         self.data[indices] = value
+        self._slicing_state._brick_cache.clear()
+        if self._slice.texture is not None:
+            # the slice is updated in place below, the texture prepared from
+            # it by the slice task would be out of date
+            self._slicing_state._slice = replace(self._slice, texture=None)
 
         pt_not_disp = self._get_pt_not_disp()
         displayed_indices = index_in_slice(
@@ -1517,55 +1581,35 @@ class Labels(ScalarFieldBase):
             return None
         return values[np.argmax(np.ravel(non_bg))]
 
-    def get_status(
+    def _ray_hit(self, values):
+        non_bg = np.ravel(values != self.colormap.background_value)
+        if not np.any(non_bg):
+            return None
+        return int(np.argmax(non_bg))
+
+    def _get_status_inputs(
         self,
-        position: npt.ArrayLike | None = None,
+        position: npt.ArrayLike | None,
         *,
         view_direction: npt.ArrayLike | None = None,
         dims_displayed: list[int] | None = None,
         world: bool = False,
-        value: Any | None = None,
-    ) -> dict[str, str]:
-        """Status message information of the data at a coordinate position.
-
-        Parameters
-        ----------
-        position : tuple
-            Position in either data or world coordinates.
-        view_direction : Optional[np.ndarray]
-            A unit vector giving the direction of the ray in nD world coordinates.
-            The default value is None.
-        dims_displayed : Optional[List[int]]
-            A list of the dimensions currently being displayed in the viewer.
-            The default value is None.
-        world : bool
-            If True the position is taken to be in world coordinates
-            and converted into data coordinates. False by default.
-
-        Returns
-        -------
-        status : dict
-            Dict containing a information that can be used in a status update.
-        """
-        status = super().get_status(
+    ) -> _LabelsStatusInputs:
+        inputs = super()._get_status_inputs(
             position,
             view_direction=view_direction,
             dims_displayed=dims_displayed,
             world=world,
         )
-
-        # if this labels layer has properties
-        properties = self._get_properties(
-            position,
-            view_direction=np.asarray(view_direction),
-            dims_displayed=dims_displayed,
-            world=world,
+        return _LabelsStatusInputs(
+            inputs.source_info,
+            inputs.position,
+            inputs.value,
+            # a column set in place must not change the recorded features
+            features=self.features.copy(deep=False),
+            label_index=self._label_index,
+            multiscale=self.multiscale,
         )
-        if properties:
-            status['coordinates'] += '; ' + ', '.join(properties)
-            status['value'] += '; ' + ', '.join(properties)
-
-        return status
 
     def _get_tooltip_text(
         self,
@@ -1597,26 +1641,12 @@ class Labels(ScalarFieldBase):
         msg : string
             String containing a message that can be used as a tooltip.
         """
-        value = self.get_value(
-            position,
-            view_direction=view_direction,
-            dims_displayed=dims_displayed,
-            world=world,
-        )
-        if value is None:
-            return ''
-
-        properties = self._get_properties(
+        return self._get_status_inputs(
             position,
             view_direction=view_direction,
             dims_displayed=dims_displayed,
             world=world,
-        )
-
-        if not properties:
-            return f'{value}'
-
-        return f'{value}\n' + '\n'.join(properties)
+        ).get_tooltip_text()
 
     def _get_properties(
         self,
@@ -1626,34 +1656,13 @@ class Labels(ScalarFieldBase):
         dims_displayed: list[int] | None = None,
         world: bool = False,
     ) -> list:
-        if len(self._label_index) == 0 or self.features.shape[1] == 0:
-            return []
-
-        value = self.get_value(
+        inputs = self._get_status_inputs(
             position,
             view_direction=view_direction,
             dims_displayed=dims_displayed,
             world=world,
         )
-        # if the cursor is not outside the image or on the background
-        if value is None:
-            return []
-
-        label_value: int = typing.cast(
-            int, value[1] if self.multiscale else value
-        )
-        if label_value not in self._label_index:
-            return [trans._('[No Properties]')]
-
-        idx = self._label_index[label_value]
-        return [
-            f'{k}: {v[idx]}'
-            for k, v in self.features.items()
-            if k != 'index'
-            and len(v) > idx
-            and v[idx] is not None
-            and not (isinstance(v[idx], float) and np.isnan(v[idx]))
-        ]
+        return inputs.get_properties(inputs.get_value())
 
     def _get_layer_slicing_state(
         self, data: LayerDataType, cache: bool
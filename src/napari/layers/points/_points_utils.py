@@ -8,7 +8,10 @@ from napari.layers.points._points_constants import (
     SYMBOL_DICT,
     Symbol,
 )
-from napari.utils.geometry import project_points_onto_plane
+from napari.layers.utils.interactivity_utils import (
+    displayed_plane_from_nd_line_segment,
+)
+from napari.utils.geometry import project_points_onto_plane, rotate_points
 from napari.utils.translations import trans
 
 
@@ -213,6 +216,102 @@ def points_in_box(
     return list(inside)
 
 
+def point_at_position(
+    position: npt.NDArray,
+    view_data: npt.NDArray,
+    view_size: npt.NDArray,
+    scale_ratio: npt.NDArray,
+) -> int | None:
+    """Find the last point in view at a position of the displayed dimensions.
+
+    Parameters
+    ----------
+    position : (D,) array
+        Position in the displayed dimensions, in data coordinates.
+    view_data : (N, D) array
+        Coordinates of the points in view, in the displayed dimensions.
+    view_size : (N,) array
+        Sizes of the points in view.
+    scale_ratio : (D,) array
+        Scale of the displayed dimensions over the scale of the last one.
+        Positions are scaled anisotropically by the scale, but sizes are
+        not, so it maps sizes to data coordinates.
+
+    Returns
+    -------
+    index : int or None
+        Index, among the points in view, of the point at the position.
+    """
+    # TODO: calculate distance in canvas space to account for canvas_size_limits.
+    # Without this implementation, point hover and selection (and anything depending
+    # on self.get_value()) won't be aware of the real extent of points, causing
+    # unexpected behaviour. See #3734 for details.
+    sizes = np.expand_dims(view_size, axis=1) / scale_ratio / 2
+    distances = abs(view_data - position)
+    indices = np.where(np.all(distances <= sizes, axis=1))[0]
+    return indices[-1] if len(indices) > 0 else None
+
+
+def point_along_ray(
+    start_point: npt.NDArray,
+    end_point: npt.NDArray,
+    dims_displayed: list[int],
+    view_data: npt.NDArray,
+    view_size: npt.NDArray,
+    scale_ratio: npt.NDArray,
+) -> int | None:
+    """Find the point in view closest to the start of a ray crossing it.
+
+    Parameters
+    ----------
+    start_point : (D,) array
+        The start position of the ray, in data coordinates.
+    end_point : (D,) array
+        The end position of the ray, in data coordinates.
+    dims_displayed : list of int
+        The displayed dimensions of the layer.
+    view_data : (N, 3) array
+        Coordinates of the points in view, in the displayed dimensions.
+    view_size : (N,) array
+        Sizes of the points in view.
+    scale_ratio : (3,) array
+        Scale of the displayed dimensions over the scale of the last one,
+        see `point_at_position`.
+
+    Returns
+    -------
+    index : int or None
+        Index, among the points in view, of the point along the ray.
+    """
+    plane_point, plane_normal = displayed_plane_from_nd_line_segment(
+        start_point, end_point, dims_displayed
+    )
+
+    # project the in view points onto the plane
+    projected_points, projection_distances = project_points_onto_plane(
+        points=view_data,
+        plane_point=plane_point,
+        plane_normal=plane_normal,
+    )
+
+    # rotate points and plane to be axis aligned with normal [0, 0, 1]
+    rotated_points, rotation_matrix = rotate_points(
+        points=projected_points,
+        current_plane_normal=plane_normal,
+        new_plane_normal=[0, 0, 1],
+    )
+    rotated_click_point = np.dot(rotation_matrix, plane_point)
+
+    # find the points the click intersects
+    sizes = np.expand_dims(view_size, axis=1) / scale_ratio / 2
+    distances = abs(rotated_points - rotated_click_point)
+    indices = np.where(np.all(distances <= sizes, axis=1))[0]
+    if len(indices) == 0:
+        return None
+    # find the point that is most in the foreground
+    return indices[np.argmin(projection_distances[indices])]
+
+
 def fix_data_points(
     points: np.ndarray | None, ndim: int | None
 ) -> tuple[np.ndarray, int]:
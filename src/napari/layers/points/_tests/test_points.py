@@ -882,6 +882,23 @@ def test_updating_points_properties():
     np.testing.assert_equal(layer.properties, updated_properties)
 
 
+def test_updating_points_properties_updates_text():
+    data = 20 * np.random.random((3, 2))
+    features = {'point_type': ['A', 'B', 'B']}
+    layer = Points(data, features=features, text='type {point_type}')
+    np.testing.assert_array_equal(
+        layer.text.view_text(np.arange(3)), ['type A', 'type B', 'type B']
+    )
+
+    layer.mode = 'select'
+    layer.selected_data = [1]
+    layer.current_properties = {'point_type': np.array(['A'])}
+
+    np.testing.assert_array_equal(
+        layer.text.view_text(np.arange(3)), ['type A', 'type A', 'type B']
+    )
+
+
 def test_setting_current_properties():
     shape = (2, 2)
     np.random.seed(0)
@@ -3,6 +3,8 @@ import typing
 import warnings
 from collections.abc import Callable, Iterable, Sequence, Set as AbstractSet
 from copy import copy, deepcopy
+from dataclasses import dataclass
+from functools import cached_property
 from itertools import cycle
 from typing import (
     TYPE_CHECKING,
@@ -14,7 +16,6 @@ from typing import (
 
 import numpy as np
 import numpy.typing as npt
-import pandas as pd
 from psygnal.containers import Selection
 
 from napari.layers.base import Layer, _LayerSlicingState, no_op
@@ -23,6 +24,7 @@ from napari.layers.base._base_mouse_bindings import (
     highlight_box_handles,
     transform_with_box,
 )
+from napari.layers.base._status import _format_properties, _LayerStatusInputs
 from napari.layers.points._points_constants import (
     Mode,
     PointsProjectionMode,
@@ -34,6 +36,8 @@ from napari.layers.points._points_utils import (
     coerce_symbols,
     create_box,
     fix_data_points,
+    point_along_ray,
+    point_at_position,
     points_to_squares,
 )
 from napari.layers.points._slice import _PointSliceRequest, _PointSliceResponse
@@ -41,9 +45,6 @@ from napari.layers.utils._color_manager_constants import ColorMode
 from napari.layers.utils._slice_input import _SliceInput, _ThickNDSlice
 from napari.layers.utils.color_manager import ColorManager
 from napari.layers.utils.color_transformations import ColorType
-from napari.layers.utils.interactivity_utils import (
-    displayed_plane_from_nd_line_segment,
-)
 from napari.layers.utils.layer_utils import (
     _features_to_properties,
     _FeatureTable,
@@ -55,16 +56,106 @@ from napari.utils.colormaps import Colormap, ValidColormapArg
 from napari.utils.colormaps.standardize_color import hex_to_name, rgb_to_hex
 from napari.utils.events import Event
 from napari.utils.events.custom_types import Array
-from napari.utils.geometry import project_points_onto_plane, rotate_points
 from napari.utils.transforms import Affine
 from napari.utils.translations import trans
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from napari.components.dims import Dims
 
 DEFAULT_COLOR_CYCLE = np.array([[1, 0, 1, 1], [0, 1, 0, 1]])
 
 
+@dataclass(frozen=True, kw_only=True)
+class _PointsStatusInputs(_LayerStatusInputs):
+    """What the status of a points layer at a position is computed from.
+
+    Finding the point at a position is costly with many points, so unless
+    it was already found when recording, it is found when the status is
+    computed, from the arrays of the layer. These are not changed in place
+    by the layer, which replaces them instead.
+
+    Attributes
+    ----------
+    data : np.ndarray
+        The coordinates of the points.
+    size : np.ndarray
+        The sizes of the points.
+    indices_view : np.ndarray
+        The indices of the points in view.
+    view_size_scale : float or np.ndarray
+        The scale of the sizes of the points in view.
+    displayed : tuple of int
+        The displayed dimensions of the layer.
+    scale_ratio : np.ndarray
+        The scale of the displayed dimensions over the scale of the last one.
+    query : np.ndarray or None
+        The position in data coordinates, see ``Layer._get_value_query``, or
+        None if the point was found when recording, it is then the value.
+    ray : tuple or None
+        The ray along which the point is found in 3D, see
+        ``Layer._get_value_query``.
+    features : pd.DataFrame
+        The features of the points.
+    """
+
+    data: np.ndarray
+    size: np.ndarray
+    indices_view: np.ndarray
+    view_size_scale: float | np.ndarray
+    displayed: tuple[int, ...]
+    scale_ratio: np.ndarray
+    query: np.ndarray | None
+    ray: tuple[np.ndarray | None, np.ndarray | None, list[int]] | None
+    features: 'pd.DataFrame'
+
+    @cached_property
+    def _point(self) -> int | None:
+        if len(self.indices_view) == 0:
+            return None
+        view_data = self.data[np.ix_(self.indices_view, self.displayed)]
+        view_size = self.size[self.indices_view] * self.view_size_scale
+        if self.ray is None:
+            index = point_at_position(
+                np.asarray(self.query)[list(self.displayed)],
+                view_data,
+                view_size,
+                self.scale_ratio,
+            )
+        else:
+            start_point, end_point, dims_displayed = self.ray
+            if start_point is None or end_point is None:
+                # the ray doesn't intersect the data, no point was hit
+                return None
+            index = point_along_ray(
+                start_point,
+                end_point,
+                dims_displayed,
+                view_data,
+                view_size,
+                self.scale_ratio,
+            )
+        return None if index is None else int(self.indices_view[index])
+
+    def get_value(self) -> int | None:
+        return self.value if self.query is None else self._point
+
+    def get_properties(self, value: Any) -> list[str]:
+        # if the cursor is not outside the image or on the background
+        if (
+            self.features.shape[1] == 0
+            or value is None
+            or value > self.data.shape[0]
+        ):
+            return []
+
+        return _format_properties(self.features, value)
+
+    def get_tooltip_text(self) -> str:
+        return '\n'.join(self.get_properties(self.get_value()))
+
+
 class Points(Layer):
     """Points layer.
 
@@ -663,7 +754,7 @@ class Points(Layer):
             self.events.highlight()
 
     @property
-    def features(self) -> pd.DataFrame:
+    def features(self) -> 'pd.DataFrame':
         """Dataframe-like features table.
 
         It is an implementation detail that this is a `pandas.DataFrame`. In the future,
@@ -683,7 +774,7 @@ class Points(Layer):
     @features.setter
     def features(
         self,
-        features: dict[str, np.ndarray] | pd.DataFrame,
+        features: 'dict[str, np.ndarray] | pd.DataFrame',
     ) -> None:
         self._feature_table.set_values(features, num_data=len(self.data))
         self._update_color_manager(
@@ -697,7 +788,7 @@ class Points(Layer):
         self.events.features()
 
     @property
-    def feature_defaults(self) -> pd.DataFrame:
+    def feature_defaults(self) -> 'pd.DataFrame':
         """Dataframe-like with one row of feature default values.
 
         See `features` for more details on the type of this property.
@@ -706,7 +797,7 @@ class Points(Layer):
 
     @feature_defaults.setter
     def feature_defaults(
-        self, defaults: dict[str, Any] | pd.DataFrame
+        self, defaults: 'dict[str, Any] | pd.DataFrame'
     ) -> None:
         self._feature_table.set_defaults(defaults)
         current_properties = self.current_properties
@@ -748,7 +839,7 @@ class Points(Layer):
 
     @properties.setter
     def properties(
-        self, properties: dict[str, Array] | pd.DataFrame | None
+        self, properties: 'dict[str, Array] | pd.DataFrame | None'
     ) -> None:
         self.features = properties
 
@@ -771,6 +862,7 @@ class Points(Layer):
         self.events.current_properties()
         self.events.feature_defaults()
         if update_indices is not None:
+            self.text._refresh_rows(self.features, update_indices)
             self.events.properties()
             self.events.features()
 
@@ -934,7 +1026,9 @@ class Points(Layer):
         self._current_size = size
         if self._update_properties and len(self.selected_data) > 0:
             idx = np.fromiter(self.selected_data, dtype=int)
-            self.size[idx] = size
+            # resized in a copy, see _move_points
+            self._size = self._size.copy()
+            self._size[idx] = size
             # TODO: also here technically no need to clear base extent
             self.refresh(highlight=False)
             self.events.size()
@@ -1613,14 +1707,26 @@ class Points(Layer):
             self.mode = Mode.PAN_ZOOM
 
     def _update_draw(
-        self, scale_factor, corner_pixels_displayed, shape_threshold
+        self,
+        scale_factor,
+        corner_pixels_displayed,
+        shape_threshold,
+        view_direction=None,
     ):
         prev_scale = self.scale_factor
+        prev_corners = self.corner_pixels
         super()._update_draw(
-            scale_factor, corner_pixels_displayed, shape_threshold
+            scale_factor,
+            corner_pixels_displayed,
+            shape_threshold,
+            view_direction=view_direction,
         )
         # update highlight only if scale has changed, otherwise causes a cycle
         self._set_highlight(force=(prev_scale != self.scale_factor))
+        # decluttered text depends on the part of the layer in view, and is
+        # already updated on scale changes by the scale_factor event
+        if not np.array_equal(prev_corners, self.corner_pixels):
+            self.text._on_view_change()
 
     def _get_value_(
         self,
@@ -1655,33 +1761,16 @@ class Points(Layer):
             Index of point that is at the current coordinate if any.
         """
         # Display points if there are any in this slice
-        view_data = self._view_data
-        selection = None
-        if len(view_data) > 0:
-            displayed_position = [
-                position[i] for i in self._slice_input.displayed
-            ]
-            # positions are scaled anisotropically by scale, but sizes are not,
-            # so we need to calculate the ratio to correctly map to screen coordinates
-            scale_ratio = (
-                self.scale[self._slice_input.displayed] / self.scale[-1]
-            )
-            # Get the point sizes
-            # TODO: calculate distance in canvas space to account for canvas_size_limits.
-            # Without this implementation, point hover and selection (and anything depending
-            # on self.get_value()) won't be aware of the real extent of points, causing
-            # unexpected behaviour. See #3734 for details.
-            sizes = np.expand_dims(self._view_size, axis=1) / scale_ratio / 2
-            distances = abs(view_data - displayed_position)
-            in_slice_matches = np.all(
-                distances <= sizes,
-                axis=1,
-            )
-            indices = np.where(in_slice_matches)[0]
-            if len(indices) > 0:
-                selection = self._indices_view[indices[-1]]
-
-        return selection
+        if len(self._indices_view) == 0:
+            return None
+        displayed = list(self._slice_input.displayed)
+        index = point_at_position(
+            np.asarray(position)[displayed],
+            self._view_data,
+            self._view_size,
+            self._scale_ratio,
+        )
+        return None if index is None else self._indices_view[index]
 
     def _get_value_3d(
         self,
@@ -1708,45 +1797,24 @@ class Points(Layer):
         if (start_point is None) or (end_point is None):
             # if the ray doesn't intersect the data volume, no points could have been intersected
             return None
-        plane_point, plane_normal = displayed_plane_from_nd_line_segment(
-            start_point, end_point, dims_displayed
-        )
-
-        # project the in view points onto the plane
-        projected_points, projection_distances = project_points_onto_plane(
-            points=self._view_data,
-            plane_point=plane_point,
-            plane_normal=plane_normal,
+        index = point_along_ray(
+            start_point,
+            end_point,
+            dims_displayed,
+            self._view_data,
+            self._view_size,
+            self._scale_ratio,
         )
+        return None if index is None else self._indices_view[index]
 
-        # rotate points and plane to be axis aligned with normal [0, 0, 1]
-        rotated_points, rotation_matrix = rotate_points(
-            points=projected_points,
-            current_plane_normal=plane_normal,
-            new_plane_normal=[0, 0, 1],
-        )
-        rotated_click_point = np.dot(rotation_matrix, plane_point)
-
-        # positions are scaled anisotropically by scale, but sizes are not,
-        # so we need to calculate the ratio to correctly map to screen coordinates
-        scale_ratio = self.scale[self._slice_input.displayed] / self.scale[-1]
-        # find the points the click intersects
-        sizes = np.expand_dims(self._view_size, axis=1) / scale_ratio / 2
-        distances = abs(rotated_points - rotated_click_point)
-        in_slice_matches = np.all(
-            distances <= sizes,
-            axis=1,
-        )
-        indices = np.where(in_slice_matches)[0]
+    @property
+    def _scale_ratio(self) -> np.ndarray:
+        """Scale of the displayed dimensions over the scale of the last one.
 
-        if len(indices) > 0:
-            # find the point that is most in the foreground
-            candidate_point_distances = projection_distances[indices]
-            closest_index = indices[np.argmin(candidate_point_distances)]
-            selection = self._indices_view[closest_index]
-        else:
-            selection = None
-        return selection
+        Positions are scaled anisotropically by scale, but sizes are not, so
+        this is needed to correctly map sizes to screen coordinates.
+        """
+        return self.scale[self._slice_input.displayed] / self.scale[-1]
 
     def get_ray_intersections(
         self,
@@ -2095,9 +2163,13 @@ class Points(Layer):
             self._set_drag_start(selection_indices, position)
             center = self.data[np.ix_(selection_indices, disp)].mean(axis=0)
             shift = np.array(position)[disp] - center - self._drag_start
-            self.data[np.ix_(selection_indices, disp)] = (
-                self.data[np.ix_(selection_indices, disp)] + shift
+            # the points are moved in a copy, as slicing and the cursor
+            # status may still read the data in other threads
+            data = self.data.copy()
+            data[np.ix_(selection_indices, disp)] = (
+                data[np.ix_(selection_indices, disp)] + shift
             )
+            self._data = data
             self.refresh()
             self.events.data(
                 value=self.data,
@@ -2294,55 +2366,6 @@ class Points(Layer):
             mask[np.ix_(*submask_coords)] |= normalized_square_distances <= 1
         return mask
 
-    def get_status(
-        self,
-        position: tuple | None = None,
-        *,
-        view_direction: np.ndarray | None = None,
-        dims_displayed: list[int] | None = None,
-        world: bool = False,
-    ) -> dict:
-        """Status message information of the data at a coordinate position.
-
-        # Parameters
-        # ----------
-        # position : tuple
-        #     Position in either data or world coordinates.
-        # view_direction : Optional[np.ndarray]
-        #     A unit vector giving the direction of the ray in nD world coordinates.
-        #     The default value is None.
-        # dims_displayed : Optional[List[int]]
-        #     A list of the dimensions currently being displayed in the viewer.
-        #     The default value is None.
-        # world : bool
-        #     If True the position is taken to be in world coordinates
-        #     and converted into data coordinates. False by default.
-
-        # Returns
-        # -------
-        # source_info : dict
-        #     Dict containing information that can be used in a status update.
-        #"""
-        status = super().get_status(
-            position,
-            view_direction=view_direction,
-            dims_displayed=dims_displayed,
-            world=world,
-        )
-
-        # if this points layer has properties
-        properties = self._get_properties(
-            position,
-            view_direction=view_direction,
-            dims_displayed=dims_displayed,
-            world=world,
-        )
-        if properties:
-            status['coordinates'] += '; ' + ', '.join(properties)
-            status['value'] += '; ' + ', '.join(properties)
-
-        return status
-
     def _get_tooltip_text(
         self,
         position,
@@ -2373,14 +2396,12 @@ class Points(Layer):
         msg : string
             String containing a message that can be used as a tooltip.
         """
-        return '\n'.join(
-            self._get_properties(
-                position,
-                view_direction=view_direction,
-                dims_displayed=dims_displayed,
-                world=world,
-            )
-        )
+        return self._get_status_inputs(
+            position,
+            view_direction=view_direction,
+            dims_displayed=dims_displayed,
+            world=world,
+        ).get_tooltip_text()
 
     def _get_properties(
         self,
@@ -2390,27 +2411,63 @@ class Points(Layer):
         dims_displayed: list[int] | None = None,
         world: bool = False,
     ) -> list:
-        if self.features.shape[1] == 0:
-            return []
-
-        value = self.get_value(
+        inputs = self._get_status_inputs(
             position,
             view_direction=view_direction,
             dims_displayed=dims_displayed,
             world=world,
         )
-        # if the cursor is not outside the image or on the background
-        if value is None or value > self.data.shape[0]:
-            return []
+        return inputs.get_properties(inputs.get_value())
 
-        return [
-            f'{k}: {v[value]}'
-            for k, v in self.features.items()
-            if k != 'index'
-            and len(v) > value
-            and v[value] is not None
-            and not (isinstance(v[value], float) and np.isnan(v[value]))
-        ]
+    def _get_status_inputs(
+        self,
+        position: npt.ArrayLike | None,
+        *,
+        view_direction: npt.ArrayLike | None = None,
+        dims_displayed: list[int] | None = None,
+        world: bool = False,
+    ) -> _LayerStatusInputs:
+        if position is None or not self.visible:
+            return super()._get_status_inputs(
+                position,
+                view_direction=view_direction,
+                dims_displayed=dims_displayed,
+                world=world,
+            )
+        position = np.asarray(position)
+        if self.mode != 'pan_zoom':
+            # the hovered point is highlighted from `_value`, which is set
+            # by `get_value` and must be found here on the main thread
+            value = self.get_value(
+                position,
+                view_direction=view_direction,
+                dims_displayed=dims_displayed,
+                world=world,
+            )
+            query, ray = None, None
+        else:
+            value = None
+            query, ray = self._get_value_query(
+                position,
+                view_direction=view_direction,
+                dims_displayed=dims_displayed,
+                world=world,
+            )
+        return _PointsStatusInputs(
+            self._get_source_info(),
+            tuple(position[-self.ndim :]),
+            value,
+            data=self.data,
+            size=self.size,
+            indices_view=self._indices_view,
+            view_size_scale=self._view_size_scale,
+            displayed=tuple(self._slice_input.displayed),
+            scale_ratio=self._scale_ratio,
+            query=query,
+            ray=ray,
+            # a column set in place must not change the recorded features
+            features=self.features.copy(deep=False),
+        )
 
     def _get_layer_slicing_state(
         self, data: LayerDataType, cache: bool
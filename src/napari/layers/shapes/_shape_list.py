@@ -25,10 +25,10 @@ from napari.layers.shapes.shape_types import (
     ZOrderArray,
     ZOrderDtype,
 )
+from napari.utils._triangle_bvh import LazyTriangleBVH
 from napari.utils.geometry import (
     inside_triangles,
     intersect_line_with_triangles,
-    line_in_triangles_3d,
 )
 from napari.utils.translations import trans
 
@@ -797,6 +797,7 @@ class ShapeList:
         self._mesh.displayed_triangles = self._mesh.triangles[
             z_order[triangle_ranges]
         ]
+        self.__dict__.pop('_displayed_triangles_bvh', None)
 
         self._update_displayed_triangles_to_shape_index(disp_indices)
 
@@ -1920,6 +1921,12 @@ class ShapeList:
     ) -> np.ndarray[tuple[int], np.dtype[IndexDtype]]:
         return np.array([s[0] for s in self._visible_shapes])
 
+    @cached_property
+    def _displayed_triangles_bvh(self) -> LazyTriangleBVH:
+        return LazyTriangleBVH(
+            self._mesh.vertices, self._mesh.displayed_triangles
+        )
+
     def inside(self, coord):
         """Determines if any shape at given coord by looking inside triangle
         meshes. Looks only at displayed shapes
@@ -1990,28 +1997,14 @@ class ShapeList:
             The point where the ray intersects the mesh face. If there was
             no intersection, returns None.
         """
-        triangles = self._mesh.vertices[self._mesh.displayed_triangles]
-        inside = line_in_triangles_3d(
-            line_point=ray_position,
-            line_direction=ray_direction,
-            triangles=triangles,
+        triangle_index, intersection = (
+            self._displayed_triangles_bvh.find_nearest_intersection(
+                ray_position, ray_direction
+            )
         )
-        # intersected_shapes = self._mesh.displayed_triangles_index[inside, 0]
-        if not np.any(inside):
+        if triangle_index is None:
             return None, None
-
-        intersection_points = self._triangle_intersection(
-            triangle_indices=inside,
-            ray_position=ray_position,
-            ray_direction=ray_direction,
-        )
-        start_to_intersection = intersection_points - ray_position
-        distances = np.linalg.norm(start_to_intersection, axis=1)
-        closest_shape_index = np.argmin(distances)
-        shape = self._mesh.displayed_triangles_to_shape_index[inside][
-            closest_shape_index
-        ]
-        intersection = intersection_points[closest_shape_index]
+        shape = self._mesh.displayed_triangles_to_shape_index[triangle_index]
         return shape, intersection
 
     def _triangle_intersection(
@@ -2184,3 +2177,4 @@ class ShapeList:
         self.__dict__.pop('_bounding_boxes', None)
         self.__dict__.pop('_visible_shapes', None)
         self.__dict__.pop('_visible_shapes_indices', None)
+        self.__dict__.pop('_displayed_triangles_bvh', None)
@@ -3,11 +3,10 @@ from collections.abc import Callable, Collection, Iterable, Sized
 from contextlib import contextmanager
 from copy import copy, deepcopy
 from itertools import cycle
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import numpy as np
 import numpy.typing as npt
-import pandas as pd
 from psygnal.containers import Selection
 from vispy.color import get_color_names
 
@@ -81,6 +80,9 @@ from napari.utils.misc import ensure_iterable
 from napari.utils.notifications import show_warning
 from napari.utils.translations import trans
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 DEFAULT_COLOR_CYCLE = np.array([[1, 0, 1, 1], [0, 1, 0, 1]])
 
 
@@ -796,7 +798,7 @@ class Shapes(Layer):
     @features.setter
     def features(
         self,
-        features: dict[str, np.ndarray] | pd.DataFrame,
+        features: 'dict[str, np.ndarray] | pd.DataFrame',
     ) -> None:
         self._feature_table.set_values(features, num_data=self.nshapes)
         if self._face_color_property and (
@@ -838,7 +840,7 @@ class Shapes(Layer):
 
     @feature_defaults.setter
     def feature_defaults(
-        self, defaults: dict[str, Any] | pd.DataFrame
+        self, defaults: 'dict[str, Any] | pd.DataFrame'
     ) -> None:
         self._feature_table.set_defaults(defaults)
         self.events.current_properties()
@@ -955,6 +957,7 @@ class Shapes(Layer):
             current_properties, update_indices=update_indices
         )
         if update_indices is not None:
+            self.text._refresh_rows(self.features, update_indices)
             self.refresh_colors()
             self.events.properties()
             self.events.features()
@@ -1768,14 +1771,26 @@ class Shapes(Layer):
             self.mode = Mode.PAN_ZOOM
 
     def _update_draw(
-        self, scale_factor, corner_pixels_displayed, shape_threshold
+        self,
+        scale_factor,
+        corner_pixels_displayed,
+        shape_threshold,
+        view_direction=None,
     ):
         prev_scale = self.scale_factor
+        prev_corners = self.corner_pixels
         super()._update_draw(
-            scale_factor, corner_pixels_displayed, shape_threshold
+            scale_factor,
+            corner_pixels_displayed,
+            shape_threshold,
+            view_direction=view_direction,
         )
         if prev_scale != self.scale_factor and self.selected_data:
             self._set_highlight(force=True)
+        # decluttered text depends on the part of the layer in view, and is
+        # already updated on scale changes by the scale_factor event
+        if not np.array_equal(prev_corners, self.corner_pixels):
+            self.text._on_view_change()
 
     def add_rectangles(
         self,
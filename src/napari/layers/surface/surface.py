@@ -1,9 +1,8 @@
 import copy
 import warnings
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
-import pandas as pd
 
 from napari.layers.base import Layer, _LayerSlicingState
 from napari.layers.intensity_mixin import IntensityVisualizationMixin
@@ -19,12 +18,15 @@ from napari.layers.utils.interactivity_utils import (
 from napari.layers.utils.layer_utils import _FeatureTable, calc_data_range
 from napari.types import LayerDataType
 from napari.utils._dtype import normalize_dtype
+from napari.utils._triangle_bvh import LazyTriangleBVH
 from napari.utils.colormaps import AVAILABLE_COLORMAPS
 from napari.utils.events import Event
 from napari.utils.events.event_utils import connect_no_arg
-from napari.utils.geometry import find_nearest_triangle_intersection
 from napari.utils.translations import trans
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 # Mixin must come before Layer
 class Surface(IntensityVisualizationMixin, Layer):
@@ -483,7 +485,7 @@ class Surface(IntensityVisualizationMixin, Layer):
         return extrema
 
     @property
-    def features(self) -> pd.DataFrame:
+    def features(self) -> 'pd.DataFrame':
         """Dataframe-like features table.
 
         It is an implementation detail that this is a `pandas.DataFrame`. In the future,
@@ -503,13 +505,13 @@ class Surface(IntensityVisualizationMixin, Layer):
     @features.setter
     def features(
         self,
-        features: dict[str, np.ndarray] | pd.DataFrame,
+        features: 'dict[str, np.ndarray] | pd.DataFrame',
     ) -> None:
         self._feature_table.set_values(features, num_data=len(self.data[0]))
         self.events.features()
 
     @property
-    def feature_defaults(self) -> pd.DataFrame:
+    def feature_defaults(self) -> 'pd.DataFrame':
         """Dataframe-like with one row of feature default values.
 
         See `features` for more details on the type of this property.
@@ -518,7 +520,7 @@ class Surface(IntensityVisualizationMixin, Layer):
 
     @feature_defaults.setter
     def feature_defaults(
-        self, defaults: dict[str, Any] | pd.DataFrame
+        self, defaults: 'dict[str, Any] | pd.DataFrame'
     ) -> None:
         self._feature_table.set_defaults(defaults)
         self.events.feature_defaults()
@@ -691,14 +693,11 @@ class Surface(IntensityVisualizationMixin, Layer):
             dims_displayed=dims_displayed,
         )
 
-        # get the mesh triangles
-        mesh_triangles = self._data_view[self._view_faces]
-
         # get the triangles intersection
-        intersection_index, intersection = find_nearest_triangle_intersection(
+        bvh = self._slicing_state._view_triangle_bvh
+        intersection_index, intersection = bvh.find_nearest_intersection(
             ray_position=start_position,
             ray_direction=ray_direction,
-            triangles=mesh_triangles,
         )
 
         if intersection_index is None or intersection is None:
@@ -766,6 +765,14 @@ class _SurfaceSlicingState(_LayerSlicingState):
         self._view_faces = np.zeros((0, 3), dtype=int)
         self._view_vertex_values: list[Any] | np.ndarray = []
         self._view_vertex_colors: list[Any] | np.ndarray = []
+        # accelerates picking in 3D, created on the first pick of a slice
+        self._view_bvh: LazyTriangleBVH | None = None
+
+    @property
+    def _view_triangle_bvh(self) -> LazyTriangleBVH:
+        if self._view_bvh is None:
+            self._view_bvh = LazyTriangleBVH(self._data_view, self._view_faces)
+        return self._view_bvh
 
     def _slice_associated_data(
         self,
@@ -803,6 +810,7 @@ class _SurfaceSlicingState(_LayerSlicingState):
         return data
 
     def _set_view_slice(self):
+        self._view_bvh = None
         _, vertex_ndim = self.layer.vertices.shape
         values_ndim = self.layer.vertex_values.ndim - 1
 
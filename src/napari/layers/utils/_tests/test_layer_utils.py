@@ -9,6 +9,7 @@ from napari.layers.utils.layer_utils import (
     _FeatureTable,
     calc_data_range,
     coerce_current_properties,
+    compute_multiscale_level_3d,
     dataframe_to_properties,
     dims_displayed_world_to_layer,
     get_current_properties,
@@ -509,3 +510,12 @@ def test_register_label_attr_action(monkeypatch):
     monkeypatch.setattr(time, 'time', lambda: 2)
     assert handler.release_key('K')
     assert foo.value == 0
+
+
+def test_compute_multiscale_level_3d():
+    factors = np.array([[1, 1, 1], [2, 2, 2], [4, 4, 4]])
+    assert compute_multiscale_level_3d(np.array([1, 1, 1]), factors) == 0
+    assert compute_multiscale_level_3d(np.array([3, 3, 3]), factors) == 1
+    assert compute_multiscale_level_3d(np.array([8, 8, 8]), factors) == 2
+    # all axes must be coarse enough
+    assert compute_multiscale_level_3d(np.array([8, 8, 1]), factors) == 0
@@ -155,6 +155,80 @@ def test_format_with_index_column(features):
     np.testing.assert_array_equal(values, ['a: 0.50', 'b: 1.00', 'c: 0.25'])
 
 
+def test_format_by_column_matches_format_by_row():
+    features = pd.DataFrame(
+        {
+            'int': np.array([-3, 0, 7], dtype=np.int16),
+            'float': np.array([0.1, np.nan, -0.0], dtype=np.float32),
+            'bool': [True, False, True],
+            'str': ['a', 'b', 'c'],
+            'object': [None, 1.5, 'x'],
+            'time': pd.to_datetime(['2020-01-01', '2021-02-03', '2022-03-04']),
+        },
+        index=[5, 6, 9],
+    )
+    format_str = (
+        '{int} {int:05d} {float} {float:+.3e} {bool} {bool:d} '
+        '{str!r:>5} {object} {time:%Y} {{index}}: {index}'
+    )
+    encoding = FormatStringEncoding(format=format_str)
+
+    values = encoding(features)
+
+    expected = [
+        format_str.format(index=index, **row)
+        for index, row in zip(
+            features.index, features.to_dict('records'), strict=True
+        )
+    ]
+    np.testing.assert_array_equal(values, expected)
+
+
+def test_format_derives_requested_rows_only(features):
+    encoding = FormatStringEncoding(format='{class}: {confidence:.2f}')
+    encoding._apply(features)
+
+    values = encoding._values_at([2, 2])
+
+    np.testing.assert_array_equal(values, ['c: 0.25', 'c: 0.25'])
+    # the first row is derived when the features are applied
+    np.testing.assert_array_equal(encoding._derived, [True, False, True])
+
+
+def test_format_update_rows(features):
+    encoding = FormatStringEncoding(format='{class}: {confidence:.2f}')
+    encoding._apply(features)
+    np.testing.assert_array_equal(
+        encoding._values, ['a: 0.50', 'b: 1.00', 'c: 0.25']
+    )
+
+    features.loc[[0, 2], 'class'] = 'longer'
+    encoding._update_rows(features, [0, 2])
+
+    np.testing.assert_array_equal(
+        encoding._values, ['longer: 0.50', 'b: 1.00', 'longer: 0.25']
+    )
+
+
+def test_format_append_and_delete(features):
+    encoding = FormatStringEncoding(format='{class}: {confidence:.2f}')
+    encoding._apply(features)
+    encoding._append(np.array(['d: 0.75']))
+
+    encoding._delete([0, 2])
+
+    np.testing.assert_array_equal(encoding._values, ['b: 1.00', 'd: 0.75'])
+
+
+def test_format_with_missing_field_warns_once(features):
+    encoding = FormatStringEncoding(format='{class}: {score:.2f}')
+
+    with pytest.warns(RuntimeWarning):
+        encoding._apply(features)
+
+    np.testing.assert_array_equal(encoding._values, ['', '', ''])
+
+
 def test_validate_from_non_format_string():
     argument = 'abc'
     expected = DirectStringEncoding(feature=argument)
@@ -10,6 +10,7 @@ from napari.layers.utils._text_utils import (
     _calculate_anchor_upper_right,
     _calculate_bbox_centers,
     _calculate_bbox_extents,
+    declutter_text,
     get_text_anchors,
 )
 
@@ -107,3 +108,33 @@ def test_bbox_extents_exception():
     """_calculate_bbox_extents should raise a TypeError for non ndarray or list inputs"""
     with pytest.raises(TypeError):
         _ = _calculate_bbox_extents({'bad_data_type': True})
+
+
+def test_declutter_text_removes_overlaps():
+    positions = np.array([[0, 0], [5, 5], [0, 20], [30, 0], [31, 1]])
+    selection = declutter_text(positions, box_size=(10, 10))
+    np.testing.assert_array_equal(selection, [0, 2, 3])
+
+
+def test_declutter_text_overlap_across_cells():
+    # the labels are in different cells of the grid, but still overlap
+    positions = np.array([[9, 9], [11, 11]])
+    selection = declutter_text(positions, box_size=(10, 10))
+    np.testing.assert_array_equal(selection, [0])
+
+
+def test_declutter_text_priority():
+    positions = np.array([[0, 0], [5, 5], [11, 11], [30, 30]])
+    priority = np.array([1, 3, np.nan, 2])
+    selection = declutter_text(positions, box_size=(10, 10), priority=priority)
+    np.testing.assert_array_equal(selection, [1, 3])
+
+
+def test_declutter_text_max_labels():
+    positions = np.stack([np.arange(10) * 20, np.zeros(10)], axis=1)
+    priority = np.arange(10)
+    selection = declutter_text(
+        positions, box_size=(10, 10), priority=priority, max_labels=3
+    )
+    np.testing.assert_array_equal(selection, [7, 8, 9])
+    assert len(declutter_text(positions[:0], box_size=(10, 10))) == 0
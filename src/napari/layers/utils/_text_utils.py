@@ -1,3 +1,5 @@
+import itertools
+
 import numpy as np
 import numpy.typing as npt
 
@@ -173,3 +175,80 @@ TEXT_ANCHOR_CALCULATION = {
     Anchor.LOWER_LEFT: _calculate_anchor_lower_left,
     Anchor.LOWER_RIGHT: _calculate_anchor_lower_right,
 }
+
+
+def declutter_text(
+    positions: npt.NDArray,
+    box_size: tuple[float, float],
+    priority: npt.NDArray | None = None,
+    max_labels: int | None = None,
+) -> npt.NDArray[np.intp]:
+    """Select text labels whose boxes do not overlap on screen.
+
+    Labels are considered by decreasing priority, and a label is kept if
+    its box does not overlap the box of a label kept before. As all boxes
+    have the same size and anchor, two labels overlap when their positions
+    are closer than the box size along both axes. Positions are bucketed in
+    a grid of cells of the size of a box, so only the label of highest
+    priority of each cell is a candidate, and a candidate only needs to be
+    compared with the kept labels of the neighboring cells.
+
+    Parameters
+    ----------
+    positions : (N, 2) array
+        Positions of the labels in screen pixels.
+    box_size : tuple of float
+        Size of the box of a label in screen pixels along each axis.
+    priority : (N,) array, optional
+        Priority of each label, labels of higher priority are kept first
+        and nan values have the lowest priority. If None, labels that come
+        first are kept first.
+    max_labels : int, optional
+        Maximum number of labels to keep.
+
+    Returns
+    -------
+    selection : array of int
+        Sorted indices of the kept labels.
+    """
+    positions = np.asarray(positions, dtype=float)
+    n_labels = len(positions)
+    if n_labels == 0 or max_labels == 0:
+        return np.empty(0, dtype=np.intp)
+    if priority is None:
+        order = np.arange(n_labels)
+    else:
+        # negate so that nan values sort last
+        order = np.argsort(-np.asarray(priority, dtype=float), kind='stable')
+
+    size = np.maximum(np.asarray(box_size, dtype=float), 1e-6)
+    cells = np.floor(positions[order] / size).astype(np.int64)
+    # first label of each cell in priority order, keeping that order
+    _, first = np.unique(cells, axis=0, return_index=True)
+    first.sort()
+    candidates = order[first]
+
+    size_0, size_1 = size.tolist()
+    kept: dict[tuple[int, int], tuple[float, float]] = {}
+    selection = []
+    for index, (row, col), (y, x) in zip(
+        candidates.tolist(),
+        cells[first].tolist(),
+        positions[candidates].tolist(),
+        strict=True,
+    ):
+        neighbors = itertools.product(
+            (row - 1, row, row + 1), (col - 1, col, col + 1)
+        )
+        if any(
+            (other := kept.get(neighbor)) is not None
+            and abs(other[0] - y) < size_0
+            and abs(other[1] - x) < size_1
+            for neighbor in neighbors
+        ):
+            continue
+        kept[(row, col)] = (y, x)
+        selection.append(index)
+        if max_labels is not None and len(selection) >= max_labels:
+            break
+    return np.sort(np.array(selection, dtype=np.intp))
@@ -11,9 +11,7 @@ from typing import (
     TypeVar,
 )
 
-import dask
 import numpy as np
-import pandas as pd
 
 from napari.utils.action_manager import action_manager
 from napari.utils.events.custom_types import Array
@@ -24,6 +22,7 @@ if TYPE_CHECKING:
     from collections.abc import Mapping
 
     import numpy.typing as npt
+    import pandas as pd
 
     from napari.layers._data_protocols import LayerDataProtocol
 
@@ -281,6 +280,8 @@ def calc_data_range(
                 [_nanmin(data[idx]) for idx in idxs],
             ]
         # compute everything in one go
+        import dask
+
         reduced_data = dask.compute(*reduced_data)
     else:
         reduced_data = data
@@ -567,6 +568,35 @@ def compute_multiscale_level(
     return level
 
 
+def compute_multiscale_level_3d(pixel_size, downsample_factors):
+    """Compute the level of a multiscale volume given the screen resolution.
+
+    The level is the lowest resolution one with voxels that are still no
+    larger than a screen pixel, so that zooming in on a volume loads higher
+    resolution levels.
+
+    Parameters
+    ----------
+    pixel_size : array (D,)
+        Size of a screen pixel along each displayed axis, in data pixels at
+        full resolution.
+    downsample_factors : array (L, D)
+        Downsampling factors of the displayed axes for each level of the
+        multiscale. Must be increasing for each level of the multiscale.
+
+    Returns
+    -------
+    level : int
+        Level of the multiscale to be viewing.
+    """
+    fits = np.all(
+        np.asarray(downsample_factors) <= np.asarray(pixel_size) * 1.001,
+        axis=1,
+    )
+    locations = np.flatnonzero(fits)
+    return int(locations[-1]) if len(locations) > 0 else 0
+
+
 def compute_multiscale_level_and_corners(
     corner_pixels, shape_threshold, downsample_factors
 ):
@@ -827,6 +857,8 @@ class _FeatureTable:
         Dict[str, np.ndarray]
             The property choices dictionary equivalent to this.
         """
+        import pandas as pd
+
         return {
             name: series.dtype.categories.to_numpy()
             for name, series in self._values.items()
@@ -887,6 +919,8 @@ class _FeatureTable:
         to_append : pd.DataFrame
             The features to append.
         """
+        import pandas as pd
+
         self._values = pd.concat([self._values, to_append], ignore_index=True)
 
     def remove(self, indices: Any) -> None:
@@ -952,6 +986,8 @@ class _FeatureTable:
 
 def _get_default_column(column: pd.Series) -> pd.Series:
     """Get the default column of length 1 from a data column."""
+    import pandas as pd
+
     value = None
     if column.size > 0:
         value = column.iloc[-1]
@@ -980,6 +1016,8 @@ def _validate_features(
     --------
     :class:`_FeatureTable` : See initialization for parameter descriptions.
     """
+    import pandas as pd
+
     if isinstance(features, pd.DataFrame):
         features = features.reset_index(drop=True)
     elif isinstance(features, dict):
@@ -1003,6 +1041,8 @@ def _validate_feature_defaults(
     --------
     :class:`_FeatureTable` : See initialization for parameter descriptions.
     """
+    import pandas as pd
+
     if defaults is None:
         defaults = {c: _get_default_column(values[c]) for c in values.columns}
     else:
@@ -1052,6 +1092,8 @@ def _features_from_properties(
     --------
     :meth:`_FeatureTable.from_layer`
     """
+    import pandas as pd
+
     # Create categorical series for any choices provided.
     if property_choices is not None:
         properties_df = pd.DataFrame(data=properties)
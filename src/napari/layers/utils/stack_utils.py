@@ -5,10 +5,10 @@ import logging
 from typing import TYPE_CHECKING
 
 import numpy as np
-import pint
 
 from napari.layers import Image
 from napari.layers.image._image_utils import guess_multiscale
+from napari.utils._units import get_unit_registry
 from napari.utils.colormaps import CMYBGR, MAGENTA_GREEN, Colormap
 from napari.utils.misc import ensure_iterable, ensure_sequence_of_iterables
 from napari.utils.translations import trans
@@ -405,9 +405,7 @@ def images_to_stack(images: list[Image], axis: int = 0, **kwargs) -> Image:
     # RGB images do not need extra dimensions inserted into metadata
     # They can use the meta dict from one of the source image layers
     if not meta['rgb']:
-        meta['units'] = (pint.get_application_registry().pixel,) + meta[
-            'units'
-        ]
+        meta['units'] = (get_unit_registry().pixel,) + meta['units']
         meta['axis_labels'] = (f'-{data.ndim + 1}',) + meta['axis_labels']
 
     return Image(new_data, **meta)
@@ -7,6 +7,7 @@ from pydantic import GetCoreSchemaHandler, TypeAdapter
 from pydantic_core import core_schema
 
 from napari.layers.utils.style_encoding import (
+    IndicesType,
     StyleEncoding,
     _ConstantStyleEncoding,
     _DerivedStyleEncoding,
@@ -129,7 +130,111 @@ class ManualStringEncoding(_ManualStyleEncoding[StringValue, StringArray]):
     encoding_type: Literal['ManualStringEncoding'] = 'ManualStringEncoding'
 
 
-class DirectStringEncoding(_DerivedStyleEncoding[StringValue, StringArray]):
+class _LazyDerivedStringEncoding(
+    _DerivedStyleEncoding[StringValue, StringArray]
+):
+    """Derives the strings of rows of features only when they are requested.
+
+    Applying this to features only keeps a reference to them. The strings
+    of rows are derived the first time they are requested, typically when
+    they come into view, and are cached until those rows are removed or
+    updated, so that layers with many rows only format the strings that
+    are displayed.
+    """
+
+    _strings: np.ndarray
+    _derived: np.ndarray
+    _features: Any
+    _failed: bool
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._clear()
+
+    @property
+    def _values(self) -> StringArray:
+        return self._values_at(np.arange(self._strings.shape[0]))
+
+    def _values_at(self, indices: IndicesType) -> StringArray:
+        indices = np.asarray(indices)
+        if indices.dtype == bool:
+            indices = np.flatnonzero(indices)
+        indices = indices.astype(np.intp, copy=False)
+        missing = np.unique(indices[~self._derived[indices]])
+        if missing.size > 0:
+            self._strings[missing] = self._call_safely(
+                self._features.iloc[missing]
+            )
+            self._derived[missing] = True
+        return np.array(self._strings[indices], dtype=str)
+
+    def _apply(self, features: Any) -> None:
+        n_strings = self._strings.shape[0]
+        n_rows = features.shape[0]
+        if n_strings < n_rows:
+            self._strings = np.append(
+                self._strings, np.empty(n_rows - n_strings, dtype=object)
+            )
+            self._derived = np.append(
+                self._derived, np.zeros(n_rows - n_strings, dtype=bool)
+            )
+        elif n_strings > n_rows:
+            self._strings = self._strings[:n_rows]
+            self._derived = self._derived[:n_rows]
+        if features is not self._features:
+            # rows that are not derived yet are derived from these features
+            self._set_features(features)
+            if not self._derived.all():
+                self._values_at([np.argmin(self._derived)])
+
+    def _update_rows(self, features: Any, indices: IndicesType) -> None:
+        self._apply(features)
+        indices = np.asarray(indices)
+        self._derived[indices] = False
+        self._set_features(features)
+        self._values_at(indices[:1])
+
+    def _set_features(self, features: Any) -> None:
+        self._features = features
+        self._failed = False
+
+    def _call_safely(self, features: Any) -> StringArray:
+        # Deriving one row is enough to warn that these features do not
+        # apply, so the others use the fallback without warning again,
+        # like when all rows are derived at once.
+        if self._failed:
+            return np.broadcast_to(self.fallback, (features.shape[0],))
+        try:
+            return self(features)
+        except (KeyError, ValueError):
+            self._failed = True
+            return self._fallback_values(features.shape[0])
+
+    def _append(self, array: StringArray) -> None:
+        array = np.asarray(array, dtype=object).reshape(-1)
+        self._strings = np.append(self._strings, array)
+        self._derived = np.append(
+            self._derived, np.ones(array.shape[0], dtype=bool)
+        )
+
+    def _delete(self, indices: IndicesType) -> None:
+        keep = np.delete(np.arange(self._strings.shape[0]), indices)
+        self._strings = self._strings[keep]
+        self._derived = self._derived[keep]
+        if self._features is not None:
+            # appended rows, which are at the end, have no features but
+            # are already derived
+            self._features = self._features.iloc[
+                keep[keep < self._features.shape[0]]
+            ]
+
+    def _clear(self) -> None:
+        self._strings = np.empty(0, dtype=object)
+        self._derived = np.empty(0, dtype=bool)
+        self._set_features(None)
+
+
+class DirectStringEncoding(_LazyDerivedStringEncoding):
     """Encodes strings directly from a feature column.
 
     Attributes
@@ -152,7 +257,7 @@ class DirectStringEncoding(_DerivedStyleEncoding[StringValue, StringArray]):
         return np.array(features[self.feature], dtype=str)
 
 
-class FormatStringEncoding(_DerivedStyleEncoding[StringValue, StringArray]):
+class FormatStringEncoding(_LazyDerivedStringEncoding):
     """Encodes string values by formatting feature values.
 
     Attributes
@@ -173,6 +278,9 @@ class FormatStringEncoding(_DerivedStyleEncoding[StringValue, StringArray]):
     encoding_type: Literal['FormatStringEncoding'] = 'FormatStringEncoding'
 
     def __call__(self, features: Any) -> StringArray:
+        values = _format_by_column(self.format, features)
+        if values is not None:
+            return values
         feature_names = features.columns.to_list()
         # Expose the dataframe index to the format string keys
         # unless a column exists with the name "index", which takes precedence.
@@ -198,3 +306,69 @@ def _is_format_string(string: str) -> bool:
     except ValueError:
         return False
     return len(fields) > 0
+
+
+# conversions of replacement fields, such as {name!r}
+_CONVERSIONS = {None: lambda value: value, 's': str, 'r': repr, 'a': ascii}
+
+
+def _format_by_column(format_string: str, features: Any) -> np.ndarray | None:
+    """Formats the rows of features one feature column at a time.
+
+    This gives the same strings as calling ``format_string.format`` with
+    the features of each row, but avoids building a mapping for each row.
+
+    Returns None if the format string cannot be formatted by column, e.g.
+    because a field accesses an attribute or item of a feature value, or
+    has a nested format spec.
+    """
+    try:
+        parsed = list(Formatter().parse(format_string))
+    except ValueError:
+        return None
+    if any(
+        (
+            name is not None
+            and (not name or name.isdigit() or '.' in name or '[' in name)
+        )
+        or (spec is not None and '{' in spec)
+        for _, name, spec, _ in parsed
+    ):
+        return None
+    result = np.full(features.shape[0], '', dtype=str)
+    for literal, name, spec, conversion in parsed:
+        if literal:
+            result = np.char.add(result, literal)
+        if name is None:
+            continue
+        # the index is exposed unless a column has the same name
+        if name in features.columns:
+            column = features[name]
+        elif name == 'index':
+            column = features.index
+        else:
+            raise KeyError(name)
+        result = np.char.add(
+            result, _format_column(column, spec or '', conversion)
+        )
+    return result
+
+
+def _format_column(
+    column: Any, spec: str, conversion: str | None
+) -> np.ndarray:
+    """Formats all values of a feature column with a format spec."""
+    if (
+        conversion is None
+        and spec in ('', 'd')
+        and isinstance(column.dtype, np.dtype)
+        and column.dtype.kind in 'iu'
+    ):
+        # integers are formatted like numpy converts them to strings
+        return column.to_numpy().astype(str)
+    convert = _CONVERSIONS[conversion]
+    # tolist gives the same values as iterating over the rows
+    return np.array(
+        [format(convert(value), spec) for value in column.tolist()],
+        dtype=str,
+    )
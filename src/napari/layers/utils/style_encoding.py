@@ -249,17 +249,39 @@ class _DerivedStyleEncoding(
         try:
             array = self(features)
         except (KeyError, ValueError):
-            warnings.warn(
-                trans._(
-                    'Applying the encoding failed. Using the safe fallback value instead.',
-                    deferred=True,
-                ),
-                category=RuntimeWarning,
-            )
-            shape = (features.shape[0], *self.fallback.shape)
-            array = np.broadcast_to(self.fallback, shape)
+            array = self._fallback_values(features.shape[0])
         return array
 
+    def _fallback_values(self, n_rows: int) -> StyleArray:
+        """Warns that applying failed and returns fallback values for n_rows."""
+        warnings.warn(
+            trans._(
+                'Applying the encoding failed. Using the safe fallback value instead.',
+                deferred=True,
+            ),
+            category=RuntimeWarning,
+        )
+        shape = (n_rows, *self.fallback.shape)
+        return np.broadcast_to(self.fallback, shape)
+
+    def _values_at(self, indices: IndicesType) -> StyleArray:
+        """The cached values at the given indices."""
+        return self._cached[indices]
+
+    def _update_rows(self, features: Any, indices: IndicesType) -> None:
+        """Updates cached values after the features of some rows changed.
+
+        Parameters
+        ----------
+        features : Dataframe-like
+            The full layer features table from which to derive the output values.
+        indices
+            The indices of the rows whose features changed.
+        """
+        # derived values like quantitative colors may depend on all rows
+        self._clear()
+        self._apply(features)
+
     def _append(self, array: StyleArray) -> None:
         self._cached = np.append(self._cached, array, axis=0)
 
@@ -279,6 +301,9 @@ def _get_style_values(
     value_ndim: int = 0,
 ):
     """Returns a scalar style value or indexes non-scalar style values."""
+    if isinstance(encoding, _DerivedStyleEncoding):
+        # derived encodings may only generate the values that are requested
+        return encoding._values_at(indices)
     values = encoding._values
     return values if values.ndim == value_ndim else values[indices]
 
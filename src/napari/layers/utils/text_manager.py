@@ -4,7 +4,6 @@ from copy import deepcopy
 from typing import Any, Union
 
 import numpy as np
-import pandas as pd
 from pydantic import PositiveFloat, field_validator
 
 from napari.layers.base._base_constants import Blending
@@ -21,7 +20,11 @@ from napari.layers.utils.string_encoding import (
     StringArray,
     StringEncoding,
 )
-from napari.layers.utils.style_encoding import _get_style_values
+from napari.layers.utils.style_encoding import (
+    IndicesType,
+    _DerivedStyleEncoding,
+    _get_style_values,
+)
 from napari.utils.events import Event, EventedModel
 from napari.utils.events.custom_types import Array
 from napari.utils.translations import trans
@@ -82,6 +85,13 @@ class TextManager(EventedModel):
         Offset from the anchor point in data coordinates.
     rotation : float
         Angle of the text elements around the anchor point. Default value is 0.
+    declutter : bool
+        True if only text elements that do not overlap on screen should be
+        displayed in 2D, False otherwise. Default value is False.
+    priority : str, optional
+        Name of a numeric feature by which overlapping text elements are
+        chosen when decluttering, elements of higher value being displayed
+        first. If None, elements that come first are displayed first.
     """
 
     string: StringEncoding = ConstantStringEncoding(constant='')
@@ -94,6 +104,8 @@ class TextManager(EventedModel):
     # Use a scalar default translation to broadcast to any dimensionality.
     translation: Array[float] = 0
     rotation: float = 0
+    declutter: bool = False
+    priority: str | None = None
 
     def __init__(
         self, text=None, properties=None, n_text=None, features=None, **kwargs
@@ -132,6 +144,12 @@ class TextManager(EventedModel):
             return self.size
         return self.size / scale_factor
 
+    def _on_view_change(self) -> None:
+        """Update the text elements in view after the layer view changed."""
+        if self.declutter:
+            # Trigger the main event for vispy layers.
+            self.events(Event(type_name='refresh'))
+
     def refresh(self, features: Any) -> None:
         """Refresh all encoded values using new layer features.
 
@@ -148,6 +166,23 @@ class TextManager(EventedModel):
         # Trigger the main event for vispy layers.
         self.events(Event(type_name='refresh'))
 
+    def _refresh_rows(self, features: Any, indices: IndicesType) -> None:
+        """Refresh the encoded values of rows whose features changed.
+
+        Parameters
+        ----------
+        features : Any
+            The features table of a layer.
+        indices : IndicesType
+            The indices of the rows whose features changed.
+        """
+        for encoding in (self.string, self.color):
+            if isinstance(encoding, _DerivedStyleEncoding):
+                encoding._update_rows(features, indices)
+        self.events.values()
+        # Trigger the main event for vispy layers.
+        self.events(Event(type_name='refresh'))
+
     def refresh_text(self, properties: dict[str, np.ndarray]):
         """Refresh all of the current text elements using updated properties values
 
@@ -183,6 +218,8 @@ class TextManager(EventedModel):
             DeprecationWarning,
             stacklevel=2,
         )
+        import pandas as pd
+
         features = pd.DataFrame(
             {
                 name: np.repeat(value, n_text, axis=0)
@@ -0,0 +1,190 @@
+"""On-disk cache of discovered plugin manifests.
+
+Plugin discovery walks every installed distribution, then reads and
+validates the manifest of each plugin it finds. The result only changes
+when the environment changes, so the discovered manifests are stored in the
+user cache directory together with a fingerprint of the environment, and
+registered directly on later launches while the fingerprint still matches.
+
+The fingerprint covers the napari and npe2 versions, the Python executable,
+and the modification times of the ``sys.path`` entries (installing, removing
+or upgrading a distribution changes the mtime of its site-packages
+directory). Each cached npe2 manifest additionally records the mtime of its
+source file, so editing the manifest of an editable install invalidates the
+cache as well.
+
+Set ``NAPARI_DISABLE_PLUGIN_CACHE=1`` to always run a full discovery.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import sys
+from importlib import metadata
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import npe2
+from npe2 import PluginManager, PluginManifest
+
+from napari.utils._appdirs import user_cache_dir
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+#: bump when the layout of the cache file changes
+CACHE_VERSION = 1
+
+
+def _cache_path() -> Path:
+    return Path(user_cache_dir()) / 'plugin_manifests.json'
+
+
+def _mtime_ns(path: str | os.PathLike) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _environment_fingerprint() -> str:
+    """Return a hash that changes whenever installed distributions change."""
+    from napari import __version__
+
+    parts: list = [
+        CACHE_VERSION,
+        __version__,
+        npe2.__version__,
+        sys.executable,
+    ]
+    # '' is the current working directory, which should not matter
+    parts.extend((entry, _mtime_ns(entry)) for entry in sys.path if entry)
+    return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+
+def _manifest_entry(mf: PluginManifest) -> dict:
+    if mf.npe1_shim:
+        # adapters are rebuilt from their distribution, npe2 caches the
+        # (expensive) conversion of the npe1 plugin itself.
+        return {'name': mf.name, 'npe1': True}
+    source = getattr(mf, '_source_file', None)
+    return {
+        'name': mf.name,
+        'npe1': False,
+        'source_file': str(source) if source else None,
+        'mtime': _mtime_ns(source) if source else None,
+        'manifest': mf.model_dump_json(),
+    }
+
+
+def _manifest_from_entry(entry: dict) -> PluginManifest:
+    if entry['npe1']:
+        from npe2.manifest._npe1_adapter import NPE1Adapter
+
+        return NPE1Adapter(dist=metadata.distribution(entry['name']))
+
+    source = entry['source_file']
+    if source and _mtime_ns(source) != entry['mtime']:
+        raise ValueError(f'manifest {source!r} changed since it was cached')
+    mf = PluginManifest.model_validate_json(entry['manifest'])
+    mf._source_file = Path(source) if source else None
+    return mf
+
+
+def load_cached_manifests(
+    fingerprint: str, path: Path | None = None
+) -> list[PluginManifest] | None:
+    """Return the cached manifests, or None if the cache is stale or invalid.
+
+    Parameters
+    ----------
+    fingerprint : str
+        The fingerprint of the current environment.
+    path : Path, optional
+        Location of the cache file. By default, in the user cache directory.
+
+    Returns
+    -------
+    list of PluginManifest or None
+        The manifests discovered when the cache was written.
+    """
+    path = _cache_path() if path is None else path
+    try:
+        data = json.loads(path.read_text(encoding='utf-8'))
+        if data['fingerprint'] != fingerprint:
+            return None
+        return [_manifest_from_entry(entry) for entry in data['plugins']]
+    except FileNotFoundError:
+        return None
+    # a missing distribution raises PackageNotFoundError (an ImportError),
+    # and a failing manifest validation raises a ValueError
+    except (KeyError, TypeError, OSError, ValueError, ImportError) as e:
+        logger.debug('Ignoring plugin manifest cache %s: %s', path, e)
+        return None
+
+
+def write_manifest_cache(
+    fingerprint: str,
+    manifests: Iterable[PluginManifest],
+    path: Path | None = None,
+) -> None:
+    """Write ``manifests`` to the cache, tagged with ``fingerprint``.
+
+    Failing to write the cache is not an error; discovery just runs again
+    on the next launch.
+    """
+    path = _cache_path() if path is None else path
+    data = {
+        'fingerprint': fingerprint,
+        'plugins': [_manifest_entry(mf) for mf in manifests],
+    }
+    tmp = path.with_suffix('.tmp')
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(data), encoding='utf-8')
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.debug('Could not write plugin manifest cache %s: %s', path, e)
+        with contextlib.suppress(OSError):
+            tmp.unlink()
+
+
+def discover_plugins(pm: PluginManager) -> None:
+    """Discover and register plugins in ``pm``, using the cache if valid.
+
+    This is equivalent to ``pm.discover(include_npe1=True)``.
+    """
+    if (
+        os.getenv('NAPARI_DISABLE_PLUGIN_CACHE', '').lower() in ('1', 'true')
+        # plugin managers with customized discovery (e.g. the npe2
+        # TestPluginManager, which refuses to discover) must not be
+        # bypassed, nor their results cached.
+        or type(pm).discover is not PluginManager.discover
+    ):
+        pm.discover(include_npe1=True)
+        return
+
+    fingerprint = _environment_fingerprint()
+    manifests = load_cached_manifests(fingerprint)
+    if manifests is not None:
+        # mirror PluginManager.discover, which emits a single
+        # plugins_registered event for all discovered plugins
+        with pm.events.plugins_registered.paused(lambda a, b: (a[0] | b[0],)):
+            for mf in manifests:
+                if mf.name not in pm:
+                    pm.register(mf, warn_disabled=False)
+        return
+
+    # discovery skips the plugins that are already registered, e.g. by a
+    # previous discovery or by hand, so what it found cannot be told apart
+    # from those. Only cache the result of a discovery from scratch.
+    complete = next(pm.iter_manifests(), None) is None
+    pm.discover(include_npe1=True)
+    if complete:
+        write_manifest_cache(fingerprint, pm.iter_manifests())
@@ -0,0 +1,103 @@
+import os
+import shutil
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from npe2 import PluginManager, PluginManifest
+
+from napari.plugins import _discovery_cache
+from napari.plugins._discovery_cache import (
+    discover_plugins,
+    load_cached_manifests,
+    write_manifest_cache,
+)
+
+MANIFEST_PATH = Path(__file__).parent / '_sample_manifest.yaml'
+
+
+def _manifest(tmp_path: Path) -> PluginManifest:
+    path = tmp_path / 'napari.yaml'
+    shutil.copy(MANIFEST_PATH, path)
+    return PluginManifest.from_file(path)
+
+
+def test_cache_roundtrip(tmp_path):
+    mf = _manifest(tmp_path)
+    cache = tmp_path / 'cache.json'
+    write_manifest_cache('abc', [mf], path=cache)
+
+    loaded = load_cached_manifests('abc', path=cache)
+    assert loaded == [mf]
+    assert loaded[0]._source_file == mf._source_file
+
+
+def test_cache_invalidation(tmp_path):
+    mf = _manifest(tmp_path)
+    cache = tmp_path / 'cache.json'
+    assert load_cached_manifests('abc', path=cache) is None
+
+    write_manifest_cache('abc', [mf], path=cache)
+    # environment changed
+    assert load_cached_manifests('def', path=cache) is None
+
+    # manifest file edited since it was cached
+    stat = os.stat(mf._source_file)
+    os.utime(mf._source_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10))
+    assert load_cached_manifests('abc', path=cache) is None
+
+    cache.write_text('not json')
+    assert load_cached_manifests('abc', path=cache) is None
+
+
+def test_discover_plugins_uses_cache(tmp_path, monkeypatch):
+    mf = _manifest(tmp_path)
+    cache = tmp_path / 'cache.json'
+    monkeypatch.setattr(_discovery_cache, '_cache_path', lambda: cache)
+    monkeypatch.delenv('NAPARI_DISABLE_PLUGIN_CACHE', raising=False)
+
+    def fake_discover(self, *args, **kwargs):
+        self.register(mf)
+
+    monkeypatch.setattr(PluginManager, 'discover', fake_discover)
+    pm = PluginManager()
+    discover_plugins(pm)
+    assert mf.name in pm
+    assert cache.exists()
+
+    monkeypatch.setattr(PluginManager, 'discover', MagicMock())
+    pm = PluginManager()
+    registered = MagicMock()
+    pm.events.plugins_registered.connect(registered)
+    discover_plugins(pm)
+    PluginManager.discover.assert_not_called()
+    assert pm.get_manifest(mf.name) == mf
+    registered.assert_called_once()
+
+
+def test_discover_plugins_after_registration_skips_cache(
+    tmp_path, monkeypatch
+):
+    mf = _manifest(tmp_path)
+    cache = tmp_path / 'cache.json'
+    monkeypatch.setattr(_discovery_cache, '_cache_path', lambda: cache)
+    monkeypatch.delenv('NAPARI_DISABLE_PLUGIN_CACHE', raising=False)
+    # discovery does not register plugins twice
+    monkeypatch.setattr(PluginManager, 'discover', MagicMock())
+
+    # e.g. napari.utils.info.get_plugin_list() discovered them already
+    pm = PluginManager()
+    pm.register(mf)
+    discover_plugins(pm)
+    PluginManager.discover.assert_called_once()
+    assert mf.name in pm
+    # an empty cache would hide the plugins on the next launch
+    assert not cache.exists()
+
+    discover_plugins(PluginManager())
+    assert PluginManager.discover.call_count == 2
+
+
+def test_discover_plugins_respects_custom_discovery(npe2pm, tmp_path):
+    npe2pm.discover = MagicMock()
+    discover_plugins(npe2pm)
+    npe2pm.discover.assert_called_once_with(include_npe1=True)
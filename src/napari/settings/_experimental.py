@@ -47,6 +47,28 @@ class ExperimentalSettings(EventedSettings):
         json_schema_extra={'requires_restart': True},
     )
 
+    multiscale_3d: bool = Field(
+        False,
+        title=trans._('View-dependent multiscale rendering in 3D'),
+        description=trans._(
+            'Pick the level of multiscale images in 3D from the camera zoom, '
+            'and only load the bricks of the volume that are in view.\n'
+            'When disabled, the lowest resolution level is always rendered.'
+        ),
+        json_schema_extra={'requires_restart': False},
+    )
+
+    max_text_labels: int = Field(
+        10000,
+        title=trans._('Maximum number of decluttered text labels'),
+        description=trans._(
+            'Maximum number of text labels drawn by a layer whose text is '
+            'decluttered.'
+        ),
+        ge=1,
+        json_schema_extra={'requires_restart': False},
+    )
+
     rdp_epsilon: float = Field(
         0.5,
         title=trans._('Shapes polygon lasso and path RDP epsilon'),
@@ -1,26 +1,49 @@
-"""Dask cache utilities."""
+"""Dask cache utilities.
+
+Importing dask (and in particular ``dask.array``) is slow, so it is deferred
+until dask data is actually given to napari or the cache is configured.
+"""
+
+from __future__ import annotations
 
 import collections.abc
 import contextlib
+import sys
 from collections.abc import Callable, Iterator
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import dask
-import dask.array as da
-from dask.cache import Cache
+if TYPE_CHECKING:
+    from dask.cache import Cache
 
 #: dask.cache.Cache, optional : A dask cache for opportunistic caching
 #: use :func:`~.resize_dask_cache` to actually register and resize.
 #: this is a global cache (all layers will use it), but individual layers
-#: can opt out using Layer(..., cache=False)
-_DASK_CACHE = Cache(1)
+#: can opt out using Layer(..., cache=False).
+#: Created on first access, see :func:`__getattr__`.
+_DASK_CACHE: Cache
 _DEFAULT_MEM_FRACTION = 0.25
 
 DaskIndexer = Callable[
-    [], contextlib.AbstractContextManager[tuple[dict, Cache] | None]
+    [], contextlib.AbstractContextManager['tuple[dict, Cache] | None']
 ]
 
 
+def _get_dask_cache() -> Cache:
+    """Return the global dask cache, creating it on first use."""
+    cache = globals().get('_DASK_CACHE')
+    if cache is None:
+        from dask.cache import Cache
+
+        cache = globals()['_DASK_CACHE'] = Cache(1)
+    return cache
+
+
+def __getattr__(name: str) -> Any:
+    if name == '_DASK_CACHE':
+        return _get_dask_cache()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
 def resize_dask_cache(
     nbytes: int | None = None, mem_fraction: float | None = None
 ) -> Cache:
@@ -64,23 +87,29 @@ def resize_dask_cache(
     if nbytes is None and mem_fraction is not None:
         nbytes = int(virtual_memory().total * mem_fraction)
 
-    avail = _DASK_CACHE.cache.available_bytes
+    dask_cache = _get_dask_cache()
+    avail = dask_cache.cache.available_bytes
     # if we don't have a cache already, create one.
     if avail == 1:
         # If neither nbytes nor mem_fraction was provided, use default
         if nbytes is None:
             nbytes = int(virtual_memory().total * _DEFAULT_MEM_FRACTION)
-        _DASK_CACHE.cache.resize(nbytes)
-    elif nbytes is not None and nbytes != _DASK_CACHE.cache.available_bytes:
+        dask_cache.cache.resize(nbytes)
+    elif nbytes is not None and nbytes != dask_cache.cache.available_bytes:
         # if the cache has already been registered, then calling
         # resize_dask_cache() without supplying either mem_fraction or nbytes
         # is a no-op:
-        _DASK_CACHE.cache.resize(nbytes)
-    return _DASK_CACHE
+        dask_cache.cache.resize(nbytes)
+    return dask_cache
 
 
 def _is_dask_data(data: Any) -> bool:
     """Return True if data is a dask array or a list/tuple of dask arrays."""
+    # dask arrays cannot exist before dask.array has been imported, so avoid
+    # importing it just to find out that data is not one.
+    da = sys.modules.get('dask.array')
+    if da is None:
+        return False
     return isinstance(data, da.Array) or (
         isinstance(data, collections.abc.Sequence)
         and any(isinstance(i, da.Array) for i in data)
@@ -147,6 +176,8 @@ def configure_dask(data: Any, cache: bool = True) -> DaskIndexer:
     ) -> Iterator[tuple[Any, Any]]:
         # For debug from where the delayed slicer is called
         # add "scheduler": "synchronous" to opts
+        import dask
+
         opts = {'optimization.fuse.active': False}
         with dask.config.set(opts) as cfg, _cache as c:
             yield cfg, c
@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from napari.utils._triangle_bvh import LazyTriangleBVH, TriangleBVH
+from napari.utils.geometry import find_nearest_triangle_intersection
+
+
+def _random_mesh(n_triangles, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.uniform(0, 100, size=(n_triangles, 1, 3))
+    vertices = (
+        centers + rng.normal(scale=2, size=(n_triangles, 3, 3))
+    ).reshape(-1, 3)
+    faces = np.arange(3 * n_triangles).reshape(-1, 3)
+    return vertices, faces
+
+
+def _random_rays(n_rays, seed=1):
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform(-20, 120, size=(n_rays, 3))
+    # aim at the mesh so that most rays hit something
+    targets = rng.uniform(20, 80, size=(n_rays, 3))
+    directions = targets - positions
+    directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+    return positions, directions
+
+
+@pytest.mark.parametrize('leaf_size', [1, 7, 64])
+def test_triangle_bvh_matches_brute_force(leaf_size):
+    vertices, faces = _random_mesh(2000)
+    bvh = TriangleBVH(vertices, faces, leaf_size=leaf_size)
+    assert len(bvh) == 2000
+
+    n_hits = 0
+    for position, direction in zip(*_random_rays(50), strict=False):
+        expected_index, expected = find_nearest_triangle_intersection(
+            position, direction, vertices[faces]
+        )
+        index, intersection = bvh.find_nearest_intersection(
+            position, direction
+        )
+        if expected_index is None:
+            assert index is None
+            assert intersection is None
+            continue
+        n_hits += 1
+        assert index == expected_index
+        np.testing.assert_allclose(intersection, expected)
+    assert n_hits > 10
+
+
+def test_triangle_bvh_axis_aligned_ray():
+    # a ray along an axis has zero direction components
+    vertices = np.array(
+        [
+            [10, 0, 0],
+            [10, 5, 0],
+            [10, 0, 5],
+            [20, 0, 0],
+            [20, 5, 0],
+            [20, 0, 5],
+        ]
+    )
+    faces = np.array([[0, 1, 2], [3, 4, 5]])
+    bvh = TriangleBVH(vertices, faces, leaf_size=1)
+
+    index, intersection = bvh.find_nearest_intersection(
+        np.array([30, 1, 1]), np.array([-1, 0, 0])
+    )
+    assert index == 1
+    np.testing.assert_allclose(intersection, [20, 1, 1])
+
+    index, _ = bvh.find_nearest_intersection(
+        np.array([30, 10, 10]), np.array([-1, 0, 0])
+    )
+    assert index is None
+
+
+def test_lazy_triangle_bvh():
+    vertices, faces = _random_mesh(500)
+    small = LazyTriangleBVH(vertices, faces)
+    assert small.bvh(wait=True) is None
+
+    lazy = LazyTriangleBVH(vertices, faces, min_triangles=100)
+    positions, directions = _random_rays(10)
+    # before and after the tree is built
+    for _ in range(2):
+        for position, direction in zip(positions, directions, strict=False):
+            expected_index, _ = find_nearest_triangle_intersection(
+                position, direction, vertices[faces]
+            )
+            index, _ = lazy.find_nearest_intersection(position, direction)
+            assert index == expected_index
+        assert isinstance(lazy.bvh(wait=True), TriangleBVH)
@@ -0,0 +1,290 @@
+"""Bounding volume hierarchy for picking triangle meshes with a ray.
+
+Finding the triangle under the mouse in 3D tests every triangle of a mesh
+(see :func:`napari.utils.geometry.find_nearest_triangle_intersection`),
+which gets slow for meshes with millions of triangles. A
+:class:`TriangleBVH` groups spatially close triangles into leaves, and
+leaves into a binary tree of bounding boxes, so that a query only tests the
+triangles of the few leaves whose boxes are crossed by the ray.
+
+The tree is a linear BVH: triangles are sorted along a Morton curve of
+their centroids and consecutive runs of them form the leaves. This makes
+building and traversing it vectorizable with numpy.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+
+import numpy as np
+import numpy.typing as npt
+
+from napari.utils.geometry import find_nearest_triangle_intersection
+
+#: number of triangles in a leaf of the tree
+LEAF_SIZE = 64
+#: below this number of triangles, testing all of them is fast enough
+MIN_TRIANGLES = 2**14
+#: number of leaves whose triangles are tested at once in a query
+_LEAVES_PER_BATCH = 16
+
+_executor: Executor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> Executor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix='napari-bvh'
+            )
+        return _executor
+
+
+def _morton_codes(points: npt.NDArray) -> npt.NDArray[np.uint64]:
+    """Morton codes of 3D points, with 21 bits per axis."""
+    low = points.min(axis=0)
+    size = np.maximum(points.max(axis=0) - low, np.finfo(float).tiny)
+    cells = ((points - low) / size * (2**21 - 1)).astype(np.uint64)
+    codes = np.zeros(len(points), dtype=np.uint64)
+    for bit in range(21):
+        for axis in range(3):
+            codes |= ((cells[:, axis] >> np.uint64(bit)) & np.uint64(1)) << (
+                np.uint64(3 * bit + axis)
+            )
+    return codes
+
+
+def _line_box_intervals(
+    position: npt.NDArray,
+    direction: npt.NDArray,
+    low: npt.NDArray,
+    high: npt.NDArray,
+) -> tuple[npt.NDArray, npt.NDArray]:
+    """Parameters of the line ``position + t * direction`` in each box.
+
+    Returns the entry and exit parameters of the line in the boxes. The
+    line misses a box when the entry is larger than the exit.
+    """
+    moving = direction != 0
+    t_low = (low[:, moving] - position[moving]) / direction[moving]
+    t_high = (high[:, moving] - position[moving]) / direction[moving]
+    t_in = np.minimum(t_low, t_high).max(axis=1, initial=-np.inf)
+    t_out = np.maximum(t_low, t_high).min(axis=1, initial=np.inf)
+    # the line is parallel to the other axes, and must lie between the faces
+    parallel = ~moving
+    outside = np.any(
+        (position[parallel] < low[:, parallel])
+        | (position[parallel] > high[:, parallel]),
+        axis=1,
+    )
+    t_out[outside] = -np.inf
+    return t_in, t_out
+
+
+class TriangleBVH:
+    """Bounding volume hierarchy of the triangles of a mesh.
+
+    Parameters
+    ----------
+    vertices : (V, 3) array
+        Coordinates of the vertices of the mesh.
+    faces : (N, 3) array of int
+        Indices of the vertices of each triangle.
+    leaf_size : int
+        Number of triangles in a leaf of the tree.
+    """
+
+    def __init__(
+        self,
+        vertices: npt.NDArray,
+        faces: npt.NDArray,
+        leaf_size: int = LEAF_SIZE,
+    ) -> None:
+        self.vertices = vertices
+        faces = np.asarray(faces)
+        self.leaf_size = leaf_size
+
+        # accumulate per vertex of the triangles to limit the memory use
+        corner = vertices[faces[:, 0]]
+        low, high, centroids = corner.copy(), corner.copy(), corner
+        for k in (1, 2):
+            corner = vertices[faces[:, k]]
+            np.minimum(low, corner, out=low)
+            np.maximum(high, corner, out=high)
+            centroids = centroids + corner
+
+        self._order = np.argsort(_morton_codes(centroids), kind='stable')
+        self._faces = faces[self._order]
+        low, high = low[self._order], high[self._order]
+
+        # pad the boxes so that triangles seen edge-on are not missed
+        pad = 1e-9 * max(float(np.ptp(vertices, axis=0).max()), 1)
+        starts = np.arange(0, len(faces), leaf_size)
+        levels = [
+            (
+                np.minimum.reduceat(low, starts) - pad,
+                np.maximum.reduceat(high, starts) + pad,
+            )
+        ]
+        while len(levels[-1][0]) > 1:
+            low, high = levels[-1]
+            pairs = np.arange(0, len(low), 2)
+            levels.append(
+                (
+                    np.minimum.reduceat(low, pairs),
+                    np.maximum.reduceat(high, pairs),
+                )
+            )
+        # root first, the children of node i of a level are nodes 2i and
+        # 2i + 1 of the next one
+        self._levels = levels[::-1]
+
+    def __len__(self) -> int:
+        return len(self._faces)
+
+    def _hit_leaves(
+        self, position: npt.NDArray, direction: npt.NDArray
+    ) -> tuple[npt.NDArray, npt.NDArray]:
+        """Leaves crossed by the line, and their distance lower bounds."""
+        nodes = np.zeros(1, dtype=np.intp)
+        for depth, (low, high) in enumerate(self._levels):
+            t_in, t_out = _line_box_intervals(
+                position, direction, low[nodes], high[nodes]
+            )
+            hit = t_in <= t_out
+            nodes, t_in, t_out = nodes[hit], t_in[hit], t_out[hit]
+            if depth == len(self._levels) - 1 or len(nodes) == 0:
+                break
+            n_children = len(self._levels[depth + 1][0])
+            nodes = np.concatenate([2 * nodes, 2 * nodes + 1])
+            nodes = nodes[nodes < n_children]
+        # the distance to the closest point of a box along the line
+        bound = np.where(
+            (t_in <= 0) & (t_out >= 0),
+            0,
+            np.minimum(np.abs(t_in), np.abs(t_out)),
+        )
+        order = np.argsort(bound, kind='stable')
+        return nodes[order], bound[order]
+
+    def find_nearest_intersection(
+        self, ray_position: npt.NDArray, ray_direction: npt.NDArray
+    ) -> tuple[int | None, npt.NDArray | None]:
+        """Find the triangle intersected by a ray closest to its start.
+
+        This returns the same result as
+        :func:`napari.utils.geometry.find_nearest_triangle_intersection`
+        for the triangles of the mesh.
+
+        Parameters
+        ----------
+        ray_position : np.ndarray
+            The coordinate of the starting point of the ray.
+        ray_direction : np.ndarray
+            A unit vector describing the direction of the ray.
+
+        Returns
+        -------
+        closest_intersected_triangle_index : int
+            The index of the intersected triangle in the faces.
+        intersection : np.ndarray
+            The coordinate of where the ray intersects the triangle.
+        """
+        position = np.asarray(ray_position, dtype=float)
+        direction = np.asarray(ray_direction, dtype=float)
+        leaves, bounds = self._hit_leaves(position, direction)
+
+        best: tuple[float, int, npt.NDArray] | None = None
+        offsets = np.arange(self.leaf_size)
+        for start in range(0, len(leaves), _LEAVES_PER_BATCH):
+            # leaves are sorted by distance, so the remaining ones cannot
+            # contain a closer intersection
+            if best is not None and best[0] < bounds[start]:
+                break
+            batch = leaves[start : start + _LEAVES_PER_BATCH]
+            indices = (batch[:, None] * self.leaf_size + offsets).ravel()
+            indices = indices[indices < len(self._faces)]
+            index, intersection = find_nearest_triangle_intersection(
+                position, direction, self.vertices[self._faces[indices]]
+            )
+            if index is None or intersection is None:
+                continue
+            distance = np.linalg.norm(intersection - position)
+            distance /= np.linalg.norm(direction)
+            if best is None or distance < best[0]:
+                best = (distance, int(indices[index]), intersection)
+
+        if best is None:
+            return None, None
+        return int(self._order[best[1]]), best[2]
+
+
+class LazyTriangleBVH:
+    """Nearest ray intersection with a mesh, accelerated once a BVH is built.
+
+    The :class:`TriangleBVH` of large meshes is built in a background thread
+    on the first query. Until it is ready, all the triangles are tested.
+    The mesh must not change afterwards; create a new instance instead.
+
+    Parameters
+    ----------
+    vertices : (V, 3) array
+        Coordinates of the vertices of the mesh.
+    faces : (N, 3) array of int
+        Indices of the vertices of each triangle.
+    min_triangles : int
+        Meshes with fewer triangles do not use a BVH.
+    """
+
+    def __init__(
+        self,
+        vertices: npt.NDArray,
+        faces: npt.NDArray,
+        min_triangles: int = MIN_TRIANGLES,
+    ) -> None:
+        self.vertices = vertices
+        self.faces = faces
+        self.min_triangles = min_triangles
+        self._future: Future[TriangleBVH] | None = None
+
+    def bvh(self, wait: bool = False) -> TriangleBVH | None:
+        """Return the BVH if it is built, starting to build it if needed.
+
+        Parameters
+        ----------
+        wait : bool
+            If True, wait for the BVH to be built.
+
+        Returns
+        -------
+        TriangleBVH or None
+            None if the mesh is too small or the BVH is not built yet.
+        """
+        if len(self.faces) < self.min_triangles:
+            return None
+        if self._future is None:
+            self._future = _get_executor().submit(
+                TriangleBVH, self.vertices, self.faces
+            )
+        if not (wait or self._future.done()):
+            return None
+        if self._future.exception() is not None:
+            return None
+        return self._future.result()
+
+    def find_nearest_intersection(
+        self, ray_position: npt.NDArray, ray_direction: npt.NDArray
+    ) -> tuple[int | None, npt.NDArray | None]:
+        """Find the triangle intersected by a ray closest to its start.
+
+        See :meth:`TriangleBVH.find_nearest_intersection`.
+        """
+        bvh = self.bvh()
+        if bvh is not None:
+            return bvh.find_nearest_intersection(ray_position, ray_direction)
+        return find_nearest_triangle_intersection(
+            ray_position, ray_direction, self.vertices[self.faces]
+        )
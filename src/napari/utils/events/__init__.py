@@ -2,6 +2,8 @@ from napari.utils.events.event import (  # isort:skip
     EmitterGroup,
     Event,
     EventEmitter,
+    get_callback_stats,
+    set_callback_profiling_enabled,
     set_event_tracing_enabled,
 )
 from napari.utils.events.containers._evented_dict import EventedDict
@@ -31,5 +33,7 @@ __all__ = [
     'SupportsEvents',
     'TypedMutableSequence',
     'disconnect_events',
+    'get_callback_stats',
+    'set_callback_profiling_enabled',
     'set_event_tracing_enabled',
 ]
@@ -3,7 +3,13 @@ from functools import partial
 
 import pytest
 
-from napari.utils.events import EventEmitter
+from napari.utils.events import (
+    EmitterGroup,
+    EventEmitter,
+    get_callback_stats,
+    set_callback_profiling_enabled,
+)
+from napari.utils.events.event import EventBatcher
 
 
 def test_event_blocker_count_none():
@@ -351,3 +357,118 @@ def test_none_disconnect():
     e.connect(fun2)
     e()
     assert count_list == [1, 2]
+
+
+def test_connect_invalidates_callback_cache():
+    calls = []
+    e = EventEmitter(type_name='test')
+    e.connect(lambda: calls.append(1))
+    e()
+    assert calls == [1]
+
+    def fun2():
+        calls.append(2)
+
+    e.connect(fun2)
+    e()
+    assert sorted(calls) == [1, 1, 2]
+    e.disconnect(fun2)
+    e()
+    assert sorted(calls) == [1, 1, 1, 2]
+
+
+def test_batched_coalesces_emissions():
+    group = EmitterGroup(a=None, b=None)
+    received = []
+    group.a.connect(lambda event: received.append(('a', event.value)))
+    group.b.connect(lambda event: received.append(('b', event.value)))
+
+    with group.batched():
+        group.a(value=1)
+        group.b(value=1)
+        group.a(value=2)
+        assert received == []
+
+    # one emission per emitter, in order of the last emission
+    assert received == [('b', 1), ('a', 2)]
+
+    group.a(value=3)
+    assert received[-1] == ('a', 3)
+
+
+def test_batched_keeps_every_delta_event():
+    group = EmitterGroup(a=None, b=None)
+    received = []
+    group.a.connect(lambda event: received.append(('a', event.index)))
+    group.b.connect(lambda event: received.append(('b', event.value)))
+
+    with group.batched():
+        group.a(index=0, value='x')
+        group.b(value=1)
+        group.a(index=1, value='y')
+        group.b(value=2)
+
+    # events with more than a value describe a change, none are dropped
+    assert received == [('a', 0), ('a', 1), ('b', 2)]
+
+
+def test_batched_group_callback_and_blocking():
+    group = EmitterGroup(a=None)
+    received = []
+    group.connect(lambda event: received.append(event.type))
+
+    with group.batched():
+        group.a()
+        group.a()
+        with group.a.blocker():
+            group.a()
+    assert received == ['a']
+
+    with group.a.blocker(), group.batched():
+        group.a()
+    assert received == ['a']
+
+
+def test_nested_batches_flush_on_outermost_exit():
+    group1 = EmitterGroup(a=None)
+    group2 = EmitterGroup(a=None)
+    received = []
+    group1.a.connect(lambda: received.append(1))
+    group2.a.connect(lambda: received.append(2))
+
+    with EventBatcher(group1, group2):
+        with group1.batched():
+            group1.a()
+            group2.a()
+        assert received == []
+    assert received == [1, 2]
+
+
+def test_callback_profiling():
+    assert get_callback_stats() is None
+
+    class Obj:
+        def cb(self, event):
+            pass
+
+    obj = Obj()
+    e = EventEmitter(type_name='test')
+    e.connect(obj.cb)
+    e()
+
+    stats = set_callback_profiling_enabled(True)
+    try:
+        assert get_callback_stats() is stats
+        e()
+        e()
+        record = stats.records[('NoneType.events.test', 'Obj.cb')]
+        assert record.count == 2
+        assert record.max_ns <= record.total_ns
+        assert 'Obj.cb' in stats.table()
+        with pytest.raises(ValueError, match='sort_by'):
+            stats.table(sort_by='bad')
+        stats.clear()
+        assert not stats.records
+    finally:
+        set_callback_profiling_enabled(False)
+    assert get_callback_stats() is None
@@ -807,3 +807,45 @@ def test_events_called():
     s.a = 2
 
     e_m.assert_called_once()
+
+
+def test_identical_value_skips_equality_check():
+    class Tt(EventedModel):
+        a: Array = Field(default_factory=lambda: np.zeros(3))
+
+    t = Tt()
+    a_eq = Mock(return_value=False)
+    t.__eq_operators__['a'] = a_eq
+    call = Mock()
+    t.events.a.connect(call)
+
+    t.a = t.a
+    a_eq.assert_not_called()
+    call.assert_not_called()
+
+
+def test_update_compares_each_field_once():
+    class Tt(EventedModel):
+        a: int = 1
+        b: int = 2
+
+        @property
+        def c(self) -> int:
+            return self.a + self.b
+
+    t = Tt()
+    a_eq = Mock(side_effect=operator.eq)
+    c_eq = Mock(side_effect=operator.eq)
+    t.__eq_operators__['a'] = a_eq
+    t.__eq_operators__['c'] = c_eq
+    call_c = Mock()
+    call_model = Mock()
+    t.events.c.connect(call_c)
+    t.events.connect(call_model)
+
+    t.update({'a': 5, 'b': 7})
+    a_eq.assert_called_once()
+    c_eq.assert_called_once()
+    call_c.assert_called_once()
+    assert call_c.call_args.args[0].value == 12
+    call_model.assert_called_once()
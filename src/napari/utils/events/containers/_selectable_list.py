@@ -63,6 +63,10 @@ class SelectableEventedList(Selectable[_T], EventedList[_T]):
 
     def _process_delete_item(self, item: _T) -> None:
         self.selection.discard(item)
+        # the current item need not be selected, and must not keep a
+        # removed item alive
+        if self.selection._current is item:
+            self.selection._current = None
 
     def insert(self, index: int, value: _T) -> None:
         super().insert(index, value)
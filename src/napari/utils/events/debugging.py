@@ -1,12 +1,16 @@
 import inspect
 import os
 import site
+from collections.abc import Callable
+from functools import partial
 from textwrap import indent
+from time import perf_counter_ns
 from typing import TYPE_CHECKING, ClassVar
 
 from pydantic import Field, PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from napari.utils import perf
 from napari.utils.misc import ROOT_DIR
 from napari.utils.translations import trans
 
@@ -20,7 +24,7 @@ except ModuleNotFoundError:
     )
 
 if TYPE_CHECKING:
-    from napari.utils.events.event import Event
+    from napari.utils.events.event import Event, EventEmitter
 
 
 class EventDebugSettings(BaseSettings):
@@ -128,3 +132,155 @@ def log_event_stack(event: 'Event', cfg: EventDebugSettings = _SETTINGS):
 
     event._pop_source = _pop_source
     cfg._cur_depth += 1
+
+
+class CallbackRecord:
+    """Invocation count and timings of one (emitter, callback) pair.
+
+    Attributes
+    ----------
+    count : int
+        How many times the callback was invoked.
+    total_ns : int
+        Cumulative time spent in the callback, in nanoseconds. This includes
+        the time of any callbacks triggered by nested emissions.
+    max_ns : int
+        Duration of the slowest invocation, in nanoseconds.
+    """
+
+    __slots__ = ('count', 'max_ns', 'total_ns')
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def add(self, duration_ns: int) -> None:
+        self.count += 1
+        self.total_ns += duration_ns
+        self.max_ns = max(self.max_ns, duration_ns)
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_ns / 1e6
+
+    @property
+    def max_ms(self) -> float:
+        return self.max_ns / 1e6
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+
+def _emitter_name(emitter: 'EventEmitter') -> str:
+    type_name = emitter.default_args.get('type_name', '?')
+    return f'{type(emitter.source).__name__}.events.{type_name}'
+
+
+def _callback_name(cb: Callable) -> str:
+    if isinstance(cb, partial):
+        cb = cb.func
+    if inspect.ismethod(cb):
+        return f'{type(cb.__self__).__name__}.{cb.__name__}'
+    name = getattr(cb, '__qualname__', None) or type(cb).__name__
+    module = getattr(cb, '__module__', None)
+    return f'{module}.{name}' if module else name
+
+
+class CallbackStats:
+    """Per-(emitter, callback) invocation counts and timings.
+
+    Collection is enabled with
+    :func:`napari.utils.events.set_callback_profiling_enabled`, which
+    returns the active instance. When perfmon is enabled, each invocation
+    is also added to the perfmon timers, so it shows up in Chrome traces
+    recorded with "Debug -> Performance Trace".
+
+    Attributes
+    ----------
+    records : dict[tuple[str, str], CallbackRecord]
+        Maps (emitter name, callback name) to the timings of that pair.
+    """
+
+    def __init__(self) -> None:
+        self.records: dict[tuple[str, str], CallbackRecord] = {}
+
+    def invoke(
+        self,
+        emitter: 'EventEmitter',
+        cb: Callable,
+        event: 'Event | None',
+    ) -> None:
+        """Invoke ``cb`` with ``event`` and record how long it took."""
+        start_ns = perf_counter_ns()
+        try:
+            if event is not None:
+                cb(event)
+            else:
+                cb()
+        finally:
+            end_ns = perf_counter_ns()
+            key = (_emitter_name(emitter), _callback_name(cb))
+            record = self.records.get(key)
+            if record is None:
+                record = self.records[key] = CallbackRecord()
+            record.add(end_ns - start_ns)
+            if perf.USE_PERFMON:
+                perf.timers.add_event(
+                    perf.PerfEvent(
+                        f'{key[0]} -> {key[1]}',
+                        start_ns,
+                        end_ns,
+                        category='event',
+                    )
+                )
+
+    def clear(self) -> None:
+        """Forget all recorded timings."""
+        self.records.clear()
+
+    def table(self, sort_by: str = 'total_ms', limit: int | None = 20) -> str:
+        """Return the recorded timings formatted as a text table.
+
+        Parameters
+        ----------
+        sort_by : str
+            One of 'count', 'total_ms', 'max_ms' or 'mean_ms'. Rows are
+            sorted in descending order of this column.
+        limit : int, optional
+            Show at most this many rows. ``None`` shows all of them.
+
+        Returns
+        -------
+        str
+            The formatted table.
+        """
+        if sort_by not in ('count', 'total_ms', 'max_ms', 'mean_ms'):
+            raise ValueError(
+                trans._(
+                    "sort_by must be one of 'count', 'total_ms', 'max_ms' or 'mean_ms', not {sort_by!r}",
+                    deferred=True,
+                    sort_by=sort_by,
+                )
+            )
+        rows = sorted(
+            self.records.items(),
+            key=lambda item: getattr(item[1], sort_by),
+            reverse=True,
+        )[:limit]
+        lines = [
+            f'{"count":>8} {"total ms":>10} {"mean ms":>9} {"max ms":>9}  emitter -> callback'
+        ]
+        lines.extend(
+            f'{rec.count:>8} {rec.total_ms:>10.2f} {rec.mean_ms:>9.3f} '
+            f'{rec.max_ms:>9.3f}  {emitter} -> {callback}'
+            for (emitter, callback), rec in rows
+        )
+        return '\n'.join(lines)
+
+    def print_table(
+        self, sort_by: str = 'total_ms', limit: int | None = 20
+    ) -> None:
+        """Print the table returned by :meth:`table`."""
+        print(self.table(sort_by=sort_by, limit=limit))
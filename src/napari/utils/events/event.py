@@ -56,6 +56,7 @@ import weakref
 from collections.abc import Callable, Iterable, Iterator, Sequence
 from functools import partial
 from typing import (
+    TYPE_CHECKING,
     Any,
     Generic,
     Literal,
@@ -69,6 +70,9 @@ from vispy.util.logs import _handle_exception
 
 from napari.utils.translations import trans
 
+if TYPE_CHECKING:
+    from napari.utils.events.debugging import CallbackStats
+
 
 class Event:
     """Class describing events that occur and can be reacted to with callbacks.
@@ -286,6 +290,13 @@ class EventEmitter:
         # used when connecting new callbacks at specific positions
         self._callback_refs: list[str | None] = []
         self._callback_pass_event: list[bool] = []
+        # (callback, pass_event) pairs snapshotted for emission; rebuilt
+        # lazily after any connect/disconnect
+        self._callback_cache: (
+            tuple[tuple[Callback | CallbackRef, bool], ...] | None
+        ) = None
+        # set while an EventBatcher is queueing emissions of this emitter
+        self._batcher: EventBatcher | None = None
 
         # count number of times this emitter is blocked for each callback.
         self._blocked: dict[Callback | None, int] = {None: 0}
@@ -563,6 +574,7 @@ class EventEmitter:
         self._callbacks.insert(idx, callback)
         self._callback_refs.insert(idx, _ref)
         self._callback_pass_event.insert(idx, pass_event)
+        self._callback_cache = None
 
         if until is not None:
             until.connect(partial(self.disconnect, callback))
@@ -605,6 +617,7 @@ class EventEmitter:
                 self._callbacks.pop(idx)
                 self._callback_refs.pop(idx)
                 self._callback_pass_event.pop(idx)
+        self._callback_cache = None
 
     @staticmethod
     def _get_proper_name(callback):
@@ -708,6 +721,17 @@ class EventEmitter:
         # create / massage event as needed
         event = self._prepare_event(*args, **kwargs)
 
+        if self._batcher is not None and blocked.get(None, 0) == 0:
+            # defer delivery until the batch is flushed
+            self._batcher._enqueue(self, event)
+            return event
+
+        callbacks = self._callback_cache
+        if callbacks is None:
+            callbacks = self._callback_cache = tuple(
+                zip(self._callbacks, self._callback_pass_event, strict=True)
+            )
+
         # Add our source to the event; remove it after all callbacks have been
         # invoked.
         event._push_source(self.source)
@@ -720,9 +744,7 @@ class EventEmitter:
             _log_event_stack(event)
 
             rem: list[CallbackRef] = []
-            for cb, pass_event in zip(
-                self._callbacks[:], self._callback_pass_event[:], strict=False
-            ):
+            for cb, pass_event in callbacks:
                 if isinstance(cb, tuple):
                     obj = cb[0]()
                     if obj is None:
@@ -773,7 +795,9 @@ class EventEmitter:
         self, cb: Callback | Callable[[], None], event: Event | None
     ):
         try:
-            if event is not None:
+            if _callback_stats is not None:
+                _callback_stats.invoke(self, cb, event)
+            elif event is not None:
                 cb(event)
             else:
                 cb()
@@ -1163,6 +1187,80 @@ class EmitterGroup(EventEmitter):
         """
         return EventBlockerAll(self)
 
+    def batched(self) -> 'EventBatcher':
+        """Return an EventBatcher to be used in 'with' statements
+
+        Notes
+        -----
+        While inside the block, emissions of the group's emitters are queued
+        rather than delivered. Repeated emissions of the same emitter are
+        coalesced into the last one, unless they carry more than a ``value``
+        (see :class:`EventBatcher`), and every queued event is emitted once
+        when the block exits. For example::
+
+            with layer.events.batched():
+                layer.opacity = 0.5
+                layer.opacity = 0.7  # only this change is emitted
+                layer.blending = 'additive'
+        """
+        return EventBatcher(self)
+
+
+class EventBatcher:
+    """Queue and coalesce the emissions of one or more EmitterGroups
+    within a context manager (i.e. 'with' statement).
+
+    Events that only report a new state, i.e. carry nothing but an optional
+    ``value``, are coalesced: only the last such event of each emitter is
+    kept. Events carrying any other attribute describe a change, e.g. the
+    ``index`` of an inserted item or the ``offset`` of a ``labels_update``,
+    so every one of them is kept. The queued events are emitted in the order
+    of their (last) emission when the outermost batch exits. Emitters
+    already claimed by an enclosing batch are left to that batch, so batches
+    may be nested freely.
+
+    Parameters
+    ----------
+    *targets : EmitterGroup
+        The emitter groups whose emitters should be batched, e.g. the
+        ``events`` of many layers that are being updated together.
+    """
+
+    def __init__(self, *targets: EmitterGroup) -> None:
+        self.targets = targets
+        self._claimed: list[EventEmitter] = []
+        # keyed by emitter for the events to coalesce, else by a unique key
+        self._queue: dict[object, tuple[EventEmitter, Event]] = {}
+
+    def _enqueue(self, emitter: EventEmitter, event: Event) -> None:
+        if event._kwargs.keys() - {'value'}:
+            key: object = object()
+        else:
+            key = emitter
+            # pop first so the dict order follows the last emission
+            self._queue.pop(key, None)
+        self._queue[key] = (emitter, event)
+
+    def __enter__(self):
+        for group in self.targets:
+            for emitter in group.emitters.values():
+                if emitter._batcher is None:
+                    emitter._batcher = self
+                    self._claimed.append(emitter)
+        return self
+
+    def __exit__(self, *args):
+        for emitter in self._claimed:
+            emitter._batcher = None
+        self._claimed = []
+        self.flush()
+
+    def flush(self) -> None:
+        """Emit all queued events, leaving the queue empty."""
+        queue, self._queue = self._queue, {}
+        for emitter, event in queue.values():
+            emitter(event)
+
 
 class EventBlocker:
     """Represents a block for an EventEmitter to be used in a context
@@ -1236,5 +1334,44 @@ def set_event_tracing_enabled(enabled=True, cfg=None):
         _log_event_stack = _noop
 
 
+_callback_stats: 'CallbackStats | None' = None
+
+
+def set_callback_profiling_enabled(
+    enabled: bool = True,
+) -> 'CallbackStats | None':
+    """Enable or disable timing of every event callback invocation.
+
+    Parameters
+    ----------
+    enabled : bool
+        Whether to record callback invocations. Disabling discards the
+        collected statistics.
+
+    Returns
+    -------
+    CallbackStats or None
+        The active statistics collector, or None if profiling is disabled.
+        Use ``CallbackStats.print_table()`` to show the slowest callbacks.
+    """
+    global _callback_stats
+    if enabled:
+        if _callback_stats is None:
+            from napari.utils.events.debugging import CallbackStats
+
+            _callback_stats = CallbackStats()
+    else:
+        _callback_stats = None
+    return _callback_stats
+
+
+def get_callback_stats() -> 'CallbackStats | None':
+    """Return the active callback statistics, or None if disabled."""
+    return _callback_stats
+
+
 if os.getenv('NAPARI_DEBUG_EVENTS', '').lower() in ('1', 'true'):
     set_event_tracing_enabled(True)
+
+if os.getenv('NAPARI_PROFILE_EVENTS', '').lower() in ('1', 'true'):
+    set_callback_profiling_enabled(True)
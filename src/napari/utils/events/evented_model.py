@@ -78,6 +78,11 @@ class EventedMetaclass(ModelMetaclass):
                     )
 
         cls.__field_dependents__ = _get_field_dependents(cls)
+        # frozen copy of the above, iterated on every assignment
+        cls.__field_dependents_tuple__ = {
+            field: tuple(deps)
+            for field, deps in cls.__field_dependents__.items()
+        }
         return cls
 
 
@@ -184,6 +189,7 @@ class EventedModel(BaseModel, metaclass=EventedMetaclass):
     # mapping of field name -> dependent set of property names
     # when field is changed, an event for dependent properties will be emitted.
     __field_dependents__: ClassVar[dict[str, set[str]]]
+    __field_dependents_tuple__: ClassVar[dict[str, tuple[str, ...]]]
     __eq_operators__: ClassVar[dict[str, Callable[[Any, Any], bool]]]
     _changes_queue: dict[str, Any] = PrivateAttr(default_factory=dict)
     _primary_changes: dict[str, None] = PrivateAttr(default_factory=dict)
@@ -246,14 +252,22 @@ class EventedModel(BaseModel, metaclass=EventedMetaclass):
         Returns True if data changed, else False. Return current value.
         """
         new_value = getattr(self, name, object())
-        if name in self.__eq_operators__:
-            are_equal = self.__eq_operators__[name]
-        else:
+        if new_value is old_value:
+            # identical objects are equal; skip potentially costly
+            # comparisons such as those of arrays
+            return False, new_value
+        are_equal = self.__eq_operators__.get(name)
+        if are_equal is None:
             are_equal = pick_equality_operator(new_value)
         return not are_equal(new_value, old_value), new_value
 
+    def _has_emitter(self, name: str) -> bool:
+        # `events` is not yet available while pydantic initializes the model
+        events = getattr(self, 'events', None)
+        return events is not None and name in events.emitters
+
     def __setattr__(self, name: str, value: Any) -> None:
-        if name not in getattr(self, 'events', {}):
+        if not self._has_emitter(name):
             # This is a workaround needed because `EventedConfigFileSettings` uses
             # `_config_path` before calling the superclass constructor
             super().__setattr__(name, value)
@@ -313,32 +327,28 @@ class EventedModel(BaseModel, metaclass=EventedMetaclass):
                 self.events(type_name=to_emit[0][0], value=to_emit[0][1])
 
     def _setattr_impl(self, name: str, value: Any) -> None:
-        if name not in getattr(self, 'events', {}):
+        if not self._has_emitter(name):
             # fallback to default behavior
             self._super_setattr_(name, value)
             return
 
-        # grab current value
-        field_dep = self.__field_dependents__.get(name, set())
-        has_callbacks = {
-            name: bool(getattr(self.events, name).callbacks)
-            for name in field_dep
-        }
-        emitter = getattr(self.events, name)
+        events = self._events
+        dep_with_callbacks = [
+            dep
+            for dep in self.__field_dependents_tuple__.get(name, ())
+            if getattr(events, dep)._callbacks
+        ]
         # equality comparisons may be expensive, so just avoid them if
         # event has no callbacks connected
         if not (
-            emitter.callbacks
-            or self._events.callbacks
-            or any(has_callbacks.values())
+            getattr(events, name)._callbacks
+            or events._callbacks
+            or dep_with_callbacks
         ):
             self._super_setattr_(name, value)
             return
 
-        dep_with_callbacks = [
-            dep for dep, has_cb in has_callbacks.items() if has_cb
-        ]
-
+        # grab current value
         if name not in self._changes_queue:
             self._changes_queue[name] = getattr(self, name, object())
 
@@ -412,7 +422,9 @@ class EventedModel(BaseModel, metaclass=EventedMetaclass):
                 )
             )
 
-        with self.events.blocker() as block:
+        # delay comparisons so that each changed field is compared once,
+        # after all values have been assigned
+        with self.events.blocker() as block, ComparisonDelayer(self):
             for key, value in values.items():
                 field = getattr(self, key)
                 if isinstance(field, EventedModel) and recurse:
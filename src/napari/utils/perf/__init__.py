@@ -36,8 +36,24 @@ Add a line to the config file like:
 
     "trace_file_on_start": "/Path/to/my/trace.json"
 
-Perfmon will start tracing on startup. You must quit napari with the Quit
-command for napari to write trace file. See PerfmonConfig docs.
+Perfmon will start tracing on startup. Events are appended to the file as
+napari runs, so the trace survives a crash, and for long sessions the
+"trace_file_options" of the config file can cap the size of the trace and
+sample high frequency timers. See PerfmonConfig and PerfTraceFile docs.
+
+Startup Profiling
+-----------------
+Run ``napari --profile-startup /path/to/trace.json`` to time each phase of
+startup (imports, settings, plugin discovery, Qt application, stylesheet,
+viewer creation and first paint). The trace is written, and a summary
+printed, once the canvas is first drawn. This does not require perfmon.
+
+Performance Counters
+--------------------
+Some costs, such as slicing latency, texture uploads and frame times, are
+always recorded into ring buffers by ``perf.counters``, without perfmon.
+Show them live with Window -> performance counters, or take a snapshot with
+``perf.counters.snapshot()``. See the PerfCounters docs.
 
 Manual Timing
 -------------
@@ -52,6 +68,7 @@ not to leave them in the code. Think of them as similar to debug prints.
 import os
 
 from napari.utils.perf._config import perf_config
+from napari.utils.perf._counters import counters
 from napari.utils.perf._event import PerfEvent
 from napari.utils.perf._timers import (
     add_counter_event,
@@ -70,6 +87,7 @@ __all__ = [
     'add_counter_event',
     'add_instant_event',
     'block_timer',
+    'counters',
     'perf_config',
     'perf_timer',
     'timers',
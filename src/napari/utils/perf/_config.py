@@ -59,6 +59,13 @@ class PerfmonConfig:
     {
         "trace_qt_events": true,
         "trace_file_on_start": "/Path/To/latest.json",
+        "trace_file_options": {
+            "flush_interval_s": 1.0,
+            "max_bytes": 100000000,
+            "backup_count": 1,
+            "min_duration_ms": 0.1,
+            "sample_every": 1
+        },
         "trace_callables": [
             "my_callables_1",
             "my_callables_2",
@@ -157,6 +164,13 @@ class PerfmonConfig:
         else:
             return path or None
 
+    @property
+    def trace_file_options(self) -> dict[str, Any]:
+        """Return the options of trace files, see PerfTraceFile."""
+        if self.config_path is None:
+            return {}
+        return self.data.get('trace_file_options', {})
+
 
 def _create_perf_config() -> PerfmonConfig | None:
     value = os.getenv('NAPARI_PERFMON')
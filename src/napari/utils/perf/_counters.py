@@ -0,0 +1,214 @@
+"""PerfCounters class, a registry of always-on performance counters.
+
+Unlike perf timers, the counters do not depend on ``NAPARI_PERFMON``. They
+are cheap enough to be always recorded, so that a slow session can be
+diagnosed while it runs, from the performance counters dock widget or
+programmatically::
+
+    from napari.utils.perf import counters
+
+    counters.snapshot()['slice.async_ms']['p95']
+
+Each counter keeps running totals of all of its values, and the most recent
+values in a ring buffer, from which statistics of the recent history are
+computed.
+
+Counters recorded by napari:
+
+slice.async_ms
+    Time from submitting an asynchronous slicing task to its completion.
+slice.sync_ms
+    Time to slice one layer synchronously, on the main thread.
+slice.queue_depth
+    Number of slicing tasks pending, when a task is submitted or done.
+texture.upload_bytes
+    Bytes of image and labels data sent to a texture.
+canvas.frame_ms
+    Duration of a frame drawn by the canvas, including updating the layers,
+    see :class:`napari.utils.perf._frames.FrameRecorder`.
+brick_cache.hit
+    1 if a brick of a multiscale volume was found in the cache, else 0, so
+    that the mean of the recent values is the recent hit rate.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+from collections import deque
+from collections.abc import Generator
+from time import perf_counter, perf_counter_ns
+
+import numpy as np
+
+#: number of recent values kept by each counter
+HISTORY = 512
+
+
+class PerfCounter:
+    """A counter keeping totals and a ring buffer of its recent values.
+
+    Parameters
+    ----------
+    name : str
+        Name of the counter.
+    unit : str
+        Unit of the values, for display only.
+    history : int
+        Number of recent values to keep.
+
+    Attributes
+    ----------
+    count : int
+        How many values were recorded.
+    total : float
+        Sum of all recorded values.
+    last : float
+        The last value recorded, nan if none.
+    history : deque[tuple[float, float]]
+        The recent values, as ``(time, value)`` pairs with the time from
+        :func:`time.perf_counter`, oldest first.
+    """
+
+    def __init__(self, name: str, unit: str = '', history: int = HISTORY):
+        self.name = name
+        self.unit = unit
+        self.count = 0
+        self.total = 0.0
+        self.last = float('nan')
+        self.history: deque[tuple[float, float]] = deque(maxlen=history)
+        self._lock = threading.Lock()
+
+    def record(self, value: float) -> None:
+        """Record a value."""
+        with self._lock:
+            self.count += 1
+            self.total += value
+            self.last = value
+            self.history.append((perf_counter(), value))
+
+    def values(self) -> np.ndarray:
+        """Return the recent values, oldest first."""
+        with self._lock:
+            return np.array([value for _, value in self.history], dtype=float)
+
+    def clear(self) -> None:
+        """Forget all recorded values."""
+        with self._lock:
+            self.count = 0
+            self.total = 0.0
+            self.last = float('nan')
+            self.history.clear()
+
+    def snapshot(self) -> dict[str, float]:
+        """Return the totals, and statistics of the recent values.
+
+        Returns
+        -------
+        dict[str, float]
+            Maps 'count', 'total' and 'last' to those of all values, and
+            'mean', 'min', 'max', 'p50' and 'p95' to statistics of the recent
+            values, which are nan if there are none.
+        """
+        with self._lock:
+            count, total, last = self.count, self.total, self.last
+            recent = np.array(
+                [value for _, value in self.history], dtype=float
+            )
+        snapshot = {'count': count, 'total': total, 'last': last}
+        if recent.size:
+            p50, p95 = np.percentile(recent, (50, 95))
+            snapshot.update(
+                mean=float(recent.mean()),
+                min=float(recent.min()),
+                max=float(recent.max()),
+                p50=float(p50),
+                p95=float(p95),
+            )
+        else:
+            snapshot.update(
+                dict.fromkeys(
+                    ('mean', 'min', 'max', 'p50', 'p95'), float('nan')
+                )
+            )
+        return snapshot
+
+
+class PerfCounters:
+    """A registry of performance counters, created on first use.
+
+    Parameters
+    ----------
+    history : int
+        Number of recent values kept by each counter.
+
+    Attributes
+    ----------
+    enabled : bool
+        If False, recording values does nothing.
+    """
+
+    def __init__(self, history: int = HISTORY) -> None:
+        self.enabled = True
+        self._history = history
+        self._counters: dict[str, PerfCounter] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._counters
+
+    def __iter__(self):
+        return iter(list(self._counters.values()))
+
+    def get(self, name: str, unit: str = '') -> PerfCounter:
+        """Return the counter with this name, creating it if needed."""
+        try:
+            return self._counters[name]
+        except KeyError:
+            with self._lock:
+                return self._counters.setdefault(
+                    name, PerfCounter(name, unit, self._history)
+                )
+
+    def record(self, name: str, value: float, unit: str = '') -> None:
+        """Record a value of a counter.
+
+        Parameters
+        ----------
+        name : str
+            Name of the counter, created if needed.
+        value : float
+            The value to record.
+        unit : str
+            Unit of the values, used if the counter is created.
+        """
+        if self.enabled:
+            self.get(name, unit).record(value)
+
+    @contextlib.contextmanager
+    def timer(self, name: str) -> Generator[None, None, None]:
+        """Record the duration of the enclosed block, in milliseconds."""
+        if not self.enabled:
+            yield
+            return
+        start_ns = perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(name, (perf_counter_ns() - start_ns) / 1e6, 'ms')
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Return the snapshot of every counter, by name.
+
+        See :meth:`PerfCounter.snapshot` for the statistics of each counter.
+        """
+        return {counter.name: counter.snapshot() for counter in self}
+
+    def clear(self) -> None:
+        """Forget the values recorded by all counters."""
+        for counter in self:
+            counter.clear()
+
+
+#: the global registry of counters
+counters = PerfCounters()
@@ -0,0 +1,242 @@
+"""FrameRecorder class to measure the frame times of a canvas.
+
+A frame lasts from the start of the draw event of a vispy canvas to the end
+of its last callback, so it covers updating the layers in
+``VispyCanvas.on_draw``, rendering the scene and flushing the GL commands.
+The time spent in ``VispyCanvas.on_draw`` is also kept on its own, as the
+update part of the frame.
+
+The canvas of a viewer times its frames with a FrameRecorder, into the
+``canvas.frame_ms`` counter. The frame time benchmarks also record them,
+while they script interactions in a headless viewer, and report
+percentiles of the frame times of each scenario.
+"""
+
+import contextlib
+from collections.abc import Callable, Generator
+from time import perf_counter_ns
+from typing import Any
+
+import numpy as np
+
+from napari.utils.events import (
+    get_callback_stats,
+    set_callback_profiling_enabled,
+)
+from napari.utils.events.debugging import CallbackStats
+from napari.utils.perf._counters import counters
+
+#: percentiles reported by FrameStats.summary
+PERCENTILES = (50, 95, 99)
+
+
+class FrameStats:
+    """Durations of the frames drawn during one scenario.
+
+    Parameters
+    ----------
+    name : str
+        Name of the scenario.
+
+    Attributes
+    ----------
+    frame_ms : list[float]
+        Duration of each frame, in milliseconds.
+    update_ms : list[float]
+        Time spent updating the layers in each frame, in milliseconds.
+    callbacks : CallbackStats or None
+        Timings of the event callbacks invoked during the scenario, if they
+        were recorded.
+    """
+
+    def __init__(self, name: str = '') -> None:
+        self.name = name
+        self.frame_ms: list[float] = []
+        self.update_ms: list[float] = []
+        self.callbacks: CallbackStats | None = None
+
+    def add(self, frame_ms: float, update_ms: float = 0.0) -> None:
+        """Add one frame."""
+        self.frame_ms.append(frame_ms)
+        self.update_ms.append(update_ms)
+
+    def percentile(self, q: float, update: bool = False) -> float:
+        """Return the q-th percentile of the frame times, nan if no frames.
+
+        Parameters
+        ----------
+        q : float
+            Percentile to compute, between 0 and 100.
+        update : bool
+            If True, use the update times instead of the frame times.
+        """
+        values = self.update_ms if update else self.frame_ms
+        if not values:
+            return float('nan')
+        return float(np.percentile(values, q))
+
+    def summary(self) -> dict[str, float]:
+        """Return the number of frames and percentiles of their durations.
+
+        Returns
+        -------
+        dict[str, float]
+            Maps 'frames' to the number of frames, and 'p50', 'p95', 'p99'
+            to the percentiles of the frame times and 'update_p50',
+            'update_p95', 'update_p99' to those of the update times, in
+            milliseconds.
+        """
+        summary: dict[str, float] = {'frames': len(self.frame_ms)}
+        for q in PERCENTILES:
+            summary[f'p{q}'] = self.percentile(q)
+        for q in PERCENTILES:
+            summary[f'update_p{q}'] = self.percentile(q, update=True)
+        return summary
+
+    def table_row(self) -> str:
+        """Return the summary formatted as a row of :func:`frame_table`."""
+        s = self.summary()
+        return (
+            f'{self.name:<24} {int(s["frames"]):>7} {s["p50"]:>8.2f} '
+            f'{s["p95"]:>8.2f} {s["p99"]:>8.2f} {s["update_p50"]:>10.2f}'
+        )
+
+
+def frame_table(stats: list[FrameStats]) -> str:
+    """Return the summaries of several scenarios as a text table."""
+    header = (
+        f'{"scenario":<24} {"frames":>7} {"p50 ms":>8} {"p95 ms":>8} '
+        f'{"p99 ms":>8} {"update p50":>10}'
+    )
+    lines = [header]
+    lines.extend(s.table_row() for s in stats)
+    return '\n'.join(lines)
+
+
+class FrameRecorder:
+    """Record the duration of the frames drawn by a vispy canvas.
+
+    The recorder times every frame from its creation until it is
+    disconnected. The frames are kept in a FrameStats while recording, and
+    recorded into a performance counter if one is given. The canvas of a
+    viewer has one, which records the ``canvas.frame_ms`` counter.
+
+    Parameters
+    ----------
+    draw_emitter : vispy.util.event.EventEmitter
+        The draw event of the vispy ``SceneCanvas``.
+    update_callback : callable, optional
+        The callback of the draw event updating the layers, usually
+        ``VispyCanvas.on_draw``. Its duration is recorded as the update
+        time of each frame. It must be connected to the draw event first.
+    counter : str, optional
+        Name of the performance counter to record the frame times into,
+        see :mod:`napari.utils.perf._counters`.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        recorder = viewer.window._qt_viewer.canvas.frame_recorder
+        with recorder.record('zoom') as stats:
+            zoom_in_and_out()
+        print(frame_table([stats]))
+    """
+
+    def __init__(
+        self,
+        draw_emitter: Any,
+        update_callback: Callable | None = None,
+        counter: str | None = None,
+    ) -> None:
+        self._draw_emitter = draw_emitter
+        self.counter = counter
+        self._stats: FrameStats | None = None
+        self._frame_start_ns = 0
+        self._update_start_ns = 0
+        self._update_ns = 0
+
+        emitter = draw_emitter
+        if update_callback is not None:
+            # vispy stores methods as (weakref, name) pairs, which is also
+            # how they are matched by the before and after criteria
+            update = emitter._normalize_cb(update_callback)
+            emitter.connect(
+                self._on_update_start, before=update, position='last'
+            )
+            emitter.connect(
+                self._on_update_end, after=update, position='first'
+            )
+        # connected after the update hooks, so that they are at the ends
+        emitter.connect(self._on_frame_start, position='first')
+        emitter.connect(self._on_frame_end, position='last')
+
+    def _on_frame_start(self, event=None) -> None:
+        self._frame_start_ns = perf_counter_ns()
+        self._update_ns = 0
+
+    def _on_update_start(self, event=None) -> None:
+        self._update_start_ns = perf_counter_ns()
+
+    def _on_update_end(self, event=None) -> None:
+        self._update_ns = perf_counter_ns() - self._update_start_ns
+
+    def _on_frame_end(self, event=None) -> None:
+        frame_ms = (perf_counter_ns() - self._frame_start_ns) / 1e6
+        if self.counter is not None:
+            counters.record(self.counter, frame_ms, 'ms')
+        if self._stats is not None:
+            self._stats.add(frame_ms, self._update_ns / 1e6)
+
+    def disconnect(self) -> None:
+        """Stop timing the frames, disconnecting from the draw event."""
+        self.stop()
+        for callback in (
+            self._on_frame_start,
+            self._on_update_start,
+            self._on_update_end,
+            self._on_frame_end,
+        ):
+            self._draw_emitter.disconnect(callback)
+
+    def start(self, name: str = '') -> FrameStats:
+        """Start recording frames, into a new FrameStats that is returned."""
+        self._stats = FrameStats(name)
+        return self._stats
+
+    def stop(self) -> FrameStats | None:
+        """Stop recording frames, and return what was recorded."""
+        stats, self._stats = self._stats, None
+        return stats
+
+    @contextlib.contextmanager
+    def record(
+        self, name: str = '', profile_callbacks: bool = True
+    ) -> Generator[FrameStats, None, None]:
+        """Record the frames drawn in the enclosed block.
+
+        Parameters
+        ----------
+        name : str
+            Name of the scenario.
+        profile_callbacks : bool
+            If True, also time the event callbacks invoked in the block,
+            into ``FrameStats.callbacks``. Ignored if callback profiling
+            is already enabled, so as not to reset its statistics.
+
+        Yields
+        ------
+        FrameStats
+            The frames recorded so far.
+        """
+        profile = profile_callbacks and get_callback_stats() is None
+        stats = self.start(name)
+        if profile:
+            stats.callbacks = set_callback_profiling_enabled(True)
+        try:
+            yield stats
+        finally:
+            if profile:
+                set_callback_profiling_enabled(False)
+            self.stop()
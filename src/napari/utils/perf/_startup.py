@@ -0,0 +1,93 @@
+"""StartupProfiler class to time the phases of launching napari.
+
+Used by ``napari --profile-startup trace.json``, which writes one complete
+event per startup phase (imports, settings, plugin discovery, Qt
+application, stylesheet, viewer creation, first paint) to a
+chrome://tracing file.
+"""
+
+import contextlib
+import os
+import time
+from collections.abc import Generator
+from time import perf_counter_ns
+
+from napari.utils.perf._event import PerfEvent
+from napari.utils.perf._timers import timers
+from napari.utils.perf._trace_file import PerfTraceFile
+
+
+def _process_start_ns() -> int | None:
+    """Return when this process started, on the perf_counter_ns clock."""
+    try:
+        import psutil
+
+        created_s = psutil.Process(os.getpid()).create_time()
+    except Exception:  # noqa: BLE001
+        return None
+    elapsed_ns = int((time.time() - created_s) * 1e9)
+    return perf_counter_ns() - max(elapsed_ns, 0)
+
+
+class StartupProfiler:
+    """Record the duration of each napari startup phase.
+
+    Each phase is stored as a PerfEvent with category "startup". If perfmon
+    is enabled, the events are also sent to the perfmon timers.
+
+    Attributes
+    ----------
+    events : list[PerfEvent]
+        The recorded phases, in the order in which they finished.
+    """
+
+    def __init__(self) -> None:
+        self.events: list[PerfEvent] = []
+
+    def add_phase(self, name: str, start_ns: int, end_ns: int) -> None:
+        """Record a phase that ran from ``start_ns`` to ``end_ns``."""
+        event = PerfEvent(name, start_ns, end_ns, category='startup')
+        self.events.append(event)
+        timers.add_event(event)
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Generator[None, None, None]:
+        """Time the enclosed block as the startup phase ``name``."""
+        start_ns = perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.add_phase(name, start_ns, perf_counter_ns())
+
+    def add_process_start_phase(
+        self, name: str = 'imports', end_ns: int | None = None
+    ) -> None:
+        """Record the time from process creation until ``end_ns`` as ``name``.
+
+        This covers interpreter startup and every import done before
+        ``end_ns`` (by default, now), which cannot be timed from within
+        napari itself.
+        """
+        start_ns = _process_start_ns()
+        if start_ns is not None:
+            end_ns = perf_counter_ns() if end_ns is None else end_ns
+            self.add_phase(name, start_ns, end_ns)
+
+    def summary(self) -> str:
+        """Return a text table of the recorded phases."""
+        lines = [
+            f'{event.duration_ms:>10.1f} ms  {event.name}'
+            for event in self.events
+        ]
+        if self.events:
+            start = min(event.span.start_ns for event in self.events)
+            end = max(event.span.end_ns for event in self.events)
+            lines.append(f'{(end - start) / 1e6:>10.1f} ms  total')
+        return '\n'.join(lines)
+
+    def write(self, path: str) -> None:
+        """Write the recorded phases to a chrome://tracing file at ``path``."""
+        trace_file = PerfTraceFile(path)
+        for event in self.events:
+            trace_file.add_event(event)
+        trace_file.close()
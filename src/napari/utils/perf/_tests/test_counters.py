@@ -0,0 +1,51 @@
+import math
+
+import numpy as np
+
+from napari.utils.perf._counters import PerfCounter, PerfCounters
+
+
+def test_counter_history_is_bounded():
+    counter = PerfCounter('test', 'ms', history=4)
+    for value in range(10):
+        counter.record(value)
+
+    assert counter.count == 10
+    assert counter.total == 45
+    assert counter.last == 9
+    np.testing.assert_array_equal(counter.values(), [6, 7, 8, 9])
+
+    snapshot = counter.snapshot()
+    assert snapshot['count'] == 10
+    assert snapshot['mean'] == 7.5
+    assert snapshot['min'] == 6
+    assert snapshot['max'] == 9
+    assert snapshot['p50'] == 7.5
+
+    counter.clear()
+    snapshot = counter.snapshot()
+    assert snapshot['count'] == 0
+    assert math.isnan(snapshot['last'])
+    assert math.isnan(snapshot['p95'])
+
+
+def test_counters_registry():
+    counters = PerfCounters()
+    counters.record('hit', 1, 'ratio')
+    counters.record('hit', 0)
+    with counters.timer('time_ms'):
+        pass
+
+    assert 'hit' in counters
+    assert counters.get('hit').unit == 'ratio'
+    assert counters.get('time_ms').unit == 'ms'
+    snapshot = counters.snapshot()
+    assert set(snapshot) == {'hit', 'time_ms'}
+    assert snapshot['hit']['mean'] == 0.5
+    assert snapshot['time_ms']['count'] == 1
+
+    counters.enabled = False
+    counters.record('hit', 1)
+    counters.record('other', 1)
+    assert counters.get('hit').count == 2
+    assert 'other' not in counters
@@ -0,0 +1,98 @@
+import time
+
+import numpy as np
+import pytest
+from vispy.util.event import EventEmitter
+
+from napari.utils.events import (
+    EventEmitter as NapariEventEmitter,
+    get_callback_stats,
+)
+from napari.utils.perf._counters import counters
+from napari.utils.perf._frames import FrameRecorder, FrameStats, frame_table
+
+
+def test_frame_stats():
+    stats = FrameStats('pan')
+    assert np.isnan(stats.percentile(50))
+    for ms in range(1, 101):
+        stats.add(float(ms), update_ms=1.0)
+    summary = stats.summary()
+    assert summary['frames'] == 100
+    assert summary['p50'] == pytest.approx(50.5)
+    assert summary['p99'] == pytest.approx(99.01)
+    assert summary['update_p95'] == 1
+    table = frame_table([stats])
+    assert 'p95 ms' in table
+    assert table.splitlines()[1].startswith('pan')
+
+
+def test_frame_recorder():
+    draw = EventEmitter(type='draw')
+
+    class Canvas:
+        def on_draw(self, event):
+            time.sleep(0.002)
+
+        def on_other(self, event):
+            time.sleep(0.001)
+
+    canvas = Canvas()
+    draw.connect(canvas.on_other)
+    draw.connect(canvas.on_draw, position='last')
+    recorder = FrameRecorder(draw, canvas.on_draw)
+    # the update is timed within the frame
+    assert [name for _, name in draw.callbacks] == [
+        '_on_frame_start',
+        'on_other',
+        '_on_update_start',
+        'on_draw',
+        '_on_update_end',
+        '_on_frame_end',
+    ]
+    emitter = NapariEventEmitter(type_name='test')
+    emitter.connect(lambda: None)
+
+    draw()
+    with recorder.record('scenario') as stats:
+        draw()
+        emitter()
+        draw()
+    draw()
+
+    assert stats.name == 'scenario'
+    assert len(stats.frame_ms) == 2
+    assert all(u >= 2 for u in stats.update_ms)
+    assert all(
+        f >= u + 1
+        for f, u in zip(stats.frame_ms, stats.update_ms, strict=True)
+    )
+    assert stats.callbacks is not None
+    assert any(
+        name.endswith('events.test') for name, _ in stats.callbacks.records
+    )
+    assert get_callback_stats() is None
+
+    recorder.disconnect()
+    assert len(draw.callbacks) == 2
+
+
+def test_frame_recorder_counter():
+    draw = EventEmitter(type='draw')
+    recorder = FrameRecorder(draw, counter='test.frame_ms')
+
+    draw()
+    draw()
+    counter = counters.get('test.frame_ms')
+    assert counter.count == 2
+    assert counter.unit == 'ms'
+
+    # the frames are also kept while recording
+    with recorder.record('scenario', profile_callbacks=False) as stats:
+        draw()
+    assert len(stats.frame_ms) == 1
+    assert counter.count == 3
+
+    recorder.disconnect()
+    draw()
+    assert counter.count == 3
@@ -0,0 +1,124 @@
+import json
+import threading
+import time
+
+from napari.utils.perf._event import PerfEvent
+from napari.utils.perf._trace_file import PerfTraceFile
+
+
+def _event(name='test', duration_ms=1.0):
+    return PerfEvent(name, 0, int(duration_ms * 1e6))
+
+
+def _load_partial(path):
+    """Load a trace which may not have its closing bracket yet."""
+    text = path.read_text().rstrip()
+    if not text.endswith(']'):
+        text += ']'
+    return json.loads(text)
+
+
+def _wait_for_events(path, n, timeout=5.0):
+    """Wait until the writer thread wrote n events, and return them."""
+    deadline = time.monotonic() + timeout
+    while len(events := _load_partial(path)) < n:
+        assert time.monotonic() < deadline, 'events were not written'
+        time.sleep(0.01)
+    return events
+
+
+def test_trace_file_streams_events(tmp_path):
+    path = tmp_path / 'trace.json'
+    trace_file = PerfTraceFile(str(path), flush_interval_s=60, buffer_size=2)
+
+    trace_file.add_event(_event('a'))
+    assert _load_partial(path) == []
+    trace_file.add_event(_event('b'))
+    # a full buffer is written by the writer thread
+    events = _wait_for_events(path, 2)
+    assert [e['name'] for e in events] == ['a', 'b']
+    assert trace_file._pending == []
+
+    trace_file.add_event(_event('c'))
+    trace_file.flush()
+    assert [e['name'] for e in _load_partial(path)] == ['a', 'b', 'c']
+
+    trace_file.close()
+    data = json.loads(path.read_text())
+    assert [e['name'] for e in data] == ['a', 'b', 'c']
+    assert data[0]['dur'] == 1000
+    # adding after close does not fail
+    trace_file.add_event(_event('d'))
+    trace_file.close()
+
+
+def test_trace_file_flush_interval(tmp_path):
+    path = tmp_path / 'trace.json'
+    trace_file = PerfTraceFile(str(path), flush_interval_s=0.05)
+    trace_file.add_event(_event('a'))
+    # written without adding more events
+    assert len(_wait_for_events(path, 1)) == 1
+    trace_file.close()
+
+    path = tmp_path / 'trace0.json'
+    trace_file = PerfTraceFile(str(path), flush_interval_s=0)
+    trace_file.add_event(_event('a'))
+    assert len(_wait_for_events(path, 1)) == 1
+    trace_file.close()
+
+
+def test_trace_file_writes_in_background(tmp_path, monkeypatch):
+    path = tmp_path / 'trace.json'
+    trace_file = PerfTraceFile(str(path), flush_interval_s=0.05, buffer_size=1)
+    writers = set()
+    get_event_data = trace_file._get_event_data
+
+    def _get_event_data(event):
+        writers.add(threading.current_thread())
+        return get_event_data(event)
+
+    monkeypatch.setattr(trace_file, '_get_event_data', _get_event_data)
+    for _ in range(10):
+        trace_file.add_event(_event('a'))
+    _wait_for_events(path, 10)
+    trace_file.close()
+    assert writers == {trace_file._writer}
+    assert not trace_file._writer.is_alive()
+
+
+def test_trace_file_roll_over(tmp_path):
+    path = tmp_path / 'trace.json'
+    trace_file = PerfTraceFile(
+        str(path), buffer_size=1, max_bytes=500, backup_count=2
+    )
+    for i in range(50):
+        trace_file.add_event(_event(f'event{i}'))
+    trace_file.close()
+
+    backups = [tmp_path / 'trace.json.1', tmp_path / 'trace.json.2']
+    assert all(backup.exists() for backup in backups)
+    assert not (tmp_path / 'trace.json.3').exists()
+    names = [
+        e['name']
+        for p in [*reversed(backups), path]
+        for e in json.loads(p.read_text())
+    ]
+    # the most recent events are kept, in order
+    assert names[-1] == 'event49'
+    assert names == [f'event{i}' for i in range(50 - len(names), 50)]
+    assert path.stat().st_size <= 1000
+
+
+def test_trace_file_sampling(tmp_path):
+    path = tmp_path / 'trace.json'
+    trace_file = PerfTraceFile(str(path), min_duration_ms=0.5, sample_every=3)
+    for _ in range(6):
+        trace_file.add_event(_event('fast', duration_ms=0.1))
+        trace_file.add_event(_event('slow', duration_ms=1))
+    trace_file.add_event(PerfEvent('count', 0, 0, phase='C', value=1))
+    trace_file.close()
+
+    names = [e['name'] for e in json.loads(path.read_text())]
+    assert names == ['slow', 'slow', 'count']
+    assert trace_file.n_events == 3
+    assert trace_file.n_dropped == 10
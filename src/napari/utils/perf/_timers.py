@@ -4,6 +4,7 @@ import contextlib
 import os
 from collections.abc import Generator
 from time import perf_counter_ns
+from typing import Any
 
 from napari.utils.perf._event import PerfEvent
 from napari.utils.perf._stat import Stat
@@ -146,15 +147,19 @@ class PerfTimers:
         # so that we start accumulating fresh information.
         self.timers.clear()
 
-    def start_trace_file(self, path: str) -> None:
+    def start_trace_file(self, path: str, **options: Any) -> None:
         """Start recording a trace file to disk.
 
         Parameters
         ----------
         path : str
             Write the trace to this path.
+        **options
+            Options of the PerfTraceFile, such as ``max_bytes`` or
+            ``sample_every``.
         """
-        self.trace_file = PerfTraceFile(path)
+        self.stop_trace_file()
+        self.trace_file = PerfTraceFile(path, **options)
 
     def stop_trace_file(self) -> None:
         """Stop recording a trace file."""
@@ -251,7 +256,7 @@ class DummyTimer:
     def add_event(self, event: PerfEvent) -> None:
         """empty timer to use when perfmon is disabled"""
 
-    def start_trace_file(self, path: str) -> None:
+    def start_trace_file(self, path: str, **options: Any) -> None:
         """empty timer to use when perfmon is disabled"""
 
     def stop_trace_file(self) -> None:
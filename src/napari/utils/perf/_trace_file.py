@@ -1,6 +1,9 @@
 """PerfTraceFile class to write the chrome://tracing file format (JSON)"""
 
 import json
+import os
+import threading
+from pathlib import Path
 from time import perf_counter_ns
 from typing import TYPE_CHECKING
 
@@ -9,14 +12,37 @@ if TYPE_CHECKING:
 
 
 class PerfTraceFile:
-    """Writes a chrome://tracing formatted JSON file.
+    """Writes a chrome://tracing formatted JSON file, while tracing.
 
-    Stores PerfEvents in memory, writes the JSON file in PerfTraceFile.close().
+    Events are buffered in memory and appended to the file by a background
+    thread, every ``flush_interval_s`` seconds, or as soon as
+    ``buffer_size`` events are pending, so that neither serializing nor
+    writing them slows down the threads adding them, and so that a long
+    trace neither grows in memory nor is lost on a crash. The file is a
+    JSON array of events. The closing bracket is only written by close(),
+    but the trace viewers accept files without it.
 
     Parameters
     ----------
     output_path : str
         Write the trace file to this path.
+    flush_interval_s : float
+        Append the pending events to the file at least this often, in
+        seconds, even if no events are added.
+    buffer_size : int
+        Append the pending events to the file once there are this many.
+    max_bytes : int, optional
+        If set, roll the file over once it is larger than this, so only the
+        most recent part of a long trace is kept. The file is closed and
+        renamed to ``output_path.1``, older files being shifted to ``.2``
+        and so on, and a new file is started.
+    backup_count : int
+        Number of rolled over files to keep. Ignored without ``max_bytes``.
+    min_duration_ms : float
+        Drop complete events shorter than this, in milliseconds.
+    sample_every : int
+        Only keep one in every ``sample_every`` events of each name, to trace
+        high frequency timers. The first event of each name is kept.
 
     Attributes
     ----------
@@ -24,10 +50,10 @@ class PerfTraceFile:
         Write the trace file to this path.
     zero_ns : int
         perf_counter_ns() time when we started the trace.
-    events : List[PerfEvent]
-        Process ID.
-    outf : file handle
-        JSON file we are writing to.
+    n_events : int
+        Number of events written or pending.
+    n_dropped : int
+        Number of events dropped by ``min_duration_ms`` or ``sample_every``.
 
     Notes
     -----
@@ -35,32 +61,139 @@ class PerfTraceFile:
     https://chromium.googlesource.com/catapult/+/HEAD/tracing/README.md
     """
 
-    def __init__(self, output_path: str) -> None:
-        """Store events in memory and write to the file when done."""
+    def __init__(
+        self,
+        output_path: str,
+        *,
+        flush_interval_s: float = 1.0,
+        buffer_size: int = 10_000,
+        max_bytes: int | None = None,
+        backup_count: int = 1,
+        min_duration_ms: float = 0.0,
+        sample_every: int = 1,
+    ) -> None:
+        """Open the file, events are appended to it as they are added."""
         self.output_path = output_path
+        self.flush_interval_s = flush_interval_s
+        self.buffer_size = buffer_size
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.min_duration_us = min_duration_ms * 1e3
+        self.sample_every = max(sample_every, 1)
 
         # So the events we write start at t=0.
         self.zero_ns = perf_counter_ns()
 
-        # Accumulate events in a list and only write at the end so the cost
-        # of writing to a file does not bloat our timings.
-        self.events: list[PerfEvent] = []
+        self.n_events = 0
+        self.n_dropped = 0
+        self._name_counts: dict[str, int] = {}
+
+        # Events are serialized when written rather than when added, so
+        # the cost of writing to a file does not bloat our timings.
+        self._pending: list[PerfEvent] = []
+        # protects the pending events and the statistics
+        self._lock = threading.Lock()
+        # protects the file, written by the writer thread and by flush()
+        self._write_lock = threading.Lock()
+        self._outf = self._open()
+
+        self._wake = threading.Event()
+        self._closing = False
+        self._writer = threading.Thread(
+            target=self._run, name='napari-perf-trace', daemon=True
+        )
+        self._writer.start()
+
+    def _open(self):
+        outf = open(self.output_path, 'w')  # noqa: SIM115
+        outf.write('[\n')
+        outf.flush()
+        self._first_in_file = True
+        return outf
+
+    def _run(self) -> None:
+        """Append the pending events to the file until closed."""
+        while not self._closing:
+            # without an interval, each event added wakes the thread
+            self._wake.wait(self.flush_interval_s or None)
+            self._wake.clear()
+            self.flush()
 
     def add_event(self, event: 'PerfEvent') -> None:
-        """Add one perf event to our in-memory list.
+        """Add one perf event, appended to the file by the writer thread.
 
         Parameters
         ----------
         event : PerfEvent
             Event to add
         """
-        self.events.append(event)
+        with self._lock:
+            if self._closing:
+                return
+            if (
+                self.min_duration_us
+                and event.phase == 'X'
+                and event.duration_us < self.min_duration_us
+            ):
+                self.n_dropped += 1
+                return
+            if self.sample_every > 1:
+                count = self._name_counts.get(event.name, 0)
+                self._name_counts[event.name] = count + 1
+                if count % self.sample_every:
+                    self.n_dropped += 1
+                    return
+            self._pending.append(event)
+            self.n_events += 1
+            if (
+                len(self._pending) >= self.buffer_size
+                or not self.flush_interval_s
+            ):
+                self._wake.set()
+
+    def flush(self) -> None:
+        """Append the pending events to the file now."""
+        with self._write_lock:
+            with self._lock:
+                events, self._pending = self._pending, []
+            if self._outf.closed:
+                return
+            for event in events:
+                sep = '' if self._first_in_file else ',\n'
+                self._outf.write(sep + json.dumps(self._get_event_data(event)))
+                self._first_in_file = False
+                if (
+                    self.max_bytes is not None
+                    and self._outf.tell() > self.max_bytes
+                ):
+                    self._roll_over()
+            self._outf.flush()
+
+    def _roll_over(self) -> None:
+        """Close the file, shift it to the backups, and start a new one."""
+        self._outf.write('\n]\n')
+        self._outf.close()
+        path = Path(self.output_path)
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                backup = path.with_name(f'{path.name}.{i}')
+                if backup.exists():
+                    os.replace(backup, path.with_name(f'{path.name}.{i + 1}'))
+            os.replace(path, path.with_name(f'{path.name}.1'))
+        self._outf = self._open()
 
     def close(self) -> None:
-        """Close the trace file, write all events to disk."""
-        event_data = [self._get_event_data(x) for x in self.events]
-        with open(self.output_path, 'w') as outf:
-            json.dump(event_data, outf)
+        """Stop the writer thread, and write the pending events to disk."""
+        with self._lock:
+            self._closing = True
+        self._wake.set()
+        if self._writer is not threading.current_thread():
+            self._writer.join()
+        self.flush()
+        with self._write_lock:
+            if not self._outf.closed:
+                self._outf.write('\n]\n')
+                self._outf.close()
 
     def _get_event_data(self, event: 'PerfEvent') -> dict:
         """Return the data for one perf event.
@@ -1,3 +1,4 @@
+import numpy as np
 import numpy.testing as npt
 import pytest
 
@@ -121,3 +122,57 @@ def test_mutate_item_invalidates_cache():
 
     npt.assert_array_equal(chain((1, 1)), (4, -5))
     npt.assert_array_equal(chain.inverse((1, 1)), (1 / 4, -1 / 5))
+
+
+def test_affine_chain_evaluated_as_one_matrix():
+    transform_a = Affine(scale=(2, 3), translate=(1, 1), rotate=30)
+    transform_b = Affine(scale=(4, 5), shear=(0.5,))
+    chain = TransformChain((transform_a, transform_b))
+    assert chain._is_affine_chain
+
+    coords = np.random.default_rng(0).random((10, 3))
+    npt.assert_allclose(chain(coords), transform_b(transform_a(coords)))
+    npt.assert_allclose(chain(coords[0]), transform_b(transform_a(coords[0])))
+
+
+def test_affine_chain_updated_after_insert_and_move():
+    chain = TransformChain([Affine(scale=(2, 2)), Affine(translate=(1, 1))])
+    npt.assert_array_equal(chain((1, 1)), (3, 3))
+
+    chain.append(Affine(scale=(10, 10)))
+    npt.assert_array_equal(chain((1, 1)), (30, 30))
+
+    chain.insert(0, Affine(translate=(1, 1)))
+    npt.assert_array_equal(chain((1, 1)), (50, 50))
+
+    chain.move(0, 3)
+    npt.assert_array_equal(chain((1, 1)), (40, 40))
+
+    chain[0].scale = (3, 3)
+    npt.assert_array_equal(chain((1, 1)), (50, 50))
+
+
+def test_mixed_chain_evaluated_in_turn():
+    chain = TransformChain(
+        (Affine(scale=(2, 3)), ScaleTranslate(scale=(4, 5, 6)))
+    )
+    assert not chain._is_affine_chain
+    npt.assert_array_equal(chain((1, 1, 1)), (4, 10, 18))
+
+    chain = TransformChain((Affine(scale=(2, 3)), Affine(scale=(4, 5, 6))))
+    assert not chain._is_affine_chain
+    npt.assert_array_equal(chain((1, 1, 1)), (4, 10, 18))
+
+
+def test_sliced_cached_until_changed():
+    chain = TransformChain(
+        (Affine(scale=(2, 3, 4)), Affine(translate=(1, 2, 3)))
+    )
+    sliced = chain._sliced([1, 2])
+    assert chain._sliced((1, 2)) is sliced
+    assert chain._sliced([0, 2]) is not sliced
+    npt.assert_array_equal(sliced((1, 1)), (5, 7))
+
+    chain[0].scale = (1, 1, 1)
+    assert chain._sliced([1, 2]) is not sliced
+    npt.assert_array_equal(chain._sliced([1, 2])((1, 1)), (3, 4))
@@ -450,3 +450,13 @@ def test_set_axis_error(AffineType):
     affine = AffineType(ndim=2)
     with pytest.raises(ValueError, match='must have length ndim'):
         affine.axis_labels = ('x', 'y', 'z')
+
+
+def test_affine_padded_cache_invalidated():
+    affine = Affine(scale=(2, 3), translate=(1, 1))
+    npt.assert_array_equal(affine((1, 1, 1)), (1, 3, 4))
+
+    affine.translate = (0, 0)
+    npt.assert_array_equal(affine((1, 1, 1)), (1, 2, 3))
+    affine.scale = (1, 1)
+    npt.assert_array_equal(affine((1, 1, 1)), (1, 1, 1))
@@ -2,14 +2,18 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 from typing import (
+    TYPE_CHECKING,
     Union,
     overload,
 )
 
-import pint
+from napari.utils._units import get_unit_registry
 
-UnitsLike = Union[None, str, pint.Unit, Sequence[str | pint.Unit]]
-UnitsInfo = Union[None, pint.Unit, tuple[pint.Unit, ...]]
+if TYPE_CHECKING:
+    import pint
+
+UnitsLike = Union[None, str, 'pint.Unit', Sequence['str | pint.Unit']]
+UnitsInfo = Union[None, 'pint.Unit', tuple['pint.Unit', ...]]
 
 
 __all__ = (
@@ -37,12 +41,10 @@ def get_units_from_name(units: UnitsLike) -> UnitsInfo:
     """Convert a string or sequence of strings to pint units."""
     try:
         if isinstance(units, str):
-            return (
-                pint.get_application_registry().parse_expression(units).units
-            )
+            return get_unit_registry().parse_expression(units).units
         if isinstance(units, Sequence):
             return tuple(
-                pint.get_application_registry().parse_expression(unit).units
+                get_unit_registry().parse_expression(unit).units
                 if isinstance(unit, str)
                 else unit
                 for unit in units
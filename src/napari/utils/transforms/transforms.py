@@ -1,12 +1,12 @@
 from collections.abc import Iterable, Sequence
-from typing import Generic, TypeVar, overload
+from typing import TYPE_CHECKING, Generic, TypeVar, overload
 
 import numpy as np
 import numpy.typing as npt
-import pint
 import toolz as tz
 from psygnal import Signal
 
+from napari.utils._units import get_unit_registry
 from napari.utils.events import EventedList
 from napari.utils.transforms._units import get_units_from_name
 from napari.utils.transforms.transform_utils import (
@@ -24,6 +24,9 @@ from napari.utils.transforms.transform_utils import (
 )
 from napari.utils.translations import trans
 
+if TYPE_CHECKING:
+    import pint
+
 
 class Transform:
     """Base transform class.
@@ -105,6 +108,27 @@ class Transform:
             trans._('Cannot subset arbitrary transforms.', deferred=True)
         )
 
+    def _sliced(self, axes: Sequence[int]) -> 'Transform':
+        """Return a cached transform subset to the visible dimensions.
+
+        Same as :meth:`set_slice`, but the result is cached until this
+        transform changes, so it must not be modified.
+
+        Parameters
+        ----------
+        axes : Sequence[int]
+            Axes to subset the current transform with.
+
+        Returns
+        -------
+        Transform
+            Resulting transform.
+        """
+        key = ('set_slice', tuple(int(axis) for axis in axes))
+        if key not in self._cache_dict:
+            self._cache_dict[key] = self.set_slice(axes)
+        return self._cache_dict[key]
+
     @property
     def _is_diagonal(self):
         """Indicate when a transform does not mix or permute dimensions.
@@ -138,10 +162,32 @@ class TransformChain(EventedList[_T], Transform, Generic[_T]):
         for tr in self:
             if hasattr(tr, 'changed'):
                 tr.changed.connect(self._clean_cache)
+        # insert, append, extend and move do not go through __setitem__
+        self.events.inserted.connect(self._on_inserted)
+        self.events.reordered.connect(self._clean_cache)
+
+    def _on_inserted(self, event) -> None:
+        if hasattr(event.value, 'changed'):
+            event.value.changed.connect(self._clean_cache)
+        self._clean_cache()
 
     def __call__(self, coords):
+        if self._is_affine_chain:
+            # a single matrix product instead of one per transform
+            return self.simplified(coords)
         return tz.pipe(coords, *self)
 
+    @property
+    def _is_affine_chain(self) -> bool:
+        """Whether the chain composes into a single Affine transform."""
+        if '_is_affine_chain' not in self._cache_dict:
+            self._cache_dict['_is_affine_chain'] = (
+                len(self) > 1
+                and all(isinstance(tf, Affine) for tf in self)
+                and len({tf.ndim for tf in self}) == 1
+            )
+        return self._cache_dict['_is_affine_chain']
+
     def __newlike__(self, iterable):
         return TransformChain(iterable)
 
@@ -433,7 +479,7 @@ class Affine(Transform):
         ndim=None,
         rotate=None,
         shear=None,
-        units: Sequence[str | pint.Unit] | None = None,
+        units: Sequence['str | pint.Unit'] | None = None,
     ) -> None:
         super().__init__(name=name)
         self._upper_triangular = True
@@ -472,7 +518,8 @@ class Affine(Transform):
         self._linear_matrix = embed_in_identity_matrix(linear_matrix, ndim)
         self._translate = translate_to_vector(translate, ndim=ndim)
         self._axis_labels = tuple(f'axis {i}' for i in range(-ndim, 0))
-        self._units = (pint.get_application_registry().pixel,) * ndim
+        # None means pixels, see `units`
+        self._units: tuple[pint.Unit, ...] | None = None
 
         self.axis_labels = axis_labels
         self.units = units
@@ -483,16 +530,23 @@ class Affine(Transform):
         if append_first_axis:
             coords = coords[np.newaxis, :]
         coords_ndim = coords.shape[1]
-        padded_linear_matrix = embed_in_identity_matrix(
-            self._linear_matrix, coords_ndim
-        )
-        translate = translate_to_vector(self._translate, ndim=coords_ndim)
+        padded_linear_matrix, translate = self._padded(coords_ndim)
         out = coords @ padded_linear_matrix.T
         out += translate
         if append_first_axis:
             out = out[0]
         return out
 
+    def _padded(self, ndim: int) -> tuple[npt.NDArray, npt.NDArray]:
+        """Linear matrix and translation embedded in ndim dimensions."""
+        key = ('padded', ndim)
+        if key not in self._cache_dict:
+            self._cache_dict[key] = (
+                embed_in_identity_matrix(self._linear_matrix, ndim),
+                translate_to_vector(self._translate, ndim=ndim),
+            )
+        return self._cache_dict[key]
+
     @property
     def ndim(self) -> int:
         """Dimensionality of the transform."""
@@ -515,15 +569,23 @@ class Affine(Transform):
         self._axis_labels = axis_labels
 
     @property
-    def units(self) -> tuple[pint.Unit, ...]:
+    def units(self) -> 'tuple[pint.Unit, ...]':
         """List of units for the layer."""
+        if self._units is None:
+            # the default pixel units are only created when requested, so
+            # that transforms can be used without importing pint
+            return (get_unit_registry().pixel,) * self.ndim
         return self._units
 
     @units.setter
-    def units(self, units: Sequence[pint.Unit] | None) -> None:
+    def units(self, units: 'Sequence[pint.Unit] | None') -> None:
         units = get_units_from_name(units)
         if units is None:
-            units = (pint.get_application_registry().pixel,) * self.ndim
+            self._units = None
+            return
+
+        import pint
+
         if isinstance(units, pint.Unit):
             units = (units,) * self.ndim
         if len(units) != self.ndim:
@@ -552,7 +614,7 @@ class Affine(Transform):
         self._clean_cache()
 
     @property
-    def physical_scale(self) -> tuple[pint.Quantity, ...]:
+    def physical_scale(self) -> 'tuple[pint.Quantity, ...]':
         """Return the scale of the transform, with units."""
         return tuple(np.multiply(self.scale, self.units))
 
@@ -695,7 +757,9 @@ class Affine(Transform):
             linear_matrix = np.diag(self.scale[axes])
         else:
             linear_matrix = self.linear_matrix[np.ix_(axes, axes)]
-        units = [self.units[i] for i in axes]
+        units = (
+            None if self._units is None else [self._units[i] for i in axes]
+        )
         axes_labels = [self.axis_labels[i] for i in axes]
         return Affine(
             linear_matrix=linear_matrix,
@@ -929,7 +993,11 @@ class CompositeAffine(Affine):
             shear=self._shear[np.ix_(axes, axes)],
             ndim=len(axes),
             name=self.name,
-            units=[self.units[i] for i in axes],
+            units=(
+                None
+                if self._units is None
+                else [self._units[i] for i in axes]
+            ),
             axis_labels=[self.axis_labels[i] for i in axes],
         )
 
@@ -123,7 +123,8 @@ def imshow(
         list and arrays are decreasing in shape then the data is treated as
         a multiscale image. Please note multiscale rendering is only
         supported in 2D. In 3D, only the lowest resolution scale is
-        displayed.
+        displayed, unless the experimental ``multiscale_3d`` setting
+        is enabled.
     channel_axis : int, optional
         Axis to expand image along. If provided, each channel in the data
         will be added as an individual image layer. In channel_axis mode,
@@ -192,7 +193,8 @@ def imshow(
         then it will be taken to be multiscale. The first image in the list
         should be the largest. Please note multiscale rendering is only
         supported in 2D. In 3D, only the lowest resolution scale is
-        displayed.
+        displayed, unless the experimental ``multiscale_3d`` setting
+        is enabled.
     name : str or list of str
         Name of the layer.
     opacity : float or list